@@ -0,0 +1,126 @@
+using NUnit.Framework;
+
+using Python.Runtime;
+
+namespace Python.EmbeddingTest.NeedsReinit
+{
+    [Category("NeedsReinit")]
+    public class TestLazyMemberReflection : StopAndRestartEngine
+    {
+        // the metatype slots for lazy members are only set up by Initialize
+        [OneTimeSetUp]
+        public void InitializeLazily()
+        {
+            var configuration = InteropConfiguration.MakeDefault();
+            configuration.LazyMemberReflection = true;
+            PythonEngine.InteropConfiguration = configuration;
+            PythonEngine.Initialize();
+        }
+
+        [OneTimeTearDown]
+        public void Shutdown()
+        {
+            // also restores the default configuration
+            PythonEngine.Shutdown();
+        }
+
+        [Test]
+        public void MembersAreReflectedOnFirstAccess()
+        {
+            using var scope = Py.CreateScope();
+            scope.Set("t", PyType.Get(typeof(LazyBase)));
+            Assert.IsFalse(scope.Eval<bool>($"'{nameof(LazyBase.Twice)}' in t.__dict__"));
+
+            Assert.AreEqual(4, scope.Eval<int>($"t().{nameof(LazyBase.Twice)}(2)"));
+            Assert.IsTrue(scope.Eval<bool>($"'{nameof(LazyBase.Twice)}' in t.__dict__"));
+        }
+
+        [Test]
+        public void DirListsPendingMembers()
+        {
+            using var scope = Py.CreateScope();
+            scope.Set("t", PyType.Get(typeof(LazyDir)));
+            Assert.IsTrue(scope.Eval<bool>($"'{nameof(LazyDir.Pending)}' in dir(t)"));
+            Assert.IsTrue(scope.Eval<bool>($"'{nameof(LazyDir.Pending)}' in dir(t())"));
+        }
+
+        [Test]
+        public void SettingPendingPropertyCallsSetter()
+        {
+            var instance = new LazyProperty();
+            using var scope = Py.CreateScope();
+            scope.Set("o", instance.ToPython());
+            scope.Exec($"o.{nameof(LazyProperty.Value)} = 42");
+
+            Assert.AreEqual(42, instance.Value);
+        }
+
+        [Test]
+        public void StaticMembersAreReflectedOnFirstAccess()
+        {
+            using var scope = Py.CreateScope();
+            scope.Set("t", PyType.Get(typeof(LazyStatic)));
+            Assert.IsFalse(scope.Eval<bool>($"'{nameof(LazyStatic.Triple)}' in t.__dict__"));
+            Assert.AreEqual(9, scope.Eval<int>($"t.{nameof(LazyStatic.Triple)}(3)"));
+
+            // set through the property, not stored in the type __dict__
+            scope.Exec($"t.{nameof(LazyStatic.Value)} = 42");
+            Assert.AreEqual(42, LazyStatic.Value);
+            Assert.AreEqual(42, scope.Eval<int>($"t.{nameof(LazyStatic.Value)}"));
+        }
+
+        [Test]
+        public void DerivedClassesSeeBaseMembers()
+        {
+            using var scope = Py.CreateScope();
+            scope.Set("d", PyType.Get(typeof(LazyDerived)));
+            scope.Set("b", PyType.Get(typeof(LazyBase)));
+
+            Assert.AreEqual(6, scope.Eval<int>($"d().{nameof(LazyBase.Twice)}(3)"));
+            Assert.AreEqual("derived", scope.Eval<string>($"d().{nameof(LazyBase.Name)}()"));
+            Assert.AreEqual("base", scope.Eval<string>($"b().{nameof(LazyBase.Name)}()"));
+        }
+
+        [Test]
+        public void PythonSubclassCanCallSuper()
+        {
+            using var scope = Py.CreateScope();
+            scope.Set("t", PyType.Get(typeof(LazySuper)));
+            scope.Exec($@"
+class Sub(t):
+    def Twice(self, x):
+        return super().{nameof(LazyBase.Twice)}(x) + 1
+");
+            Assert.AreEqual(5, scope.Eval<int>("Sub().Twice(2)"));
+        }
+
+        public class LazyBase
+        {
+            public int Twice(int x) => x * 2;
+            public virtual string Name() => "base";
+        }
+
+        public class LazyDerived : LazyBase
+        {
+            public override string Name() => "derived";
+        }
+
+        public class LazyDir
+        {
+            public int Pending => 0;
+        }
+
+        public class LazyProperty
+        {
+            public int Value { get; set; }
+        }
+
+        public class LazySuper : LazyBase { }
+
+        public class LazyStatic
+        {
+            public static int Value { get; set; }
+            public static int Triple(int x) => x * 3;
+        }
+    }
+}
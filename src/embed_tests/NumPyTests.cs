@@ -62,6 +62,19 @@ namespace Python.EmbeddingTest
             Assert.That(ndarray[(1, 0).ToPython()].InvokeMethod("__int__").As<long>(), Is.EqualTo(array[1, 0]));
         }
 
+        [Test]
+        public void ScalarConversion()
+        {
+            var array = new long[,] { { 1, 2 }, { 3, 4 } };
+            var ndarray = np.InvokeMethod("asarray", array.ToPython());
+            Assert.That(ndarray[(1, 0).ToPython()].As<long>(), Is.EqualTo(array[1, 0]));
+            Assert.That(ndarray[(1, 1).ToPython()].As<int>(), Is.EqualTo(array[1, 1]));
+            Assert.That(np.float32(2.5).As<double>(), Is.EqualTo(2.5));
+            Assert.That(np.bool_(true).As<bool>(), Is.True);
+            Assert.That(np.array(7).As<int>(), Is.EqualTo(7));
+            Assert.Throws<InvalidCastException>(() => np.int32(-1).As<uint>());
+        }
+
         [Test]
         public void VarArg()
         {
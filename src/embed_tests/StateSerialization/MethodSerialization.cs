@@ -29,6 +29,28 @@ public class MethodSerialization
         Assert.That(restored.Value, Is.EqualTo(ctor));
     }
 
+    [Test]
+    public void UnusedMethodRoundtrip()
+    {
+        var method = typeof(MethodTestHost).GetMethod(nameof(MethodTestHost.Generic));
+        var maybeMethod = new MaybeMethodBase<MethodBase>(method);
+        // restored methods are looked up on first use,
+        // and can be stashed again before that
+        var restored = SerializationRoundtrip(SerializationRoundtrip(maybeMethod));
+        Assert.IsTrue(restored.Valid);
+        Assert.That(restored.Value, Is.EqualTo(method));
+    }
+
+    [Test]
+    public void PropertyRoundtrip()
+    {
+        var property = typeof(MethodTestHost).GetProperty(nameof(MethodTestHost.Property));
+        var maybeProperty = new MaybeMemberInfo<PropertyInfo>(property);
+        var restored = SerializationRoundtrip(SerializationRoundtrip(maybeProperty));
+        Assert.IsTrue(restored.Valid);
+        Assert.That(restored.Value, Is.EqualTo(property));
+    }
+
     static T SerializationRoundtrip<T>(T item)
     {
         using var buf = new MemoryStream();
@@ -47,4 +69,5 @@ public class MethodTestHost
 {
     public MethodTestHost(int _) { }
     public void Generic<T>(T item, T[] array, ref T @ref) { }
+    public int Property { get; set; }
 }
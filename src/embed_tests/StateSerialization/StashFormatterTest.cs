@@ -0,0 +1,101 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Reflection;
+using System.Runtime.Serialization;
+
+using NUnit.Framework;
+
+using Python.Runtime;
+
+namespace Python.EmbeddingTest.StateSerialization;
+
+public class StashFormatterTest
+{
+    [Test]
+    public void ObjectGraphRoundtrip()
+    {
+        var node = new Node { Name = "first", Kind = DayOfWeek.Friday, Type = typeof(Node) };
+        node.Next = new Node { Name = "second", Next = node, Values = new object[] { 1, 2L, null, "x", node } };
+        var graph = new Dictionary<string, Node> { ["a"] = node, ["b"] = node.Next };
+
+        var restored = Roundtrip(graph);
+
+        var first = restored["a"];
+        Assert.AreEqual("first", first.Name);
+        Assert.AreEqual(DayOfWeek.Friday, first.Kind);
+        Assert.AreSame(typeof(Node), first.Type);
+        Assert.AreSame(restored["b"], first.Next);
+        Assert.AreSame(first, first.Next.Next);
+        var values = first.Next.Values;
+        Assert.AreEqual(5, values.Length);
+        Assert.AreEqual(1, values[0]);
+        Assert.AreEqual(2L, values[1]);
+        Assert.IsNull(values[2]);
+        Assert.AreEqual("x", values[3]);
+        Assert.AreSame(first, values[4]);
+        Assert.IsNull(first.Transient);
+    }
+
+    [Test]
+    public void MaybeMembersRoundtrip()
+    {
+        var property = typeof(MethodTestHost).GetProperty(nameof(MethodTestHost.Property));
+        var method = typeof(MethodTestHost).GetMethod(nameof(MethodTestHost.Generic));
+        var state = new object[]
+        {
+            new MaybeType(typeof(MethodTestHost)),
+            new MaybeMemberInfo<PropertyInfo>(property),
+            new MaybeMethodBase<MethodBase>(method),
+        };
+
+        var restored = Roundtrip(state);
+
+        Assert.AreEqual(typeof(MethodTestHost), ((MaybeType)restored[0]).Value);
+        Assert.AreEqual(property, ((MaybeMemberInfo<PropertyInfo>)restored[1]).Value);
+        Assert.AreEqual(method, ((MaybeMethodBase<MethodBase>)restored[2]).Value);
+    }
+
+    [Test]
+    public void WritesRepeatedNamesOnce()
+    {
+        var one = new[] { new MaybeType(typeof(MethodTestHost)) };
+        var many = new MaybeType[100];
+        for (int i = 0; i < many.Length; i++) many[i] = typeof(MethodTestHost);
+
+        long oneSize = Serialize(one).Length;
+        long manySize = Serialize(many).Length;
+
+        // only the handles of the type name are repeated
+        Assert.Less(manySize - oneSize, 99 * 8);
+    }
+
+    [Test]
+    public void RejectsNonSerializableTypes()
+    {
+        Assert.Throws<SerializationException>(() => Serialize(new MethodTestHost(0)));
+    }
+
+    static MemoryStream Serialize(object graph)
+    {
+        var buf = new MemoryStream();
+        new StashFormatter().Serialize(buf, graph);
+        buf.Position = 0;
+        return buf;
+    }
+
+    static T Roundtrip<T>(T graph) where T : class
+        => (T)new StashFormatter().Deserialize(Serialize(graph));
+
+    [Serializable]
+    class Node
+    {
+        public string Name;
+        public DayOfWeek Kind;
+        public Type Type;
+        public Node Next;
+        public object[] Values;
+        [NonSerialized]
+        public object Transient = new();
+    }
+}
@@ -120,6 +120,28 @@ namespace Python.EmbeddingTest
             Assert.That(ni, Is.EqualTo(Const));
         }
 
+        [Test]
+        public void ToPrimitives()
+        {
+            using var pi = new PyFloat(3.25);
+            using var big = new PyInt(BigInteger.Pow(2, 40));
+            using var text = new PyString("spam");
+            Assert.That(pi.As<double>(), Is.EqualTo(3.25));
+            Assert.That(pi.As<float>(), Is.EqualTo(3.25f));
+            Assert.That(big.As<long>(), Is.EqualTo(1L << 40));
+            Assert.That(big.As<double>(), Is.EqualTo((double)(1L << 40)));
+            Assert.That(new PyInt(-7).As<int>(), Is.EqualTo(-7));
+            Assert.That(true.ToPython().As<bool>(), Is.True);
+            Assert.That(text.As<string>(), Is.EqualTo("spam"));
+            // values the specialized conversions do not handle
+            Assert.That(new PyInt(3).As<float>(), Is.EqualTo(3f));
+            Assert.That(true.ToPython().As<long>(), Is.EqualTo(1));
+            Assert.Throws<InvalidCastException>(() => big.As<int>());
+            Assert.Throws<InvalidCastException>(() => pi.As<long>());
+            Assert.Throws<InvalidCastException>(() => text.As<double>());
+            Assert.Throws<InvalidCastException>(() => big.As<string>());
+        }
+
         [Test]
         public void BigIntExplicit()
         {
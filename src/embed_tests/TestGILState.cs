@@ -1,5 +1,7 @@
 namespace Python.EmbeddingTest
 {
+    using System;
+    using System.Threading.Tasks;
     using NUnit.Framework;
     using Python.Runtime;
 
@@ -17,5 +19,84 @@ namespace Python.EmbeddingTest
                     gilState.Dispose();
             }
         }
+
+        [Test]
+        public void CanDisposeScopeMultipleTimes()
+        {
+            // not a using variable: Dispose would be called on defensive copies
+            var scope = Py.EnterGIL();
+            for (int i = 0; i < 50; i++)
+                scope.Dispose();
+        }
+
+        [Test]
+        public void GILHandlesCanBeDisposedOutOfOrder()
+        {
+            var outer = Py.GIL();
+            var inner = Py.GIL();
+            outer.Dispose();
+            Assert.AreEqual(1, Runtime.Runtime.PyGILState_Check());
+            Assert.AreEqual(2, PythonEngine.Eval("1 + 1").As<int>());
+            inner.Dispose();
+        }
+
+        [Test]
+        public void ScopesDisposedOutOfOrderThrow()
+        {
+            var outer = Py.EnterGIL();
+            IntPtr ts = PythonEngine.BeginAllowThreads();
+            var inner = Py.EnterGIL();
+            Assert.Throws<InvalidOperationException>(() => outer.Dispose());
+            inner.Dispose();
+            PythonEngine.EndAllowThreads(ts);
+            outer.Dispose();
+
+            var scope = Py.EnterGIL();
+            var copy = scope;
+            scope.Dispose();
+            Assert.Throws<InvalidOperationException>(() => copy.Dispose());
+        }
+
+        [Test]
+        public void NestedScopesKeepGIL()
+        {
+            using (Py.EnterGIL())
+            {
+                using (Py.EnterGIL())
+                {
+                    Assert.AreEqual(1, Runtime.Runtime.PyGILState_Check());
+                }
+                Assert.AreEqual(1, Runtime.Runtime.PyGILState_Check());
+                using var _ = Py.GIL();
+                Assert.AreEqual(1, Runtime.Runtime.PyGILState_Check());
+            }
+        }
+
+        [Test]
+        public void NestedScopeAcquiresReleasedGIL()
+        {
+            using (Py.EnterGIL())
+            {
+                IntPtr ts = PythonEngine.BeginAllowThreads();
+                try
+                {
+                    var other = Task.Run(() =>
+                    {
+                        using var _ = Py.EnterGIL();
+                        return PythonEngine.Eval("1 + 1").As<int>();
+                    });
+                    using (Py.EnterGIL())
+                    {
+                        Assert.AreEqual(1, Runtime.Runtime.PyGILState_Check());
+                    }
+                    Assert.AreEqual(2, other.Result);
+                }
+                finally
+                {
+                    PythonEngine.EndAllowThreads(ts);
+                }
+                Assert.AreEqual(1, Runtime.Runtime.PyGILState_Check());
+            }
+        }
     }
 }
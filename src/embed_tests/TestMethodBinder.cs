@@ -0,0 +1,45 @@
+using System;
+using System.Runtime.ExceptionServices;
+using System.Threading;
+
+using NUnit.Framework;
+
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestMethodBinder
+    {
+        [Test]
+        public void ConstraintViolationsAreCached()
+        {
+            var definition = typeof(TestMethodBinder).GetMethod(nameof(ValueOnly));
+            int thread = Environment.CurrentManagedThreadId;
+            int thrown = 0;
+            void OnException(object sender, FirstChanceExceptionEventArgs e)
+            {
+                if (e.Exception is ArgumentException && Environment.CurrentManagedThreadId == thread)
+                {
+                    Interlocked.Increment(ref thrown);
+                }
+            }
+
+            AppDomain.CurrentDomain.FirstChanceException += OnException;
+            try
+            {
+                for (int i = 0; i < 3; i++)
+                {
+                    Assert.IsNull(MethodBinder.MakeGenericMethod(definition, new[] { typeof(object) }));
+                }
+            }
+            finally
+            {
+                AppDomain.CurrentDomain.FirstChanceException -= OnException;
+            }
+            // only the first call asks reflection, which throws
+            Assert.AreEqual(1, thrown);
+        }
+
+        public static T ValueOnly<T>(T value) where T : struct => value;
+    }
+}
@@ -33,6 +33,29 @@ namespace Python.EmbeddingTest
 
 
 
+        [Test]
+        public void TestMultipleKeywordArgs()
+        {
+            dynamic a = CreateTestClass();
+            var first = Py.kw("a3", 4);
+            var second = Py.kw("a4", 8);
+            var result = (int)a.Test3(2, first, second);
+
+            Assert.That(result, Is.EqualTo(15));
+            Assert.That(first.Length(), Is.EqualTo(1));
+            Assert.That(second.Length(), Is.EqualTo(1));
+        }
+
+        [Test]
+        public void TestNamedArgsCallable()
+        {
+            dynamic a = CreateTestClass();
+            dynamic test3 = a.Test3;
+            var result = (int)test3(a3: 4, a4: 8);
+
+            Assert.That(result, Is.EqualTo(14));
+        }
+
         private static PyObject CreateTestClass()
         {
             var locals = new PyDict();
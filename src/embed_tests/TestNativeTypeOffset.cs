@@ -29,5 +29,19 @@ namespace Python.EmbeddingTest
                 Assert.NotNull(Type.GetType(typeName), $"{typeName} does not exist and sys.abiflags={abiflags}");
             }
         }
+
+        /// <summary>
+        /// Tests that the object header layout matches the build of the loaded library.
+        /// </summary>
+        [Test]
+        public void DetectsFreeThreadedObjectHeader()
+        {
+            using var sysconfig = Py.Import("sysconfig");
+            using var gilDisabled = sysconfig.InvokeMethod("get_config_var", new PyString("Py_GIL_DISABLED"));
+            Assert.AreEqual(gilDisabled.IsTrue(), Python.Runtime.Native.ABI.IsFreeThreaded);
+
+            using var list = new PyList();
+            Assert.AreEqual(1, list.Refcount);
+        }
     }
 }
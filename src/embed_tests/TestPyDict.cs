@@ -0,0 +1,35 @@
+using System.Collections.Generic;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestPyDict
+    {
+        [Test]
+        public void TestFromPairs()
+        {
+            var pairs = new Dictionary<string, double> { ["a"] = 1.5, ["b"] = 2.5 };
+            using var dict = PyDict.FromPairs(pairs);
+
+            Assert.That(dict.Length(), Is.EqualTo(2));
+            Assert.That(dict["a"].As<double>(), Is.EqualTo(1.5));
+            Assert.That(dict["b"].As<double>(), Is.EqualTo(2.5));
+        }
+
+        [Test]
+        public void TestFromPairsLaterKeyWins()
+        {
+            var pairs = new[]
+            {
+                new KeyValuePair<int, string>(1, "first"),
+                new KeyValuePair<int, string>(1, "second"),
+            };
+            using var dict = PyDict.FromPairs(pairs);
+
+            Assert.That(dict.Length(), Is.EqualTo(1));
+            using var key = new PyInt(1);
+            Assert.That(dict[key].As<string>(), Is.EqualTo("second"));
+        }
+    }
+}
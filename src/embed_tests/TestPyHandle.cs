@@ -0,0 +1,115 @@
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestPyHandle
+    {
+        [Test]
+        public void Operations()
+        {
+            using var scope = Py.CreateScope();
+            scope.Exec(@"
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+    def norm2(self):
+        return self.x * self.x + self.y * self.y
+");
+            using var pointType = PyHandle.From(scope.Get("Point"));
+            using var x = PyHandle.From(3);
+            using var y = PyHandle.From(4.0);
+            using var point = pointType.Invoke(x, y);
+
+            using var px = point.GetAttr("x");
+            Assert.That(px.As<int>(), Is.EqualTo(3));
+            using var norm2 = point.InvokeMethod("norm2");
+            Assert.That(norm2.As<double>(), Is.EqualTo(25.0));
+
+            using var text = PyHandle.From("spam");
+            point.SetAttr("name", text);
+            using var name = point.GetAttr("name");
+            Assert.That(name.As<string>(), Is.EqualTo("spam"));
+            Assert.That(name.ToString(), Is.EqualTo("spam"));
+
+            Assert.Throws<PythonException>(() => point.GetAttr("z"));
+            Assert.Throws<InvalidCastException>(() => text.As<int>());
+        }
+
+        [Test]
+        public void Items()
+        {
+            using var list = PyHandle.From(new PyList(new PyObject[] { new PyInt(1), new PyInt(2) }));
+            using var second = list.GetItem(1);
+            Assert.That(second.As<long>(), Is.EqualTo(2));
+            using var index = PyHandle.From(0);
+            using var value = PyHandle.From(10);
+            list.SetItem(index, value);
+            using var first = list.GetItem(index);
+            Assert.That(first.As<int>(), Is.EqualTo(10));
+
+            using var dict = PyHandle.From(new PyDict());
+            using var key = PyHandle.From("key");
+            dict.SetItem(key, value);
+            using var item = dict.GetItem("key");
+            Assert.That(item.As<int>(), Is.EqualTo(10));
+            Assert.Throws<PythonException>(() => dict.GetItem("missing"));
+        }
+
+        [Test]
+        public void PyObjectRoundTrip()
+        {
+            using var original = new PyString("round trip");
+            long refcount = original.Refcount;
+
+            var handle = PyHandle.From(original);
+            Assert.That(original.Refcount, Is.EqualTo(refcount + 1));
+
+            using (var copy = handle.ToPyObject())
+            {
+                Assert.That(PythonReferenceComparer.Instance.Equals(copy, original), Is.True);
+                Assert.That(original.Refcount, Is.EqualTo(refcount + 2));
+            }
+
+            using var moved = handle.MoveToPyObject();
+            Assert.That(handle.IsNull, Is.True);
+            Assert.That(original.Refcount, Is.EqualTo(refcount + 1));
+            moved.Dispose();
+            Assert.That(original.Refcount, Is.EqualTo(refcount));
+        }
+
+        [Test]
+        public void UsingHandleToPyObject()
+        {
+            using var original = new PyString("using");
+            long refcount = original.Refcount;
+
+            using (var handle = PyHandle.From(original))
+            {
+                // MoveToPyObject would only clear a copy of a using variable
+                using var copy = handle.ToPyObject();
+                Assert.That(original.Refcount, Is.EqualTo(refcount + 2));
+            }
+            Assert.That(original.Refcount, Is.EqualTo(refcount));
+        }
+
+        [Test]
+        public void Dispose()
+        {
+            using var original = new PyString("disposed");
+            long refcount = original.Refcount;
+
+            var handle = PyHandle.From(original);
+            handle.Dispose();
+            Assert.That(handle.IsNull, Is.True);
+            Assert.That(original.Refcount, Is.EqualTo(refcount));
+
+            // disposing twice is harmless
+            handle.Dispose();
+            Assert.Throws<ObjectDisposedException>(() => handle.GetAttr("upper"));
+            Assert.That(default(PyHandle).ToString(), Is.Null);
+        }
+    }
+}
@@ -156,5 +156,34 @@ namespace Python.EmbeddingTest
             Assert.That(result[1], Is.EqualTo("bar"));
             Assert.That(result[2], Is.EqualTo("baz"));
         }
+
+        [Test]
+        public void TestFromArray()
+        {
+            using var list = PyList.From(new[] { 1, 2, 3 });
+
+            Assert.That(list.Length(), Is.EqualTo(3));
+            Assert.That(list[2].As<int>(), Is.EqualTo(3));
+        }
+
+        [Test]
+        public void TestFromArraySegment()
+        {
+            var items = new[] { 1.5, 2.5, 3.5, 4.5 };
+            using var list = PyList.From(new ArraySegment<double>(items, 1, 2));
+
+            Assert.That(list.Length(), Is.EqualTo(2));
+            Assert.That(list[0].As<double>(), Is.EqualTo(2.5));
+            Assert.That(list[1].As<double>(), Is.EqualTo(3.5));
+        }
+
+        [Test]
+        public void TestFromReadOnlyList()
+        {
+            using var list = PyList.From(new List<string> { "foo", null });
+
+            Assert.That(list[0].ToString(), Is.EqualTo("foo"));
+            Assert.That(list[1].IsNone(), Is.True);
+        }
     }
 }
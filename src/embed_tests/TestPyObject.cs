@@ -83,6 +83,36 @@ a = MemberNamesTest()
             Assert.That(typeErrResult.Type, Is.EqualTo(Exceptions.TypeError));
         }
 
+        [Test]
+        public void InvokeVectorcall()
+        {
+            using var scope = Py.CreateScope();
+            scope.Exec(@"
+class Summer:
+    def total(self, *args, scale=1):
+        return sum(args) * scale
+summer = Summer()
+");
+            using var summer = scope.Get("summer");
+            using var total = summer.GetAttr("total");
+            var args = Enumerable.Range(1, 20).Select(i => new PyInt(i)).ToArray<PyObject>();
+            using var scale = Py.kw("scale", 2);
+
+            Assert.That(total.Invoke(args[0], args[1]).As<int>(), Is.EqualTo(3));
+            Assert.That(total.Invoke(args).As<int>(), Is.EqualTo(210));
+            Assert.That(total.Invoke(args, scale).As<int>(), Is.EqualTo(420));
+            Assert.That(summer.InvokeMethod("total", args[0], args[1]).As<int>(), Is.EqualTo(3));
+            Assert.That(summer.InvokeMethod("total", args).As<int>(), Is.EqualTo(210));
+            using var name = new PyString("total");
+            Assert.That(summer.InvokeMethod(name, args).As<int>(), Is.EqualTo(210));
+            Assert.That(summer.InvokeMethod("total", args, scale).As<int>(), Is.EqualTo(420));
+            Assert.That(scale.Length(), Is.EqualTo(1));
+
+            var missing = Assert.Throws<PythonException>(() => summer.InvokeMethod("missing", args[0]));
+            Assert.That(missing.Type, Is.EqualTo(Exceptions.AttributeError));
+            Assert.Throws<ArgumentNullException>(() => summer.InvokeMethod("total", new PyObject[] { null }));
+        }
+
         // regression test from https://github.com/pythonnet/pythonnet/issues/1642
         [Test]
         public void InheritedMethodsAutoacquireGIL()
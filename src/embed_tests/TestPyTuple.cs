@@ -153,5 +153,25 @@ namespace Python.EmbeddingTest
             Assert.That(ex.Message, Is.EqualTo("'int' object is not iterable"));
             Assert.IsNull(t);
         }
+
+        [Test]
+        public void TestCreateFromArray()
+        {
+            using var t = PyTuple.Create(new long[] { 1, 2, long.MaxValue });
+
+            Assert.That(t.Length(), Is.EqualTo(3));
+            Assert.That(t[2].As<long>(), Is.EqualTo(long.MaxValue));
+        }
+
+        [Test]
+        public void TestCreateFromValues()
+        {
+            using var t = PyTuple.Create(1, "two", 3.0);
+
+            Assert.That(t.Length(), Is.EqualTo(3));
+            Assert.That(t[0].As<int>(), Is.EqualTo(1));
+            Assert.That(t[1].As<string>(), Is.EqualTo("two"));
+            Assert.That(t[2].As<double>(), Is.EqualTo(3.0));
+        }
     }
 }
@@ -0,0 +1,137 @@
+using System;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+
+using NUnit.Framework;
+
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestPythonExecutor
+    {
+        IntPtr threadState;
+
+        [SetUp]
+        public void SetUp()
+        {
+            // the executor threads need the GIL
+            threadState = PythonEngine.BeginAllowThreads();
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            PythonEngine.EndAllowThreads(threadState);
+        }
+
+        [Test]
+        public void DispatchReturnsResult()
+        {
+            var result = PythonEngine.Dispatch(() => PythonEngine.Eval("40 + 2").As<int>());
+            Assert.AreEqual(42, result.Result);
+        }
+
+        [Test]
+        public void RunsSubmittedWorkFromManyThreads()
+        {
+            using var executor = PythonEngine.CreateExecutor(threadCount: 2, capacity: 8);
+            var results = Enumerable.Range(0, 16).AsParallel()
+                .Select(i => executor.Run(() => PythonEngine.Eval($"{i} * 2").As<int>()))
+                .ToArray();
+
+            Task.WaitAll(results);
+            CollectionAssert.AreEquivalent(Enumerable.Range(0, 16).Select(i => i * 2),
+                                           results.Select(task => task.Result));
+        }
+
+        [Test]
+        public void UnwrapsAsyncResults()
+        {
+            using var executor = PythonEngine.CreateExecutor();
+            Task<int> result = executor.Run(async () =>
+            {
+                int value = PythonEngine.Eval("40 + 2").As<int>();
+                await Task.Yield();
+                return value;
+            });
+            Assert.AreEqual(42, result.Result);
+
+            Task failed = executor.Run(async () =>
+            {
+                await Task.Yield();
+                throw new InvalidOperationException();
+            });
+            var error = Assert.Throws<AggregateException>(() => failed.Wait());
+            Assert.IsInstanceOf<InvalidOperationException>(error.InnerException);
+        }
+
+        [Test]
+        public void PythonErrorsFaultTheTask()
+        {
+            using var executor = PythonEngine.CreateExecutor();
+            var task = executor.Run(() => PythonEngine.Eval("1 / 0"));
+
+            var error = Assert.Throws<AggregateException>(() => task.Wait());
+            Assert.IsInstanceOf<PythonException>(error.InnerException);
+            // the executor is still usable
+            Assert.AreEqual(2, executor.Run(() => 2).Result);
+        }
+
+        [Test]
+        public void NestedRunIsInline()
+        {
+            using var executor = PythonEngine.CreateExecutor(capacity: 1);
+            var result = executor.Run(() => executor.Run(() => 5).Result);
+            Assert.AreEqual(5, result.Result);
+        }
+
+        [Test]
+        public void CancelsQueuedWork()
+        {
+            using var executor = PythonEngine.CreateExecutor(capacity: 1);
+            using var gate = new ManualResetEventSlim();
+            using var cancellation = new CancellationTokenSource();
+            var blocker = executor.Run(() => gate.Wait());
+            bool ran = false;
+            while (executor.PendingCount > 0) Thread.Yield();
+
+            var queued = executor.Run(() => ran = true, cancellation.Token);
+            cancellation.Cancel();
+            gate.Set();
+            blocker.Wait();
+
+            Assert.IsTrue(queued.IsCanceled);
+            Assert.AreEqual(0, executor.Run(() => 0).Result);
+            Assert.IsFalse(ran);
+        }
+
+        [Test]
+        public void CancelsBlockedSubmission()
+        {
+            using var executor = PythonEngine.CreateExecutor(capacity: 1);
+            using var gate = new ManualResetEventSlim();
+            var blocker = executor.Run(() => gate.Wait());
+            var queued = executor.Run(() => 1);
+
+            using var cancellation = new CancellationTokenSource(TimeSpan.FromMilliseconds(100));
+            var rejected = executor.Run(() => 2, cancellation.Token);
+            gate.Set();
+
+            Assert.IsTrue(rejected.IsCanceled);
+            Assert.AreEqual(1, queued.Result);
+        }
+
+        [Test]
+        public void DisposeRunsQueuedWork()
+        {
+            var executor = PythonEngine.CreateExecutor();
+            var tasks = Enumerable.Range(0, 10).Select(i => executor.Run(() => i)).ToArray();
+            executor.Dispose();
+
+            Assert.IsTrue(tasks.All(task => task.IsCompleted));
+            Assert.Throws<ObjectDisposedException>(() => executor.Run(() => 0));
+        }
+    }
+}
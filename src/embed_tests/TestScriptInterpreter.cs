@@ -0,0 +1,125 @@
+using System;
+using System.Linq;
+using System.Threading.Tasks;
+
+using NUnit.Framework;
+
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestScriptInterpreter
+    {
+        [SetUp]
+        public void SetUp()
+        {
+            if (Runtime.Runtime.PyVersion < new Version(3, 12))
+            {
+                Assert.Ignore("Script interpreters require Python 3.12 or later");
+            }
+        }
+
+        [Test]
+        public void ExecAndEval()
+        {
+            using var interpreter = PythonEngine.CreateScriptInterpreter();
+            interpreter.Exec("x = 40");
+            Assert.AreEqual(42L, interpreter.Eval("x + 2"));
+        }
+
+        [Test]
+        public void EvalReturnsPlainValues()
+        {
+            using var interpreter = PythonEngine.CreateScriptInterpreter();
+            Assert.IsNull(interpreter.Eval("None"));
+            Assert.AreEqual(true, interpreter.Eval("1 < 2"));
+            Assert.AreEqual(0.5, interpreter.Eval("1 / 2"));
+            Assert.AreEqual("spam", interpreter.Eval("'sp' + 'am'"));
+
+            Assert.Throws<NotSupportedException>(() => interpreter.Eval("[1, 2]"));
+            var error = Assert.Throws<ScriptInterpreterException>(() => interpreter.Eval("2 ** 64"));
+            Assert.AreEqual("OverflowError", error.PythonTypeName);
+        }
+
+        [Test]
+        public void StateIsNotShared()
+        {
+            using var first = PythonEngine.CreateScriptInterpreter();
+            using var second = PythonEngine.CreateScriptInterpreter();
+            first.Exec("import sys; sys.isolated_marker = 1");
+
+            Assert.AreEqual(false, second.Eval("hasattr(__import__('sys'), 'isolated_marker')"));
+            using (Py.GIL())
+            {
+                using var sys = Py.Import("sys");
+                Assert.IsFalse(sys.HasAttr("isolated_marker"));
+            }
+        }
+
+        [Test]
+        public void PythonErrorsAreTranslated()
+        {
+            using var interpreter = PythonEngine.CreateScriptInterpreter();
+            var error = Assert.Throws<ScriptInterpreterException>(
+                () => interpreter.Exec("raise ValueError('boom')"));
+            Assert.AreEqual("ValueError", error.PythonTypeName);
+            Assert.AreEqual("ValueError: boom", error.Message);
+            StringAssert.Contains("Traceback", error.PythonTraceback);
+
+            // the interpreter is still usable
+            Assert.AreEqual(2L, interpreter.Eval("1 + 1"));
+        }
+
+        [Test]
+        public void ClrCanNotBeImported()
+        {
+            using var interpreter = PythonEngine.CreateScriptInterpreter();
+            var error = Assert.Throws<ScriptInterpreterException>(
+                () => interpreter.Exec("import clr"));
+            Assert.AreEqual("ModuleNotFoundError", error.PythonTypeName);
+        }
+
+        [Test]
+        public void CanBeCreatedWhileHoldingGIL()
+        {
+            using (Py.GIL())
+            {
+                using var interpreter = PythonEngine.CreateScriptInterpreter();
+                Assert.AreEqual(2L, interpreter.Eval("1 + 1"));
+                Assert.AreEqual(2, PythonEngine.Eval("1 + 1").As<int>());
+            }
+        }
+
+        [Test]
+        public void RunsConcurrently()
+        {
+            var interpreters = Enumerable.Range(0, 4)
+                .Select(_ => PythonEngine.CreateScriptInterpreter())
+                .ToArray();
+            try
+            {
+                var results = Task.WhenAll(interpreters.Select((interpreter, i) => Task.Run(
+                    () => interpreter.Eval($"sum(range({i * 100_000}))")))).Result;
+                for (int i = 0; i < results.Length; i++)
+                {
+                    long n = i * 100_000L;
+                    Assert.AreEqual(n * (n - 1) / 2, results[i]);
+                }
+            }
+            finally
+            {
+                foreach (var interpreter in interpreters)
+                    interpreter.Dispose();
+            }
+        }
+
+        [Test]
+        public void DisposedInterpreterThrows()
+        {
+            var interpreter = PythonEngine.CreateScriptInterpreter();
+            interpreter.Dispose();
+            interpreter.Dispose();
+            Assert.Throws<ObjectDisposedException>(() => interpreter.Exec("pass"));
+        }
+    }
+}
@@ -0,0 +1,107 @@
+using System;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestThreadStatePool
+    {
+        [TearDown]
+        public void TearDown()
+        {
+            PythonEngine.ThreadStatePool.Enable = false;
+            PythonEngine.ThreadStatePool.MaxSize = 256;
+        }
+
+        static void CallFromThreadPool(int times)
+        {
+            // the thread pool threads need the GIL
+            IntPtr threadState = PythonEngine.BeginAllowThreads();
+            try
+            {
+                for (int i = 0; i < times; i++)
+                {
+                    Task.Run(() =>
+                    {
+                        using var _ = Py.GIL();
+                        PythonEngine.Eval("1 + 1").Dispose();
+                    }).Wait();
+                }
+            }
+            finally
+            {
+                PythonEngine.EndAllowThreads(threadState);
+            }
+        }
+
+        [Test]
+        public void ReusesThreadStates()
+        {
+            var before = PythonEngine.ThreadStatePool.GetStatistics();
+            PythonEngine.ThreadStatePool.Enable = true;
+
+            CallFromThreadPool(100);
+
+            var after = PythonEngine.ThreadStatePool.GetStatistics();
+            long created = after.Created - before.Created;
+            long reused = after.Reused - before.Reused;
+            Assert.That(created + reused, Is.GreaterThanOrEqualTo(100));
+            Assert.That(reused, Is.GreaterThan(0));
+            Assert.That(after.Count, Is.LessThanOrEqualTo(PythonEngine.ThreadStatePool.MaxSize));
+        }
+
+        [Test]
+        public void ReleasesThreadStatesOfExitedThreads()
+        {
+            var before = PythonEngine.ThreadStatePool.GetStatistics();
+            IntPtr threadState = IntPtr.Zero;
+            var thread = new Thread(() =>
+            {
+                var state = Runtime.Runtime.PyGILState_Ensure();
+                // keep the thread state after the thread exits, like the pool does
+                Runtime.Runtime.PyGILState_Ensure();
+                threadState = PythonEngine.BeginAllowThreads();
+                PythonEngine.EndAllowThreads(threadState);
+                Runtime.Runtime.PyGILState_Release(state);
+            });
+
+            IntPtr ts = PythonEngine.BeginAllowThreads();
+            try
+            {
+                thread.Start();
+                thread.Join();
+                PythonEngine.ThreadStatePool.ReleaseExited(threadState);
+
+                var timeout = Stopwatch.StartNew();
+                while (PythonEngine.ThreadStatePool.GetStatistics().Released == before.Released
+                       && timeout.Elapsed < TimeSpan.FromSeconds(10))
+                {
+                    Thread.Sleep(10);
+                }
+            }
+            finally
+            {
+                PythonEngine.EndAllowThreads(ts);
+            }
+
+            var after = PythonEngine.ThreadStatePool.GetStatistics();
+            Assert.AreEqual(before.Released + 1, after.Released);
+            // the reaper left this thread's own thread state intact
+            Assert.AreEqual(2, PythonEngine.Eval("1 + 1").As<int>());
+        }
+
+        [Test]
+        public void DisabledPoolKeepsNothing()
+        {
+            var before = PythonEngine.ThreadStatePool.GetStatistics();
+
+            CallFromThreadPool(10);
+
+            var after = PythonEngine.ThreadStatePool.GetStatistics();
+            Assert.AreEqual(before.Created, after.Created);
+        }
+    }
+}
@@ -0,0 +1,20 @@
+using System;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Marks a <see cref="PyObject"/> parameter of a method, constructor or
+    /// delegate called from Python, whose argument is only used during the call.
+    /// </summary>
+    /// <remarks>
+    /// The argument is passed as a <see cref="PyObject"/>, that borrows the
+    /// reference of the caller, instead of a new wrapper, that owns a reference
+    /// and is released by the <see cref="Finalizer"/>. The argument is disposed
+    /// when the call returns, so it must not be stored or used by other threads
+    /// afterwards; use <see cref="PyObject.NewReference"/> to keep the object.
+    /// </remarks>
+    [AttributeUsage(AttributeTargets.Parameter, AllowMultiple = false, Inherited = false)]
+    public sealed class BorrowedAttribute : Attribute
+    {
+    }
+}
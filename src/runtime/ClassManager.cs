@@ -1,11 +1,14 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Diagnostics;
+using System.Dynamic;
 using System.Linq;
 using System.Reflection;
 using System.Runtime.InteropServices;
 using System.Security;
 
+using Python.Runtime.Slots;
 using Python.Runtime.StateSerialization;
 
 namespace Python.Runtime
@@ -33,7 +36,11 @@ namespace Python.Runtime
                                                              BindingFlags.Public |
                                                              BindingFlags.NonPublic;
 
-        internal static Dictionary<MaybeType, ReflectedClrType> cache = new(capacity: 128);
+        internal static ConcurrentDictionary<MaybeType, ReflectedClrType> cache = new();
+        /// <summary>
+        /// Set from <see cref="InteropConfiguration.LazyMemberReflection"/> when the engine is initialized.
+        /// </summary>
+        internal static bool ReflectMembersLazily;
         private static readonly Type dtype;
 
         private ClassManager()
@@ -103,13 +110,13 @@ namespace Python.Runtime
             return new()
             {
                 Contexts = contexts,
-                Cache = cache,
+                Cache = new Dictionary<MaybeType, ReflectedClrType>(cache),
             };
         }
 
         internal static void RestoreRuntimeData(ClassManagerState storage)
         {
-            cache = storage.Cache;
+            cache = new ConcurrentDictionary<MaybeType, ReflectedClrType>(storage.Cache);
             var invalidClasses = new List<KeyValuePair<MaybeType, ReflectedClrType>>();
             var contexts = storage.Contexts;
             foreach (var pair in cache)
@@ -217,23 +224,41 @@ namespace Python.Runtime
             impl.richcompare.Clear();
 
 
-            // Finally, initialize the class __dict__ and return the object.
-            using var newDict = Runtime.PyObject_GenericGetDict(pyType.Reference);
-            BorrowedReference dict = newDict.Borrow();
-
+            var lazyMembers = ReflectMembersLazily && CanReflectMembersLazily(type, impl)
+                ? new ConcurrentDictionary<string, Func<PyObject>>()
+                : null;
+            // nested types must be created before the class __dict__
+            var members = new List<KeyValuePair<string, PyObject>>(info.members.Count);
             foreach (var iter in info.members)
             {
-                var item = iter.Value;
                 var name = iter.Key;
-                impl.dotNetMembers.Add(name);
-                Runtime.PyDict_SetItemString(dict, name, item);
-                if (ClassBase.CilToPyOpMap.TryGetValue(name, out var pyOp)
-                    // workaround for unintialized types crashing in GetManagedObject
-                    && item is not ReflectedClrType
-                    && ManagedType.GetManagedObject(item) is MethodObject method)
+                if (lazyMembers is not null && CanReflectLazily(name)
+                    && !IsInheritedName(pyType, name))
                 {
-                    impl.richcompare.Add(pyOp, method);
+                    lazyMembers[name] = iter.Value;
                 }
+                else
+                {
+                    members.Add(new(name, iter.Value()));
+                }
+            }
+
+            // Finally, initialize the class __dict__ and return the object.
+            using var newDict = Runtime.PyObject_GenericGetDict(pyType.Reference);
+            BorrowedReference dict = newDict.Borrow();
+
+            PyObject? init = null;
+            foreach (var iter in members)
+            {
+                if (iter.Key == "__init__") init = iter.Value;
+                AddMember(impl, dict, iter.Key, iter.Value);
+            }
+            impl.collectionSlots = CollectionSlots.For(type, impl.indexer);
+            impl.collectionSlots?.AddMethods(dict);
+            impl.lazyMembers = lazyMembers;
+            if (lazyMembers is not null)
+            {
+                ClassBase.AddLazyDir(dict);
             }
 
             // If class has constructors, generate an __doc__ attribute.
@@ -259,10 +284,10 @@ namespace Python.Runtime
                     {
                         // HACK: __init__ points to instance constructors.
                         // When unbound they fully instantiate object, so we get overloads for free from MethodBinding.
-                        var init = info.members["__init__"];
+                        Debug.Assert(init is not null);
                         // TODO: deprecate __overloads__ soon...
-                        Runtime.PyDict_SetItem(dict, PyIdentifier.__overloads__, init);
-                        Runtime.PyDict_SetItem(dict, PyIdentifier.Overloads, init);
+                        Runtime.PyDict_SetItem(dict, PyIdentifier.__overloads__, init!);
+                        Runtime.PyDict_SetItem(dict, PyIdentifier.Overloads, init!);
                     }
 
                     // don't generate the docstring if one was already set from a DocStringAttribute.
@@ -289,6 +314,84 @@ namespace Python.Runtime
             Runtime.PyType_Modified(pyType.Reference);
         }
 
+        static void AddMember(ClassBase impl, BorrowedReference dict, string name, PyObject item)
+        {
+            impl.dotNetMembers.Add(name);
+            Runtime.PyDict_SetItemString(dict, name, item);
+            if (ClassBase.CilToPyOpMap.TryGetValue(name, out var pyOp)
+                // workaround for unintialized types crashing in GetManagedObject
+                && item is not ReflectedClrType
+                && ManagedType.GetManagedObject(item) is MethodObject method)
+            {
+                impl.richcompare.Add(pyOp, method);
+            }
+        }
+
+        /// <summary>
+        /// Adds a member, that was not reflected by <see cref="InitClassBase"/>,
+        /// to the __dict__ of its class, unless the class already has a member
+        /// with that name.
+        /// </summary>
+        internal static void AddLazyMember(ClassBase impl, BorrowedReference pyType, string name, Func<PyObject> member)
+        {
+            BorrowedReference dict = Util.ReadRef(pyType, TypeOffset.tp_dict);
+            if (Runtime.PyDict_GetItemString(dict, name).IsNull)
+            {
+                AddMember(impl, dict, name, member());
+            }
+            Runtime.PyType_Modified(pyType);
+        }
+
+        /// <summary>
+        /// Members of dynamic types are looked up by their own tp_getattro,
+        /// and Python code in classes derived from Python, that overrides them,
+        /// expects them in the base class __dict__.
+        /// </summary>
+        static bool CanReflectMembersLazily(Type type, ClassBase impl)
+            => impl is not ClassDerivedObject
+               && !typeof(IDynamicMetaObjectProvider).IsAssignableFrom(type);
+
+        /// <summary>
+        /// Special methods are looked up on the type by the interpreter,
+        /// and comparison operators are bound to tp_richcompare.
+        /// </summary>
+        static bool CanReflectLazily(string name)
+            => !name.StartsWith("__") && !ClassBase.CilToPyOpMap.ContainsKey(name);
+
+        /// <summary>
+        /// A member, that hides a member of a base class, that is already in
+        /// the __dict__ of that base class, must not be reflected lazily,
+        /// because the base class member would be found first.
+        /// </summary>
+        static bool IsInheritedName(BorrowedReference pyType, string name)
+        {
+            using var pyName = Runtime.PyString_FromString(name);
+            BorrowedReference bases = Util.ReadRef(pyType, TypeOffset.tp_bases);
+            if (bases.IsNull)
+            {
+                BorrowedReference @base = Util.ReadRef(pyType, TypeOffset.tp_base);
+                return !@base.IsNull && HasAttr(@base, pyName.BorrowOrThrow());
+            }
+
+            nint count = Runtime.PyTuple_Size(bases);
+            for (nint i = 0; i < count; i++)
+            {
+                if (HasAttr(Runtime.PyTuple_GetItem(bases, i), pyName.BorrowOrThrow())) return true;
+            }
+            return false;
+
+            static bool HasAttr(BorrowedReference type, BorrowedReference name)
+            {
+                if (Util.ReadRef(type, TypeOffset.tp_mro).IsNull)
+                {
+                    // base type is being initialized
+                    return !Runtime.PyDict_GetItem(Util.ReadRef(type, TypeOffset.tp_dict), name).IsNull;
+                }
+                // static types, like object, have no tp_dict since Python 3.12
+                return !Runtime._PyType_Lookup(type, name).IsNull;
+            }
+        }
+
         internal static bool ShouldBindMethod(MethodBase mb)
         {
             if (mb is null) throw new ArgumentNullException(nameof(mb));
@@ -337,7 +440,6 @@ namespace Python.Runtime
             var ci = new ClassInfo();
             var methods = new Dictionary<string, List<MethodBase>>();
             MethodInfo meth;
-            ExtensionType ob;
             string name;
             Type tp;
             int i, n;
@@ -491,8 +593,7 @@ namespace Python.Runtime
                             continue;
                         }
 
-                        ob = new PropertyObject(pi);
-                        ci.members[pi.Name] = ob.AllocObject();
+                        ci.members[pi.Name] = () => new PropertyObject(pi).AllocObject();
                         continue;
 
                     case MemberTypes.Field:
@@ -501,8 +602,7 @@ namespace Python.Runtime
                         {
                             continue;
                         }
-                        ob = new FieldObject(fi);
-                        ci.members[mi.Name] = ob.AllocObject();
+                        ci.members[mi.Name] = () => new FieldObject(fi).AllocObject();
                         continue;
 
                     case MemberTypes.Event:
@@ -511,10 +611,9 @@ namespace Python.Runtime
                         {
                             continue;
                         }
-                        ob = ei.AddMethod.IsStatic
+                        ci.members[ei.Name] = () => (ei.AddMethod.IsStatic
                             ? new EventBinding(ei)
-                            : new EventObject(ei);
-                        ci.members[ei.Name] = ob.AllocObject();
+                            : (ExtensionType)new EventObject(ei)).AllocObject();
                         continue;
 
                     case MemberTypes.NestedType:
@@ -524,29 +623,32 @@ namespace Python.Runtime
                         {
                             continue;
                         }
-                        // Note the given instance might be uninitialized
-                        var pyType = GetClass(tp);
-                        // make a copy, that could be disposed later
-                        ci.members[mi.Name] = new ReflectedClrType(pyType);
+                        var nested = tp;
+                        ci.members[mi.Name] = () =>
+                        {
+                            // Note the given instance might be uninitialized
+                            var pyType = GetClass(nested);
+                            // make a copy, that could be disposed later
+                            return new ReflectedClrType(pyType);
+                        };
                         continue;
                 }
             }
 
             foreach (var iter in methods)
             {
-                name = iter.Key;
+                string methodName = iter.Key;
                 var mlist = iter.Value.ToArray();
 
-                ob = new MethodObject(type, name, mlist);
-                ci.members[name] = ob.AllocObject();
-                if (name == nameof(IDictionary<int, int>.Remove)
+                ci.members[methodName] = () => new MethodObject(type, methodName, mlist).AllocObject();
+                if (methodName == nameof(IDictionary<int, int>.Remove)
                     && mlist.Any(m => m.DeclaringType?.GetInterfaces()
                         .Any(i => i.TryGetGenericDefinition() == typeof(IDictionary<,>)) is true))
                 {
                     ci.del = new();
                     ci.del.AddRange(mlist.Where(m => !m.IsStatic));
                 }
-                else if (name == nameof(IList<int>.RemoveAt)
+                else if (methodName == nameof(IList<int>.RemoveAt)
                          && mlist.Any(m => m.DeclaringType?.GetInterfaces()
                              .Any(i => i.TryGetGenericDefinition() == typeof(IList<>)) is true))
                 {
@@ -556,15 +658,15 @@ namespace Python.Runtime
 
                 if (mlist.Any(OperatorMethod.IsOperatorMethod))
                 {
-                    string pyName = OperatorMethod.GetPyMethodName(name);
+                    string pyName = OperatorMethod.GetPyMethodName(methodName);
                     string pyNameReverse = OperatorMethod.ReversePyMethodName(pyName);
                     OperatorMethod.FilterMethods(mlist, out var forwardMethods, out var reverseMethods);
                     // Only methods where the left operand is the declaring type.
                     if (forwardMethods.Length > 0)
-                        ci.members[pyName] = new MethodObject(type, name, forwardMethods).AllocObject();
+                        ci.members[pyName] = () => new OperatorMethodObject(type, methodName, forwardMethods).AllocObject();
                     // Only methods where only the right operand is the declaring type.
                     if (reverseMethods.Length > 0)
-                        ci.members[pyNameReverse] = new MethodObject(type, name, reverseMethods, argsReversed: true).AllocObject();
+                        ci.members[pyNameReverse] = () => new OperatorMethodObject(type, methodName, reverseMethods, argsReversed: true).AllocObject();
                 }
             }
 
@@ -591,14 +693,14 @@ namespace Python.Runtime
         }
 
         /// <summary>
-        /// This class owns references to PyObjects in the `members` member.
-        /// The caller has responsibility to DECREF them.
+        /// The `members` member creates the Python objects for the members of
+        /// the class. The caller has responsibility to DECREF them.
         /// </summary>
         private class ClassInfo
         {
             public Indexer? indexer;
             public MethodBinder? del;
-            public readonly Dictionary<string, PyObject> members = new();
+            public readonly Dictionary<string, Func<PyObject>> members = new();
 
             internal ClassInfo()
             {
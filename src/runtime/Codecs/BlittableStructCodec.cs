@@ -0,0 +1,351 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+
+namespace Python.Runtime.Codecs
+{
+    /// <summary>
+    /// Converts values of the blittable struct <typeparamref name="T"/> to
+    /// <c>ctypes.Structure</c> instances with the same memory layout, and
+    /// arrays of <typeparamref name="T"/> to <c>ctypes</c> arrays of them,
+    /// copying the memory in a single block instead of wrapping each value.
+    /// <para>Register it with <see cref="Register"/> to opt in.</para>
+    /// </summary>
+    /// <remarks>
+    /// <typeparamref name="T"/> must have sequential layout, and only contain
+    /// fields of blittable primitive types (not <see cref="bool"/> or <see cref="char"/>),
+    /// enums, fixed size buffers and other such structs.
+    /// <para>
+    /// The structure fields are named after the .NET fields. Arrays support
+    /// the buffer protocol, so <c>numpy.asarray</c> turns them into numpy
+    /// arrays with a structured dtype without copying. Any C-contiguous
+    /// buffer with items of the same format, and numpy arrays with the
+    /// same dtype, can be passed back to .NET where <typeparamref name="T"/>
+    /// or an array of <typeparamref name="T"/> is expected.
+    /// </para>
+    /// <para>
+    /// Values are copies: changes made from Python are not reflected
+    /// in the original .NET value.
+    /// </para>
+    /// </remarks>
+    public sealed class BlittableStructCodec<T> : IPyObjectEncoder, IPyObjectDecoder, IDisposable
+        where T : unmanaged
+    {
+        public static BlittableStructCodec<T> Instance { get; } = new();
+
+        PyType? structType;
+        string? structFormat;
+
+        BlittableStructCodec() { }
+
+        /// <summary>
+        /// Registers <see cref="Instance"/> as both encoder and decoder.
+        /// </summary>
+        /// <exception cref="NotSupportedException"><typeparamref name="T"/> is not a blittable sequential struct.</exception>
+        public static void Register()
+        {
+            CtypesLayout.Validate(typeof(T));
+            PyObjectConversions.RegisterEncoder(Instance);
+            PyObjectConversions.RegisterDecoder(Instance);
+        }
+
+        /// <summary>
+        /// Returns the <c>ctypes.Structure</c> subclass, that mirrors <typeparamref name="T"/>.
+        /// </summary>
+        public PyType GetPythonType()
+        {
+            if (structType is null)
+            {
+                using var _ = Py.EnterGIL();
+                if (structType is null)
+                {
+                    var type = CtypesLayout.CreateStructType(typeof(T));
+                    using (var instance = type.Invoke())
+                    using (var view = instance.GetBuffer(PyBUF.FORMATS))
+                    {
+                        structFormat = view.Format;
+                    }
+                    structType = type;
+                    CtypesLayout.Track(this);
+                }
+            }
+            return structType;
+        }
+
+        public bool CanEncode(Type type) => type == typeof(T) || type == typeof(T[]);
+
+        public unsafe PyObject? TryEncode(object value)
+        {
+            switch (value)
+            {
+                case T item:
+                {
+                    var result = GetPythonType().Invoke();
+                    CopyTo(result, &item, sizeof(T));
+                    return result;
+                }
+
+                case T[] items:
+                {
+                    using var arrayType = CtypesLayout.ArrayOf(GetPythonType(), items.Length);
+                    var result = arrayType.Invoke();
+                    fixed (T* source = items)
+                    {
+                        CopyTo(result, source, (long)sizeof(T) * items.Length);
+                    }
+                    return result;
+                }
+
+                default:
+                    return null;
+            }
+        }
+
+        public bool CanDecode(PyType objectType, Type targetType)
+            => (targetType == typeof(T) || targetType == typeof(T[]))
+               && Util.ReadIntPtr(objectType, TypeOffset.tp_as_buffer) != IntPtr.Zero;
+
+        public unsafe bool TryDecode<TTarget>(PyObject pyObj, out TTarget? value)
+        {
+            value = default;
+            if (typeof(TTarget) != typeof(T) && typeof(TTarget) != typeof(T[])) return false;
+
+            PyBuffer buffer;
+            try
+            {
+                buffer = pyObj.GetBuffer(PyBUF.C_CONTIGUOUS | PyBUF.FORMATS);
+            }
+            catch (PythonException)
+            {
+                return false;
+            }
+
+            using (buffer)
+            {
+                if (buffer.ItemSize != sizeof(T)) return false;
+                GetPythonType();
+                if (buffer.Format != structFormat && !HasStructDtype(pyObj)) return false;
+
+                if (typeof(TTarget) == typeof(T))
+                {
+                    if (buffer.Length != sizeof(T)) return false;
+                    T item = *(T*)buffer.Buffer;
+                    value = (TTarget)(object)item;
+                    return true;
+                }
+
+                var items = new T[buffer.Length / sizeof(T)];
+                fixed (T* destination = items)
+                {
+                    Buffer.MemoryCopy((void*)buffer.Buffer, destination, buffer.Length, buffer.Length);
+                }
+                value = (TTarget)(object)items;
+                return true;
+            }
+        }
+
+        /// <summary>
+        /// numpy exports structured arrays in its own format, that includes padding,
+        /// so compare their dtype to the one of the <c>ctypes</c> structure instead.
+        /// </summary>
+        bool HasStructDtype(PyObject pyObj)
+        {
+            if (!pyObj.HasAttr("dtype")) return false;
+            try
+            {
+                using var numpy = Py.Import("numpy");
+                using var expected = numpy.InvokeMethod("dtype", GetPythonType());
+                using var actual = pyObj.GetAttr("dtype");
+                return actual.Equals(expected);
+            }
+            catch (PythonException)
+            {
+                return false;
+            }
+        }
+
+        static unsafe void CopyTo(PyObject destination, void* source, long size)
+        {
+            using var buffer = destination.GetBuffer(PyBUF.WRITABLE);
+            Buffer.MemoryCopy(source, (void*)buffer.Buffer, buffer.Length, size);
+        }
+
+        /// <summary>
+        /// Releases the <c>ctypes.Structure</c> subclass. It is recreated on demand.
+        /// This is done automatically on <see cref="PythonEngine.Shutdown"/>.
+        /// </summary>
+        public void Dispose()
+        {
+            structType?.Dispose();
+            structType = null;
+            structFormat = null;
+        }
+    }
+
+    /// <summary>
+    /// Describes blittable .NET structs as <c>ctypes.Structure</c> subclasses.
+    /// </summary>
+    static class CtypesLayout
+    {
+        // codecs holding structure types, that must be released on shutdown
+        static readonly HashSet<IDisposable> owners = new();
+
+        internal static void Track(IDisposable owner)
+        {
+            lock (owners) owners.Add(owner);
+        }
+
+        internal static void Reset()
+        {
+            lock (owners)
+            {
+                foreach (var owner in owners)
+                {
+                    owner.Dispose();
+                }
+                owners.Clear();
+            }
+        }
+
+        static readonly Dictionary<Type, string> primitives = new()
+        {
+            [typeof(sbyte)] = "c_int8",
+            [typeof(byte)] = "c_uint8",
+            [typeof(short)] = "c_int16",
+            [typeof(ushort)] = "c_uint16",
+            [typeof(int)] = "c_int32",
+            [typeof(uint)] = "c_uint32",
+            [typeof(long)] = "c_int64",
+            [typeof(ulong)] = "c_uint64",
+            [typeof(float)] = "c_float",
+            [typeof(double)] = "c_double",
+            [typeof(IntPtr)] = "c_ssize_t",
+            [typeof(UIntPtr)] = "c_size_t",
+        };
+
+        static FieldInfo[] GetFields(Type type)
+            => type.GetFields(BindingFlags.Instance | BindingFlags.Public | BindingFlags.NonPublic);
+
+        /// <exception cref="NotSupportedException"><paramref name="type"/> can not be described.</exception>
+        internal static void Validate(Type type)
+        {
+            if (primitives.ContainsKey(type)) return;
+            if (type.IsEnum)
+            {
+                Validate(Enum.GetUnderlyingType(type));
+                return;
+            }
+            if (!type.IsValueType || type.IsPrimitive || !type.IsLayoutSequential)
+            {
+                throw new NotSupportedException($"{type} is not a blittable struct with sequential layout");
+            }
+            foreach (FieldInfo field in GetFields(type))
+            {
+                Validate(GetFixedBuffer(field)?.ElementType ?? field.FieldType);
+            }
+        }
+
+        internal static PyType CreateStructType(Type type)
+        {
+            Validate(type);
+
+            using var ctypes = Py.Import("ctypes");
+            using var fields = new PyList();
+            foreach (FieldInfo field in GetFields(type))
+            {
+                using var fieldType = GetFieldType(ctypes, field);
+                using var name = new PyString(GetFieldName(field));
+                using var entry = new PyTuple(new PyObject[] { name, fieldType });
+                fields.Append(entry);
+            }
+
+            using var structure = ctypes.GetAttr("Structure");
+            using var bases = new PyTuple(new PyObject[] { structure });
+            using var members = new PyDict();
+            using var module = new PyString(type.Namespace ?? "");
+            members["__module__"] = module;
+            using var typeName = new PyString(type.Name);
+            members["__qualname__"] = typeName;
+            int pack = type.StructLayoutAttribute?.Pack ?? 0;
+            if (pack != 0)
+            {
+                using var pyPack = new PyInt(pack);
+                members["_pack_"] = pyPack;
+                // .NET packing follows the MSVC rules on all platforms
+                using var layout = new PyString("ms");
+                members["_layout_"] = layout;
+            }
+            members["_fields_"] = fields;
+
+            using var metatype = structure.GetPythonType();
+            using var args = new PyTuple(new PyObject[] { typeName, bases, members });
+            using var created = metatype.Invoke(args);
+            var result = new PyType(created);
+
+            if (!LayoutMatches(ctypes, result, type))
+            {
+                result.Dispose();
+                throw new NotSupportedException($"ctypes layout of {type} does not match .NET layout");
+            }
+            return result;
+        }
+
+        static bool LayoutMatches(PyObject ctypes, PyType structType, Type type)
+        {
+            using (var size = ctypes.InvokeMethod("sizeof", structType))
+            {
+                if (size.As<int>() != Marshal.SizeOf(type)) return false;
+            }
+            foreach (FieldInfo field in GetFields(type))
+            {
+                using var descriptor = structType.GetAttr(GetFieldName(field));
+                using var offset = descriptor.GetAttr("offset");
+                if (offset.As<long>() != (long)Marshal.OffsetOf(type, field.Name)) return false;
+            }
+            return true;
+        }
+
+        /// <summary>Returns the <c>ctypes</c> array type <c>elementType * length</c>.</summary>
+        internal static PyObject ArrayOf(PyObject elementType, int length)
+        {
+            using var arrayType = Runtime.PySequence_Repeat(elementType, length);
+            PythonException.ThrowIfIsNull(arrayType);
+            return arrayType.MoveToPyObject();
+        }
+
+        static PyObject GetFieldType(PyObject ctypes, FieldInfo field)
+        {
+            if (GetFixedBuffer(field) is { } fixedBuffer)
+            {
+                using var elementType = GetCtype(ctypes, fixedBuffer.ElementType);
+                return ArrayOf(elementType, fixedBuffer.Length);
+            }
+            return GetCtype(ctypes, field.FieldType);
+        }
+
+        static PyObject GetCtype(PyObject ctypes, Type type)
+        {
+            if (type.IsEnum) type = Enum.GetUnderlyingType(type);
+            return primitives.TryGetValue(type, out string? name)
+                ? ctypes.GetAttr(name)
+                : CreateStructType(type);
+        }
+
+        static FixedBufferAttribute? GetFixedBuffer(FieldInfo field)
+            => field.GetCustomAttributes(typeof(FixedBufferAttribute), inherit: false)
+                    .Cast<FixedBufferAttribute>()
+                    .FirstOrDefault();
+
+        static string GetFieldName(FieldInfo field)
+        {
+            // auto-property backing fields are named <Name>k__BackingField
+            string name = field.Name;
+            return name.StartsWith("<") && name.IndexOf('>') is int end and > 1
+                ? name.Substring(1, end - 1)
+                : name;
+        }
+    }
+}
@@ -0,0 +1,50 @@
+using System;
+
+namespace Python.Runtime.Codecs
+{
+    /// <summary>
+    /// Encodes .NET dictionaries as Python dicts and other .NET collections
+    /// (arrays, lists, sets, etc) as Python lists, instead of wrapping them.
+    /// <para>Register it with <see cref="PyObjectConversions.RegisterEncoder"/> to opt in.</para>
+    /// </summary>
+    /// <remarks>
+    /// Python lists and dicts are copies: changes made to them from Python
+    /// are not reflected in the original .NET collection.
+    /// Lazy sequences (<see cref="System.Collections.IEnumerable"/> without
+    /// a known size) are not encoded, use <c>clr.to_pylist</c> for them.
+    /// </remarks>
+    public sealed class CollectionEncoder : IPyObjectEncoder
+    {
+        public static CollectionEncoder Instance { get; } = new();
+
+        CollectionEncoder() { }
+
+        public bool CanEncode(Type type)
+            => type == typeof(object)
+               || CollectionConverter.IsDictionary(type)
+               || CollectionConverter.IsCollection(type);
+
+        public PyObject? TryEncode(object value)
+        {
+            if (value is null) return null;
+
+            Type type = value.GetType();
+            NewReference result;
+            if (CollectionConverter.IsDictionary(type))
+            {
+                result = CollectionConverter.ToPyDict(value);
+            }
+            else if (CollectionConverter.IsCollection(type) && type != typeof(string))
+            {
+                result = CollectionConverter.ToPyList(value);
+            }
+            else
+            {
+                return null;
+            }
+
+            if (result.IsNull()) throw PythonException.ThrowLastAsClrException();
+            return result.MoveToPyObject();
+        }
+    }
+}
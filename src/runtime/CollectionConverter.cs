@@ -0,0 +1,329 @@
+using System;
+using System.Collections;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Collections.ObjectModel;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Converts .NET collections to Python lists and dicts in bulk.
+    /// </summary>
+    /// <remarks>
+    /// The element type is inspected once per collection type. Elements of
+    /// primitive types are converted without boxing, and lists with a known
+    /// size are preallocated.
+    /// </remarks>
+    internal static class CollectionConverter
+    {
+        delegate NewReference CollectionToPython(object collection);
+
+        static readonly ConcurrentDictionary<Type, CollectionToPython?> listConverters = new();
+        static readonly ConcurrentDictionary<Type, CollectionToPython?> dictConverters = new();
+
+        static readonly MethodInfo listFromIList = GetConverterMethod(nameof(ListFromIList));
+        static readonly MethodInfo listFromReadOnlyList = GetConverterMethod(nameof(ListFromReadOnlyList));
+        static readonly MethodInfo listFromCollection = GetConverterMethod(nameof(ListFromCollection));
+        static readonly MethodInfo listFromReadOnlyCollection = GetConverterMethod(nameof(ListFromReadOnlyCollection));
+        static readonly MethodInfo listFromEnumerable = GetConverterMethod(nameof(ListFromEnumerable));
+        static readonly MethodInfo dictFromPairs = GetConverterMethod(nameof(DictFromPairs));
+
+        /// <summary>
+        /// Returns <c>true</c> if <paramref name="type"/> can be converted
+        /// by <see cref="ToPyList"/>.
+        /// </summary>
+        internal static bool IsList(Type type)
+            => type != typeof(string) && typeof(IEnumerable).IsAssignableFrom(type);
+
+        /// <summary>
+        /// Returns <c>true</c> if <paramref name="type"/> is a collection with a known size.
+        /// </summary>
+        internal static bool IsCollection(Type type)
+            => typeof(ICollection).IsAssignableFrom(type)
+               || FindGenericInterface(type, typeof(ICollection<>)) is not null
+               || FindGenericInterface(type, typeof(IReadOnlyCollection<>)) is not null;
+
+        /// <summary>
+        /// Returns <c>true</c> if <paramref name="type"/> can be converted
+        /// by <see cref="ToPyDict"/>.
+        /// </summary>
+        internal static bool IsDictionary(Type type)
+            => typeof(IDictionary).IsAssignableFrom(type)
+               || FindGenericInterface(type, typeof(IDictionary<,>)) is not null
+               || FindGenericInterface(type, typeof(IReadOnlyDictionary<,>)) is not null;
+
+        /// <summary>
+        /// Converts the items of an <see cref="IEnumerable"/> to a new Python list.
+        /// </summary>
+        internal static NewReference ToPyList(object collection)
+        {
+            if (collection is null) throw new ArgumentNullException(nameof(collection));
+
+            var convert = listConverters.GetOrAdd(collection.GetType(), CreateListConverter);
+            if (convert is null)
+            {
+                return Exceptions.RaiseTypeError($"{collection.GetType()} is not enumerable");
+            }
+            return convert(collection);
+        }
+
+        /// <summary>
+        /// Converts the entries of a .NET dictionary to a new Python dict.
+        /// </summary>
+        internal static NewReference ToPyDict(object dictionary)
+        {
+            if (dictionary is null) throw new ArgumentNullException(nameof(dictionary));
+
+            var convert = dictConverters.GetOrAdd(dictionary.GetType(), CreateDictConverter);
+            if (convert is null)
+            {
+                return Exceptions.RaiseTypeError($"{dictionary.GetType()} is not a dictionary");
+            }
+            return convert(dictionary);
+        }
+
+        /// <summary>
+        /// Converts <paramref name="count"/> items of <paramref name="items"/>
+        /// starting at <paramref name="offset"/> to a new Python list.
+        /// </summary>
+        internal static NewReference NewList<T>(T[] items, int offset, int count)
+        {
+            using var list = Runtime.PyList_New(count);
+            if (list.IsNull()) return default;
+            for (int i = 0; i < count; i++)
+            {
+                using var item = TypedConverter<T>.ToPython(items[offset + i]);
+                if (item.IsNull()) return default;
+                Runtime.PyList_SetItem(list.Borrow(), i, item.Steal());
+            }
+            return list.Move();
+        }
+
+        /// <summary>
+        /// Converts the items of <paramref name="items"/> to a new Python list.
+        /// </summary>
+        internal static NewReference NewList<T>(IReadOnlyList<T> items)
+        {
+            int count = items.Count;
+            using var list = Runtime.PyList_New(count);
+            if (list.IsNull()) return default;
+            for (int i = 0; i < count; i++)
+            {
+                using var item = TypedConverter<T>.ToPython(items[i]);
+                if (item.IsNull()) return default;
+                Runtime.PyList_SetItem(list.Borrow(), i, item.Steal());
+            }
+            return list.Move();
+        }
+
+        /// <summary>
+        /// Converts <paramref name="count"/> items of <paramref name="items"/>
+        /// starting at <paramref name="offset"/> to a new Python tuple.
+        /// </summary>
+        internal static NewReference NewTuple<T>(T[] items, int offset, int count)
+        {
+            using var tuple = Runtime.PyTuple_New(count);
+            if (tuple.IsNull()) return default;
+            for (int i = 0; i < count; i++)
+            {
+                using var item = TypedConverter<T>.ToPython(items[offset + i]);
+                if (item.IsNull()) return default;
+                Runtime.PyTuple_SetItem(tuple.Borrow(), i, item.Steal());
+            }
+            return tuple.Move();
+        }
+
+        /// <summary>
+        /// Converts the items of <paramref name="items"/> to a new Python tuple.
+        /// </summary>
+        internal static NewReference NewTuple<T>(IReadOnlyList<T> items)
+        {
+            int count = items.Count;
+            using var tuple = Runtime.PyTuple_New(count);
+            if (tuple.IsNull()) return default;
+            for (int i = 0; i < count; i++)
+            {
+                using var item = TypedConverter<T>.ToPython(items[i]);
+                if (item.IsNull()) return default;
+                Runtime.PyTuple_SetItem(tuple.Borrow(), i, item.Steal());
+            }
+            return tuple.Move();
+        }
+
+        /// <summary>
+        /// Converts key-value pairs to a new Python dict.
+        /// </summary>
+        internal static NewReference NewDict<TKey, TValue>(IEnumerable<KeyValuePair<TKey, TValue>> pairs)
+        {
+            using var dict = Runtime.PyDict_New();
+            if (dict.IsNull()) return default;
+            foreach (var pair in pairs)
+            {
+                using var key = TypedConverter<TKey>.ToPython(pair.Key);
+                if (key.IsNull()) return default;
+                using var value = TypedConverter<TValue>.ToPython(pair.Value);
+                if (value.IsNull()) return default;
+                if (Runtime.PyDict_SetItem(dict.Borrow(), key.Borrow(), value.Borrow()) != 0)
+                {
+                    return default;
+                }
+            }
+            return dict.Move();
+        }
+
+        static CollectionToPython? CreateListConverter(Type type)
+        {
+            if (!IsList(type)) return null;
+
+            foreach (var (definition, method) in new[]
+            {
+                (typeof(IList<>), listFromIList),
+                (typeof(IReadOnlyList<>), listFromReadOnlyList),
+                (typeof(ICollection<>), listFromCollection),
+                (typeof(IReadOnlyCollection<>), listFromReadOnlyCollection),
+                (typeof(IEnumerable<>), listFromEnumerable),
+            })
+            {
+                if (FindGenericInterface(type, definition) is { } iface)
+                {
+                    return CreateConverter(method.MakeGenericMethod(iface.GetGenericArguments()));
+                }
+            }
+            return ListFromNonGenericEnumerable;
+        }
+
+        static CollectionToPython? CreateDictConverter(Type type)
+        {
+            var iface = FindGenericInterface(type, typeof(IDictionary<,>))
+                     ?? FindGenericInterface(type, typeof(IReadOnlyDictionary<,>));
+            if (iface is not null)
+            {
+                return CreateConverter(dictFromPairs.MakeGenericMethod(iface.GetGenericArguments()));
+            }
+            return typeof(IDictionary).IsAssignableFrom(type) ? DictFromNonGenericDictionary : null;
+        }
+
+        static CollectionToPython CreateConverter(MethodInfo method)
+            => (CollectionToPython)Delegate.CreateDelegate(typeof(CollectionToPython), method);
+
+        static MethodInfo GetConverterMethod(string name)
+            => typeof(CollectionConverter).GetMethod(name, BindingFlags.Static | BindingFlags.NonPublic)!;
+
+        static Type? FindGenericInterface(Type type, Type definition)
+        {
+            if (type.IsInterface && type.IsGenericType && type.GetGenericTypeDefinition() == definition)
+            {
+                return type;
+            }
+            // GetInterfaces returns interfaces in no particular order, so types
+            // implementing several instantiations are left to the next, less
+            // specific converter instead of picking one of them arbitrarily
+            Type? found = null;
+            foreach (var iface in type.GetInterfaces())
+            {
+                if (!iface.IsGenericType || iface.GetGenericTypeDefinition() != definition)
+                {
+                    continue;
+                }
+                if (found is not null) return null;
+                found = iface;
+            }
+            return found;
+        }
+
+        static NewReference ListFromIList<T>(object collection)
+            => NewList(collection as IReadOnlyList<T> ?? new ReadOnlyCollection<T>((IList<T>)collection));
+
+        static NewReference ListFromReadOnlyList<T>(object collection)
+            => NewList((IReadOnlyList<T>)collection);
+
+        static NewReference ListFromCollection<T>(object collection)
+            => ListFromSizedEnumerable((ICollection<T>)collection, ((ICollection<T>)collection).Count);
+
+        static NewReference ListFromReadOnlyCollection<T>(object collection)
+            => ListFromSizedEnumerable((IReadOnlyCollection<T>)collection, ((IReadOnlyCollection<T>)collection).Count);
+
+        static NewReference ListFromSizedEnumerable<T>(IEnumerable<T> items, int count)
+        {
+            using var list = Runtime.PyList_New(count);
+            if (list.IsNull()) return default;
+            int i = 0;
+            foreach (T value in items)
+            {
+                using var item = TypedConverter<T>.ToPython(value);
+                if (item.IsNull()) return default;
+                if (i < count)
+                {
+                    Runtime.PyList_SetItem(list.Borrow(), i, item.Steal());
+                }
+                else if (Runtime.PyList_Append(list.Borrow(), item.Borrow()) != 0)
+                {
+                    return default;
+                }
+                i++;
+            }
+            if (i < count)
+            {
+                // the collection shrank while being enumerated
+                if (Runtime.PyList_SetSlice(list.Borrow(), i, count, BorrowedReference.Null) != 0)
+                {
+                    return default;
+                }
+            }
+            return list.Move();
+        }
+
+        static NewReference ListFromEnumerable<T>(object collection)
+        {
+            using var list = Runtime.PyList_New(0);
+            if (list.IsNull()) return default;
+            foreach (T value in (IEnumerable<T>)collection)
+            {
+                using var item = TypedConverter<T>.ToPython(value);
+                if (item.IsNull() || Runtime.PyList_Append(list.Borrow(), item.Borrow()) != 0)
+                {
+                    return default;
+                }
+            }
+            return list.Move();
+        }
+
+        static NewReference ListFromNonGenericEnumerable(object collection)
+        {
+            using var list = Runtime.PyList_New(0);
+            if (list.IsNull()) return default;
+            foreach (object? value in (IEnumerable)collection)
+            {
+                using var item = Converter.ToPython(value, typeof(object));
+                if (item.IsNull() || Runtime.PyList_Append(list.Borrow(), item.Borrow()) != 0)
+                {
+                    return default;
+                }
+            }
+            return list.Move();
+        }
+
+        static NewReference DictFromPairs<TKey, TValue>(object dictionary)
+            => NewDict((IEnumerable<KeyValuePair<TKey, TValue>>)dictionary);
+
+        static NewReference DictFromNonGenericDictionary(object dictionary)
+        {
+            using var dict = Runtime.PyDict_New();
+            if (dict.IsNull()) return default;
+            var enumerator = ((IDictionary)dictionary).GetEnumerator();
+            while (enumerator.MoveNext())
+            {
+                using var key = Converter.ToPython(enumerator.Key, typeof(object));
+                if (key.IsNull()) return default;
+                using var value = Converter.ToPython(enumerator.Value, typeof(object));
+                if (value.IsNull()) return default;
+                if (Runtime.PyDict_SetItem(dict.Borrow(), key.Borrow(), value.Borrow()) != 0)
+                {
+                    return default;
+                }
+            }
+            return dict.Move();
+        }
+    }
+}
@@ -20,7 +20,7 @@ namespace Python.Runtime.CollectionWrappers
         public IEnumerator<T> GetEnumerator()
         {
             PyIter iterObject;
-            using (Py.GIL())
+            using (Py.EnterGIL())
             {
                 iterObject = PyIter.GetIter(pyObject);
             }
@@ -28,17 +28,23 @@ namespace Python.Runtime.CollectionWrappers
             {
                 while (true)
                 {
-                    using var _ = Py.GIL();
-                    if (!iterObject.MoveNext())
+                    T item;
+                    // the GIL must not be held across yield: the caller may
+                    // dispose its own scopes before resuming the enumerator
+                    using (Py.EnterGIL())
                     {
-                        break;
+                        if (!iterObject.MoveNext())
+                        {
+                            break;
+                        }
+                        item = iterObject.Current.As<T>()!;
                     }
-                    yield return iterObject.Current.As<T>()!;
+                    yield return item;
                 }
             }
             finally
             {
-                using var _ = Py.GIL();
+                using var _ = Py.EnterGIL();
                 iterObject.Dispose();
             }
         }
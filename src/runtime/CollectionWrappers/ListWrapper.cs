@@ -14,14 +14,14 @@ namespace Python.Runtime.CollectionWrappers
         {
             get
             {
-                using var _ = Py.GIL();
+                using var _ = Py.EnterGIL();
                 var item = Runtime.PyList_GetItem(pyObject, index);
                 var pyItem = new PyObject(item);
                 return pyItem.As<T>()!;
             }
             set
             {
-                using var _ = Py.GIL();
+                using var _ = Py.EnterGIL();
                 var pyItem = value.ToPython();
                 var result = Runtime.PyList_SetItem(pyObject, index, new NewReference(pyItem).Steal());
                 if (result == -1)
@@ -39,7 +39,7 @@ namespace Python.Runtime.CollectionWrappers
             if (IsReadOnly)
                 throw new InvalidOperationException("Collection is read-only");
 
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             var pyItem = item.ToPython();
 
             int result = Runtime.PyList_Insert(pyObject, index, pyItem);
@@ -16,7 +16,7 @@ namespace Python.Runtime.CollectionWrappers
             {
                 nint size = -1;
                 {
-                    using var _ = Py.GIL();
+                    using var _ = Py.EnterGIL();
                     size = Runtime.PySequence_Size(pyObject.Reference);
                     if (size == -1)
                     {
@@ -42,7 +42,7 @@ namespace Python.Runtime.CollectionWrappers
         {
             if (IsReadOnly)
                 throw new NotImplementedException();
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             int result = Runtime.PySequence_DelSlice(pyObject, 0, Count);
             if (result == -1)
             {
@@ -84,7 +84,7 @@ namespace Python.Runtime.CollectionWrappers
 
 
             {
-                using var _ = Py.GIL();
+                using var _ = Py.EnterGIL();
                 int result = Runtime.PySequence_DelItem(pyObject, index);
 
                 if (result == 0)
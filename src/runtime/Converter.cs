@@ -274,6 +274,14 @@ namespace Python.Runtime
             return Converter.ToManagedValue(value, type, out result, setError);
         }
 
+        /// <summary>
+        /// Converts a Python object to a managed value of the statically known type
+        /// <typeparamref name="T"/>, without boxing primitive values.
+        /// </summary>
+        /// <seealso cref="TypedConverter{T}.ToManaged"/>
+        internal static bool ToManaged<T>(BorrowedReference value, out T? result, bool setError)
+            => TypedConverter<T>.ToManaged(value, out result, setError);
+
         internal static bool ToManagedValue(BorrowedReference value, Type obType,
             out object? result, bool setError)
         {
@@ -575,6 +583,17 @@ namespace Python.Runtime
 
             TypeCode tc = Type.GetTypeCode(obType);
 
+            if (tc is >= TypeCode.Boolean and <= TypeCode.Double)
+            {
+                switch (NumPyScalars.TryConvert(value, tc, out result))
+                {
+                    case NumPyScalars.Conversion.Converted:
+                        return true;
+                    case NumPyScalars.Conversion.Overflow:
+                        goto overflow;
+                }
+            }
+
             switch (tc)
             {
                 case TypeCode.String:
@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
 using System.Reflection;
 using System.Reflection.Emit;
@@ -44,11 +45,21 @@ namespace Python.Runtime
             // unique signatures rather than delegate types, since multiple
             // delegate types with the same sig could use the same dispatcher.
 
-            if (cache.TryGetValue(dtype, out Type item))
+            // Delegates can be requested from several threads at once,
+            // and the dispatcher type must only be emitted once.
+            lock (cache)
             {
+                if (!cache.TryGetValue(dtype, out Type item))
+                {
+                    item = CreateDispatcher(dtype);
+                    cache[dtype] = item;
+                }
                 return item;
             }
+        }
 
+        private Type CreateDispatcher(Type dtype)
+        {
             string name = $"__{dtype.FullName}Dispatcher";
             name = name.Replace('.', '_');
             name = name.Replace('+', '_');
@@ -149,9 +160,7 @@ namespace Python.Runtime
 
             il.Emit(OpCodes.Ret);
 
-            Type disp = tb.CreateType();
-            cache[dtype] = disp;
-            return disp;
+            return tb.CreateType();
         }
 
         /// <summary>
@@ -166,6 +175,25 @@ namespace Python.Runtime
             object o = Activator.CreateInstance(dispatcher, args);
             return Delegate.CreateDelegate(dtype, o, "Invoke");
         }
+
+        /// <summary>
+        /// Returns an instance of the delegate type, that dispatches calls to
+        /// all Python callables in its <see cref="Dispatcher"/>'s target list,
+        /// initially containing <paramref name="callable"/>. The arguments are
+        /// converted once, and the GIL is acquired once per call.
+        /// </summary>
+        /// <remarks>
+        /// Only supported for delegate types without return value and by-ref
+        /// parameters, see <see cref="Dispatcher.CanMulticast"/>.
+        /// </remarks>
+        internal Delegate GetMulticastDelegate(Type dtype, PyObject callable)
+        {
+            Delegate d = GetDelegate(dtype, callable);
+            var dispatcher = (Dispatcher)d.Target;
+            Debug.Assert(Dispatcher.CanMulticast(dtype));
+            dispatcher.multicastTargets = new[] { callable };
+            return d;
+        }
     }
 
 
@@ -191,34 +219,44 @@ namespace Python.Runtime
     public class Dispatcher
     {
         readonly PyObject target;
-        readonly Type dtype;
+        readonly ParameterInfo[] pi;
+        readonly Type rtype;
+
+        /// <summary>
+        /// When not <c>null</c>, calls are dispatched to all of these callables
+        /// in order, instead of to the target. The array is replaced, not modified,
+        /// so that handlers can be added and removed while it is being called.
+        /// </summary>
+        internal volatile PyObject[]? multicastTargets;
 
         protected Dispatcher(PyObject target, Type dtype)
         {
             this.target = target;
-            this.dtype = dtype;
+            MethodInfo method = dtype.GetMethod("Invoke");
+            this.pi = method.GetParameters();
+            this.rtype = method.ReturnType;
         }
 
-        public object? Dispatch(object?[] args)
+        /// <summary>
+        /// Whether delegates of type <paramref name="dtype"/> can dispatch to
+        /// several Python callables, which requires, that there are no results
+        /// to return from the callables.
+        /// </summary>
+        internal static bool CanMulticast(Type dtype)
         {
-            PyGILState gs = PythonEngine.AcquireLock();
+            MethodInfo method = dtype.GetMethod("Invoke");
+            return method.ReturnType == typeof(void)
+                && method.GetParameters().All(p => !p.ParameterType.IsByRef);
+        }
 
-            try
-            {
-                return TrueDispatch(args);
-            }
-            finally
-            {
-                PythonEngine.ReleaseLock(gs);
-            }
+        public object? Dispatch(object?[] args)
+        {
+            using var _ = Py.EnterGIL();
+            return TrueDispatch(args);
         }
 
         private object? TrueDispatch(object?[] args)
         {
-            MethodInfo method = dtype.GetMethod("Invoke");
-            ParameterInfo[] pi = method.GetParameters();
-            Type rtype = method.ReturnType;
-
             NewReference callResult;
             using (var pyargs = Runtime.PyTuple_New(pi.Length))
             {
@@ -234,6 +272,19 @@ namespace Python.Runtime
                     }
                 }
 
+                if (multicastTargets is { } targets)
+                {
+                    foreach (var handler in targets)
+                    {
+                        using var handlerResult = Runtime.PyObject_Call(handler, pyargs.Borrow(), null);
+                        if (handlerResult.IsNull())
+                        {
+                            throw PythonException.ThrowLastAsClrException();
+                        }
+                    }
+                    return null;
+                }
+
                 callResult = Runtime.PyObject_Call(target, pyargs.Borrow(), null);
             }
 
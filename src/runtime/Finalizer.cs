@@ -41,6 +41,31 @@ namespace Python.Runtime
         [DefaultValue(true)]
         public bool Enable { get; set; } = true;
 
+        /// <summary>
+        /// Record the allocation site of every N-th <see cref="PyObject"/>
+        /// created on each thread, and whether it is disposed or finalized.
+        /// 0 (the default) disables leak tracking, 1 records every object.
+        /// See <see cref="GetLiveObjectReport"/>.
+        /// </summary>
+        [DefaultValue(0)]
+        public int LeakTrackingSampleRate
+        {
+            get => LeakTracker.SampleRate;
+            set => LeakTracker.SampleRate = value;
+        }
+
+        /// <summary>
+        /// Returns counts of sampled <see cref="PyObject"/> wrappers by
+        /// allocation site and Python type, with the most live wrappers first.
+        /// </summary>
+        public IReadOnlyList<LiveObjectStatistics> GetLiveObjectReport() => LeakTracker.GetReport();
+
+        /// <summary>
+        /// Discards the records of <see cref="GetLiveObjectReport"/>.
+        /// Wrappers sampled before the reset are no longer reported.
+        /// </summary>
+        public void ResetLeakTracking() => LeakTracker.Reset();
+
         private readonly ConcurrentQueue<PendingFinalization> _objQueue = new();
         private readonly ConcurrentQueue<PendingFinalization> _derivedQueue = new();
         private readonly ConcurrentQueue<Py_buffer> _bufferQueue = new();
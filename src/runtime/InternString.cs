@@ -8,6 +8,8 @@ namespace Python.Runtime
 {
     static partial class InternString
     {
+        // Both maps are only written during Initialize and Shutdown,
+        // so concurrent lookups from multiple threads are safe.
         private static readonly Dictionary<string, PyString> _string2interns = new();
         private static readonly Dictionary<IntPtr, string> _intern2strings = new();
         const BindingFlags PyIdentifierFieldFlags = BindingFlags.Static | BindingFlags.NonPublic;
@@ -75,6 +75,11 @@ namespace Python.Runtime
         HasClrInstance = (1 << 15),
         /// <remarks>PythonNet specific</remarks>
         Subclass = (1 << 16),
+        /// <summary>
+        /// Instances are called with the object, that they are looked up on, as
+        /// the first argument, instead of being bound to it first.
+        /// </summary>
+        MethodDescriptor = (1 << 17),
         /* Objects support nb_index in PyNumberMethods */
         HaveVersionTag = (1 << 18),
         ValidVersionTag = (1 << 19),
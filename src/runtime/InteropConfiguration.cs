@@ -14,6 +14,22 @@ namespace Python.Runtime
         /// <summary>Enables replacing base types of CLR types as seen from Python</summary>
         public IList<IPythonBaseTypeProvider> PythonBaseTypeProviders => this.pythonBaseTypeProviders;
 
+        /// <summary>
+        /// Enables <see cref="InteropProfiler"/> when the engine is initialized.
+        /// </summary>
+        public bool EnableProfiling { get; set; }
+
+        /// <summary>
+        /// When the engine is initialized with this option, members of .NET types
+        /// are reflected on first access from Python, instead of all at once, when
+        /// the type is first used. This speeds up first use of types with many members.
+        /// </summary>
+        /// <remarks>
+        /// <c>dir()</c> lists members, that were not accessed yet, but the class
+        /// <c>__dict__</c> only contains members, that were.
+        /// </remarks>
+        public bool LazyMemberReflection { get; set; }
+
         public static InteropConfiguration MakeDefault()
         {
             return new InteropConfiguration
@@ -0,0 +1,284 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
+using System.IO;
+using System.Linq;
+using System.Reflection;
+using System.Text;
+using System.Threading;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Opt-in profiler, that records per CLR member call counts and the time
+    /// spent binding, converting arguments, invoking and converting results
+    /// for calls made from Python into .NET.
+    /// </summary>
+    /// <remarks>
+    /// Profiling can be enabled from .NET via <see cref="Enable"/> or
+    /// <see cref="InteropConfiguration.EnableProfiling"/>, and from Python via
+    /// <c>clr.enable_profiling()</c>.
+    /// </remarks>
+    public sealed class InteropProfiler
+    {
+        public static InteropProfiler Instance { get; } = new();
+
+        static volatile bool enabled;
+
+        readonly ConcurrentDictionary<MethodBase, MemberCounters> counters = new();
+        // bind failures can not be attributed to an overload, so they are
+        // recorded per method group
+        readonly ConcurrentDictionary<string, MemberCounters> groupCounters = new();
+
+        [ThreadStatic]
+        static long pendingConversionTicks;
+
+        InteropProfiler() { }
+
+        /// <summary>Set to <c>true</c> to start recording interop calls.</summary>
+        public bool Enable
+        {
+            get => enabled;
+            set => enabled = value;
+        }
+
+        internal static bool IsEnabled => enabled;
+
+        /// <summary>Discards all recorded statistics.</summary>
+        public void Reset()
+        {
+            counters.Clear();
+            groupCounters.Clear();
+        }
+
+        /// <summary>
+        /// Returns statistics for every CLR member called since profiling was
+        /// enabled or last <see cref="Reset"/>, ordered by total time spent.
+        /// Calls, that matched no overload, are reported for the method group.
+        /// </summary>
+        public IReadOnlyList<InteropCallStatistics> GetSnapshot()
+            => counters.Select(pair => pair.Value.ToStatistics(GetMemberName(pair.Key)))
+                       .Concat(groupCounters.Select(pair => pair.Value.ToStatistics(pair.Key)))
+                       .OrderByDescending(s => s.TotalTime)
+                       .ToList();
+
+        /// <summary>
+        /// Writes the recorded statistics in the
+        /// <a href="https://www.speedscope.app/">speedscope</a> file format.
+        /// Each member is reported as a frame, and each phase of the call as
+        /// its child frame.
+        /// </summary>
+        public void WriteSpeedscope(TextWriter writer)
+        {
+            if (writer is null) throw new ArgumentNullException(nameof(writer));
+
+            var snapshot = GetSnapshot();
+            var frames = new List<string>();
+            var samples = new List<(int member, int phase)>();
+            var weights = new List<double>();
+            var phaseFrames = new Dictionary<string, int>();
+
+            int GetPhaseFrame(string phase)
+            {
+                if (!phaseFrames.TryGetValue(phase, out int index))
+                {
+                    index = frames.Count;
+                    frames.Add(phase);
+                    phaseFrames.Add(phase, index);
+                }
+                return index;
+            }
+
+            foreach (var stats in snapshot)
+            {
+                int memberFrame = frames.Count;
+                frames.Add(stats.Member);
+                foreach (var (phase, time) in new[]
+                {
+                    ("bind", stats.BindTime),
+                    ("convert arguments", stats.ArgumentConversionTime),
+                    ("invoke", stats.InvocationTime),
+                    ("convert result", stats.ResultConversionTime),
+                })
+                {
+                    if (time <= TimeSpan.Zero) continue;
+                    samples.Add((memberFrame, GetPhaseFrame(phase)));
+                    weights.Add(time.TotalMilliseconds);
+                }
+            }
+
+            writer.Write("{\"$schema\":\"https://www.speedscope.app/file-format-schema.json\",");
+            writer.Write("\"exporter\":\"pythonnet\",\"shared\":{\"frames\":[");
+            for (int i = 0; i < frames.Count; i++)
+            {
+                if (i > 0) writer.Write(',');
+                writer.Write("{\"name\":");
+                WriteJsonString(writer, frames[i]);
+                writer.Write('}');
+            }
+            double total = weights.Sum();
+            writer.Write("]},\"profiles\":[{\"type\":\"sampled\",\"name\":\"Python.NET interop\",\"unit\":\"milliseconds\",\"startValue\":0,");
+            writer.Write($"\"endValue\":{total.ToString("R", CultureInfo.InvariantCulture)},\"samples\":[");
+            writer.Write(string.Join(",", samples.Select(s => $"[{s.member},{s.phase}]")));
+            writer.Write("],\"weights\":[");
+            writer.Write(string.Join(",", weights.Select(w => w.ToString("R", CultureInfo.InvariantCulture))));
+            writer.Write("]}]}");
+        }
+
+        /// <summary>
+        /// Writes the recorded statistics to the file at <paramref name="path"/>
+        /// in the speedscope file format.
+        /// </summary>
+        public void ExportSpeedscope(string path)
+        {
+            using var writer = new StreamWriter(path, append: false, new UTF8Encoding(false));
+            WriteSpeedscope(writer);
+        }
+
+        static void WriteJsonString(TextWriter writer, string value)
+        {
+            writer.Write('"');
+            foreach (char c in value)
+            {
+                switch (c)
+                {
+                    case '"': writer.Write("\\\""); break;
+                    case '\\': writer.Write("\\\\"); break;
+                    default:
+                        if (c < ' ')
+                            writer.Write($"\\u{(int)c:x4}");
+                        else
+                            writer.Write(c);
+                        break;
+                }
+            }
+            writer.Write('"');
+        }
+
+        internal static long Timestamp() => Stopwatch.GetTimestamp();
+
+        /// <summary>
+        /// Accumulates argument conversion time on the current thread. It is
+        /// attributed to the member, that is eventually reported by
+        /// <see cref="RecordCall"/> or <see cref="RecordBindFailure"/>.
+        /// Callers must <see cref="ResetArgumentConversion"/> before binding.
+        /// </summary>
+        internal static void AddArgumentConversion(long startTimestamp)
+            => pendingConversionTicks += Stopwatch.GetTimestamp() - startTimestamp;
+
+        internal static void ResetArgumentConversion() => pendingConversionTicks = 0;
+
+        internal static long TakeArgumentConversion()
+        {
+            long ticks = pendingConversionTicks;
+            pendingConversionTicks = 0;
+            return ticks;
+        }
+
+        internal void RecordCall(MethodBase member, long bindTicks, long conversionTicks,
+                                 long invokeTicks, long resultTicks, bool exceptionTranslated)
+        {
+            var c = counters.GetOrAdd(member, _ => new MemberCounters());
+            Interlocked.Increment(ref c.Calls);
+            Interlocked.Add(ref c.BindTicks, bindTicks - conversionTicks);
+            Interlocked.Add(ref c.ConversionTicks, conversionTicks);
+            Interlocked.Add(ref c.InvokeTicks, invokeTicks);
+            Interlocked.Add(ref c.ResultTicks, resultTicks);
+            if (exceptionTranslated)
+            {
+                Interlocked.Increment(ref c.ExceptionsTranslated);
+            }
+        }
+
+        internal void RecordBindFailure(MethodBase[] overloads, long bindTicks, long conversionTicks)
+        {
+            var c = groupCounters.GetOrAdd(GetGroupName(overloads[0]), _ => new MemberCounters());
+            Interlocked.Increment(ref c.BindFailures);
+            Interlocked.Add(ref c.BindTicks, bindTicks - conversionTicks);
+            Interlocked.Add(ref c.ConversionTicks, conversionTicks);
+        }
+
+        sealed class MemberCounters
+        {
+            public long Calls;
+            public long BindFailures;
+            public long ExceptionsTranslated;
+            public long BindTicks;
+            public long ConversionTicks;
+            public long InvokeTicks;
+            public long ResultTicks;
+
+            public InteropCallStatistics ToStatistics(string member) => new(
+                member: member,
+                calls: Interlocked.Read(ref Calls),
+                bindFailures: Interlocked.Read(ref BindFailures),
+                exceptionsTranslated: Interlocked.Read(ref ExceptionsTranslated),
+                bindTime: ToTimeSpan(Interlocked.Read(ref BindTicks)),
+                argumentConversionTime: ToTimeSpan(Interlocked.Read(ref ConversionTicks)),
+                invocationTime: ToTimeSpan(Interlocked.Read(ref InvokeTicks)),
+                resultConversionTime: ToTimeSpan(Interlocked.Read(ref ResultTicks)));
+        }
+
+        static TimeSpan ToTimeSpan(long stopwatchTicks)
+            => TimeSpan.FromTicks((long)(stopwatchTicks * ((double)TimeSpan.TicksPerSecond / Stopwatch.Frequency)));
+
+        static string GetMemberName(MethodBase member)
+        {
+            string parameters = string.Join(", ", member.GetParameters().Select(p => p.ParameterType.Name));
+            return $"{GetGroupName(member)}({parameters})";
+        }
+
+        static string GetGroupName(MethodBase member)
+        {
+            string name = member.IsConstructor ? "__init__" : member.Name;
+            return $"{member.DeclaringType?.FullName}.{name}";
+        }
+    }
+
+    /// <summary>
+    /// Statistics recorded by <see cref="InteropProfiler"/> for a single CLR member.
+    /// </summary>
+    public sealed class InteropCallStatistics
+    {
+        internal InteropCallStatistics(string member, long calls, long bindFailures, long exceptionsTranslated,
+                                       TimeSpan bindTime, TimeSpan argumentConversionTime,
+                                       TimeSpan invocationTime, TimeSpan resultConversionTime)
+        {
+            Member = member;
+            Calls = calls;
+            BindFailures = bindFailures;
+            ExceptionsTranslated = exceptionsTranslated;
+            BindTime = bindTime;
+            ArgumentConversionTime = argumentConversionTime;
+            InvocationTime = invocationTime;
+            ResultConversionTime = resultConversionTime;
+        }
+
+        /// <summary>
+        /// Full name of the member, including parameter types, or of the
+        /// method group for bind failures.
+        /// </summary>
+        public string Member { get; }
+        /// <summary>Number of successful bindings (calls that reached .NET).</summary>
+        public long Calls { get; }
+        /// <summary>Number of calls, for which no overload matched the arguments.</summary>
+        public long BindFailures { get; }
+        /// <summary>Number of .NET exceptions translated into Python exceptions.</summary>
+        public long ExceptionsTranslated { get; }
+        /// <summary>Time spent selecting an overload, excluding argument conversion.</summary>
+        public TimeSpan BindTime { get; }
+        /// <summary>Time spent converting Python arguments to .NET.</summary>
+        public TimeSpan ArgumentConversionTime { get; }
+        /// <summary>Time spent in the .NET member itself.</summary>
+        public TimeSpan InvocationTime { get; }
+        /// <summary>Time spent converting the result and out parameters to Python.</summary>
+        public TimeSpan ResultConversionTime { get; }
+
+        public TimeSpan TotalTime => BindTime + ArgumentConversionTime + InvocationTime + ResultConversionTime;
+
+        public override string ToString()
+            => $"{Member}: {Calls} calls, {BindFailures} bind failures, {TotalTime.TotalMilliseconds:0.###} ms";
+    }
+}
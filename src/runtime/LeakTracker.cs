@@ -0,0 +1,174 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Reflection;
+using System.Runtime.InteropServices;
+using System.Threading;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Records where a sample of <see cref="PyObject"/> wrappers were created,
+    /// and whether they were disposed or left to the finalizer.
+    /// See <see cref="Finalizer.LeakTrackingSampleRate"/>.
+    /// </summary>
+    /// <remarks>
+    /// Only every N-th wrapper created on each thread is sampled, and only
+    /// sampled wrappers pay for capturing the stack. Unsampled wrappers only
+    /// cost a counter decrement.
+    /// </remarks>
+    internal static class LeakTracker
+    {
+        static volatile int sampleRate;
+
+        [ThreadStatic]
+        static int countdown;
+
+        static readonly ConcurrentDictionary<(string site, string type), AllocationSite> sites = new();
+        static readonly Assembly runtimeAssembly = typeof(PyObject).Assembly;
+
+        internal static int SampleRate
+        {
+            get => sampleRate;
+            set
+            {
+                if (value < 0) throw new ArgumentOutOfRangeException(nameof(value), "must not be negative");
+                sampleRate = value;
+            }
+        }
+
+        /// <summary>
+        /// Decides whether the new wrapper of <paramref name="reference"/> is sampled,
+        /// and if so, returns the record of its allocation site.
+        /// </summary>
+        internal static AllocationSite? Sample(BorrowedReference reference)
+        {
+            int rate = sampleRate;
+            if (rate == 0) return null;
+            // the countdown may be left over from a larger sample rate
+            int remaining = --countdown;
+            if (remaining > 0 && remaining < rate) return null;
+            countdown = rate;
+
+            var key = (GetAllocationSite(), GetTypeName(reference));
+            var site = sites.GetOrAdd(key, k => new AllocationSite(k.site, k.type));
+            Interlocked.Increment(ref site.Live);
+            return site;
+        }
+
+        internal static IReadOnlyList<LiveObjectStatistics> GetReport()
+            => sites.Values.Select(site => site.ToStatistics())
+                           .OrderByDescending(s => s.Live)
+                           .ThenByDescending(s => s.Finalized)
+                           .ToList();
+
+        internal static void Reset() => sites.Clear();
+
+        static string GetAllocationSite()
+        {
+            var frames = new StackTrace(2, fNeedFileInfo: false).GetFrames() ?? Array.Empty<StackFrame>();
+            MethodBase? fallback = null;
+            foreach (var frame in frames)
+            {
+                var method = frame.GetMethod();
+                var type = method?.DeclaringType;
+                if (method is null || type is null) continue;
+
+                if (type.Assembly != runtimeAssembly) return GetName(method);
+
+                // objects created by the runtime itself: report the first
+                // method, that is not a wrapper constructor
+                if (fallback is null && !(method.IsConstructor && typeof(PyObject).IsAssignableFrom(type)))
+                {
+                    fallback = method;
+                }
+            }
+            return fallback is null ? "<unknown>" : GetName(fallback);
+        }
+
+        static string GetName(MethodBase method) => $"{method.DeclaringType?.FullName}.{method.Name}";
+
+        static string GetTypeName(BorrowedReference reference)
+        {
+            var type = Runtime.PyObject_TYPE(reference);
+            var name = Util.ReadIntPtr(type, TypeOffset.tp_name);
+            return Marshal.PtrToStringAnsi(name) ?? "<unknown>";
+        }
+    }
+
+    /// <summary>
+    /// Counters of sampled wrappers of one Python type created at one site.
+    /// </summary>
+    internal sealed class AllocationSite
+    {
+        public long Live;
+        public long Disposed;
+        public long Finalized;
+
+        readonly string site;
+        readonly string pythonType;
+
+        public AllocationSite(string site, string pythonType)
+        {
+            this.site = site;
+            this.pythonType = pythonType;
+        }
+
+        public void OnDisposed()
+        {
+            Interlocked.Decrement(ref Live);
+            Interlocked.Increment(ref Disposed);
+        }
+
+        public void OnFinalized()
+        {
+            Interlocked.Decrement(ref Live);
+            Interlocked.Increment(ref Finalized);
+        }
+
+        public LiveObjectStatistics ToStatistics() => new(
+            site: site,
+            pythonType: pythonType,
+            live: Interlocked.Read(ref Live),
+            disposed: Interlocked.Read(ref Disposed),
+            finalized: Interlocked.Read(ref Finalized));
+    }
+
+    /// <summary>
+    /// Sampled <see cref="PyObject"/> wrappers of one Python type, created at one site.
+    /// </summary>
+    /// <remarks>
+    /// Counts only include sampled wrappers: multiply them by
+    /// <see cref="Finalizer.LeakTrackingSampleRate"/> to estimate totals.
+    /// </remarks>
+    public sealed class LiveObjectStatistics
+    {
+        internal LiveObjectStatistics(string site, string pythonType, long live, long disposed, long finalized)
+        {
+            Site = site;
+            PythonType = pythonType;
+            Live = live;
+            Disposed = disposed;
+            Finalized = finalized;
+        }
+
+        /// <summary>
+        /// Full name of the method, that created the wrappers. The first method
+        /// outside of Python.Runtime is reported, if there is one on the stack.
+        /// </summary>
+        public string Site { get; }
+        /// <summary>Name of the Python type of the wrapped objects.</summary>
+        public string PythonType { get; }
+        /// <summary>Number of wrappers, that are still alive.</summary>
+        public long Live { get; }
+        /// <summary>Number of wrappers, that were disposed or whose reference was transferred.</summary>
+        public long Disposed { get; }
+        /// <summary>Number of wrappers, that were never disposed and reached the finalizer.</summary>
+        public long Finalized { get; }
+
+        public override string ToString()
+            => $"{Site} ({PythonType}): {Live} live, {Disposed} disposed, {Finalized} finalized";
+    }
+}
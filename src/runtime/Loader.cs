@@ -46,7 +46,7 @@ namespace Python.Runtime
                     PythonDLL = null;
                 }
 
-                using var _ = Py.GIL();
+                using var _ = Py.EnterGIL();
                 PythonEngine.InitExt();
             }
             catch (Exception exc)
@@ -68,7 +68,7 @@ namespace Python.Runtime
 
                 if (command == "full_shutdown")
                 {
-                    using var _ = Py.GIL();
+                    using var _ = Py.EnterGIL();
                     PythonEngine.Shutdown();
                 }
             }
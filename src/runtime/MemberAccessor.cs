@@ -0,0 +1,151 @@
+using System;
+using System.Linq.Expressions;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Compiled getter and setter for a CLR property or field, used by
+    /// <see cref="PropertyObject"/> and <see cref="FieldObject"/> in place of
+    /// reflection once the member has been accessed a few times.
+    /// </summary>
+    /// <remarks>
+    /// Values are read through a delegate typed with the member type and
+    /// converted with <see cref="TypedConverter{T}"/>, so primitive values
+    /// are not boxed. Fields of structs are read through a reference into
+    /// the boxed instance, without copying the struct.
+    /// </remarks>
+    internal abstract class MemberAccessor
+    {
+        /// <summary>
+        /// Number of reflection-based accesses, after which the accessor is compiled.
+        /// Members accessed only a few times are not worth the compilation cost.
+        /// </summary>
+        internal const int CompileThreshold = 8;
+
+        /// <summary><c>false</c> if values must be set through reflection.</summary>
+        public abstract bool CanSet { get; }
+
+        /// <summary>Reads the member, and converts its value to Python.</summary>
+        public abstract NewReference GetValue(object? target);
+
+        public abstract void SetValue(object? target, object? value);
+
+        /// <summary>
+        /// Returns the compiled accessor for the member, compiling it once
+        /// <paramref name="accesses"/> reaches <see cref="CompileThreshold"/>.
+        /// Returns <c>null</c> if reflection should be used.
+        /// </summary>
+        internal static MemberAccessor? GetOrCompile(ref MemberAccessor? accessor, ref int accesses,
+                                                    MemberInfo member, MethodInfo? getter, MethodInfo? setter)
+        {
+            if (accessor is not null) return accessor;
+            if (++accesses < CompileThreshold) return null;
+
+            accessor = Compile(member, getter, setter);
+            if (accessor is null)
+            {
+                // not supported, never try again
+                accesses = int.MinValue;
+            }
+            return accessor;
+        }
+
+        internal static MemberAccessor? Compile(MemberInfo member, MethodInfo? getter, MethodInfo? setter)
+        {
+            Type valueType;
+            switch (member)
+            {
+                case PropertyInfo property:
+                    if (getter is null || getter.GetParameters().Length != 0) return null;
+                    valueType = property.PropertyType;
+                    break;
+                case FieldInfo field:
+                    if (field.IsLiteral) return null;
+                    valueType = field.FieldType;
+                    break;
+                default:
+                    return null;
+            }
+
+            Type? declaringType = member.DeclaringType;
+            if (declaringType is null || declaringType.ContainsGenericParameters
+                || valueType.IsByRef || valueType.IsPointer || valueType.ContainsGenericParameters)
+            {
+                return null;
+            }
+
+            try
+            {
+                var accessorType = typeof(MemberAccessor<>).MakeGenericType(valueType);
+                var compile = accessorType.GetMethod(nameof(MemberAccessor<object>.Create),
+                                                     BindingFlags.Static | BindingFlags.NonPublic)!;
+                return (MemberAccessor)compile.Invoke(null, new object?[] { member, getter, setter });
+            }
+            catch (Exception e) when (e is ArgumentException or InvalidOperationException
+                                        or NotSupportedException or TargetInvocationException)
+            {
+                return null;
+            }
+        }
+
+        protected static Expression Target(ParameterExpression target, MemberInfo member, bool isStatic)
+        {
+            if (isStatic) return null!;
+            Type declaringType = member.DeclaringType!;
+            return declaringType.IsValueType
+                ? Expression.Unbox(target, declaringType)
+                : Expression.Convert(target, declaringType);
+        }
+    }
+
+    internal sealed class MemberAccessor<TValue> : MemberAccessor
+    {
+        readonly Func<object?, TValue> get;
+        readonly Action<object?, TValue>? set;
+
+        MemberAccessor(Func<object?, TValue> get, Action<object?, TValue>? set)
+        {
+            this.get = get;
+            this.set = set;
+        }
+
+        public override bool CanSet => set is not null;
+
+        public override NewReference GetValue(object? target) => TypedConverter<TValue>.ToPython(get(target));
+
+        public override void SetValue(object? target, object? value) => set!(target, (TValue)value!);
+
+        internal static MemberAccessor<TValue> Create(MemberInfo member, MethodInfo? getter, MethodInfo? setter)
+        {
+            var target = Expression.Parameter(typeof(object), "target");
+            var value = Expression.Parameter(typeof(TValue), "value");
+            // mutating a copy of an unboxed struct would be lost,
+            // so setters of struct members keep using reflection
+            bool canSet = !member.DeclaringType!.IsValueType;
+
+            Expression read;
+            Expression? write = null;
+            if (member is FieldInfo field)
+            {
+                read = Expression.Field(Target(target, field, field.IsStatic), field);
+                if (canSet && !field.IsInitOnly)
+                {
+                    write = Expression.Assign(Expression.Field(Target(target, field, field.IsStatic), field), value);
+                }
+            }
+            else
+            {
+                read = Expression.Call(Target(target, getter!, getter!.IsStatic), getter);
+                if (canSet && setter is not null && setter.GetParameters().Length == 1)
+                {
+                    write = Expression.Call(Target(target, setter, setter.IsStatic), setter, value);
+                }
+            }
+
+            var get = Expression.Lambda<Func<object?, TValue>>(read, target).Compile();
+            var set = write is null ? null : Expression.Lambda<Action<object?, TValue>>(write, target, value).Compile();
+            return new MemberAccessor<TValue>(get, set);
+        }
+    }
+}
@@ -1,7 +1,9 @@
 using System;
 using System.Collections;
+using System.Collections.Concurrent;
 using System.Reflection;
 using System.Text;
+using System.Threading.Tasks;
 using System.Collections.Generic;
 using System.Diagnostics.CodeAnalysis;
 using System.Linq;
@@ -34,6 +36,17 @@ namespace Python.Runtime
 
         public bool argsReversed = false;
 
+        [NonSerialized]
+        OperatorBinder? operators;
+        [NonSerialized]
+        bool operatorsBound;
+
+        /// <summary>
+        /// Closed generic methods by generic method definition and type arguments.
+        /// <c>null</c> values record type arguments, that violate the constraints.
+        /// </summary>
+        static readonly ConcurrentDictionary<MethodInfo, ConcurrentDictionary<Type[], MethodInfo?>> closedGenericMethods = new();
+
         internal MethodBinder()
         {
             list = new List<MaybeMethodBase>();
@@ -116,20 +129,43 @@ namespace Python.Runtime
                 {
                     continue;
                 }
-                try
+                if (MakeGenericMethod(t, tp) is { } method)
                 {
-                    // MakeGenericMethod can throw ArgumentException if the type parameters do not obey the constraints.
-                    MethodInfo method = t.MakeGenericMethod(tp);
                     result.Add(method);
                 }
-                catch (ArgumentException)
-                {
-                    // The error will remain set until cleared by a successful match.
-                }
             }
             return result.ToArray();
         }
 
+        /// <summary>
+        /// Returns the closed generic method for the given type arguments,
+        /// or <c>null</c> if they do not satisfy the constraints of the
+        /// generic method definition. The results are cached.
+        /// </summary>
+        internal static MethodInfo? MakeGenericMethod(MethodInfo definition, Type[] typeArguments)
+        {
+            var instantiations = closedGenericMethods.GetOrAdd(
+                definition, _ => new ConcurrentDictionary<Type[], MethodInfo?>(TypeArrayComparer.Instance));
+            if (instantiations.TryGetValue(typeArguments, out MethodInfo? method))
+            {
+                return method;
+            }
+
+            try
+            {
+                method = definition.MakeGenericMethod(typeArguments);
+            }
+            catch (ArgumentException)
+            {
+                // MakeGenericMethod throws ArgumentException if the type arguments do not obey the constraints.
+                method = null;
+            }
+            instantiations.TryAdd((Type[])typeArguments.Clone(), method);
+            return method;
+        }
+
+        internal static void Reset() => closedGenericMethods.Clear();
+
 
         /// <summary>
         /// Given a sequence of MethodInfo and two sequences of type parameters,
@@ -170,9 +206,7 @@ namespace Python.Runtime
                         MethodInfo match = t;
                         if (match.IsGenericMethodDefinition)
                         {
-                            // FIXME: typeArgs not used
-                            Type[] typeArgs = match.GetGenericArguments();
-                            return match.MakeGenericMethod(genericTp);
+                            return MakeGenericMethod(match, genericTp);
                         }
                         return match;
                     }
@@ -356,7 +390,8 @@ namespace Python.Runtime
                 {
                     var keyStr = Runtime.GetManagedString(Runtime.PyList_GetItem(keylist.Borrow(), i));
                     BorrowedReference value = Runtime.PyList_GetItem(valueList.Borrow(), i);
-                    kwargDict[keyStr!] = new PyObject(value);
+                    // values are kept alive by the keyword argument dict of the caller
+                    kwargDict[keyStr!] = new BorrowedPyObject(value);
                 }
             }
 
@@ -414,7 +449,12 @@ namespace Python.Runtime
                     // We need to take the first CLR argument.
                     pi = pi.Take(1).ToArray();
                 }
+                long conversionStart = InteropProfiler.IsEnabled ? InteropProfiler.Timestamp() : 0;
                 var margs = TryConvertArguments(pi, paramsArray, args, pynargs, kwargDict, defaultArgList, outs: out int outs);
+                if (conversionStart != 0)
+                {
+                    InteropProfiler.AddArgumentConversion(conversionStart);
+                }
                 if (margs == null)
                 {
                     var mismatchCause = PythonException.FetchCurrent();
@@ -636,6 +676,12 @@ namespace Python.Runtime
                     }
                 }
 
+                if (tempObject.IsNull() && BorrowedPyObject.IsBorrowed(parameter))
+                {
+                    margs[paramIndex] = new BorrowedPyObject(op);
+                    continue;
+                }
+
                 if (!TryConvertArgument(op, parameter.ParameterType, out margs[paramIndex], out bool isOut))
                 {
                     tempObject.Dispose();
@@ -824,6 +870,28 @@ namespace Python.Runtime
             return Invoke(inst, args, kw, null, null);
         }
 
+        /// <summary>
+        /// Calls an operator with the instance <paramref name="inst"/> and the Python
+        /// <paramref name="operand"/> (null for unary operators) through an
+        /// <see cref="OperatorBinder"/>, that is created on first use.
+        /// Returns <c>false</c>, if the call has to be bound by <see cref="Invoke(BorrowedReference, BorrowedReference, BorrowedReference)"/>.
+        /// </summary>
+        internal bool TryInvokeOperator(BorrowedReference inst, BorrowedReference operand, out NewReference result)
+        {
+            if (!operatorsBound)
+            {
+                operators = OperatorBinder.Create(GetMethods(), argsReversed, allow_threads);
+                operatorsBound = true;
+            }
+            // the profiler records calls bound by the method binder
+            if (operators is null || InteropProfiler.IsEnabled)
+            {
+                result = default;
+                return false;
+            }
+            return operators.TryInvoke(inst, operand, out result);
+        }
+
         internal virtual NewReference Invoke(BorrowedReference inst, BorrowedReference args, BorrowedReference kw, MethodBase? info)
         {
             return Invoke(inst, args, kw, info, null);
@@ -875,27 +943,30 @@ namespace Python.Runtime
                 return Exceptions.RaiseTypeError(msg.ToString());
             }
 
+            if (info is null && kw.IsNull && inst != null && Runtime.PyTuple_Size(args) is 0 or 1
+                && TryInvokeOperator(inst, Runtime.PyTuple_Size(args) == 1 ? Runtime.PyTuple_GetItem(args, 0) : BorrowedReference.Null,
+                                     out var operatorResult))
+            {
+                return operatorResult;
+            }
+
+            bool profile = InteropProfiler.IsEnabled;
+            // discard conversion time left over by calls, that failed before recording it
+            InteropProfiler.ResetArgumentConversion();
+            long bindStart = profile ? InteropProfiler.Timestamp() : 0;
             Binding? binding = Bind(inst, args, kw, info, methodinfo);
+            long bindTicks = profile ? InteropProfiler.Timestamp() - bindStart : 0;
+            long conversionTicks = profile ? InteropProfiler.TakeArgumentConversion() : 0;
             object result;
             IntPtr ts = IntPtr.Zero;
 
             if (binding == null)
             {
-                var value = new StringBuilder("No method matches given arguments");
-                if (methodinfo != null && methodinfo.Length > 0)
+                if (profile)
                 {
-                    value.Append($" for {methodinfo[0].DeclaringType?.Name}.{methodinfo[0].Name}");
+                    InteropProfiler.Instance.RecordBindFailure(GetMethods(), bindTicks, conversionTicks);
                 }
-                else if (list.Count > 0 && list[0].Valid)
-                {
-                    value.Append($" for {list[0].Value.DeclaringType?.Name}.{list[0].Value.Name}");
-                }
-
-                value.Append(": ");
-                Runtime.PyErr_Fetch(out var errType, out var errVal, out var errTrace);
-                AppendArgumentTypes(to: value, args);
-                Runtime.PyErr_Restore(errType.StealNullable(), errVal.StealNullable(), errTrace.StealNullable());
-                return Exceptions.RaiseTypeError(value.ToString());
+                return RaiseNoMatch(args, methodinfo);
             }
 
             if (allow_threads)
@@ -903,6 +974,7 @@ namespace Python.Runtime
                 ts = PythonEngine.BeginAllowThreads();
             }
 
+            long invokeStart = profile ? InteropProfiler.Timestamp() : 0;
             try
             {
                 result = binding.info.Invoke(binding.inst, BindingFlags.Default, null, binding.args, null);
@@ -917,7 +989,14 @@ namespace Python.Runtime
                 {
                     PythonEngine.EndAllowThreads(ts);
                 }
+                BorrowedPyObject.Release(binding.args);
                 Exceptions.SetError(e);
+                if (profile)
+                {
+                    InteropProfiler.Instance.RecordCall(binding.info, bindTicks, conversionTicks,
+                        invokeTicks: InteropProfiler.Timestamp() - invokeStart, resultTicks: 0,
+                        exceptionTranslated: true);
+                }
                 return default;
             }
 
@@ -926,6 +1005,187 @@ namespace Python.Runtime
                 PythonEngine.EndAllowThreads(ts);
             }
 
+            long resultStart = profile ? InteropProfiler.Timestamp() : 0;
+            var converted = ConvertResult(binding, result);
+            // the result may be one of the borrowed arguments
+            BorrowedPyObject.Release(binding.args);
+            if (profile)
+            {
+                InteropProfiler.Instance.RecordCall(binding.info, bindTicks, conversionTicks,
+                    invokeTicks: resultStart - invokeStart,
+                    resultTicks: InteropProfiler.Timestamp() - resultStart,
+                    exceptionTranslated: false);
+            }
+            return converted;
+        }
+
+        NewReference RaiseNoMatch(BorrowedReference args, MethodBase[]? methodinfo)
+        {
+            var value = new StringBuilder("No method matches given arguments");
+            if (methodinfo != null && methodinfo.Length > 0)
+            {
+                value.Append($" for {methodinfo[0].DeclaringType?.Name}.{methodinfo[0].Name}");
+            }
+            else if (list.Count > 0 && list[0].Valid)
+            {
+                value.Append($" for {list[0].Value.DeclaringType?.Name}.{list[0].Value.Name}");
+            }
+
+            value.Append(": ");
+            Runtime.PyErr_Fetch(out var errType, out var errVal, out var errTrace);
+            AppendArgumentTypes(to: value, args);
+            Runtime.PyErr_Restore(errType.StealNullable(), errVal.StealNullable(), errTrace.StealNullable());
+            return Exceptions.RaiseTypeError(value.ToString());
+        }
+
+        /// <summary>
+        /// Invokes the method once for every argument tuple in <paramref name="argTuples"/>
+        /// on the thread pool, and returns a list of the results in the same order.
+        /// </summary>
+        /// <remarks>
+        /// Arguments are converted up front with the GIL held. Once an overload
+        /// has been selected, the following argument tuples are first bound
+        /// against that overload only, and fall back to full overload
+        /// resolution if that fails. The GIL is released while the calls run,
+        /// unless the method forbids Python threads, in which case they run
+        /// sequentially. Exceptions thrown by the calls are raised together as
+        /// an <see cref="AggregateException"/>.
+        /// </remarks>
+        internal NewReference InvokeParallel(BorrowedReference inst, BorrowedReference argTuples, MethodBase? info, MethodBase[]? methodinfo, int maxDegreeOfParallelism)
+        {
+            if (GetMethods().Length == 0)
+            {
+                return Exceptions.RaiseTypeError("The underlying C# method(s) have been deleted");
+            }
+
+            int count = checked((int)Runtime.PyList_Size(argTuples));
+            var bindings = new Binding[count];
+            // overloads are selected by argument types, so items with the same
+            // Python argument types reuse the overload selected for the first one
+            var overloads = new Dictionary<IntPtr[], MethodBase>(ArgumentTypesComparer.Instance);
+            for (int i = 0; i < count; i++)
+            {
+                BorrowedReference args = Runtime.PyList_GetItem(argTuples, i);
+                IntPtr[] argTypes = GetArgumentTypes(args);
+                Binding? binding = null;
+                if (overloads.TryGetValue(argTypes, out var overload))
+                {
+                    binding = Bind(inst, args, BorrowedReference.Null, overload);
+                    if (binding is null) Exceptions.Clear();
+                }
+                if (binding is null)
+                {
+                    binding = Bind(inst, args, BorrowedReference.Null, info, methodinfo);
+                    if (binding is null)
+                    {
+                        for (int bound = 0; bound < i; bound++)
+                        {
+                            BorrowedPyObject.Release(bindings[bound].args);
+                        }
+                        return RaiseNoMatch(args, methodinfo);
+                    }
+                    overloads[argTypes] = binding.info;
+                }
+                bindings[i] = binding;
+            }
+
+            var results = new object?[count];
+            var errors = new Exception?[count];
+            void InvokeAt(int i)
+            {
+                Binding binding = bindings[i];
+                try
+                {
+                    results[i] = binding.info.Invoke(binding.inst, BindingFlags.Default, null, binding.args, null);
+                }
+                catch (Exception e)
+                {
+                    errors[i] = e is TargetInvocationException { InnerException: { } inner } ? inner : e;
+                }
+            }
+
+            if (allow_threads)
+            {
+                var options = new ParallelOptions { MaxDegreeOfParallelism = maxDegreeOfParallelism };
+                IntPtr ts = PythonEngine.BeginAllowThreads();
+                try
+                {
+                    Parallel.For(0, count, options, InvokeAt);
+                }
+                finally
+                {
+                    PythonEngine.EndAllowThreads(ts);
+                }
+            }
+            else
+            {
+                for (int i = 0; i < count; i++) InvokeAt(i);
+            }
+
+            try
+            {
+                var failures = errors.WhereNotNull().ToArray();
+                if (failures.Length > 0)
+                {
+                    Exceptions.SetError(new AggregateException(failures));
+                    return default;
+                }
+
+                using var list = Runtime.PyList_New(count);
+                for (int i = 0; i < count; i++)
+                {
+                    using var item = ConvertResult(bindings[i], results[i]);
+                    if (item.IsNull()) return default;
+                    Runtime.PyList_SetItem(list.Borrow(), i, item.Steal());
+                }
+                return list.Move();
+            }
+            finally
+            {
+                foreach (var binding in bindings)
+                {
+                    BorrowedPyObject.Release(binding.args);
+                }
+            }
+        }
+
+        static IntPtr[] GetArgumentTypes(BorrowedReference args)
+        {
+            var types = new IntPtr[Runtime.PyTuple_Size(args)];
+            for (int i = 0; i < types.Length; i++)
+            {
+                types[i] = Runtime.PyObject_TYPE(Runtime.PyTuple_GetItem(args, i)).DangerousGetAddress();
+            }
+            return types;
+        }
+
+        sealed class ArgumentTypesComparer : IEqualityComparer<IntPtr[]>
+        {
+            public static ArgumentTypesComparer Instance { get; } = new();
+
+            public bool Equals(IntPtr[] x, IntPtr[] y)
+            {
+                if (x.Length != y.Length) return false;
+                for (int i = 0; i < x.Length; i++)
+                {
+                    if (x[i] != y[i]) return false;
+                }
+                return true;
+            }
+
+            public int GetHashCode(IntPtr[] types)
+            {
+                int hash = types.Length;
+                foreach (IntPtr type in types)
+                {
+                    hash = hash * 31 + type.GetHashCode();
+                }
+                return hash;
+            }
+        }
+
+        static NewReference ConvertResult(Binding binding, object? result)
+        {
             // If there are out parameters, we return a tuple containing
             // the result, if any, followed by the out parameters. If there is only
             // one out parameter and the return type of the method is void,
@@ -37,7 +37,7 @@ class SizedMixin(col.Sized):
 
 class ContainerMixin(col.Container):
     def __contains__(self, item):
-        if hasattr('self', 'Contains'):
+        if hasattr(self, 'Contains'):
             return self.Contains(item)
         else:
             from System.Collections.Generic import ICollection
@@ -78,18 +78,18 @@ class MutableMappingMixin(MappingMixin, col.MutableMapping):
         self.Clear()
 
     def pop(self, key, default=_UNSET_):
-        existed, item = self.TryGetValue(key, None)
-        if existed:
+        item = self.get(key, self._UNSET_)
+        if item is not self._UNSET_:
             self.Remove(key)
             return item
-        elif default == self._UNSET_:
+        elif default is self._UNSET_:
             raise KeyError(key)
         else:
             return default
 
     def setdefault(self, key, value=None):
-        existed, item = self.TryGetValue(key, None)
-        if existed:
+        item = self.get(key, self._UNSET_)
+        if item is not self._UNSET_:
             return item
         else:
             self[key] = value
@@ -7,8 +7,21 @@ namespace Python.Runtime.Native
 
     static class ABI
     {
-        public static int RefCountOffset { get; } = GetRefCountOffset();
+        /// <summary>
+        /// Offset of <c>ob_refcnt</c>, or of <c>ob_ref_shared</c> in free-threaded builds.
+        /// </summary>
+        public static int RefCountOffset { get; }
         public static int ObjectHeadOffset => RefCountOffset;
+        /// <summary>
+        /// Whether the object header has the free-threaded (PEP 703) layout,
+        /// that splits the reference count into a local and a shared part.
+        /// </summary>
+        public static bool IsFreeThreaded { get; }
+
+        static ABI()
+        {
+            (RefCountOffset, IsFreeThreaded) = FindObjectHead();
+        }
 
         internal static void Initialize(Version version)
         {
@@ -34,18 +47,24 @@ namespace Python.Runtime.Native
             TypeOffset.Use(typeOffsets, nativeOffsetsClass == null ? ObjectHeadOffset : 0);
         }
 
-        static unsafe int GetRefCountOffset()
+        static unsafe (int refCountOffset, bool freeThreaded) FindObjectHead()
         {
             using var tempObject = Runtime.PyList_New(0);
+            using var type = Runtime.PyObject_Type(tempObject.Borrow());
             IntPtr* tempPtr = (IntPtr*)tempObject.DangerousGetAddress();
-            int offset = 0;
-            while(tempPtr[offset] != (IntPtr)1)
+            // ob_type follows ob_refcnt, or ob_ref_shared in free-threaded builds,
+            // so the rest of the type offsets only move by the size of the extra fields
+            int offset = 1;
+            while (tempPtr[offset] != type.DangerousGetAddress())
             {
                 offset++;
                 if (offset > 100)
                     throw new InvalidProgramException("PyObject_HEAD could not be found withing reasonable distance from the start of PyObject");
             }
-            return offset * IntPtr.Size;
+            // the only reference to the new list is counted in ob_ref_local
+            // in free-threaded builds, which leaves ob_ref_shared at zero
+            bool freeThreaded = tempPtr[offset - 1] != (IntPtr)1;
+            return ((offset - 1) * IntPtr.Size, freeThreaded);
         }
     }
 }
@@ -17,6 +17,12 @@ namespace Python.Runtime
             d(a1);
         }
 
+        public static NewReference Call_2(IntPtr fp, BorrowedReference a1, BorrowedReference a2)
+        {
+            var d = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)fp;
+            return d(a1, a2);
+        }
+
         public static NewReference Call_3(IntPtr fp, BorrowedReference a1, BorrowedReference a2, BorrowedReference a3)
         {
             var d = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference>)fp;
@@ -17,8 +17,11 @@ namespace Python.Runtime
         [MarshalAs(UnmanagedType.Bool)]
         public bool _readonly;
         public int ndim;
-        [MarshalAs(UnmanagedType.LPStr)]
-        public string? format;
+        /// <summary>
+        /// Owned by the exporter. Not marshaled as a string, because the
+        /// marshaler would free it after the call.
+        /// </summary>
+        public IntPtr format;
         public IntPtr shape;
         public IntPtr strides;
         public IntPtr suboffsets;
@@ -0,0 +1,35 @@
+using System.Runtime.InteropServices;
+
+namespace Python.Runtime.Native;
+
+/// <remarks><c>PyInterpreterConfig</c>, available since Python 3.12</remarks>
+[StructLayout(LayoutKind.Sequential)]
+struct PyInterpreterConfig
+{
+    public const int DefaultGil = 0;
+    public const int SharedGil = 1;
+    public const int OwnGil = 2;
+
+    public int use_main_obmalloc;
+    public int allow_fork;
+    public int allow_exec;
+    public int allow_threads;
+    public int allow_daemon_threads;
+    public int check_multi_interp_extensions;
+    public int gil;
+
+    /// <summary>
+    /// Equivalent of <c>_PyInterpreterConfig_INIT</c>: an isolated interpreter
+    /// with its own GIL and object allocator.
+    /// </summary>
+    public static PyInterpreterConfig Isolated => new()
+    {
+        use_main_obmalloc = 0,
+        allow_fork = 0,
+        allow_exec = 0,
+        allow_threads = 1,
+        allow_daemon_threads = 0,
+        check_multi_interp_extensions = 1,
+        gil = OwnGil,
+    };
+}
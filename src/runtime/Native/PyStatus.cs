@@ -0,0 +1,29 @@
+using System;
+using System.Runtime.InteropServices;
+
+namespace Python.Runtime.Native;
+
+/// <remarks><c>PyStatus</c></remarks>
+[StructLayout(LayoutKind.Sequential)]
+struct PyStatus
+{
+    public const int TypeOk = 0;
+    public const int TypeError = 1;
+    public const int TypeExit = 2;
+
+    public int _type;
+    public IntPtr func;
+    public IntPtr err_msg;
+    public int exitcode;
+
+    public bool IsOk => _type == TypeOk;
+
+    public override string ToString()
+    {
+        string? message = Marshal.PtrToStringAnsi(err_msg);
+        string? function = Marshal.PtrToStringAnsi(func);
+        return _type == TypeExit
+            ? $"exit code {exitcode}"
+            : function is null ? message ?? "unknown error" : $"{function}: {message}";
+    }
+}
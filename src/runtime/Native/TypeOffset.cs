@@ -168,13 +168,15 @@ namespace Python.Runtime
             {
                 var slots = managedType.GetMethods(BindingFlags.Public | BindingFlags.Static);
                 foreach(var slot in slots)
-                    if (!present.Contains(slot.Name))
+                    if (!present.Contains(slot.Name)
+                        && !slot.IsDefined(typeof(ModuleFunctionAttribute), inherit: false))
                         missing.Add(slot.Name);
             }
             foreach (string notSlot in new[]
             {
                 "__instancecheck__",
                 "__subclasscheck__",
+                "__dir__",
                 "AddReference",
                 "FindAssembly",
                 "get_SuppressDocs",
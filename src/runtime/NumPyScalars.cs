@@ -0,0 +1,219 @@
+using System;
+using System.Collections.Concurrent;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Converts NumPy scalars (<c>numpy.float64</c>, <c>numpy.int32</c>,
+    /// <c>numpy.bool_</c>, ...) and 0-d arrays to .NET primitives.
+    /// </summary>
+    /// <remarks>
+    /// Whether a Python type comes from NumPy is determined once per type.
+    /// Values of those types are read through the buffer protocol, which
+    /// NumPy scalars and arrays export as 0-dimensional buffers with a
+    /// <c>struct</c> module format, so NumPy does not need to be imported.
+    /// NumPy integers are not Python <c>int</c>s, and <c>numpy.bool_</c>
+    /// is not a Python <c>bool</c>, so the generic conversions reject them.
+    /// </remarks>
+    internal static class NumPyScalars
+    {
+        /// <summary>
+        /// Whether static types are NumPy types. NumPy scalar types are static,
+        /// and static types are never freed, so their address is not reused.
+        /// </summary>
+        static readonly ConcurrentDictionary<IntPtr, bool> staticTypes = new();
+
+        internal enum Conversion
+        {
+            /// <summary>The value is not a NumPy scalar of a kind, that converts to the type.</summary>
+            NotApplicable,
+            Converted,
+            Overflow,
+        }
+
+        enum Kind
+        {
+            Boolean,
+            Signed,
+            Unsigned,
+            Real,
+        }
+
+        /// <summary>
+        /// Converts <paramref name="value"/> to the primitive type <paramref name="typeCode"/>,
+        /// if it is a NumPy scalar or 0-d array.
+        /// </summary>
+        internal static Conversion TryConvert(BorrowedReference value, TypeCode typeCode, out object? result)
+        {
+            result = null;
+            // numpy.float64 is a float, and is read by the generic conversion
+            if (Runtime.PyInt_Check(value) || Runtime.PyFloat_Check(value) || Runtime.PyString_CheckExact(value)
+                || !IsNumPyType(Runtime.PyObject_TYPE(value))
+                || !TryRead(value, out Kind kind, out long signed, out ulong unsigned, out double real))
+            {
+                return Conversion.NotApplicable;
+            }
+
+            switch (typeCode)
+            {
+                case TypeCode.Boolean:
+                    if (kind != Kind.Boolean) return Conversion.NotApplicable;
+                    result = signed != 0;
+                    return Conversion.Converted;
+
+                case TypeCode.Single:
+                case TypeCode.Double:
+                    double number = kind switch
+                    {
+                        Kind.Real => real,
+                        Kind.Unsigned => unsigned,
+                        _ => signed,
+                    };
+                    if (typeCode == TypeCode.Double)
+                    {
+                        result = number;
+                        return Conversion.Converted;
+                    }
+                    if ((number > float.MaxValue || number < float.MinValue) && !double.IsInfinity(number))
+                    {
+                        return Conversion.Overflow;
+                    }
+                    result = (float)number;
+                    return Conversion.Converted;
+
+                default:
+                    if (kind == Kind.Real) return Conversion.NotApplicable;
+                    if (kind == Kind.Unsigned && unsigned > long.MaxValue)
+                    {
+                        if (typeCode != TypeCode.UInt64) return Conversion.Overflow;
+                        result = unsigned;
+                        return Conversion.Converted;
+                    }
+                    return ToInteger(kind == Kind.Unsigned ? (long)unsigned : signed, typeCode, out result);
+            }
+        }
+
+        static Conversion ToInteger(long value, TypeCode typeCode, out object? result)
+        {
+            result = typeCode switch
+            {
+                TypeCode.Char when value is >= char.MinValue and <= char.MaxValue => (char)value,
+                TypeCode.SByte when value is >= sbyte.MinValue and <= sbyte.MaxValue => (sbyte)value,
+                TypeCode.Byte when value is >= byte.MinValue and <= byte.MaxValue => (byte)value,
+                TypeCode.Int16 when value is >= short.MinValue and <= short.MaxValue => (short)value,
+                TypeCode.UInt16 when value is >= ushort.MinValue and <= ushort.MaxValue => (ushort)value,
+                TypeCode.Int32 when value is >= int.MinValue and <= int.MaxValue => (int)value,
+                TypeCode.UInt32 when value is >= uint.MinValue and <= uint.MaxValue => (uint)value,
+                TypeCode.Int64 => value,
+                TypeCode.UInt64 when value >= 0 => (ulong)value,
+                _ => null,
+            };
+            if (result is not null) return Conversion.Converted;
+            return typeCode is >= TypeCode.Char and <= TypeCode.UInt64 ? Conversion.Overflow : Conversion.NotApplicable;
+        }
+
+        static bool IsNumPyType(BorrowedReference type)
+        {
+            if ((PyType.GetFlags(type) & TypeFlags.HeapType) == 0)
+            {
+                return staticTypes.GetOrAdd(type.DangerousGetAddress(), Recognize);
+            }
+            // heap types, e.g. classes created in loops, are not cached,
+            // so that they can be freed. Reflected .NET types are never NumPy types.
+            return Runtime.PyObject_TYPE(type) != Runtime.PyCLRMetaType.Reference
+                && Recognize(type.DangerousGetAddress());
+        }
+
+        static bool Recognize(IntPtr address)
+        {
+            var type = new BorrowedReference(address);
+            using var module = Runtime.PyObject_GetAttrString(type, "__module__");
+            if (module.IsNull())
+            {
+                Exceptions.Clear();
+                return false;
+            }
+            return Runtime.GetManagedString(module.Borrow()) == "numpy";
+        }
+
+        static unsafe bool TryRead(BorrowedReference value, out Kind kind,
+                                   out long signed, out ulong unsigned, out double real)
+        {
+            kind = default;
+            signed = 0;
+            unsigned = 0;
+            real = 0;
+
+            if (Runtime.PyObject_GetBuffer(value, out Py_buffer view, (int)(PyBUF.FORMATS | PyBUF.ND)) != 0)
+            {
+                Exceptions.Clear();
+                return false;
+            }
+            try
+            {
+                if (view.ndim != 0 || view.len != view.itemsize || view.format == IntPtr.Zero)
+                {
+                    return false;
+                }
+
+                byte* format = (byte*)view.format;
+                if (*format is (byte)'@' or (byte)'=') format++;
+                if (format[0] == 0 || format[1] != 0) return false;
+
+                void* data = (void*)view.buf;
+                switch ((char)format[0])
+                {
+                    case '?':
+                        kind = Kind.Boolean;
+                        signed = *(byte*)data != 0 ? 1 : 0;
+                        return true;
+
+                    case 'b': case 'h': case 'i': case 'l': case 'q': case 'n':
+                        kind = Kind.Signed;
+                        switch (view.itemsize)
+                        {
+                            case 1: signed = *(sbyte*)data; return true;
+                            case 2: signed = *(short*)data; return true;
+                            case 4: signed = *(int*)data; return true;
+                            case 8: signed = *(long*)data; return true;
+                            default: return false;
+                        }
+
+                    case 'B': case 'H': case 'I': case 'L': case 'Q': case 'N':
+                        kind = Kind.Unsigned;
+                        switch (view.itemsize)
+                        {
+                            case 1: unsigned = *(byte*)data; return true;
+                            case 2: unsigned = *(ushort*)data; return true;
+                            case 4: unsigned = *(uint*)data; return true;
+                            case 8: unsigned = *(ulong*)data; return true;
+                            default: return false;
+                        }
+
+                    case 'f' when view.itemsize == sizeof(float):
+                        kind = Kind.Real;
+                        real = *(float*)data;
+                        return true;
+
+                    case 'd' when view.itemsize == sizeof(double):
+                        kind = Kind.Real;
+                        real = *(double*)data;
+                        return true;
+
+                    default:
+                        // half and extended precision floats, complex numbers, objects, ...
+                        return false;
+                }
+            }
+            finally
+            {
+                Runtime.PyBuffer_Release(ref view);
+            }
+        }
+
+        internal static void Reset()
+        {
+            staticTypes.Clear();
+        }
+    }
+}
@@ -0,0 +1,240 @@
+using System;
+using System.Linq;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Calls the overloads of a .NET operator, that implement a Python special
+    /// method like <c>__add__</c> or <c>__radd__</c>, without the general overload
+    /// resolution of <see cref="MethodBinder"/>.
+    /// </summary>
+    /// <remarks>
+    /// The overloads are bound once, in the order of precedence of the method
+    /// binder, to delegates typed with their operand and result types, so struct
+    /// operands are not copied into argument arrays, and primitive results are
+    /// not boxed. The first overload, that the Python operand converts to, is
+    /// called, which is the overload the method binder would select. Calls,
+    /// that the method binder would reject, are left to it to report.
+    /// </remarks>
+    internal sealed class OperatorBinder
+    {
+        readonly Overload[] overloads;
+        readonly int operandCount;
+        readonly bool allowThreads;
+
+        OperatorBinder(Overload[] overloads, int operandCount, bool allowThreads)
+        {
+            this.overloads = overloads;
+            this.operandCount = operandCount;
+            this.allowThreads = allowThreads;
+        }
+
+        /// <summary>
+        /// Binds the overloads of an operator, or returns <c>null</c>, if any of
+        /// <paramref name="methods"/> is not an operator, that can be bound.
+        /// </summary>
+        /// <param name="methods">The overloads, in order of precedence.</param>
+        /// <param name="reverse">Whether the Python operand is the left operand.</param>
+        /// <param name="allowThreads">Whether the GIL is released during calls.</param>
+        public static OperatorBinder? Create(MethodBase[] methods, bool reverse, bool allowThreads)
+        {
+            if (methods.Length == 0) return null;
+
+            int parameterCount = methods[0].GetParameters().Length;
+            if (parameterCount is not (1 or 2) || (reverse && parameterCount != 2)) return null;
+
+            var overloads = new Overload[methods.Length];
+            for (int i = 0; i < methods.Length; i++)
+            {
+                if (methods[i] is not MethodInfo { IsStatic: true, IsGenericMethod: false } method
+                    || !OperatorMethod.IsOperatorMethod(method)
+                    || (reverse && OperatorMethod.IsComparisonOp(method))
+                    || method.ReturnType == typeof(void)
+                    || method.GetParameters() is not { } parameters
+                    || parameters.Length != parameterCount
+                    || parameters.Any(p => p.IsOptional || p.IsDefined(typeof(ParamArrayAttribute), false))
+                    || Bind(method, parameters, reverse) is not { } overload)
+                {
+                    return null;
+                }
+                overloads[i] = overload;
+            }
+            return new OperatorBinder(overloads, operandCount: parameterCount - 1, allowThreads);
+        }
+
+        static Overload? Bind(MethodInfo method, ParameterInfo[] parameters, bool reverse)
+        {
+            var types = parameters.Select(p => p.ParameterType).Append(method.ReturnType).ToArray();
+            if (types.Any(t => t.IsByRef || t.IsPointer || t.ContainsGenericParameters)) return null;
+
+            try
+            {
+                var overloadType = types.Length == 2
+                    ? typeof(UnaryOverload<,>).MakeGenericType(types)
+                    : typeof(BinaryOverload<,,>).MakeGenericType(types);
+                return (Overload)Activator.CreateInstance(overloadType, method, reverse);
+            }
+            catch (Exception e) when (e is ArgumentException or NotSupportedException or TargetInvocationException)
+            {
+                // e.g. by-ref like types, that can not be type arguments
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Calls the operator with the instance <paramref name="inst"/>, and the
+        /// Python <paramref name="operand"/>, which is null for unary operators.
+        /// Returns <c>false</c>, if the method binder has to be used instead.
+        /// </summary>
+        public bool TryInvoke(BorrowedReference inst, BorrowedReference operand, out NewReference result)
+        {
+            result = default;
+            if ((operand.IsNull ? 0 : 1) != operandCount
+                || ManagedType.GetManagedObject(inst) is not CLRObject { inst: var instance })
+            {
+                return false;
+            }
+
+            foreach (var overload in overloads)
+            {
+                switch (overload.TryInvoke(instance, operand, allowThreads, out result))
+                {
+                    case Dispatch.Mismatch:
+                        continue;
+                    case Dispatch.Invoked:
+                        return true;
+                    default:
+                        return false;
+                }
+            }
+            return false;
+        }
+
+        enum Dispatch
+        {
+            /// <summary>The operand does not convert to the overload.</summary>
+            Mismatch,
+            /// <summary>The overload was called.</summary>
+            Invoked,
+            /// <summary>The overload is selected, but can not be called directly.</summary>
+            Unbound,
+        }
+
+        abstract class Overload
+        {
+            public abstract Dispatch TryInvoke(object instance, BorrowedReference operand, bool allowThreads,
+                                               out NewReference result);
+
+            /// <summary>
+            /// Converts <paramref name="operand"/> the way the method binder converts arguments.
+            /// </summary>
+            protected static bool TryConvert<T>(BorrowedReference operand, out T value)
+            {
+                if (ManagedType.GetManagedObject(operand) is CLRObject { inst: T clrValue })
+                {
+                    value = clrValue;
+                    return true;
+                }
+                if (Converter.ToManaged(operand, typeof(T), out object? converted, setError: false))
+                {
+                    value = (T)converted!;
+                    return true;
+                }
+                if (Exceptions.ErrorOccurred()) Runtime.PyErr_Clear();
+                value = default!;
+                return false;
+            }
+
+            /// <summary>Sets the Python error for an exception thrown by the operator.</summary>
+            protected static Dispatch Throw(Exception e, bool allowThreads, IntPtr threadState, out NewReference result)
+            {
+                if (allowThreads) PythonEngine.EndAllowThreads(threadState);
+                Exceptions.SetError(e);
+                result = default;
+                return Dispatch.Invoked;
+            }
+
+            protected static Dispatch Return<TResult>(TResult value, bool allowThreads, IntPtr threadState,
+                                                      out NewReference result)
+            {
+                if (allowThreads) PythonEngine.EndAllowThreads(threadState);
+                result = TypedConverter<TResult>.ToPython(value);
+                return Dispatch.Invoked;
+            }
+        }
+
+        sealed class UnaryOverload<TOperand, TResult> : Overload
+        {
+            readonly Func<TOperand, TResult> invoke;
+
+            public UnaryOverload(MethodInfo method, bool reverse)
+            {
+                invoke = (Func<TOperand, TResult>)Delegate.CreateDelegate(typeof(Func<TOperand, TResult>), method);
+            }
+
+            public override Dispatch TryInvoke(object instance, BorrowedReference operand, bool allowThreads,
+                                               out NewReference result)
+            {
+                result = default;
+                if (instance is not TOperand value) return Dispatch.Unbound;
+
+                IntPtr ts = allowThreads ? PythonEngine.BeginAllowThreads() : IntPtr.Zero;
+                TResult returned;
+                try
+                {
+                    returned = invoke(value);
+                }
+                catch (Exception e)
+                {
+                    return Throw(e, allowThreads, ts, out result);
+                }
+                return Return(returned, allowThreads, ts, out result);
+            }
+        }
+
+        sealed class BinaryOverload<TLeft, TRight, TResult> : Overload
+        {
+            readonly Func<TLeft, TRight, TResult> invoke;
+            readonly bool reverse;
+
+            public BinaryOverload(MethodInfo method, bool reverse)
+            {
+                invoke = (Func<TLeft, TRight, TResult>)Delegate.CreateDelegate(typeof(Func<TLeft, TRight, TResult>), method);
+                this.reverse = reverse;
+            }
+
+            public override Dispatch TryInvoke(object instance, BorrowedReference operand, bool allowThreads,
+                                               out NewReference result)
+            {
+                result = default;
+                TLeft left;
+                TRight right;
+                if (reverse)
+                {
+                    if (!TryConvert(operand, out left)) return Dispatch.Mismatch;
+                    if (instance is not TRight bound) return Dispatch.Unbound;
+                    right = bound;
+                }
+                else
+                {
+                    if (!TryConvert(operand, out right)) return Dispatch.Mismatch;
+                    if (instance is not TLeft bound) return Dispatch.Unbound;
+                    left = bound;
+                }
+
+                IntPtr ts = allowThreads ? PythonEngine.BeginAllowThreads() : IntPtr.Zero;
+                TResult returned;
+                try
+                {
+                    returned = invoke(left, right);
+                }
+                catch (Exception e)
+                {
+                    return Throw(e, allowThreads, ts, out result);
+                }
+                return Return(returned, allowThreads, ts, out result);
+            }
+        }
+    }
+}
@@ -12,11 +12,29 @@ public static class Py
 {
     public static GILState GIL() => PythonEngine.DebugGIL ? new DebugGILState() : new GILState();
 
+    /// <summary>
+    /// Acquires the GIL for the current thread until the returned scope is
+    /// disposed. Unlike <see cref="GIL"/>, this does not allocate, and it does
+    /// not call into Python at all if the current thread already holds the GIL
+    /// through an enclosing scope.
+    /// </summary>
+    /// <remarks>
+    /// Scopes must be disposed on the same thread, in the reverse order they
+    /// were entered, and must not be held across <c>yield return</c> or
+    /// <c>await</c>. Use them with <c>using</c>. Disposing a scope before a
+    /// scope entered after it throws <see cref="InvalidOperationException"/>.
+    /// </remarks>
+    public static GILScope EnterGIL() => GILScope.Enter();
+
     public static PyModule CreateScope() => new();
     public static PyModule CreateScope(string name)
         => new(name ?? throw new ArgumentNullException(nameof(name)));
 
 
+    /// <summary>
+    /// Holds a <c>PyGILState_Ensure</c>/<c>PyGILState_Release</c> pair.
+    /// Unlike <see cref="GILScope"/>, handles may be disposed in any order.
+    /// </summary>
     public class GILState : IDisposable
     {
         private readonly PyGILState state;
@@ -58,6 +76,82 @@ public static class Py
         }
     }
 
+    /// <summary>
+    /// Holds the GIL until disposed. See <see cref="EnterGIL"/>.
+    /// </summary>
+    public struct GILScope : IDisposable
+    {
+        // Thread states saved by PythonEngine.BeginAllowThreads on the current
+        // thread (e.g. while a .NET method called from Python runs), that were
+        // not restored yet. Their count is the allow-threads level.
+        [ThreadStatic]
+        static List<IntPtr>? allowThreadsStates;
+        // Allow-threads level + 1 at the time the innermost scope on the
+        // current thread acquired the GIL, or 0 if there is none.
+        // Scopes entered at the same level know, that the GIL is held.
+        [ThreadStatic]
+        static int ownerLevel;
+
+        readonly PyGILState state;
+        readonly int level;
+        readonly int previousOwnerLevel;
+        readonly int ownerThread;
+        bool acquired;
+
+        GILScope(PyGILState state, int level, int previousOwnerLevel, int ownerThread)
+        {
+            this.state = state;
+            this.level = level;
+            this.previousOwnerLevel = previousOwnerLevel;
+            this.ownerThread = ownerThread;
+            this.acquired = true;
+        }
+
+        static int AllowThreadsLevel => allowThreadsStates?.Count ?? 0;
+
+        internal static GILScope Enter()
+        {
+            int level = AllowThreadsLevel + 1;
+            if (ownerLevel == level) return default;
+
+            var state = PythonEngine.AcquireLock();
+            var scope = new GILScope(state, level, ownerLevel,
+                                     PythonEngine.DebugGIL ? Environment.CurrentManagedThreadId : 0);
+            ownerLevel = level;
+            return scope;
+        }
+
+        internal static void OnAllowThreads(IntPtr threadState)
+            => (allowThreadsStates ??= new List<IntPtr>()).Add(threadState);
+
+        internal static void OnDisallowThreads(IntPtr threadState)
+        {
+            // EndAllowThreads might be called on a different thread, than the
+            // matching BeginAllowThreads. Then the level of this thread is
+            // unchanged, and the other thread conservatively keeps its level,
+            // so its scopes keep acquiring the GIL.
+            var states = allowThreadsStates;
+            if (states is { Count: > 0 } && states[states.Count - 1] == threadState)
+            {
+                states.RemoveAt(states.Count - 1);
+            }
+        }
+
+        public void Dispose()
+        {
+            if (!acquired) return;
+
+            if (ownerThread != 0 && ownerThread != Environment.CurrentManagedThreadId)
+                throw new InvalidOperationException("GIL must always be released from the same thread, that acquired it");
+            if (ownerLevel != level)
+                throw new InvalidOperationException("GIL scopes must be disposed once, in the reverse order they were entered");
+
+            acquired = false;
+            ownerLevel = previousOwnerLevel;
+            PythonEngine.ReleaseLock(state);
+        }
+    }
+
     public class KeywordArguments : PyDict
     {
         public KeywordArguments() : base()
@@ -134,7 +228,7 @@ public static class Py
     {
         if (argv is null) throw new ArgumentNullException(nameof(argv));
 
-        using (GIL())
+        using (EnterGIL())
         {
             string[] arr = argv.ToArray();
             Runtime.PySys_SetArgvEx(arr.Length, arr, 0);
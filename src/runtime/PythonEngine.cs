@@ -5,6 +5,8 @@ using System.Diagnostics;
 using System.Linq;
 using System.Reflection;
 using System.Runtime.InteropServices;
+using System.Threading;
+using System.Threading.Tasks;
 
 using Python.Runtime.Native;
 
@@ -21,6 +23,8 @@ namespace Python.Runtime
         private static IntPtr _programName = IntPtr.Zero;
         private static IntPtr _pythonPath = IntPtr.Zero;
         private static InteropConfiguration interopConfiguration = InteropConfiguration.MakeDefault();
+        private static readonly object dispatcherLock = new();
+        private static PythonExecutor? dispatcher;
 
         public PythonEngine()
         {
@@ -47,6 +51,13 @@ namespace Python.Runtime
             get { return initialized; }
         }
 
+        /// <summary>
+        /// Time spent in each phase of the last <see cref="Initialize()"/>, in order,
+        /// including resolving the Python C API, creating the built-in types and
+        /// loading the <c>clr</c> module. Empty before the first initialization.
+        /// </summary>
+        public static IReadOnlyList<StartupPhase> StartupPhases { get; private set; } = Array.Empty<StartupPhase>();
+
         private static void EnsureInitialized()
         {
             if (!IsInitialized)
@@ -58,6 +69,12 @@ namespace Python.Runtime
         /// <summary>Set to <c>true</c> to enable GIL debugging assistance.</summary>
         public static bool DebugGIL { get; set; } = false;
 
+        /// <summary>
+        /// Keeps Python thread states of .NET thread pool threads alive
+        /// between GIL acquisitions, when enabled.
+        /// </summary>
+        public static ThreadStatePool ThreadStatePool => ThreadStatePool.Instance;
+
         internal static DelegateManager DelegateManager
         {
             get
@@ -209,8 +226,10 @@ namespace Python.Runtime
             // throws an exception in its ctor.  This exception is eaten somehow
             // during an initial "import clr", and the world ends shortly thereafter.
             // This is probably masking some bad mojo happening somewhere in Runtime.Initialize().
+            var timer = new StartupTimer();
             delegateManager = new DelegateManager();
-            Runtime.Initialize(initSigs);
+            timer.Complete("DelegateManager");
+            Runtime.Initialize(initSigs, timer);
             initialized = true;
             Exceptions.Clear();
 
@@ -271,6 +290,8 @@ namespace Python.Runtime
             }
 
             ImportHook.UpdateCLRModuleDict();
+            timer.Complete("ClrModule");
+            StartupPhases = timer.Phases;
         }
 
         static BorrowedReference DefineModule(string name)
@@ -372,7 +393,7 @@ namespace Python.Runtime
                 return;
             }
 
-            using (Py.GIL())
+            using (Py.EnterGIL())
             {
                 if (Exceptions.ErrorOccurred())
                 {
@@ -387,6 +408,9 @@ namespace Python.Runtime
             AppDomain.CurrentDomain.DomainUnload -= OnDomainUnload;
             AppDomain.CurrentDomain.ProcessExit -= OnProcessExit;
 
+            PythonExecutor.DisposeAll();
+            dispatcher = null;
+            ScriptInterpreter.DisposeAll();
             ExecuteShutdownHandlers();
             // Remember to shut down the runtime.
             Runtime.Shutdown();
@@ -396,6 +420,68 @@ namespace Python.Runtime
             InteropConfiguration = InteropConfiguration.MakeDefault();
         }
 
+        /// <summary>
+        /// Creates a new PEP 684 sub-interpreter with its own GIL, that runs pure
+        /// Python scripts without .NET interop. Requires Python 3.12 or later.
+        /// </summary>
+        /// <remarks>
+        /// Script interpreters that are not disposed are finalized by <see cref="Shutdown"/>.
+        /// </remarks>
+        public static ScriptInterpreter CreateScriptInterpreter()
+        {
+            EnsureInitialized();
+            if (!Runtime.SupportsIsolatedInterpreters)
+                throw new NotSupportedException("Script interpreters require Python 3.12 or later");
+
+            return ScriptInterpreter.Create();
+        }
+
+        /// <summary>
+        /// Creates an executor, that runs work submitted from any thread on
+        /// <paramref name="threadCount"/> dedicated threads, taking the GIL once
+        /// per batch of up to <paramref name="maxBatchSize"/> work items.
+        /// </summary>
+        /// <param name="threadCount">Number of dedicated threads.</param>
+        /// <param name="capacity">Number of work items, that can be queued before submitting blocks.</param>
+        /// <param name="maxBatchSize">Maximum number of work items to run before releasing the GIL.</param>
+        /// <remarks>
+        /// Executors that are not disposed are disposed by <see cref="Shutdown"/>.
+        /// </remarks>
+        public static PythonExecutor CreateExecutor(int threadCount = 1, int capacity = 1024, int maxBatchSize = 64)
+        {
+            EnsureInitialized();
+            return PythonExecutor.Create(threadCount, capacity, maxBatchSize);
+        }
+
+        /// <summary>
+        /// Runs <paramref name="func"/> with the GIL held on the thread of a shared
+        /// <see cref="PythonExecutor"/>, which is created on first use.
+        /// </summary>
+        /// <inheritdoc cref="PythonExecutor.Run{T}(Func{T}, CancellationToken)"/>
+        public static Task<T> Dispatch<T>(Func<T> func, CancellationToken cancellationToken = default)
+            => GetDispatcher().Run(func, cancellationToken);
+
+        /// <inheritdoc cref="Dispatch{T}(Func{T}, CancellationToken)"/>
+        public static Task Dispatch(Action action, CancellationToken cancellationToken = default)
+            => GetDispatcher().Run(action, cancellationToken);
+
+        /// <inheritdoc cref="PythonExecutor.Run{T}(Func{Task{T}}, CancellationToken)"/>
+        public static Task<T> Dispatch<T>(Func<Task<T>> func, CancellationToken cancellationToken = default)
+            => GetDispatcher().Run(func, cancellationToken);
+
+        /// <inheritdoc cref="PythonExecutor.Run(Func{Task}, CancellationToken)"/>
+        public static Task Dispatch(Func<Task> func, CancellationToken cancellationToken = default)
+            => GetDispatcher().Run(func, cancellationToken);
+
+        static PythonExecutor GetDispatcher()
+        {
+            EnsureInitialized();
+            lock (dispatcherLock)
+            {
+                return dispatcher ??= PythonExecutor.Create(threadCount: 1, capacity: 1024, maxBatchSize: 64);
+            }
+        }
+
         /// <summary>
         /// Called when the engine is shut down.
         ///
@@ -476,7 +562,9 @@ namespace Python.Runtime
         /// </remarks>
         internal static PyGILState AcquireLock()
         {
-            return Runtime.PyGILState_Ensure();
+            return ThreadStatePool.IsEnabled
+                ? ThreadStatePool.Instance.Ensure()
+                : Runtime.PyGILState_Ensure();
         }
 
 
@@ -507,7 +595,9 @@ namespace Python.Runtime
         /// </remarks>
         public static unsafe IntPtr BeginAllowThreads()
         {
-            return (IntPtr)Runtime.PyEval_SaveThread();
+            var ts = (IntPtr)Runtime.PyEval_SaveThread();
+            Py.GILScope.OnAllowThreads(ts);
+            return ts;
         }
 
 
@@ -524,6 +614,7 @@ namespace Python.Runtime
         public static unsafe void EndAllowThreads(IntPtr ts)
         {
             Runtime.PyEval_RestoreThread((PyThreadState*)ts);
+            Py.GILScope.OnDisallowThreads(ts);
         }
 
         public static PyObject Compile(string code, string filename = "", RunFlagType mode = RunFlagType.File)
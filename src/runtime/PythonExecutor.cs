@@ -0,0 +1,268 @@
+using System;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+
+using Python.Runtime.Native;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Runs work submitted from any .NET thread on one or more dedicated
+    /// threads, that take the GIL once per batch of queued work items.
+    /// Created by <see cref="PythonEngine.CreateExecutor"/>.
+    /// </summary>
+    /// <remarks>
+    /// When many threads use Python, each <see cref="Py.GIL"/> contends for
+    /// the GIL on its own. Submitting the work to an executor instead keeps
+    /// the GIL with its threads, which run queued items back to back.
+    /// <para>
+    /// The queue is bounded: when it is full, submitting work blocks until
+    /// an item is taken, or the cancellation token is canceled.
+    /// Work submitted from the executor's own threads runs inline.
+    /// </para>
+    /// </remarks>
+    public sealed class PythonExecutor : IDisposable
+    {
+        static readonly ConcurrentSet<PythonExecutor> alive = new();
+
+        [ThreadStatic]
+        static PythonExecutor? current;
+
+        readonly BlockingCollection<WorkItem> queue;
+        readonly Thread[] threads;
+        readonly int maxBatchSize;
+        int disposed;
+
+        PythonExecutor(int threadCount, int capacity, int maxBatchSize)
+        {
+            queue = new BlockingCollection<WorkItem>(capacity);
+            this.maxBatchSize = maxBatchSize;
+            threads = new Thread[threadCount];
+            for (int i = 0; i < threads.Length; i++)
+            {
+                threads[i] = new Thread(Run)
+                {
+                    IsBackground = true,
+                    Name = "Python executor",
+                };
+            }
+        }
+
+        internal static PythonExecutor Create(int threadCount, int capacity, int maxBatchSize)
+        {
+            if (threadCount < 1) throw new ArgumentOutOfRangeException(nameof(threadCount), "must be a positive number");
+            if (capacity < 1) throw new ArgumentOutOfRangeException(nameof(capacity), "must be a positive number");
+            if (maxBatchSize < 1) throw new ArgumentOutOfRangeException(nameof(maxBatchSize), "must be a positive number");
+
+            var executor = new PythonExecutor(threadCount, capacity, maxBatchSize);
+            foreach (var thread in executor.threads)
+            {
+                thread.Start();
+            }
+            alive.Add(executor);
+            return executor;
+        }
+
+        /// <summary>Number of dedicated threads.</summary>
+        public int ThreadCount => threads.Length;
+
+        /// <summary>Number of work items waiting to run.</summary>
+        public int PendingCount => queue.Count;
+
+        /// <summary>
+        /// Queues <paramref name="func"/> to run with the GIL held,
+        /// and returns a task, that completes with its result.
+        /// </summary>
+        /// <remarks>
+        /// Blocks while the queue is full. Canceling <paramref name="cancellationToken"/>
+        /// cancels the returned task, unless <paramref name="func"/> has already started.
+        /// <para>
+        /// Waiting for the returned task, e.g. through <see cref="Task{T}.Result"/>,
+        /// on a thread, that holds the GIL, deadlocks, because the executor threads
+        /// need the GIL to run the work. Release it first, e.g. with
+        /// <see cref="PythonEngine.BeginAllowThreads"/>.
+        /// </para>
+        /// </remarks>
+        /// <exception cref="ObjectDisposedException">The executor has been disposed.</exception>
+        public Task<T> Run<T>(Func<T> func, CancellationToken cancellationToken = default)
+        {
+            if (func is null) throw new ArgumentNullException(nameof(func));
+            return Submit(func, cancellationToken);
+        }
+
+        /// <summary>
+        /// Queues the asynchronous <paramref name="func"/> to run with the GIL held,
+        /// and returns a task, that completes with the result of the task it returns.
+        /// </summary>
+        /// <remarks>
+        /// Only the part of <paramref name="func"/> before its first incomplete
+        /// <c>await</c> runs on the executor with the GIL held. Continuations run
+        /// wherever the awaited task completes them, and must take the GIL with
+        /// <see cref="Py.GIL"/> before using Python.
+        /// </remarks>
+        /// <inheritdoc cref="Run{T}(Func{T}, CancellationToken)"/>
+        public Task<T> Run<T>(Func<Task<T>> func, CancellationToken cancellationToken = default)
+        {
+            if (func is null) throw new ArgumentNullException(nameof(func));
+            return Submit(func, cancellationToken).Unwrap();
+        }
+
+        /// <summary>
+        /// Queues <paramref name="action"/> to run with the GIL held,
+        /// and returns a task, that completes when it is done.
+        /// </summary>
+        /// <inheritdoc cref="Run{T}(Func{T}, CancellationToken)"/>
+        public Task Run(Action action, CancellationToken cancellationToken = default)
+        {
+            if (action is null) throw new ArgumentNullException(nameof(action));
+            return Submit<object?>(() =>
+            {
+                action();
+                return null;
+            }, cancellationToken);
+        }
+
+        /// <summary>
+        /// Queues the asynchronous <paramref name="func"/> to run with the GIL held,
+        /// and returns a task, that completes when the task it returns completes.
+        /// </summary>
+        /// <inheritdoc cref="Run{T}(Func{Task{T}}, CancellationToken)"/>
+        public Task Run(Func<Task> func, CancellationToken cancellationToken = default)
+        {
+            if (func is null) throw new ArgumentNullException(nameof(func));
+            return Submit(func, cancellationToken).Unwrap();
+        }
+
+        Task<T> Submit<T>(Func<T> func, CancellationToken cancellationToken)
+        {
+            if (cancellationToken.IsCancellationRequested) return Task.FromCanceled<T>(cancellationToken);
+
+            var item = new WorkItem<T>(func, cancellationToken);
+            if (current == this)
+            {
+                item.Execute();
+                return item.Completion.Task;
+            }
+
+            try
+            {
+                queue.Add(item, cancellationToken);
+            }
+            catch (OperationCanceledException)
+            {
+                item.Cancel();
+            }
+            catch (InvalidOperationException)
+            {
+                throw new ObjectDisposedException(nameof(PythonExecutor));
+            }
+            return item.Completion.Task;
+        }
+
+        /// <summary>
+        /// Stops accepting work, and waits for previously submitted work to complete.
+        /// </summary>
+        public unsafe void Dispose()
+        {
+            if (Interlocked.Exchange(ref disposed, 1) != 0) return;
+
+            queue.CompleteAdding();
+            alive.Remove(this);
+            // the remaining items are run by the other threads, or after the current one returns
+            if (current == this) return;
+
+            // the executor threads need the GIL to finish their work
+            bool holdsGIL = PythonEngine.IsInitialized && Runtime.PyThreadState_GetUnchecked() != null;
+            IntPtr threadState = holdsGIL ? PythonEngine.BeginAllowThreads() : IntPtr.Zero;
+            try
+            {
+                foreach (var thread in threads)
+                {
+                    thread.Join();
+                }
+            }
+            finally
+            {
+                if (holdsGIL) PythonEngine.EndAllowThreads(threadState);
+            }
+        }
+
+        internal static void DisposeAll()
+        {
+            foreach (var executor in alive)
+            {
+                executor.Dispose();
+            }
+        }
+
+        void Run()
+        {
+            current = this;
+            // keep the thread state of this thread between batches
+            PyGILState pin = Runtime.PyGILState_Ensure();
+            IntPtr threadState = PythonEngine.BeginAllowThreads();
+            try
+            {
+                foreach (var first in queue.GetConsumingEnumerable())
+                {
+                    using var _ = Py.EnterGIL();
+                    first.Execute();
+                    for (int count = 1; count < maxBatchSize && queue.TryTake(out var next); count++)
+                    {
+                        next.Execute();
+                    }
+                }
+            }
+            finally
+            {
+                PythonEngine.EndAllowThreads(threadState);
+                Runtime.PyGILState_Release(pin);
+                current = null;
+            }
+        }
+
+        abstract class WorkItem
+        {
+            public abstract void Execute();
+        }
+
+        sealed class WorkItem<T> : WorkItem
+        {
+            readonly Func<T> func;
+            readonly CancellationToken cancellationToken;
+            readonly CancellationTokenRegistration registration;
+
+            public WorkItem(Func<T> func, CancellationToken cancellationToken)
+            {
+                this.func = func;
+                this.cancellationToken = cancellationToken;
+                if (cancellationToken.CanBeCanceled)
+                {
+                    registration = cancellationToken.Register(Cancel);
+                }
+            }
+
+            public TaskCompletionSource<T> Completion { get; }
+                = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+            public void Cancel() => Completion.TrySetCanceled(cancellationToken);
+
+            public override void Execute()
+            {
+                registration.Dispose();
+                // canceled while queued
+                if (Completion.Task.IsCompleted) return;
+
+                try
+                {
+                    Completion.TrySetResult(func());
+                }
+                catch (Exception e)
+                {
+                    Completion.TrySetException(e);
+                }
+            }
+        }
+    }
+}
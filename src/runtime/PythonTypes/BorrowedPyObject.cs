@@ -0,0 +1,58 @@
+using System;
+using System.Collections.Concurrent;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Argument of a <see cref="BorrowedAttribute"/> parameter, that refers to
+    /// the Python object of the caller without owning a reference to it.
+    /// </summary>
+    /// <remarks>
+    /// The wrapper is not finalizable, and is released by the method binder,
+    /// when the call returns. Wrappers of overloads, that are not called, are
+    /// not released, and are collected without touching the Python object.
+    /// </remarks>
+    internal sealed class BorrowedPyObject : PyObject
+    {
+        static readonly ConcurrentDictionary<ParameterInfo, bool> borrowedParameters = new();
+
+        internal BorrowedPyObject(BorrowedReference reference)
+        {
+            if (reference.IsNull) throw new ArgumentNullException(nameof(reference));
+
+            rawPtr = reference.DangerousGetAddress();
+        }
+
+        /// <summary>
+        /// Whether arguments of <paramref name="parameter"/> are passed as
+        /// <see cref="BorrowedPyObject"/>.
+        /// </summary>
+        internal static bool IsBorrowed(ParameterInfo parameter)
+            => parameter.ParameterType == typeof(PyObject)
+               && borrowedParameters.GetOrAdd(parameter, p => p.IsDefined(typeof(BorrowedAttribute), inherit: false));
+
+        /// <summary>
+        /// Releases the borrowed arguments among <paramref name="args"/>,
+        /// after the call they were passed to returned.
+        /// </summary>
+        internal static void Release(object?[] args)
+        {
+            foreach (var arg in args)
+            {
+                if (arg is BorrowedPyObject borrowed)
+                {
+                    borrowed.rawPtr = IntPtr.Zero;
+                }
+            }
+        }
+
+        /// <summary>
+        /// The reference is not owned, so disposing only detaches the wrapper.
+        /// </summary>
+        protected override void Dispose(bool disposing)
+        {
+            rawPtr = IntPtr.Zero;
+        }
+    }
+}
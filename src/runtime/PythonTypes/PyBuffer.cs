@@ -46,7 +46,7 @@ namespace Python.Runtime
         public int Dimensions => _view.ndim;
         public bool ReadOnly => _view._readonly;
         public IntPtr Buffer => _view.buf;
-        public string? Format => _view.format;
+        public string? Format => _view.format == IntPtr.Zero ? null : Marshal.PtrToStringAnsi(_view.format);
 
         /// <summary>
         /// An array of length <see cref="Dimensions"/> indicating the shape of the memory as an n-dimensional array.
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.Runtime.Serialization;
 
 namespace Python.Runtime
@@ -37,6 +38,19 @@ namespace Python.Runtime
         protected PyDict(SerializationInfo info, StreamingContext context)
             : base(info, context) { }
 
+        /// <summary>
+        /// Creates a new Python dictionary from key-value pairs, converting
+        /// keys and values directly into the dictionary without intermediate
+        /// <see cref="PyObject"/> wrappers. Primitive values are not boxed.
+        /// </summary>
+        public static PyDict FromPairs<TKey, TValue>(IEnumerable<KeyValuePair<TKey, TValue>> pairs)
+        {
+            if (pairs is null) throw new ArgumentNullException(nameof(pairs));
+
+            using var dict = CollectionConverter.NewDict(pairs);
+            return new PyDict(dict.StealOrThrow());
+        }
+
 
         /// <summary>
         /// IsDictType Method
@@ -8,7 +8,7 @@ partial class PyFloat : IComparable<double>, IComparable<float>
 {
     public override bool Equals(object o)
     {
-        using var _ = Py.GIL();
+        using var _ = Py.EnterGIL();
         return o switch
         {
             double f64 => this.Equals(f64),
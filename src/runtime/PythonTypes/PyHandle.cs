@@ -0,0 +1,248 @@
+using System;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// An owned reference to a Python object, that, unlike <see cref="PyObject"/>,
+    /// has no finalizer and is not tracked by the <see cref="Finalizer"/>.
+    /// </summary>
+    /// <remarks>
+    /// A handle must be disposed exactly once, while holding the GIL and before
+    /// the engine is shut down. A handle, that is never disposed, leaks its object.
+    /// Copies of a handle share its reference, so only one of them may be disposed.
+    /// Use <see cref="From(PyObject)"/> and <see cref="ToPyObject"/> to exchange
+    /// objects with APIs taking <see cref="PyObject"/>.
+    /// <para>
+    /// Variables declared with <c>using</c> are read-only, and methods called
+    /// on them operate on a copy, so <see cref="MoveToPyObject"/> must not be
+    /// called on them: the variable would still be disposed, releasing the
+    /// reference, that was moved. Use <see cref="ToPyObject"/> instead.
+    /// </para>
+    /// </remarks>
+    public struct PyHandle : IDisposable
+    {
+        IntPtr pointer;
+
+        internal PyHandle(StolenReference reference)
+        {
+            pointer = reference.DangerousGetAddressOrNull();
+        }
+
+        /// <summary>
+        /// <c>true</c> for the default value and for disposed handles.
+        /// </summary>
+        public bool IsNull => pointer == IntPtr.Zero;
+
+        internal BorrowedReference Reference
+            => pointer == IntPtr.Zero ? throw new ObjectDisposedException(nameof(PyHandle)) : new(pointer);
+
+        /// <summary>Returns a new handle to Python's <c>None</c>.</summary>
+        public static PyHandle None => new(new NewReference(Runtime.PyNone).Steal());
+
+        /// <summary>
+        /// Returns a new handle to the object <paramref name="value"/> refers to.
+        /// </summary>
+        public static PyHandle From(PyObject value)
+        {
+            if (value is null) throw new ArgumentNullException(nameof(value));
+
+            return new(new NewReference(value.Reference).Steal());
+        }
+
+        /// <summary>
+        /// Converts a .NET value to Python like <see cref="ConverterExtension.ToPython(object?)"/>.
+        /// Primitive values are not boxed.
+        /// </summary>
+        public static PyHandle From<T>(T value)
+        {
+            using var result = TypedConverter<T>.ToPython(value);
+            return new(result.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Returns a new <see cref="PyObject"/> referring to the same object.
+        /// The handle still needs to be disposed.
+        /// </summary>
+        public PyObject ToPyObject() => new(Reference);
+
+        /// <summary>
+        /// Transfers the reference of this handle to a new <see cref="PyObject"/>.
+        /// The handle becomes null, and does not need to be disposed.
+        /// </summary>
+        /// <remarks>
+        /// Must not be called on a variable declared with <c>using</c>, that
+        /// disposes a copy of the handle, which still refers to the object.
+        /// </remarks>
+        public PyObject MoveToPyObject()
+        {
+            _ = Reference;
+            return new PyObject(StolenReference.Take(ref pointer));
+        }
+
+        /// <summary>
+        /// Returns a new handle to the same object.
+        /// </summary>
+        public PyHandle Copy() => new(new NewReference(Reference).Steal());
+
+        /// <summary>
+        /// Returns the named attribute of the object, or raises a
+        /// <see cref="PythonException"/>, if the attribute access fails.
+        /// </summary>
+        public PyHandle GetAttr(string name)
+        {
+            if (name == null) throw new ArgumentNullException(nameof(name));
+
+            using var op = Runtime.PyObject_GetAttrString(Reference, name);
+            return new(op.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Sets the named attribute of the object, or raises a
+        /// <see cref="PythonException"/>, if the attribute can not be set.
+        /// </summary>
+        public void SetAttr(string name, PyHandle value)
+        {
+            if (name == null) throw new ArgumentNullException(nameof(name));
+
+            int r = Runtime.PyObject_SetAttrString(Reference, name, value.Reference);
+            if (r < 0)
+            {
+                throw PythonException.ThrowLastAsClrException();
+            }
+        }
+
+        /// <summary>
+        /// Returns <c>self[key]</c>, or raises a <see cref="PythonException"/>,
+        /// if the indexing operation fails.
+        /// </summary>
+        public PyHandle GetItem(PyHandle key)
+        {
+            using var op = Runtime.PyObject_GetItem(Reference, key.Reference);
+            return new(op.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Returns <c>self[index]</c>. See <see cref="GetItem(PyHandle)"/>.
+        /// </summary>
+        public PyHandle GetItem(int index)
+        {
+            using var key = Runtime.PyInt_FromInt32(index);
+            using var op = Runtime.PyObject_GetItem(Reference, key.BorrowOrThrow());
+            return new(op.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Returns <c>self[key]</c>. See <see cref="GetItem(PyHandle)"/>.
+        /// </summary>
+        public PyHandle GetItem(string key)
+        {
+            if (key == null) throw new ArgumentNullException(nameof(key));
+
+            using var pyKey = Runtime.PyString_FromString(key);
+            using var op = Runtime.PyObject_GetItem(Reference, pyKey.BorrowOrThrow());
+            return new(op.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Sets <c>self[key]</c> to <paramref name="value"/>, or raises a
+        /// <see cref="PythonException"/>, if the operation fails.
+        /// </summary>
+        public void SetItem(PyHandle key, PyHandle value)
+        {
+            int r = Runtime.PyObject_SetItem(Reference, key.Reference, value.Reference);
+            if (r < 0)
+            {
+                throw PythonException.ThrowLastAsClrException();
+            }
+        }
+
+        /// <summary>
+        /// Calls the object with the given positional arguments, or raises a
+        /// <see cref="PythonException"/>, if the call fails.
+        /// </summary>
+        public PyHandle Invoke(params PyHandle[] args) => Vectorcall(BorrowedReference.Null, args);
+
+        /// <summary>
+        /// Calls the named method of the object with the given positional arguments,
+        /// or raises a <see cref="PythonException"/>, if the call fails.
+        /// </summary>
+        public PyHandle InvokeMethod(string name, params PyHandle[] args)
+        {
+            if (name == null) throw new ArgumentNullException(nameof(name));
+
+            using var pyName = Runtime.PyString_FromString(name);
+            return Vectorcall(pyName.BorrowOrThrow(), args);
+        }
+
+        unsafe PyHandle Vectorcall(BorrowedReference name, PyHandle[] args)
+        {
+            if (args == null) throw new ArgumentNullException(nameof(args));
+
+            // args[-1] is reserved for the callee, and method calls pass self first
+            int length = args.Length + 2;
+            if (length > PyObject.MaxStackArguments)
+            {
+                fixed (IntPtr* heap = new IntPtr[length])
+                {
+                    return Vectorcall(heap + 2, name, args);
+                }
+            }
+            IntPtr* stack = stackalloc IntPtr[PyObject.MaxStackArguments];
+            return Vectorcall(stack + 2, name, args);
+        }
+
+        unsafe PyHandle Vectorcall(IntPtr* argv, BorrowedReference name, PyHandle[] args)
+        {
+            BorrowedReference self = Reference;
+            for (int i = 0; i < args.Length; i++)
+            {
+                argv[i] = args[i].Reference.DangerousGetAddress();
+            }
+
+            if (name.IsNull)
+            {
+                using var r = Runtime.PyObject_Vectorcall(self, argv, args.Length, BorrowedReference.Null);
+                return new(r.StealOrThrow());
+            }
+            argv[-1] = self.DangerousGetAddress();
+            using var result = Runtime.PyObject_VectorcallMethod(name, argv - 1, args.Length + 1, BorrowedReference.Null);
+            return new(result.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Converts the object to a .NET value of type <typeparamref name="T"/>
+        /// like <see cref="PyObject.As{T}"/>.
+        /// </summary>
+        public T As<T>()
+        {
+            if (!Converter.ToManaged(Reference, out T? result, true))
+            {
+                throw new InvalidCastException("cannot convert object to target type",
+                    PythonException.FetchCurrentOrNull(out _));
+            }
+            return result!;
+        }
+
+        /// <summary>
+        /// Returns <c>str(self)</c>, or <c>null</c> for a null handle.
+        /// </summary>
+        public override string? ToString()
+        {
+            if (IsNull) return null;
+
+            using var str = Runtime.PyObject_Str(Reference);
+            return Runtime.GetManagedString(str.BorrowOrThrow());
+        }
+
+        /// <summary>
+        /// Releases the reference of this handle, and sets it to null.
+        /// Does nothing for null handles.
+        /// </summary>
+        public void Dispose()
+        {
+            if (pointer == IntPtr.Zero) return;
+
+            Runtime.XDecref(StolenReference.Take(ref pointer));
+        }
+    }
+}
@@ -10,7 +10,7 @@ partial class PyInt : IComparable<long>, IComparable<int>, IComparable<sbyte>, I
 {
     public override bool Equals(object o)
     {
-        using var _ = Py.GIL();
+        using var _ = Py.EnterGIL();
         return o switch
         {
             long i64 => this.Equals(i64),
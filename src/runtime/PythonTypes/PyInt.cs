@@ -227,7 +227,7 @@ namespace Python.Runtime
 
         public string ToString(string format, IFormatProvider formatProvider)
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             return ToBigInteger().ToString(format, formatProvider);
         }
 
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.Linq;
 using System.Runtime.Serialization;
 
@@ -80,6 +81,43 @@ namespace Python.Runtime
         {
         }
 
+        /// <summary>
+        /// Creates a new Python list from the items of an array, converting
+        /// each item directly into the list without intermediate
+        /// <see cref="PyObject"/> wrappers. Primitive values are not boxed.
+        /// </summary>
+        public static PyList From<T>(T[] items)
+        {
+            if (items is null) throw new ArgumentNullException(nameof(items));
+
+            using var list = CollectionConverter.NewList(items, 0, items.Length);
+            return new PyList(list.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Creates a new Python list from a segment of an array.
+        /// See <see cref="From{T}(T[])"/>.
+        /// </summary>
+        public static PyList From<T>(ArraySegment<T> items)
+        {
+            if (items.Array is null) throw new ArgumentNullException(nameof(items));
+
+            using var list = CollectionConverter.NewList(items.Array, items.Offset, items.Count);
+            return new PyList(list.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Creates a new Python list from the items of a list.
+        /// See <see cref="From{T}(T[])"/>.
+        /// </summary>
+        public static PyList From<T>(IReadOnlyList<T> items)
+        {
+            if (items is null) throw new ArgumentNullException(nameof(items));
+
+            using var list = CollectionConverter.NewList(items);
+            return new PyList(list.StealOrThrow());
+        }
+
         /// <summary>
         /// Returns true if the given object is a Python list.
         /// </summary>
@@ -8,7 +8,7 @@ public partial class PyObject : IConvertible
 
     private T DoConvert<T>()
     {
-        using var _ = Py.GIL();
+        using var _ = Py.EnterGIL();
         if (Converter.ToPrimitive(Reference, typeof(T), out object? result, setError: false))
         {
             return (T)result!;
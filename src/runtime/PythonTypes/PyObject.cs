@@ -29,6 +29,8 @@ namespace Python.Runtime
 
         protected IntPtr rawPtr = IntPtr.Zero;
         internal readonly int run = Runtime.GetRun();
+        [NonSerialized]
+        AllocationSite? allocationSite;
 
         internal BorrowedReference obj => new (rawPtr);
 
@@ -50,6 +52,7 @@ namespace Python.Runtime
             if (ptr == IntPtr.Zero) throw new ArgumentNullException(nameof(ptr));
 
             rawPtr = ptr;
+            allocationSite = LeakTracker.Sample(obj);
             Finalizer.Instance.ThrottledCollect();
         }
 
@@ -59,6 +62,7 @@ namespace Python.Runtime
             if (ptr == IntPtr.Zero) throw new ArgumentNullException(nameof(ptr));
 
             rawPtr = ptr;
+            allocationSite = LeakTracker.Sample(obj);
             if (!skipCollect)
                 Finalizer.Instance.ThrottledCollect();
         }
@@ -73,6 +77,7 @@ namespace Python.Runtime
             if (reference.IsNull) throw new ArgumentNullException(nameof(reference));
 
             rawPtr = new NewReference(reference).DangerousMoveToPointer();
+            allocationSite = LeakTracker.Sample(obj);
             Finalizer.Instance.ThrottledCollect();
         }
 
@@ -81,6 +86,7 @@ namespace Python.Runtime
             if (reference.IsNull) throw new ArgumentNullException(nameof(reference));
 
             rawPtr = new NewReference(reference).DangerousMoveToPointer();
+            allocationSite = LeakTracker.Sample(obj);
             if (!skipCollect)
                 Finalizer.Instance.ThrottledCollect();
         }
@@ -90,9 +96,19 @@ namespace Python.Runtime
             if (reference == null) throw new ArgumentNullException(nameof(reference));
 
             rawPtr = reference.DangerousGetAddressOrNull();
+            allocationSite = LeakTracker.Sample(obj);
             Finalizer.Instance.ThrottledCollect();
         }
 
+        /// <summary>
+        /// Creates a disposed <see cref="PyObject"/>, that is not finalizable,
+        /// for derived types, that do not own their reference.
+        /// </summary>
+        private protected PyObject()
+        {
+            GC.SuppressFinalize(this);
+        }
+
         /// <summary>
         /// Create a new PyObject instance of this object, bumping the reference
         /// count.
@@ -111,6 +127,8 @@ namespace Python.Runtime
 #endif
 
                 Interlocked.Increment(ref Runtime._collected);
+                allocationSite?.OnFinalized();
+                allocationSite = null;
 
                 Finalizer.Instance.AddFinalizedObject(ref rawPtr, run
 #if TRACE_ALLOC
@@ -181,7 +199,18 @@ namespace Python.Runtime
         /// Return a managed object of the given type, based on the
         /// value of the Python object.
         /// </summary>
-        public T As<T>() => (T)this.AsManagedObject(typeof(T))!;
+        /// <remarks>
+        /// Primitive values are converted without boxing.
+        /// </remarks>
+        public T As<T>()
+        {
+            if (!Converter.ToManaged(obj, out T? result, true))
+            {
+                throw new InvalidCastException("cannot convert object to target type",
+                    PythonException.FetchCurrentOrNull(out _));
+            }
+            return result!;
+        }
 
         internal bool IsDisposed => rawPtr == IntPtr.Zero;
 
@@ -197,6 +226,12 @@ namespace Python.Runtime
                 return;
             }
 
+            if (allocationSite is not null)
+            {
+                allocationSite.OnDisposed();
+                allocationSite = null;
+            }
+
             if (Runtime.Py_IsInitialized() == 0 && Runtime._Py_IsFinalizing() != true)
             {
                 throw new InvalidOperationException("Python runtime must be initialized");
@@ -247,6 +282,8 @@ namespace Python.Runtime
         internal StolenReference Steal()
         {
             GC.SuppressFinalize(this);
+            allocationSite?.OnDisposed();
+            allocationSite = null;
             return StolenReference.Take(ref this.rawPtr);
         }
 
@@ -255,6 +292,8 @@ namespace Python.Runtime
         {
             Debug.Assert(!IsDisposed);
             GC.SuppressFinalize(this);
+            allocationSite?.OnDisposed();
+            allocationSite = null;
             rawPtr = IntPtr.Zero;
         }
 
@@ -749,11 +788,8 @@ namespace Python.Runtime
         public PyObject Invoke(params PyObject[] args)
         {
             if (args == null) throw new ArgumentNullException(nameof(args));
-            if (args.Contains(null)) throw new ArgumentNullException();
 
-            var t = new PyTuple(args);
-            using var r = Runtime.PyObject_Call(obj, t.obj, null);
-            t.Dispose();
+            using var r = Vectorcall(BorrowedReference.Null, args, null);
             return new PyObject(r.StealOrThrow());
         }
 
@@ -784,10 +820,8 @@ namespace Python.Runtime
         public PyObject Invoke(PyObject[] args, PyDict? kw)
         {
             if (args == null) throw new ArgumentNullException(nameof(args));
-            if (args.Contains(null)) throw new ArgumentNullException();
 
-            using var t = new PyTuple(args);
-            using var r = Runtime.PyObject_Call(obj, t.obj, kw is null ? null : kw.obj);
+            using var r = Vectorcall(BorrowedReference.Null, args, kw);
             return new PyObject(r.StealOrThrow());
         }
 
@@ -819,12 +853,10 @@ namespace Python.Runtime
         {
             if (name == null) throw new ArgumentNullException(nameof(name));
             if (args == null) throw new ArgumentNullException(nameof(args));
-            if (args.Contains(null)) throw new ArgumentNullException();
 
-            PyObject method = GetAttr(name);
-            PyObject result = method.Invoke(args);
-            method.Dispose();
-            return result;
+            using var pyName = Runtime.PyString_FromString(name);
+            using var r = Vectorcall(pyName.BorrowOrThrow(), args, null);
+            return new PyObject(r.StealOrThrow());
         }
 
 
@@ -857,12 +889,9 @@ namespace Python.Runtime
         {
             if (name == null) throw new ArgumentNullException(nameof(name));
             if (args == null) throw new ArgumentNullException(nameof(args));
-            if (args.Contains(null)) throw new ArgumentNullException();
 
-            PyObject method = GetAttr(name);
-            PyObject result = method.Invoke(args);
-            method.Dispose();
-            return result;
+            using var r = Vectorcall(name.obj, args, null);
+            return new PyObject(r.StealOrThrow());
         }
 
 
@@ -897,12 +926,60 @@ namespace Python.Runtime
         {
             if (name == null) throw new ArgumentNullException(nameof(name));
             if (args == null) throw new ArgumentNullException(nameof(args));
-            if (args.Contains(null)) throw new ArgumentNullException();
 
-            PyObject method = GetAttr(name);
-            PyObject result = method.Invoke(args, kw);
-            method.Dispose();
-            return result;
+            using var pyName = Runtime.PyString_FromString(name);
+            using var r = Vectorcall(pyName.BorrowOrThrow(), args, kw);
+            return new PyObject(r.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Argument vectors of up to this many references are allocated on the stack.
+        /// </summary>
+        internal const int MaxStackArguments = 16;
+
+        /// <summary>
+        /// Calls this object, or its method <paramref name="name"/>, if it is not null,
+        /// through the vectorcall protocol, passing <paramref name="args"/> as
+        /// borrowed references, without creating an argument tuple.
+        /// </summary>
+        unsafe NewReference Vectorcall(BorrowedReference name, PyObject[] args, PyDict? kw)
+        {
+            // args[-1] is reserved for the callee, and method calls pass self first
+            int length = args.Length + 2;
+            if (length > MaxStackArguments)
+            {
+                fixed (IntPtr* heap = new IntPtr[length])
+                {
+                    return Vectorcall(heap, name, args, kw);
+                }
+            }
+            IntPtr* stack = stackalloc IntPtr[MaxStackArguments];
+            return Vectorcall(stack, name, args, kw);
+        }
+
+        unsafe NewReference Vectorcall(IntPtr* vector, BorrowedReference name, PyObject[] args, PyDict? kw)
+        {
+            IntPtr* argv = vector + 2;
+            for (int i = 0; i < args.Length; i++)
+            {
+                if (args[i] is null) throw new ArgumentNullException(nameof(args));
+                argv[i] = args[i].obj.DangerousGetAddress();
+            }
+
+            if (name.IsNull)
+            {
+                return kw is null
+                    ? Runtime.PyObject_Vectorcall(obj, argv, args.Length, BorrowedReference.Null)
+                    : Runtime.PyObject_VectorcallDict(obj, argv, args.Length, kw.obj);
+            }
+            if (kw is null)
+            {
+                argv[-1] = rawPtr;
+                return Runtime.PyObject_VectorcallMethod(name, argv - 1, args.Length + 1, BorrowedReference.Null);
+            }
+            using var method = Runtime.PyObject_GetAttr(obj, name);
+            if (method.IsNull()) return default;
+            return Runtime.PyObject_VectorcallDict(method.Borrow(), argv, args.Length, kw.obj);
         }
 
 
@@ -1052,7 +1129,7 @@ namespace Python.Runtime
         /// </remarks>
         public override string? ToString()
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             using var strval = Runtime.PyObject_Str(obj);
             return Runtime.GetManagedString(strval.BorrowOrThrow());
         }
@@ -1082,7 +1159,7 @@ namespace Python.Runtime
         /// </remarks>
         public override bool Equals(object o)
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             return Equals(o as PyObject);
         }
 
@@ -1110,7 +1187,7 @@ namespace Python.Runtime
         /// </remarks>
         public override int GetHashCode()
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             nint pyHash = Runtime.PyObject_Hash(obj);
             if (pyHash == -1 && Exceptions.ErrorOccurred())
             {
@@ -1162,14 +1239,14 @@ namespace Python.Runtime
 
         public override bool TryGetMember(GetMemberBinder binder, out object? result)
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             result = CheckNone(this.GetAttr(binder.Name));
             return true;
         }
 
         public override bool TrySetMember(SetMemberBinder binder, object? value)
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             using var newVal = Converter.ToPythonDetectType(value);
             int r = Runtime.PyObject_SetAttrString(obj, binder.Name, newVal.Borrow());
             if (r < 0)
@@ -1179,73 +1256,102 @@ namespace Python.Runtime
             return true;
         }
 
-        private void GetArgs(object?[] inargs, CallInfo callInfo, out PyTuple args, out PyDict? kwargs)
+        /// <summary>
+        /// Calls <paramref name="callable"/> with the arguments of a dynamic invocation,
+        /// which are either named by <paramref name="callInfo"/>, or followed by
+        /// <see cref="Py.KeywordArguments"/>.
+        /// </summary>
+        private static unsafe NewReference InvokeDynamic(BorrowedReference callable, object?[] inargs, CallInfo? callInfo)
         {
-            if (callInfo == null || callInfo.ArgumentNames.Count == 0)
-            {
-                GetArgs(inargs, out args, out kwargs);
-                return;
-            }
-
-            // Support for .net named arguments
-            var namedArgumentCount = callInfo.ArgumentNames.Count;
-            var regularArgumentCount = callInfo.ArgumentCount - namedArgumentCount;
-
-            using var argTuple = Runtime.PyTuple_New(regularArgumentCount);
-            for (int i = 0; i < regularArgumentCount; ++i)
+            // args[-1] is reserved for the callee
+            int length = inargs.Length + 1;
+            if (length > MaxStackArguments)
             {
-                AddArgument(argTuple.Borrow(), i, inargs[i]);
-            }
-            args = new PyTuple(argTuple.Steal());
-
-            var namedArgs = new object?[namedArgumentCount * 2];
-            for (int i = 0; i < namedArgumentCount; ++i)
-            {
-                namedArgs[i * 2] = callInfo.ArgumentNames[i];
-                namedArgs[i * 2 + 1] = inargs[regularArgumentCount + i];
+                fixed (IntPtr* heap = new IntPtr[length])
+                {
+                    return InvokeDynamic(heap + 1, callable, inargs, callInfo);
+                }
             }
-            kwargs = Py.kw(namedArgs);
+            IntPtr* stack = stackalloc IntPtr[MaxStackArguments];
+            return InvokeDynamic(stack + 1, callable, inargs, callInfo);
         }
 
-        private void GetArgs(object?[] inargs, out PyTuple args, out PyDict? kwargs)
+        private static unsafe NewReference InvokeDynamic(IntPtr* argv, BorrowedReference callable, object?[] inargs, CallInfo? callInfo)
         {
-            int arg_count;
-            for (arg_count = 0; arg_count < inargs.Length && !(inargs[arg_count] is Py.KeywordArguments); ++arg_count)
+            int namedArgumentCount = callInfo?.ArgumentNames.Count ?? 0;
+            int regularArgumentCount;
+            if (namedArgumentCount > 0)
             {
-                ;
+                // Support for .net named arguments, passed after the regular ones
+                regularArgumentCount = callInfo!.ArgumentCount - namedArgumentCount;
             }
-            using var argtuple = Runtime.PyTuple_New(arg_count);
-            for (var i = 0; i < arg_count; i++)
+            else
             {
-                AddArgument(argtuple.Borrow(), i, inargs[i]);
+                for (regularArgumentCount = 0;
+                     regularArgumentCount < inargs.Length && inargs[regularArgumentCount] is not Py.KeywordArguments;
+                     ++regularArgumentCount)
+                {
+                }
             }
-            args = new PyTuple(argtuple.Steal());
 
-            kwargs = null;
-            for (int i = arg_count; i < inargs.Length; i++)
+            int converted = 0;
+            var merged = new NewReference();
+            try
             {
-                if (inargs[i] is not Py.KeywordArguments kw)
+                int valueCount = namedArgumentCount > 0 ? inargs.Length : regularArgumentCount;
+                for (; converted < valueCount; converted++)
                 {
-                    throw new ArgumentException("Keyword arguments must come after normal arguments.");
+                    using var value = GetPythonObject(inargs[converted]);
+                    argv[converted] = value.DangerousMoveToPointerOrNull();
+                    if (argv[converted] == IntPtr.Zero)
+                    {
+                        throw PythonException.ThrowLastAsClrException();
+                    }
                 }
-                if (kwargs == null)
+
+                if (namedArgumentCount > 0)
                 {
-                    kwargs = kw;
+                    using var kwnames = Runtime.PyTuple_New(namedArgumentCount);
+                    PythonException.ThrowIfIsNull(kwnames);
+                    for (int i = 0; i < namedArgumentCount; i++)
+                    {
+                        using var argName = Runtime.PyString_FromString(callInfo!.ArgumentNames[i]);
+                        Runtime.PyTuple_SetItem(kwnames.Borrow(), i, argName.StealOrThrow());
+                    }
+                    return Runtime.PyObject_Vectorcall(callable, argv, regularArgumentCount, kwnames.Borrow());
                 }
-                else
+
+                BorrowedReference kwargs = BorrowedReference.Null;
+                for (int i = regularArgumentCount; i < inargs.Length; i++)
                 {
-                    kwargs.Update(kw);
+                    if (inargs[i] is not Py.KeywordArguments kw)
+                    {
+                        throw new ArgumentException("Keyword arguments must come after normal arguments.");
+                    }
+                    if (kwargs.IsNull)
+                    {
+                        kwargs = kw.obj;
+                        continue;
+                    }
+                    if (merged.IsNull())
+                    {
+                        merged = Runtime.PyDict_Copy(kwargs);
+                        kwargs = merged.BorrowOrThrow();
+                    }
+                    if (Runtime.PyDict_Update(kwargs, kw.obj) != 0)
+                    {
+                        throw PythonException.ThrowLastAsClrException();
+                    }
                 }
+                return Runtime.PyObject_VectorcallDict(callable, argv, regularArgumentCount, kwargs);
             }
-        }
-
-        private static void AddArgument(BorrowedReference argtuple, nint i, object? target)
-        {
-            using var ptr = GetPythonObject(target);
-
-            if (Runtime.PyTuple_SetItem(argtuple, i, ptr.StealNullable()) < 0)
+            finally
             {
-                throw PythonException.ThrowLastAsClrException();
+                merged.Dispose();
+                for (int i = 0; i < converted; i++)
+                {
+                    Runtime.XDecref(StolenReference.DangerousFromPointer(argv[i]));
+                }
             }
         }
 
@@ -1263,46 +1369,30 @@ namespace Python.Runtime
 
         public override bool TryInvokeMember(InvokeMemberBinder binder, object?[] args, out object? result)
         {
-            using var _ = Py.GIL();
-            if (this.HasAttr(binder.Name) && this.GetAttr(binder.Name).IsCallable())
+            using var _ = Py.EnterGIL();
+            using var method = Runtime.PyObject_GetAttrString(obj, binder.Name);
+            if (method.IsNull())
             {
-                PyTuple? pyargs = null;
-                PyDict? kwargs = null;
-                try
-                {
-                    GetArgs(args, binder.CallInfo, out pyargs, out kwargs);
-                    result = CheckNone(InvokeMethod(binder.Name, pyargs, kwargs));
-                }
-                finally
-                {
-                    pyargs?.Dispose();
-                    kwargs?.Dispose();
-                }
-                return true;
+                Runtime.PyErr_Clear();
+                return base.TryInvokeMember(binder, args, out result);
             }
-            else
+            if (Runtime.PyCallable_Check(method.Borrow()) == 0)
             {
                 return base.TryInvokeMember(binder, args, out result);
             }
+
+            using var r = InvokeDynamic(method.Borrow(), args, binder.CallInfo);
+            result = CheckNone(new PyObject(r.StealOrThrow()));
+            return true;
         }
 
         public override bool TryInvoke(InvokeBinder binder, object?[] args, out object? result)
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             if (this.IsCallable())
             {
-                PyTuple? pyargs = null;
-                PyDict? kwargs = null;
-                try
-                {
-                    GetArgs(args, binder.CallInfo, out pyargs, out kwargs);
-                    result = CheckNone(Invoke(pyargs, kwargs));
-                }
-                finally
-                {
-                    pyargs?.Dispose();
-                    kwargs?.Dispose();
-                }
+                using var r = InvokeDynamic(obj, args, binder.CallInfo);
+                result = CheckNone(new PyObject(r.StealOrThrow()));
                 return true;
             }
             else
@@ -1313,7 +1403,7 @@ namespace Python.Runtime
 
         public override bool TryConvert(ConvertBinder binder, out object? result)
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             // always try implicit conversion first
             if (Converter.ToManaged(this.obj, binder.Type, out result, false))
             {
@@ -1351,7 +1441,7 @@ namespace Python.Runtime
 
         public override bool TryBinaryOperation(BinaryOperationBinder binder, object arg, out object? result)
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             NewReference res;
             if (arg is not PyObject)
             {
@@ -1455,7 +1545,7 @@ namespace Python.Runtime
                 return false;
             }
 
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             int result = Runtime.PyObject_RichCompareBool(a.obj, b.obj, Runtime.Py_EQ);
             if (result < 0) throw PythonException.ThrowLastAsClrException();
             return result != 0;
@@ -1472,7 +1562,7 @@ namespace Python.Runtime
                 return true;
             }
 
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             int result = Runtime.PyObject_RichCompareBool(a.obj, b.obj, Runtime.Py_NE);
             if (result < 0) throw PythonException.ThrowLastAsClrException();
             return result != 0;
@@ -1495,7 +1585,7 @@ namespace Python.Runtime
 
         public override bool TryUnaryOperation(UnaryOperationBinder binder, out object? result)
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             int r;
             NewReference res;
             switch (binder.Operation)
@@ -1543,7 +1633,7 @@ namespace Python.Runtime
         /// <returns>A sequence that contains dynamic member names.</returns>
         public override IEnumerable<string> GetDynamicMemberNames()
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             return Dir().Select(pyObj => pyObj.ToString()!).ToArray();
         }
 
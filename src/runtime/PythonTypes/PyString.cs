@@ -77,7 +77,7 @@ namespace Python.Runtime
 
         public override string ToString()
         {
-            using var _ = Py.GIL();
+            using var _ = Py.EnterGIL();
             return this.ToStringUnderGIL();
         }
     }
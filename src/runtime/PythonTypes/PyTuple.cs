@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.Linq;
 using System.Runtime.Serialization;
 
@@ -95,6 +96,87 @@ namespace Python.Runtime
         }
 
 
+        /// <summary>
+        /// Creates a new Python tuple from the items of an array, converting
+        /// each item directly into the tuple without intermediate
+        /// <see cref="PyObject"/> wrappers. Primitive values are not boxed.
+        /// </summary>
+        public static PyTuple Create<T>(T[] items)
+        {
+            if (items is null) throw new ArgumentNullException(nameof(items));
+
+            using var tuple = CollectionConverter.NewTuple(items, 0, items.Length);
+            return new PyTuple(tuple.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Creates a new Python tuple from a segment of an array.
+        /// See <see cref="Create{T}(T[])"/>.
+        /// </summary>
+        public static PyTuple Create<T>(ArraySegment<T> items)
+        {
+            if (items.Array is null) throw new ArgumentNullException(nameof(items));
+
+            using var tuple = CollectionConverter.NewTuple(items.Array, items.Offset, items.Count);
+            return new PyTuple(tuple.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Creates a new Python tuple from the items of a list.
+        /// See <see cref="Create{T}(T[])"/>.
+        /// </summary>
+        public static PyTuple Create<T>(IReadOnlyList<T> items)
+        {
+            if (items is null) throw new ArgumentNullException(nameof(items));
+
+            using var tuple = CollectionConverter.NewTuple(items);
+            return new PyTuple(tuple.StealOrThrow());
+        }
+
+        /// <summary>
+        /// Creates a new Python tuple of two values, converted without boxing.
+        /// </summary>
+        public static PyTuple Create<T1, T2>(T1 item1, T2 item2)
+        {
+            using var tuple = Runtime.PyTuple_New(2);
+            PythonException.ThrowIfIsNull(tuple);
+            SetItem(tuple.Borrow(), 0, TypedConverter<T1>.ToPython(item1));
+            SetItem(tuple.Borrow(), 1, TypedConverter<T2>.ToPython(item2));
+            return new PyTuple(tuple.Steal());
+        }
+
+        /// <summary>
+        /// Creates a new Python tuple of three values, converted without boxing.
+        /// </summary>
+        public static PyTuple Create<T1, T2, T3>(T1 item1, T2 item2, T3 item3)
+        {
+            using var tuple = Runtime.PyTuple_New(3);
+            PythonException.ThrowIfIsNull(tuple);
+            SetItem(tuple.Borrow(), 0, TypedConverter<T1>.ToPython(item1));
+            SetItem(tuple.Borrow(), 1, TypedConverter<T2>.ToPython(item2));
+            SetItem(tuple.Borrow(), 2, TypedConverter<T3>.ToPython(item3));
+            return new PyTuple(tuple.Steal());
+        }
+
+        /// <summary>
+        /// Creates a new Python tuple of four values, converted without boxing.
+        /// </summary>
+        public static PyTuple Create<T1, T2, T3, T4>(T1 item1, T2 item2, T3 item3, T4 item4)
+        {
+            using var tuple = Runtime.PyTuple_New(4);
+            PythonException.ThrowIfIsNull(tuple);
+            SetItem(tuple.Borrow(), 0, TypedConverter<T1>.ToPython(item1));
+            SetItem(tuple.Borrow(), 1, TypedConverter<T2>.ToPython(item2));
+            SetItem(tuple.Borrow(), 2, TypedConverter<T3>.ToPython(item3));
+            SetItem(tuple.Borrow(), 3, TypedConverter<T4>.ToPython(item4));
+            return new PyTuple(tuple.Steal());
+        }
+
+        static void SetItem(BorrowedReference tuple, int index, NewReference item)
+        {
+            Runtime.PyTuple_SetItem(tuple, index, item.StealOrThrow());
+        }
+
         /// <summary>
         /// Returns <c>true</c> if the given object is a Python tuple.
         /// </summary>
@@ -82,3 +82,28 @@ class clrmethod(object):
 
     def __get__(self, instance, owner):
         return self.__func.__get__(instance, owner)
+
+
+def profiling_pstats():
+    """
+    Return the statistics recorded by ``clr.enable_profiling()`` as a
+    ``pstats.Stats`` instance, e.g.::
+
+        clr.enable_profiling()
+        run_workload()
+        clr.profiling_pstats().sort_stats("tottime").print_stats(10)
+
+    Each CLR member is reported as a function in the ``<clr>`` file.
+    """
+    import pstats
+    from clr import get_profiling_stats
+
+    class _ClrProfile(object):
+        def create_stats(self):
+            self.stats = {}
+            for member, entry in get_profiling_stats().items():
+                calls = entry["calls"] + entry["bind_failures"]
+                total = entry["total_time"]
+                self.stats[("<clr>", 0, member)] = (calls, calls, total, total, {})
+
+    return pstats.Stats(_ClrProfile())
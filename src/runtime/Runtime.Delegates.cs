@@ -1,4 +1,5 @@
 using System;
+using System.Runtime.CompilerServices;
 
 using Python.Runtime.Native;
 using Python.Runtime.Platform;
@@ -10,285 +11,73 @@ public unsafe partial class Runtime
     internal static class Delegates
     {
         static readonly ILibraryLoader libraryLoader = LibraryLoader.Instance;
+        static readonly IntPtr libraryHandle;
 
+        /// <remarks>
+        /// Only loads the Python library, and resolves the symbols, that are optional,
+        /// that depend on the Python version, or that are data. The other functions
+        /// are resolved on first use (see <see cref="Get"/>).
+        /// </remarks>
         static Delegates()
         {
-            Py_IncRef = (delegate* unmanaged[Cdecl]<BorrowedReference, void>)GetFunctionByName(nameof(Py_IncRef), GetUnmanagedDll(_PythonDll));
-            Py_DecRef = (delegate* unmanaged[Cdecl]<StolenReference, void>)GetFunctionByName(nameof(Py_DecRef), GetUnmanagedDll(_PythonDll));
-            Py_Initialize = (delegate* unmanaged[Cdecl]<void>)GetFunctionByName(nameof(Py_Initialize), GetUnmanagedDll(_PythonDll));
-            Py_InitializeEx = (delegate* unmanaged[Cdecl]<int, void>)GetFunctionByName(nameof(Py_InitializeEx), GetUnmanagedDll(_PythonDll));
-            Py_IsInitialized = (delegate* unmanaged[Cdecl]<int>)GetFunctionByName(nameof(Py_IsInitialized), GetUnmanagedDll(_PythonDll));
-            Py_Finalize = (delegate* unmanaged[Cdecl]<void>)GetFunctionByName(nameof(Py_Finalize), GetUnmanagedDll(_PythonDll));
-            Py_NewInterpreter = (delegate* unmanaged[Cdecl]<PyThreadState*>)GetFunctionByName(nameof(Py_NewInterpreter), GetUnmanagedDll(_PythonDll));
-            Py_EndInterpreter = (delegate* unmanaged[Cdecl]<PyThreadState*, void>)GetFunctionByName(nameof(Py_EndInterpreter), GetUnmanagedDll(_PythonDll));
-            PyThreadState_New = (delegate* unmanaged[Cdecl]<PyInterpreterState*, PyThreadState*>)GetFunctionByName(nameof(PyThreadState_New), GetUnmanagedDll(_PythonDll));
-            PyThreadState_Get = (delegate* unmanaged[Cdecl]<PyThreadState*>)GetFunctionByName(nameof(PyThreadState_Get), GetUnmanagedDll(_PythonDll));
+            libraryHandle = GetUnmanagedDll(_PythonDll);
+
+            try
+            {
+                Py_NewInterpreterFromConfig = (delegate* unmanaged[Cdecl]<PyThreadState**, in PyInterpreterConfig, PyStatus>)GetFunctionByName(nameof(Py_NewInterpreterFromConfig), libraryHandle);
+            }
+            catch (MissingMethodException) { }
             try
             {
                 // Up until Python 3.13, this function was private and named
                 // slightly differently.
-                PyThreadState_GetUnchecked = (delegate* unmanaged[Cdecl]<PyThreadState*>)GetFunctionByName("_PyThreadState_UncheckedGet", GetUnmanagedDll(_PythonDll));
+                PyThreadState_GetUnchecked = (delegate* unmanaged[Cdecl]<PyThreadState*>)GetFunctionByName("_PyThreadState_UncheckedGet", libraryHandle);
             }
             catch (MissingMethodException)
             {
 
-                PyThreadState_GetUnchecked = (delegate* unmanaged[Cdecl]<PyThreadState*>)GetFunctionByName(nameof(PyThreadState_GetUnchecked), GetUnmanagedDll(_PythonDll));
+                PyThreadState_GetUnchecked = (delegate* unmanaged[Cdecl]<PyThreadState*>)GetFunctionByName(nameof(PyThreadState_GetUnchecked), libraryHandle);
             }
             try
             {
-                PyGILState_Check = (delegate* unmanaged[Cdecl]<int>)GetFunctionByName(nameof(PyGILState_Check), GetUnmanagedDll(_PythonDll));
+                PyGILState_Check = (delegate* unmanaged[Cdecl]<int>)GetFunctionByName(nameof(PyGILState_Check), libraryHandle);
             }
             catch (MissingMethodException e)
             {
                 throw new NotSupportedException(Util.MinimalPythonVersionRequired, innerException: e);
             }
-            PyGILState_Ensure = (delegate* unmanaged[Cdecl]<PyGILState>)GetFunctionByName(nameof(PyGILState_Ensure), GetUnmanagedDll(_PythonDll));
-            PyGILState_Release = (delegate* unmanaged[Cdecl]<PyGILState, void>)GetFunctionByName(nameof(PyGILState_Release), GetUnmanagedDll(_PythonDll));
-            PyGILState_GetThisThreadState = (delegate* unmanaged[Cdecl]<PyThreadState*>)GetFunctionByName(nameof(PyGILState_GetThisThreadState), GetUnmanagedDll(_PythonDll));
-            PyEval_InitThreads = (delegate* unmanaged[Cdecl]<void>)GetFunctionByName(nameof(PyEval_InitThreads), GetUnmanagedDll(_PythonDll));
-            PyEval_ThreadsInitialized = (delegate* unmanaged[Cdecl]<int>)GetFunctionByName(nameof(PyEval_ThreadsInitialized), GetUnmanagedDll(_PythonDll));
-            PyEval_AcquireLock = (delegate* unmanaged[Cdecl]<void>)GetFunctionByName(nameof(PyEval_AcquireLock), GetUnmanagedDll(_PythonDll));
-            PyEval_ReleaseLock = (delegate* unmanaged[Cdecl]<void>)GetFunctionByName(nameof(PyEval_ReleaseLock), GetUnmanagedDll(_PythonDll));
-            PyEval_AcquireThread = (delegate* unmanaged[Cdecl]<PyThreadState*, void>)GetFunctionByName(nameof(PyEval_AcquireThread), GetUnmanagedDll(_PythonDll));
-            PyEval_ReleaseThread = (delegate* unmanaged[Cdecl]<PyThreadState*, void>)GetFunctionByName(nameof(PyEval_ReleaseThread), GetUnmanagedDll(_PythonDll));
-            PyEval_SaveThread = (delegate* unmanaged[Cdecl]<PyThreadState*>)GetFunctionByName(nameof(PyEval_SaveThread), GetUnmanagedDll(_PythonDll));
-            PyEval_RestoreThread = (delegate* unmanaged[Cdecl]<PyThreadState*, void>)GetFunctionByName(nameof(PyEval_RestoreThread), GetUnmanagedDll(_PythonDll));
-            PyEval_GetBuiltins = (delegate* unmanaged[Cdecl]<BorrowedReference>)GetFunctionByName(nameof(PyEval_GetBuiltins), GetUnmanagedDll(_PythonDll));
-            PyEval_GetGlobals = (delegate* unmanaged[Cdecl]<BorrowedReference>)GetFunctionByName(nameof(PyEval_GetGlobals), GetUnmanagedDll(_PythonDll));
-            PyEval_GetLocals = (delegate* unmanaged[Cdecl]<BorrowedReference>)GetFunctionByName(nameof(PyEval_GetLocals), GetUnmanagedDll(_PythonDll));
-            Py_GetProgramName = (delegate* unmanaged[Cdecl]<IntPtr>)GetFunctionByName(nameof(Py_GetProgramName), GetUnmanagedDll(_PythonDll));
-            Py_SetProgramName = (delegate* unmanaged[Cdecl]<IntPtr, void>)GetFunctionByName(nameof(Py_SetProgramName), GetUnmanagedDll(_PythonDll));
-            Py_GetPythonHome = (delegate* unmanaged[Cdecl]<IntPtr>)GetFunctionByName(nameof(Py_GetPythonHome), GetUnmanagedDll(_PythonDll));
-            Py_SetPythonHome = (delegate* unmanaged[Cdecl]<IntPtr, void>)GetFunctionByName(nameof(Py_SetPythonHome), GetUnmanagedDll(_PythonDll));
-            Py_GetPath = (delegate* unmanaged[Cdecl]<IntPtr>)GetFunctionByName(nameof(Py_GetPath), GetUnmanagedDll(_PythonDll));
-            Py_SetPath = (delegate* unmanaged[Cdecl]<IntPtr, void>)GetFunctionByName(nameof(Py_SetPath), GetUnmanagedDll(_PythonDll));
-            Py_GetVersion = (delegate* unmanaged[Cdecl]<IntPtr>)GetFunctionByName(nameof(Py_GetVersion), GetUnmanagedDll(_PythonDll));
-            Py_GetPlatform = (delegate* unmanaged[Cdecl]<IntPtr>)GetFunctionByName(nameof(Py_GetPlatform), GetUnmanagedDll(_PythonDll));
-            Py_GetCopyright = (delegate* unmanaged[Cdecl]<IntPtr>)GetFunctionByName(nameof(Py_GetCopyright), GetUnmanagedDll(_PythonDll));
-            Py_GetCompiler = (delegate* unmanaged[Cdecl]<IntPtr>)GetFunctionByName(nameof(Py_GetCompiler), GetUnmanagedDll(_PythonDll));
-            Py_GetBuildInfo = (delegate* unmanaged[Cdecl]<IntPtr>)GetFunctionByName(nameof(Py_GetBuildInfo), GetUnmanagedDll(_PythonDll));
-            PyRun_SimpleStringFlags = (delegate* unmanaged[Cdecl]<StrPtr, in PyCompilerFlags, int>)GetFunctionByName(nameof(PyRun_SimpleStringFlags), GetUnmanagedDll(_PythonDll));
-            PyRun_StringFlags = (delegate* unmanaged[Cdecl]<StrPtr, RunFlagType, BorrowedReference, BorrowedReference, in PyCompilerFlags, NewReference>)GetFunctionByName(nameof(PyRun_StringFlags), GetUnmanagedDll(_PythonDll));
-            PyEval_EvalCode = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyEval_EvalCode), GetUnmanagedDll(_PythonDll));
-            Py_CompileStringObject = (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, int, in PyCompilerFlags, int, NewReference>)GetFunctionByName(nameof(Py_CompileStringObject), GetUnmanagedDll(_PythonDll));
-            PyImport_ExecCodeModule = (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyImport_ExecCodeModule), GetUnmanagedDll(_PythonDll));
-            PyObject_HasAttrString = (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, int>)GetFunctionByName(nameof(PyObject_HasAttrString), GetUnmanagedDll(_PythonDll));
-            PyObject_GetAttrString = (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, NewReference>)GetFunctionByName(nameof(PyObject_GetAttrString), GetUnmanagedDll(_PythonDll));
-            PyObject_SetAttrString = (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference, int>)GetFunctionByName(nameof(PyObject_SetAttrString), GetUnmanagedDll(_PythonDll));
-            PyObject_HasAttr = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyObject_HasAttr), GetUnmanagedDll(_PythonDll));
-            PyObject_GetAttr = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_GetAttr), GetUnmanagedDll(_PythonDll));
-            PyObject_SetAttr = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyObject_SetAttr), GetUnmanagedDll(_PythonDll));
-            PyObject_GetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_GetItem), GetUnmanagedDll(_PythonDll));
-            PyObject_SetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyObject_SetItem), GetUnmanagedDll(_PythonDll));
-            PyObject_DelItem = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyObject_DelItem), GetUnmanagedDll(_PythonDll));
-            PyObject_GetIter = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_GetIter), GetUnmanagedDll(_PythonDll));
-            PyObject_Call = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_Call), GetUnmanagedDll(_PythonDll));
-            PyObject_CallObject = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_CallObject), GetUnmanagedDll(_PythonDll));
-            PyObject_RichCompareBool = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int, int>)GetFunctionByName(nameof(PyObject_RichCompareBool), GetUnmanagedDll(_PythonDll));
-            PyObject_IsInstance = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyObject_IsInstance), GetUnmanagedDll(_PythonDll));
-            PyObject_IsSubclass = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyObject_IsSubclass), GetUnmanagedDll(_PythonDll));
-            PyObject_ClearWeakRefs = (delegate* unmanaged[Cdecl]<BorrowedReference, void>)GetFunctionByName(nameof(PyObject_ClearWeakRefs), GetUnmanagedDll(_PythonDll));
-            PyCallable_Check = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyCallable_Check), GetUnmanagedDll(_PythonDll));
-            PyObject_IsTrue = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyObject_IsTrue), GetUnmanagedDll(_PythonDll));
-            PyObject_Not = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyObject_Not), GetUnmanagedDll(_PythonDll));
-            PyObject_Size = (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)GetFunctionByName("PyObject_Size", GetUnmanagedDll(_PythonDll));
-            PyObject_Hash = (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)GetFunctionByName(nameof(PyObject_Hash), GetUnmanagedDll(_PythonDll));
-            PyObject_Repr = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_Repr), GetUnmanagedDll(_PythonDll));
-            PyObject_Str = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_Str), GetUnmanagedDll(_PythonDll));
-            PyObject_Type = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_Type), GetUnmanagedDll(_PythonDll));
-            PyObject_Dir = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_Dir), GetUnmanagedDll(_PythonDll));
-            PyObject_GetBuffer = (delegate* unmanaged[Cdecl]<BorrowedReference, out Py_buffer, int, int>)GetFunctionByName(nameof(PyObject_GetBuffer), GetUnmanagedDll(_PythonDll));
-            PyBuffer_Release = (delegate* unmanaged[Cdecl]<ref Py_buffer, void>)GetFunctionByName(nameof(PyBuffer_Release), GetUnmanagedDll(_PythonDll));
             try
             {
-                PyBuffer_SizeFromFormat = (delegate* unmanaged[Cdecl]<StrPtr, IntPtr>)GetFunctionByName(nameof(PyBuffer_SizeFromFormat), GetUnmanagedDll(_PythonDll));
+                PyBuffer_SizeFromFormat = (delegate* unmanaged[Cdecl]<StrPtr, IntPtr>)GetFunctionByName(nameof(PyBuffer_SizeFromFormat), libraryHandle);
             }
             catch (MissingMethodException)
             {
                 // only in 3.9+
             }
-            PyBuffer_IsContiguous = (delegate* unmanaged[Cdecl]<ref Py_buffer, char, int>)GetFunctionByName(nameof(PyBuffer_IsContiguous), GetUnmanagedDll(_PythonDll));
-            PyBuffer_GetPointer = (delegate* unmanaged[Cdecl]<ref Py_buffer, nint[], IntPtr>)GetFunctionByName(nameof(PyBuffer_GetPointer), GetUnmanagedDll(_PythonDll));
-            PyBuffer_FromContiguous = (delegate* unmanaged[Cdecl]<ref Py_buffer, IntPtr, IntPtr, char, int>)GetFunctionByName(nameof(PyBuffer_FromContiguous), GetUnmanagedDll(_PythonDll));
-            PyBuffer_ToContiguous = (delegate* unmanaged[Cdecl]<IntPtr, ref Py_buffer, IntPtr, char, int>)GetFunctionByName(nameof(PyBuffer_ToContiguous), GetUnmanagedDll(_PythonDll));
-            PyBuffer_FillContiguousStrides = (delegate* unmanaged[Cdecl]<int, IntPtr, IntPtr, int, char, void>)GetFunctionByName(nameof(PyBuffer_FillContiguousStrides), GetUnmanagedDll(_PythonDll));
-            PyBuffer_FillInfo = (delegate* unmanaged[Cdecl]<ref Py_buffer, BorrowedReference, IntPtr, IntPtr, int, int, int>)GetFunctionByName(nameof(PyBuffer_FillInfo), GetUnmanagedDll(_PythonDll));
-            PyNumber_Long = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Long), GetUnmanagedDll(_PythonDll));
-            PyNumber_Float = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Float), GetUnmanagedDll(_PythonDll));
-            PyNumber_Check = (delegate* unmanaged[Cdecl]<BorrowedReference, bool>)GetFunctionByName(nameof(PyNumber_Check), GetUnmanagedDll(_PythonDll));
-            PyLong_FromLongLong = (delegate* unmanaged[Cdecl]<long, NewReference>)GetFunctionByName(nameof(PyLong_FromLongLong), GetUnmanagedDll(_PythonDll));
-            PyLong_FromUnsignedLongLong = (delegate* unmanaged[Cdecl]<ulong, NewReference>)GetFunctionByName(nameof(PyLong_FromUnsignedLongLong), GetUnmanagedDll(_PythonDll));
-            PyLong_FromString = (delegate* unmanaged[Cdecl]<StrPtr, IntPtr, int, NewReference>)GetFunctionByName(nameof(PyLong_FromString), GetUnmanagedDll(_PythonDll));
-            PyLong_AsLongLong = (delegate* unmanaged[Cdecl]<BorrowedReference, long>)GetFunctionByName(nameof(PyLong_AsLongLong), GetUnmanagedDll(_PythonDll));
-            PyLong_AsUnsignedLongLong = (delegate* unmanaged[Cdecl]<BorrowedReference, ulong>)GetFunctionByName(nameof(PyLong_AsUnsignedLongLong), GetUnmanagedDll(_PythonDll));
-            PyLong_FromVoidPtr = (delegate* unmanaged[Cdecl]<IntPtr, NewReference>)GetFunctionByName(nameof(PyLong_FromVoidPtr), GetUnmanagedDll(_PythonDll));
-            PyLong_AsVoidPtr = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr>)GetFunctionByName(nameof(PyLong_AsVoidPtr), GetUnmanagedDll(_PythonDll));
-            PyFloat_FromDouble = (delegate* unmanaged[Cdecl]<double, NewReference>)GetFunctionByName(nameof(PyFloat_FromDouble), GetUnmanagedDll(_PythonDll));
-            PyFloat_FromString = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyFloat_FromString), GetUnmanagedDll(_PythonDll));
-            PyFloat_AsDouble = (delegate* unmanaged[Cdecl]<BorrowedReference, double>)GetFunctionByName(nameof(PyFloat_AsDouble), GetUnmanagedDll(_PythonDll));
-            PyNumber_Add = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Add), GetUnmanagedDll(_PythonDll));
-            PyNumber_Subtract = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Subtract), GetUnmanagedDll(_PythonDll));
-            PyNumber_Multiply = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Multiply), GetUnmanagedDll(_PythonDll));
-            PyNumber_TrueDivide = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_TrueDivide), GetUnmanagedDll(_PythonDll));
-            PyNumber_And = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_And), GetUnmanagedDll(_PythonDll));
-            PyNumber_Xor = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Xor), GetUnmanagedDll(_PythonDll));
-            PyNumber_Or = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Or), GetUnmanagedDll(_PythonDll));
-            PyNumber_Lshift = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Lshift), GetUnmanagedDll(_PythonDll));
-            PyNumber_Rshift = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Rshift), GetUnmanagedDll(_PythonDll));
-            PyNumber_Power = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Power), GetUnmanagedDll(_PythonDll));
-            PyNumber_Remainder = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Remainder), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceAdd = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceAdd), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceSubtract = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceSubtract), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceMultiply = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceMultiply), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceTrueDivide = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceTrueDivide), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceAnd = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceAnd), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceXor = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceXor), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceOr = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceOr), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceLshift = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceLshift), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceRshift = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceRshift), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlacePower = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlacePower), GetUnmanagedDll(_PythonDll));
-            PyNumber_InPlaceRemainder = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_InPlaceRemainder), GetUnmanagedDll(_PythonDll));
-            PyNumber_Negative = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Negative), GetUnmanagedDll(_PythonDll));
-            PyNumber_Positive = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Positive), GetUnmanagedDll(_PythonDll));
-            PyNumber_Invert = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyNumber_Invert), GetUnmanagedDll(_PythonDll));
-            PySequence_Check = (delegate* unmanaged[Cdecl]<BorrowedReference, bool>)GetFunctionByName(nameof(PySequence_Check), GetUnmanagedDll(_PythonDll));
-            PySequence_GetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference>)GetFunctionByName(nameof(PySequence_GetItem), GetUnmanagedDll(_PythonDll));
-            PySequence_SetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference, int>)GetFunctionByName(nameof(PySequence_SetItem), GetUnmanagedDll(_PythonDll));
-            PySequence_DelItem = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, int>)GetFunctionByName(nameof(PySequence_DelItem), GetUnmanagedDll(_PythonDll));
-            PySequence_GetSlice = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference>)GetFunctionByName(nameof(PySequence_GetSlice), GetUnmanagedDll(_PythonDll));
-            PySequence_SetSlice = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, BorrowedReference, int>)GetFunctionByName(nameof(PySequence_SetSlice), GetUnmanagedDll(_PythonDll));
-            PySequence_DelSlice = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, int>)GetFunctionByName(nameof(PySequence_DelSlice), GetUnmanagedDll(_PythonDll));
-            PySequence_Size = (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)GetFunctionByName(nameof(PySequence_Size), GetUnmanagedDll(_PythonDll));
-            PySequence_Contains = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PySequence_Contains), GetUnmanagedDll(_PythonDll));
-            PySequence_Concat = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PySequence_Concat), GetUnmanagedDll(_PythonDll));
-            PySequence_Repeat = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference>)GetFunctionByName(nameof(PySequence_Repeat), GetUnmanagedDll(_PythonDll));
-            PySequence_Index = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, nint>)GetFunctionByName(nameof(PySequence_Index), GetUnmanagedDll(_PythonDll));
-            PySequence_Count = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, nint>)GetFunctionByName(nameof(PySequence_Count), GetUnmanagedDll(_PythonDll));
-            PySequence_Tuple = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PySequence_Tuple), GetUnmanagedDll(_PythonDll));
-            PySequence_List = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PySequence_List), GetUnmanagedDll(_PythonDll));
-            PyBytes_AsString = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr>)GetFunctionByName(nameof(PyBytes_AsString), GetUnmanagedDll(_PythonDll));
-            PyBytes_FromString = (delegate* unmanaged[Cdecl]<IntPtr, NewReference>)GetFunctionByName(nameof(PyBytes_FromString), GetUnmanagedDll(_PythonDll));
-            PyByteArray_FromStringAndSize = (delegate* unmanaged[Cdecl]<IntPtr, nint, NewReference>)GetFunctionByName(nameof(PyByteArray_FromStringAndSize), GetUnmanagedDll(_PythonDll));
-            PyBytes_Size = (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)GetFunctionByName(nameof(PyBytes_Size), GetUnmanagedDll(_PythonDll));
-            PyUnicode_AsUTF8 = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr>)GetFunctionByName(nameof(PyUnicode_AsUTF8), GetUnmanagedDll(_PythonDll));
-            PyUnicode_DecodeUTF16 = (delegate* unmanaged[Cdecl]<IntPtr, nint, IntPtr, IntPtr, NewReference>)GetFunctionByName(nameof(PyUnicode_DecodeUTF16), GetUnmanagedDll(_PythonDll));
-            PyUnicode_GetLength = (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)GetFunctionByName(nameof(PyUnicode_GetLength), GetUnmanagedDll(_PythonDll));
-            PyUnicode_AsUTF16String = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyUnicode_AsUTF16String), GetUnmanagedDll(_PythonDll));
-            PyUnicode_ReadChar = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, int>)GetFunctionByName(nameof(PyUnicode_ReadChar), GetUnmanagedDll(_PythonDll));
-            PyUnicode_FromOrdinal = (delegate* unmanaged[Cdecl]<int, NewReference>)GetFunctionByName(nameof(PyUnicode_FromOrdinal), GetUnmanagedDll(_PythonDll));
-            PyUnicode_InternFromString = (delegate* unmanaged[Cdecl]<StrPtr, NewReference>)GetFunctionByName(nameof(PyUnicode_InternFromString), GetUnmanagedDll(_PythonDll));
-            PyUnicode_Compare = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyUnicode_Compare), GetUnmanagedDll(_PythonDll));
-            PyDict_New = (delegate* unmanaged[Cdecl]<NewReference>)GetFunctionByName(nameof(PyDict_New), GetUnmanagedDll(_PythonDll));
-            PyDict_GetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference>)GetFunctionByName(nameof(PyDict_GetItem), GetUnmanagedDll(_PythonDll));
-            PyDict_GetItemString = (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference>)GetFunctionByName(nameof(PyDict_GetItemString), GetUnmanagedDll(_PythonDll));
-            PyDict_SetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyDict_SetItem), GetUnmanagedDll(_PythonDll));
-            PyDict_SetItemString = (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference, int>)GetFunctionByName(nameof(PyDict_SetItemString), GetUnmanagedDll(_PythonDll));
-            PyDict_DelItem = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyDict_DelItem), GetUnmanagedDll(_PythonDll));
-            PyDict_DelItemString = (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, int>)GetFunctionByName(nameof(PyDict_DelItemString), GetUnmanagedDll(_PythonDll));
-            PyMapping_HasKey = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyMapping_HasKey), GetUnmanagedDll(_PythonDll));
-            PyDict_Keys = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyDict_Keys), GetUnmanagedDll(_PythonDll));
-            PyDict_Values = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyDict_Values), GetUnmanagedDll(_PythonDll));
-            PyDict_Items = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyDict_Items), GetUnmanagedDll(_PythonDll));
-            PyDict_Copy = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyDict_Copy), GetUnmanagedDll(_PythonDll));
-            PyDict_Update = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyDict_Update), GetUnmanagedDll(_PythonDll));
-            PyDict_Clear = (delegate* unmanaged[Cdecl]<BorrowedReference, void>)GetFunctionByName(nameof(PyDict_Clear), GetUnmanagedDll(_PythonDll));
-            PyDict_Size = (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)GetFunctionByName(nameof(PyDict_Size), GetUnmanagedDll(_PythonDll));
-            PySet_New = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PySet_New), GetUnmanagedDll(_PythonDll));
-            PySet_Add = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PySet_Add), GetUnmanagedDll(_PythonDll));
-            PySet_Contains = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PySet_Contains), GetUnmanagedDll(_PythonDll));
-            PyList_New = (delegate* unmanaged[Cdecl]<nint, NewReference>)GetFunctionByName(nameof(PyList_New), GetUnmanagedDll(_PythonDll));
-            PyList_GetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, BorrowedReference>)GetFunctionByName(nameof(PyList_GetItem), GetUnmanagedDll(_PythonDll));
-            PyList_SetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int>)GetFunctionByName(nameof(PyList_SetItem), GetUnmanagedDll(_PythonDll));
-            PyList_Insert = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference, int>)GetFunctionByName(nameof(PyList_Insert), GetUnmanagedDll(_PythonDll));
-            PyList_Append = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyList_Append), GetUnmanagedDll(_PythonDll));
-            PyList_Reverse = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyList_Reverse), GetUnmanagedDll(_PythonDll));
-            PyList_Sort = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyList_Sort), GetUnmanagedDll(_PythonDll));
-            PyList_GetSlice = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference>)GetFunctionByName(nameof(PyList_GetSlice), GetUnmanagedDll(_PythonDll));
-            PyList_SetSlice = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, BorrowedReference, int>)GetFunctionByName(nameof(PyList_SetSlice), GetUnmanagedDll(_PythonDll));
-            PyList_Size = (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)GetFunctionByName(nameof(PyList_Size), GetUnmanagedDll(_PythonDll));
-            PyTuple_New = (delegate* unmanaged[Cdecl]<nint, NewReference>)GetFunctionByName(nameof(PyTuple_New), GetUnmanagedDll(_PythonDll));
-            PyTuple_GetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, BorrowedReference>)GetFunctionByName(nameof(PyTuple_GetItem), GetUnmanagedDll(_PythonDll));
-            PyTuple_SetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int>)GetFunctionByName(nameof(PyTuple_SetItem), GetUnmanagedDll(_PythonDll));
-            PyTuple_GetSlice = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference>)GetFunctionByName(nameof(PyTuple_GetSlice), GetUnmanagedDll(_PythonDll));
-            PyTuple_Size = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr>)GetFunctionByName(nameof(PyTuple_Size), GetUnmanagedDll(_PythonDll));
             try
             {
-                PyIter_Check = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyIter_Check), GetUnmanagedDll(_PythonDll));
+                PyIter_Check = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyIter_Check), libraryHandle);
             }
             catch (MissingMethodException) { }
-            PyIter_Next = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyIter_Next), GetUnmanagedDll(_PythonDll));
-            PyModule_New = (delegate* unmanaged[Cdecl]<StrPtr, NewReference>)GetFunctionByName(nameof(PyModule_New), GetUnmanagedDll(_PythonDll));
-            PyModule_GetDict = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference>)GetFunctionByName(nameof(PyModule_GetDict), GetUnmanagedDll(_PythonDll));
-            PyModule_AddObject = (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, IntPtr, int>)GetFunctionByName(nameof(PyModule_AddObject), GetUnmanagedDll(_PythonDll));
-            PyImport_Import = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyImport_Import), GetUnmanagedDll(_PythonDll));
-            PyImport_ImportModule = (delegate* unmanaged[Cdecl]<StrPtr, NewReference>)GetFunctionByName(nameof(PyImport_ImportModule), GetUnmanagedDll(_PythonDll));
-            PyImport_ReloadModule = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyImport_ReloadModule), GetUnmanagedDll(_PythonDll));
-            PyImport_AddModule = (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference>)GetFunctionByName(nameof(PyImport_AddModule), GetUnmanagedDll(_PythonDll));
-            PyImport_GetModuleDict = (delegate* unmanaged[Cdecl]<BorrowedReference>)GetFunctionByName(nameof(PyImport_GetModuleDict), GetUnmanagedDll(_PythonDll));
-            PySys_SetArgvEx = (delegate* unmanaged[Cdecl]<int, IntPtr, int, void>)GetFunctionByName(nameof(PySys_SetArgvEx), GetUnmanagedDll(_PythonDll));
-            PySys_GetObject = (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference>)GetFunctionByName(nameof(PySys_GetObject), GetUnmanagedDll(_PythonDll));
-            PySys_SetObject = (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, int>)GetFunctionByName(nameof(PySys_SetObject), GetUnmanagedDll(_PythonDll));
-            PyType_Modified = (delegate* unmanaged[Cdecl]<BorrowedReference, void>)GetFunctionByName(nameof(PyType_Modified), GetUnmanagedDll(_PythonDll));
-            PyType_IsSubtype = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, bool>)GetFunctionByName(nameof(PyType_IsSubtype), GetUnmanagedDll(_PythonDll));
-            PyType_GenericNew = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyType_GenericNew), GetUnmanagedDll(_PythonDll));
-            PyType_GenericAlloc = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference>)GetFunctionByName(nameof(PyType_GenericAlloc), GetUnmanagedDll(_PythonDll));
-            PyType_Ready = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyType_Ready), GetUnmanagedDll(_PythonDll));
-            _PyType_Lookup = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference>)GetFunctionByName(nameof(_PyType_Lookup), GetUnmanagedDll(_PythonDll));
-            PyObject_GenericGetAttr = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyObject_GenericGetAttr), GetUnmanagedDll(_PythonDll));
-            PyObject_GenericGetDict = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, NewReference>)GetFunctionByName(nameof(PyObject_GenericGetDict), GetUnmanagedDll(PythonDLL));
-            PyObject_GenericSetAttr = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyObject_GenericSetAttr), GetUnmanagedDll(_PythonDll));
-            PyObject_GC_Del = (delegate* unmanaged[Cdecl]<StolenReference, void>)GetFunctionByName(nameof(PyObject_GC_Del), GetUnmanagedDll(_PythonDll));
             try
             {
-                PyObject_GC_IsTracked = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyObject_GC_IsTracked), GetUnmanagedDll(_PythonDll));
+                PyObject_GC_IsTracked = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyObject_GC_IsTracked), libraryHandle);
             }
             catch (MissingMethodException) { }
-            PyObject_GC_Track = (delegate* unmanaged[Cdecl]<BorrowedReference, void>)GetFunctionByName(nameof(PyObject_GC_Track), GetUnmanagedDll(_PythonDll));
-            PyObject_GC_UnTrack = (delegate* unmanaged[Cdecl]<BorrowedReference, void>)GetFunctionByName(nameof(PyObject_GC_UnTrack), GetUnmanagedDll(_PythonDll));
-            PyMem_Malloc = (delegate* unmanaged[Cdecl]<IntPtr, IntPtr>)GetFunctionByName(nameof(PyMem_Malloc), GetUnmanagedDll(_PythonDll));
-            PyMem_Realloc = (delegate* unmanaged[Cdecl]<IntPtr, IntPtr, IntPtr>)GetFunctionByName(nameof(PyMem_Realloc), GetUnmanagedDll(_PythonDll));
-            PyMem_Free = (delegate* unmanaged[Cdecl]<IntPtr, void>)GetFunctionByName(nameof(PyMem_Free), GetUnmanagedDll(_PythonDll));
-            PyErr_SetString = (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, void>)GetFunctionByName(nameof(PyErr_SetString), GetUnmanagedDll(_PythonDll));
-            PyErr_SetObject = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, void>)GetFunctionByName(nameof(PyErr_SetObject), GetUnmanagedDll(_PythonDll));
-            PyErr_ExceptionMatches = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyErr_ExceptionMatches), GetUnmanagedDll(_PythonDll));
-            PyErr_GivenExceptionMatches = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyErr_GivenExceptionMatches), GetUnmanagedDll(_PythonDll));
-            PyErr_NormalizeException = (delegate* unmanaged[Cdecl]<ref NewReference, ref NewReference, ref NewReference, void>)GetFunctionByName(nameof(PyErr_NormalizeException), GetUnmanagedDll(_PythonDll));
-            PyErr_Occurred = (delegate* unmanaged[Cdecl]<BorrowedReference>)GetFunctionByName(nameof(PyErr_Occurred), GetUnmanagedDll(_PythonDll));
-            PyErr_Fetch = (delegate* unmanaged[Cdecl]<out NewReference, out NewReference, out NewReference, void>)GetFunctionByName(nameof(PyErr_Fetch), GetUnmanagedDll(_PythonDll));
-            PyErr_Restore = (delegate* unmanaged[Cdecl]<StolenReference, StolenReference, StolenReference, void>)GetFunctionByName(nameof(PyErr_Restore), GetUnmanagedDll(_PythonDll));
-            PyErr_Clear = (delegate* unmanaged[Cdecl]<void>)GetFunctionByName(nameof(PyErr_Clear), GetUnmanagedDll(_PythonDll));
-            PyErr_Print = (delegate* unmanaged[Cdecl]<void>)GetFunctionByName(nameof(PyErr_Print), GetUnmanagedDll(_PythonDll));
-            PyCell_Get = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyCell_Get), GetUnmanagedDll(_PythonDll));
-            PyCell_Set = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyCell_Set), GetUnmanagedDll(_PythonDll));
-            PyGC_Collect = (delegate* unmanaged[Cdecl]<nint>)GetFunctionByName(nameof(PyGC_Collect), GetUnmanagedDll(_PythonDll));
-            PyCapsule_New = (delegate* unmanaged[Cdecl]<IntPtr, IntPtr, IntPtr, NewReference>)GetFunctionByName(nameof(PyCapsule_New), GetUnmanagedDll(_PythonDll));
-            PyCapsule_GetPointer = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, IntPtr>)GetFunctionByName(nameof(PyCapsule_GetPointer), GetUnmanagedDll(_PythonDll));
-            PyCapsule_SetPointer = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, int>)GetFunctionByName(nameof(PyCapsule_SetPointer), GetUnmanagedDll(_PythonDll));
-            PyLong_AsUnsignedSize_t = (delegate* unmanaged[Cdecl]<BorrowedReference, nuint>)GetFunctionByName("PyLong_AsSize_t", GetUnmanagedDll(_PythonDll));
-            PyLong_AsSignedSize_t = (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)GetFunctionByName("PyLong_AsSsize_t", GetUnmanagedDll(_PythonDll));
-            PyDict_GetItemWithError = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference>)GetFunctionByName(nameof(PyDict_GetItemWithError), GetUnmanagedDll(_PythonDll));
-            PyException_GetCause = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyException_GetCause), GetUnmanagedDll(_PythonDll));
-            PyException_GetTraceback = (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)GetFunctionByName(nameof(PyException_GetTraceback), GetUnmanagedDll(_PythonDll));
-            PyException_SetCause = (delegate* unmanaged[Cdecl]<BorrowedReference, StolenReference, void>)GetFunctionByName(nameof(PyException_SetCause), GetUnmanagedDll(_PythonDll));
-            PyException_SetTraceback = (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)GetFunctionByName(nameof(PyException_SetTraceback), GetUnmanagedDll(_PythonDll));
-            PyThreadState_SetAsyncExcLLP64 = (delegate* unmanaged[Cdecl]<uint, BorrowedReference, int>)GetFunctionByName("PyThreadState_SetAsyncExc", GetUnmanagedDll(_PythonDll));
-            PyThreadState_SetAsyncExcLP64 = (delegate* unmanaged[Cdecl]<ulong, BorrowedReference, int>)GetFunctionByName("PyThreadState_SetAsyncExc", GetUnmanagedDll(_PythonDll));
-            PyType_GetSlot = (delegate* unmanaged[Cdecl]<BorrowedReference, TypeSlotID, IntPtr>)GetFunctionByName(nameof(PyType_GetSlot), GetUnmanagedDll(_PythonDll));
-            PyType_FromSpecWithBases = (delegate* unmanaged[Cdecl]<in NativeTypeSpec, BorrowedReference, NewReference>)GetFunctionByName(nameof(PyType_FromSpecWithBases), GetUnmanagedDll(PythonDLL));
 
             try
             {
-                _Py_NewReference = (delegate* unmanaged[Cdecl]<BorrowedReference, void>)GetFunctionByName(nameof(_Py_NewReference), GetUnmanagedDll(_PythonDll));
+                _Py_NewReference = (delegate* unmanaged[Cdecl]<BorrowedReference, void>)GetFunctionByName(nameof(_Py_NewReference), libraryHandle);
             }
             catch (MissingMethodException) { }
             try
             {
-                _Py_IsFinalizing = (delegate* unmanaged[Cdecl]<int>)GetFunctionByName(nameof(_Py_IsFinalizing), GetUnmanagedDll(_PythonDll));
+                _Py_IsFinalizing = (delegate* unmanaged[Cdecl]<int>)GetFunctionByName(nameof(_Py_IsFinalizing), libraryHandle);
             }
             catch (MissingMethodException) { }
 
-            PyType_Type = GetFunctionByName(nameof(PyType_Type), GetUnmanagedDll(_PythonDll));
-            Py_NoSiteFlag = (int*)GetFunctionByName(nameof(Py_NoSiteFlag), GetUnmanagedDll(_PythonDll));
+            PyType_Type = GetFunctionByName(nameof(PyType_Type), libraryHandle);
+            Py_NoSiteFlag = (int*)GetFunctionByName(nameof(Py_NoSiteFlag), libraryHandle);
         }
 
         static global::System.IntPtr GetUnmanagedDll(string? libraryName)
@@ -297,6 +86,47 @@ public unsafe partial class Runtime
             return libraryLoader.Load(libraryName);
         }
 
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        static IntPtr Get(ref IntPtr function, string functionName)
+            => function != IntPtr.Zero ? function : Resolve(ref function, functionName);
+
+        [MethodImpl(MethodImplOptions.NoInlining)]
+        static IntPtr Resolve(ref IntPtr function, string functionName)
+        {
+            // races resolve the same address, so it can be stored without synchronization
+            function = GetFunctionByName(functionName, libraryHandle);
+            return function;
+        }
+
+        /// <summary>
+        /// Marks functions, that are not exported by the loaded library.
+        /// </summary>
+        static readonly IntPtr Missing = new(-1);
+
+        /// <summary>
+        /// Like <see cref="Get"/>, but returns <see cref="IntPtr.Zero"/> for functions,
+        /// that are not exported, e.g. because they are <c>static inline</c> in older versions.
+        /// </summary>
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        static IntPtr GetOptional(ref IntPtr function, string functionName)
+            => function == Missing ? IntPtr.Zero
+               : function != IntPtr.Zero ? function
+               : ResolveOptional(ref function, functionName);
+
+        [MethodImpl(MethodImplOptions.NoInlining)]
+        static IntPtr ResolveOptional(ref IntPtr function, string functionName)
+        {
+            try
+            {
+                return Resolve(ref function, functionName);
+            }
+            catch (MissingMethodException)
+            {
+                function = Missing;
+                return IntPtr.Zero;
+            }
+        }
+
         static global::System.IntPtr GetFunctionByName(string functionName, global::System.IntPtr libraryHandle)
         {
             try
@@ -313,236 +143,483 @@ public unsafe partial class Runtime
             }
         }
 
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> Py_IncRef { get; }
-        internal static delegate* unmanaged[Cdecl]<StolenReference, void> Py_DecRef { get; }
-        internal static delegate* unmanaged[Cdecl]<void> Py_Initialize { get; }
-        internal static delegate* unmanaged[Cdecl]<int, void> Py_InitializeEx { get; }
-        internal static delegate* unmanaged[Cdecl]<int> Py_IsInitialized { get; }
-        internal static delegate* unmanaged[Cdecl]<void> Py_Finalize { get; }
-        internal static delegate* unmanaged[Cdecl]<PyThreadState*> Py_NewInterpreter { get; }
-        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> Py_EndInterpreter { get; }
-        internal static delegate* unmanaged[Cdecl]<PyInterpreterState*, PyThreadState*> PyThreadState_New { get; }
-        internal static delegate* unmanaged[Cdecl]<PyThreadState*> PyThreadState_Get { get; }
+        /// <summary>
+        /// Addresses of the functions, that are resolved on first use.
+        /// </summary>
+        static class Functions
+        {
+            internal static IntPtr Py_IncRef;
+            internal static IntPtr Py_DecRef;
+            internal static IntPtr Py_Initialize;
+            internal static IntPtr Py_InitializeEx;
+            internal static IntPtr Py_IsInitialized;
+            internal static IntPtr Py_Finalize;
+            internal static IntPtr Py_NewInterpreter;
+            internal static IntPtr Py_EndInterpreter;
+            internal static IntPtr PyThreadState_New;
+            internal static IntPtr PyThreadState_Get;
+            internal static IntPtr PyThreadState_Clear;
+            internal static IntPtr PyThreadState_DeleteCurrent;
+            internal static IntPtr PyGILState_Ensure;
+            internal static IntPtr PyGILState_Release;
+            internal static IntPtr PyGILState_GetThisThreadState;
+            internal static IntPtr PyEval_InitThreads;
+            internal static IntPtr PyEval_ThreadsInitialized;
+            internal static IntPtr PyEval_AcquireLock;
+            internal static IntPtr PyEval_ReleaseLock;
+            internal static IntPtr PyEval_AcquireThread;
+            internal static IntPtr PyEval_ReleaseThread;
+            internal static IntPtr PyEval_SaveThread;
+            internal static IntPtr PyEval_RestoreThread;
+            internal static IntPtr PyEval_GetBuiltins;
+            internal static IntPtr PyEval_GetGlobals;
+            internal static IntPtr PyEval_GetLocals;
+            internal static IntPtr Py_GetProgramName;
+            internal static IntPtr Py_SetProgramName;
+            internal static IntPtr Py_GetPythonHome;
+            internal static IntPtr Py_SetPythonHome;
+            internal static IntPtr Py_GetPath;
+            internal static IntPtr Py_SetPath;
+            internal static IntPtr Py_GetVersion;
+            internal static IntPtr Py_GetPlatform;
+            internal static IntPtr Py_GetCopyright;
+            internal static IntPtr Py_GetCompiler;
+            internal static IntPtr Py_GetBuildInfo;
+            internal static IntPtr PyRun_SimpleStringFlags;
+            internal static IntPtr PyRun_StringFlags;
+            internal static IntPtr PyEval_EvalCode;
+            internal static IntPtr Py_CompileStringObject;
+            internal static IntPtr PyImport_ExecCodeModule;
+            internal static IntPtr PyObject_HasAttrString;
+            internal static IntPtr PyObject_GetAttrString;
+            internal static IntPtr PyObject_SetAttrString;
+            internal static IntPtr PyObject_HasAttr;
+            internal static IntPtr PyObject_GetAttr;
+            internal static IntPtr PyObject_SetAttr;
+            internal static IntPtr PyObject_GetItem;
+            internal static IntPtr PyObject_SetItem;
+            internal static IntPtr PyObject_DelItem;
+            internal static IntPtr PyObject_GetIter;
+            internal static IntPtr PyObject_Call;
+            internal static IntPtr PyObject_CallObject;
+            internal static IntPtr PyObject_Vectorcall;
+            internal static IntPtr PyObject_VectorcallDict;
+            internal static IntPtr PyObject_VectorcallMethod;
+            internal static IntPtr PyObject_RichCompareBool;
+            internal static IntPtr PyObject_IsInstance;
+            internal static IntPtr PyObject_IsSubclass;
+            internal static IntPtr PyObject_ClearWeakRefs;
+            internal static IntPtr PyCallable_Check;
+            internal static IntPtr PyObject_IsTrue;
+            internal static IntPtr PyObject_Not;
+            internal static IntPtr PyObject_Size;
+            internal static IntPtr PyObject_Hash;
+            internal static IntPtr PyObject_Repr;
+            internal static IntPtr PyObject_Str;
+            internal static IntPtr PyObject_Type;
+            internal static IntPtr PyObject_Dir;
+            internal static IntPtr PyCFunction_NewEx;
+            internal static IntPtr PyInstanceMethod_New;
+            internal static IntPtr PyObject_GetBuffer;
+            internal static IntPtr PyBuffer_Release;
+            internal static IntPtr PyBuffer_IsContiguous;
+            internal static IntPtr PyBuffer_GetPointer;
+            internal static IntPtr PyBuffer_FromContiguous;
+            internal static IntPtr PyBuffer_ToContiguous;
+            internal static IntPtr PyBuffer_FillContiguousStrides;
+            internal static IntPtr PyBuffer_FillInfo;
+            internal static IntPtr PyNumber_Long;
+            internal static IntPtr PyNumber_Float;
+            internal static IntPtr PyNumber_Check;
+            internal static IntPtr PyLong_FromLongLong;
+            internal static IntPtr PyLong_FromUnsignedLongLong;
+            internal static IntPtr PyLong_FromString;
+            internal static IntPtr PyLong_AsLongLong;
+            internal static IntPtr PyLong_AsUnsignedLongLong;
+            internal static IntPtr PyLong_FromVoidPtr;
+            internal static IntPtr PyLong_AsVoidPtr;
+            internal static IntPtr PyFloat_FromDouble;
+            internal static IntPtr PyFloat_FromString;
+            internal static IntPtr PyFloat_AsDouble;
+            internal static IntPtr PyNumber_Add;
+            internal static IntPtr PyNumber_Subtract;
+            internal static IntPtr PyNumber_Multiply;
+            internal static IntPtr PyNumber_TrueDivide;
+            internal static IntPtr PyNumber_And;
+            internal static IntPtr PyNumber_Xor;
+            internal static IntPtr PyNumber_Or;
+            internal static IntPtr PyNumber_Lshift;
+            internal static IntPtr PyNumber_Rshift;
+            internal static IntPtr PyNumber_Power;
+            internal static IntPtr PyNumber_Remainder;
+            internal static IntPtr PyNumber_InPlaceAdd;
+            internal static IntPtr PyNumber_InPlaceSubtract;
+            internal static IntPtr PyNumber_InPlaceMultiply;
+            internal static IntPtr PyNumber_InPlaceTrueDivide;
+            internal static IntPtr PyNumber_InPlaceAnd;
+            internal static IntPtr PyNumber_InPlaceXor;
+            internal static IntPtr PyNumber_InPlaceOr;
+            internal static IntPtr PyNumber_InPlaceLshift;
+            internal static IntPtr PyNumber_InPlaceRshift;
+            internal static IntPtr PyNumber_InPlacePower;
+            internal static IntPtr PyNumber_InPlaceRemainder;
+            internal static IntPtr PyNumber_Negative;
+            internal static IntPtr PyNumber_Positive;
+            internal static IntPtr PyNumber_Invert;
+            internal static IntPtr PySequence_Check;
+            internal static IntPtr PySequence_GetItem;
+            internal static IntPtr PySequence_SetItem;
+            internal static IntPtr PySequence_DelItem;
+            internal static IntPtr PySequence_GetSlice;
+            internal static IntPtr PySequence_SetSlice;
+            internal static IntPtr PySequence_DelSlice;
+            internal static IntPtr PySequence_Size;
+            internal static IntPtr PySequence_Contains;
+            internal static IntPtr PySequence_Concat;
+            internal static IntPtr PySequence_Repeat;
+            internal static IntPtr PySequence_Index;
+            internal static IntPtr PySequence_Count;
+            internal static IntPtr PySequence_Tuple;
+            internal static IntPtr PySequence_List;
+            internal static IntPtr PyBytes_AsString;
+            internal static IntPtr PyBytes_FromString;
+            internal static IntPtr PyByteArray_FromStringAndSize;
+            internal static IntPtr PyBytes_Size;
+            internal static IntPtr PyUnicode_AsUTF8;
+            internal static IntPtr PyUnicode_DecodeUTF16;
+            internal static IntPtr PyUnicode_GetLength;
+            internal static IntPtr PyUnicode_AsUTF16String;
+            internal static IntPtr PyUnicode_ReadChar;
+            internal static IntPtr PyUnicode_FromOrdinal;
+            internal static IntPtr PyUnicode_InternFromString;
+            internal static IntPtr PyUnicode_Compare;
+            internal static IntPtr PyDict_New;
+            internal static IntPtr PyDict_GetItem;
+            internal static IntPtr PyDict_GetItemString;
+            internal static IntPtr PyDict_SetItem;
+            internal static IntPtr PyDict_SetItemString;
+            internal static IntPtr PyDict_DelItem;
+            internal static IntPtr PyDict_DelItemString;
+            internal static IntPtr PyMapping_HasKey;
+            internal static IntPtr PyDict_Keys;
+            internal static IntPtr PyDict_Values;
+            internal static IntPtr PyDict_Items;
+            internal static IntPtr PyDict_Copy;
+            internal static IntPtr PyDict_Update;
+            internal static IntPtr PyDict_Clear;
+            internal static IntPtr PyDict_Size;
+            internal static IntPtr PySet_New;
+            internal static IntPtr PySet_Add;
+            internal static IntPtr PySet_Contains;
+            internal static IntPtr PyList_New;
+            internal static IntPtr PyList_GetItem;
+            internal static IntPtr PyList_SetItem;
+            internal static IntPtr PyList_Insert;
+            internal static IntPtr PyList_Append;
+            internal static IntPtr PyList_Reverse;
+            internal static IntPtr PyList_Sort;
+            internal static IntPtr PyList_GetSlice;
+            internal static IntPtr PyList_SetSlice;
+            internal static IntPtr PyList_Size;
+            internal static IntPtr PyTuple_New;
+            internal static IntPtr PyTuple_GetItem;
+            internal static IntPtr PyTuple_SetItem;
+            internal static IntPtr PyTuple_GetSlice;
+            internal static IntPtr PyTuple_Size;
+            internal static IntPtr PyIter_Next;
+            internal static IntPtr PyModule_New;
+            internal static IntPtr PyModule_GetDict;
+            internal static IntPtr PyModule_AddObject;
+            internal static IntPtr PyImport_Import;
+            internal static IntPtr PyImport_ImportModule;
+            internal static IntPtr PyImport_ReloadModule;
+            internal static IntPtr PyImport_AddModule;
+            internal static IntPtr PyImport_GetModuleDict;
+            internal static IntPtr PySys_SetArgvEx;
+            internal static IntPtr PySys_GetObject;
+            internal static IntPtr PySys_SetObject;
+            internal static IntPtr PyType_Modified;
+            internal static IntPtr PyType_IsSubtype;
+            internal static IntPtr PyType_GenericNew;
+            internal static IntPtr PyType_GenericAlloc;
+            internal static IntPtr PyType_Ready;
+            internal static IntPtr _PyType_Lookup;
+            internal static IntPtr PyObject_GenericGetAttr;
+            internal static IntPtr PyObject_GenericGetDict;
+            internal static IntPtr PyObject_GenericSetAttr;
+            internal static IntPtr PyObject_GC_Del;
+            internal static IntPtr PyObject_GC_Track;
+            internal static IntPtr PyObject_GC_UnTrack;
+            internal static IntPtr PyMem_Malloc;
+            internal static IntPtr PyMem_Realloc;
+            internal static IntPtr PyMem_Free;
+            internal static IntPtr PyErr_SetString;
+            internal static IntPtr PyErr_SetObject;
+            internal static IntPtr PyErr_ExceptionMatches;
+            internal static IntPtr PyErr_GivenExceptionMatches;
+            internal static IntPtr PyErr_NormalizeException;
+            internal static IntPtr PyErr_Occurred;
+            internal static IntPtr PyErr_Fetch;
+            internal static IntPtr PyErr_Restore;
+            internal static IntPtr PyErr_Clear;
+            internal static IntPtr PyErr_Print;
+            internal static IntPtr PyCell_Get;
+            internal static IntPtr PyCell_Set;
+            internal static IntPtr PyGC_Collect;
+            internal static IntPtr PyCapsule_New;
+            internal static IntPtr PyCapsule_GetPointer;
+            internal static IntPtr PyCapsule_SetPointer;
+            internal static IntPtr PyLong_AsUnsignedSize_t;
+            internal static IntPtr PyLong_AsSignedSize_t;
+            internal static IntPtr PyDict_GetItemWithError;
+            internal static IntPtr PyException_GetCause;
+            internal static IntPtr PyException_GetTraceback;
+            internal static IntPtr PyException_SetCause;
+            internal static IntPtr PyException_SetTraceback;
+            internal static IntPtr PyThreadState_SetAsyncExcLLP64;
+            internal static IntPtr PyThreadState_SetAsyncExcLP64;
+            internal static IntPtr PyType_GetSlot;
+            internal static IntPtr PyType_FromSpecWithBases;
+        }
+
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> Py_IncRef => (delegate* unmanaged[Cdecl]<BorrowedReference, void>)Get(ref Functions.Py_IncRef, nameof(Py_IncRef));
+        internal static delegate* unmanaged[Cdecl]<StolenReference, void> Py_DecRef => (delegate* unmanaged[Cdecl]<StolenReference, void>)Get(ref Functions.Py_DecRef, nameof(Py_DecRef));
+        internal static delegate* unmanaged[Cdecl]<void> Py_Initialize => (delegate* unmanaged[Cdecl]<void>)Get(ref Functions.Py_Initialize, nameof(Py_Initialize));
+        internal static delegate* unmanaged[Cdecl]<int, void> Py_InitializeEx => (delegate* unmanaged[Cdecl]<int, void>)Get(ref Functions.Py_InitializeEx, nameof(Py_InitializeEx));
+        internal static delegate* unmanaged[Cdecl]<int> Py_IsInitialized => (delegate* unmanaged[Cdecl]<int>)Get(ref Functions.Py_IsInitialized, nameof(Py_IsInitialized));
+        internal static delegate* unmanaged[Cdecl]<void> Py_Finalize => (delegate* unmanaged[Cdecl]<void>)Get(ref Functions.Py_Finalize, nameof(Py_Finalize));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*> Py_NewInterpreter => (delegate* unmanaged[Cdecl]<PyThreadState*>)Get(ref Functions.Py_NewInterpreter, nameof(Py_NewInterpreter));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> Py_EndInterpreter => (delegate* unmanaged[Cdecl]<PyThreadState*, void>)Get(ref Functions.Py_EndInterpreter, nameof(Py_EndInterpreter));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState**, in PyInterpreterConfig, PyStatus> Py_NewInterpreterFromConfig { get; }
+        internal static delegate* unmanaged[Cdecl]<PyInterpreterState*, PyThreadState*> PyThreadState_New => (delegate* unmanaged[Cdecl]<PyInterpreterState*, PyThreadState*>)Get(ref Functions.PyThreadState_New, nameof(PyThreadState_New));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*> PyThreadState_Get => (delegate* unmanaged[Cdecl]<PyThreadState*>)Get(ref Functions.PyThreadState_Get, nameof(PyThreadState_Get));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> PyThreadState_Clear => (delegate* unmanaged[Cdecl]<PyThreadState*, void>)Get(ref Functions.PyThreadState_Clear, nameof(PyThreadState_Clear));
+        internal static delegate* unmanaged[Cdecl]<void> PyThreadState_DeleteCurrent => (delegate* unmanaged[Cdecl]<void>)Get(ref Functions.PyThreadState_DeleteCurrent, nameof(PyThreadState_DeleteCurrent));
         internal static delegate* unmanaged[Cdecl]<PyThreadState*> PyThreadState_GetUnchecked { get; }
         internal static delegate* unmanaged[Cdecl]<int> PyGILState_Check { get; }
-        internal static delegate* unmanaged[Cdecl]<PyGILState> PyGILState_Ensure { get; }
-        internal static delegate* unmanaged[Cdecl]<PyGILState, void> PyGILState_Release { get; }
-        internal static delegate* unmanaged[Cdecl]<PyThreadState*> PyGILState_GetThisThreadState { get; }
-        internal static delegate* unmanaged[Cdecl]<void> PyEval_InitThreads { get; }
-        internal static delegate* unmanaged[Cdecl]<int> PyEval_ThreadsInitialized { get; }
-        internal static delegate* unmanaged[Cdecl]<void> PyEval_AcquireLock { get; }
-        internal static delegate* unmanaged[Cdecl]<void> PyEval_ReleaseLock { get; }
-        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> PyEval_AcquireThread { get; }
-        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> PyEval_ReleaseThread { get; }
-        internal static delegate* unmanaged[Cdecl]<PyThreadState*> PyEval_SaveThread { get; }
-        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> PyEval_RestoreThread { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyEval_GetBuiltins { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyEval_GetGlobals { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyEval_GetLocals { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetProgramName { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, void> Py_SetProgramName { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetPythonHome { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, void> Py_SetPythonHome { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetPath { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, void> Py_SetPath { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetVersion { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetPlatform { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetCopyright { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetCompiler { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetBuildInfo { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, in PyCompilerFlags, int> PyRun_SimpleStringFlags { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, RunFlagType, BorrowedReference, BorrowedReference, in PyCompilerFlags, NewReference> PyRun_StringFlags { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference> PyEval_EvalCode { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, int, in PyCompilerFlags, int, NewReference> Py_CompileStringObject { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, NewReference> PyImport_ExecCodeModule { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, int> PyObject_HasAttrString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, NewReference> PyObject_GetAttrString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference, int> PyObject_SetAttrString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyObject_HasAttr { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyObject_GetAttr { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int> PyObject_SetAttr { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyObject_GetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int> PyObject_SetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyObject_DelItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_GetIter { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference> PyObject_Call { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyObject_CallObject { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int, int> PyObject_RichCompareBool { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyObject_IsInstance { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyObject_IsSubclass { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyObject_ClearWeakRefs { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyCallable_Check { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyObject_IsTrue { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyObject_Not { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyObject_Size { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyObject_Hash { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_Repr { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_Str { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_Type { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_Dir { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, out Py_buffer, int, int> PyObject_GetBuffer { get; }
-        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, void> PyBuffer_Release { get; }
+        internal static delegate* unmanaged[Cdecl]<PyGILState> PyGILState_Ensure => (delegate* unmanaged[Cdecl]<PyGILState>)Get(ref Functions.PyGILState_Ensure, nameof(PyGILState_Ensure));
+        internal static delegate* unmanaged[Cdecl]<PyGILState, void> PyGILState_Release => (delegate* unmanaged[Cdecl]<PyGILState, void>)Get(ref Functions.PyGILState_Release, nameof(PyGILState_Release));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*> PyGILState_GetThisThreadState => (delegate* unmanaged[Cdecl]<PyThreadState*>)Get(ref Functions.PyGILState_GetThisThreadState, nameof(PyGILState_GetThisThreadState));
+        internal static delegate* unmanaged[Cdecl]<void> PyEval_InitThreads => (delegate* unmanaged[Cdecl]<void>)Get(ref Functions.PyEval_InitThreads, nameof(PyEval_InitThreads));
+        internal static delegate* unmanaged[Cdecl]<int> PyEval_ThreadsInitialized => (delegate* unmanaged[Cdecl]<int>)Get(ref Functions.PyEval_ThreadsInitialized, nameof(PyEval_ThreadsInitialized));
+        internal static delegate* unmanaged[Cdecl]<void> PyEval_AcquireLock => (delegate* unmanaged[Cdecl]<void>)Get(ref Functions.PyEval_AcquireLock, nameof(PyEval_AcquireLock));
+        internal static delegate* unmanaged[Cdecl]<void> PyEval_ReleaseLock => (delegate* unmanaged[Cdecl]<void>)Get(ref Functions.PyEval_ReleaseLock, nameof(PyEval_ReleaseLock));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> PyEval_AcquireThread => (delegate* unmanaged[Cdecl]<PyThreadState*, void>)Get(ref Functions.PyEval_AcquireThread, nameof(PyEval_AcquireThread));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> PyEval_ReleaseThread => (delegate* unmanaged[Cdecl]<PyThreadState*, void>)Get(ref Functions.PyEval_ReleaseThread, nameof(PyEval_ReleaseThread));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*> PyEval_SaveThread => (delegate* unmanaged[Cdecl]<PyThreadState*>)Get(ref Functions.PyEval_SaveThread, nameof(PyEval_SaveThread));
+        internal static delegate* unmanaged[Cdecl]<PyThreadState*, void> PyEval_RestoreThread => (delegate* unmanaged[Cdecl]<PyThreadState*, void>)Get(ref Functions.PyEval_RestoreThread, nameof(PyEval_RestoreThread));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyEval_GetBuiltins => (delegate* unmanaged[Cdecl]<BorrowedReference>)Get(ref Functions.PyEval_GetBuiltins, nameof(PyEval_GetBuiltins));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyEval_GetGlobals => (delegate* unmanaged[Cdecl]<BorrowedReference>)Get(ref Functions.PyEval_GetGlobals, nameof(PyEval_GetGlobals));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyEval_GetLocals => (delegate* unmanaged[Cdecl]<BorrowedReference>)Get(ref Functions.PyEval_GetLocals, nameof(PyEval_GetLocals));
+        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetProgramName => (delegate* unmanaged[Cdecl]<IntPtr>)Get(ref Functions.Py_GetProgramName, nameof(Py_GetProgramName));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, void> Py_SetProgramName => (delegate* unmanaged[Cdecl]<IntPtr, void>)Get(ref Functions.Py_SetProgramName, nameof(Py_SetProgramName));
+        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetPythonHome => (delegate* unmanaged[Cdecl]<IntPtr>)Get(ref Functions.Py_GetPythonHome, nameof(Py_GetPythonHome));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, void> Py_SetPythonHome => (delegate* unmanaged[Cdecl]<IntPtr, void>)Get(ref Functions.Py_SetPythonHome, nameof(Py_SetPythonHome));
+        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetPath => (delegate* unmanaged[Cdecl]<IntPtr>)Get(ref Functions.Py_GetPath, nameof(Py_GetPath));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, void> Py_SetPath => (delegate* unmanaged[Cdecl]<IntPtr, void>)Get(ref Functions.Py_SetPath, nameof(Py_SetPath));
+        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetVersion => (delegate* unmanaged[Cdecl]<IntPtr>)Get(ref Functions.Py_GetVersion, nameof(Py_GetVersion));
+        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetPlatform => (delegate* unmanaged[Cdecl]<IntPtr>)Get(ref Functions.Py_GetPlatform, nameof(Py_GetPlatform));
+        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetCopyright => (delegate* unmanaged[Cdecl]<IntPtr>)Get(ref Functions.Py_GetCopyright, nameof(Py_GetCopyright));
+        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetCompiler => (delegate* unmanaged[Cdecl]<IntPtr>)Get(ref Functions.Py_GetCompiler, nameof(Py_GetCompiler));
+        internal static delegate* unmanaged[Cdecl]<IntPtr> Py_GetBuildInfo => (delegate* unmanaged[Cdecl]<IntPtr>)Get(ref Functions.Py_GetBuildInfo, nameof(Py_GetBuildInfo));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, in PyCompilerFlags, int> PyRun_SimpleStringFlags => (delegate* unmanaged[Cdecl]<StrPtr, in PyCompilerFlags, int>)Get(ref Functions.PyRun_SimpleStringFlags, nameof(PyRun_SimpleStringFlags));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, RunFlagType, BorrowedReference, BorrowedReference, in PyCompilerFlags, NewReference> PyRun_StringFlags => (delegate* unmanaged[Cdecl]<StrPtr, RunFlagType, BorrowedReference, BorrowedReference, in PyCompilerFlags, NewReference>)Get(ref Functions.PyRun_StringFlags, nameof(PyRun_StringFlags));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference> PyEval_EvalCode => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyEval_EvalCode, nameof(PyEval_EvalCode));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, int, in PyCompilerFlags, int, NewReference> Py_CompileStringObject => (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, int, in PyCompilerFlags, int, NewReference>)Get(ref Functions.Py_CompileStringObject, nameof(Py_CompileStringObject));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, NewReference> PyImport_ExecCodeModule => (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, NewReference>)Get(ref Functions.PyImport_ExecCodeModule, nameof(PyImport_ExecCodeModule));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, int> PyObject_HasAttrString => (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, int>)Get(ref Functions.PyObject_HasAttrString, nameof(PyObject_HasAttrString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, NewReference> PyObject_GetAttrString => (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, NewReference>)Get(ref Functions.PyObject_GetAttrString, nameof(PyObject_GetAttrString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference, int> PyObject_SetAttrString => (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference, int>)Get(ref Functions.PyObject_SetAttrString, nameof(PyObject_SetAttrString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyObject_HasAttr => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyObject_HasAttr, nameof(PyObject_HasAttr));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyObject_GetAttr => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyObject_GetAttr, nameof(PyObject_GetAttr));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int> PyObject_SetAttr => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyObject_SetAttr, nameof(PyObject_SetAttr));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyObject_GetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyObject_GetItem, nameof(PyObject_GetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int> PyObject_SetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyObject_SetItem, nameof(PyObject_SetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyObject_DelItem => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyObject_DelItem, nameof(PyObject_DelItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_GetIter => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyObject_GetIter, nameof(PyObject_GetIter));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference> PyObject_Call => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyObject_Call, nameof(PyObject_Call));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyObject_CallObject => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyObject_CallObject, nameof(PyObject_CallObject));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr*, nuint, BorrowedReference, NewReference> PyObject_Vectorcall => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr*, nuint, BorrowedReference, NewReference>)GetOptional(ref Functions.PyObject_Vectorcall, nameof(PyObject_Vectorcall));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr*, nuint, BorrowedReference, NewReference> PyObject_VectorcallDict => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr*, nuint, BorrowedReference, NewReference>)Get(ref Functions.PyObject_VectorcallDict, nameof(PyObject_VectorcallDict));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr*, nuint, BorrowedReference, NewReference> PyObject_VectorcallMethod => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr*, nuint, BorrowedReference, NewReference>)Get(ref Functions.PyObject_VectorcallMethod, nameof(PyObject_VectorcallMethod));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int, int> PyObject_RichCompareBool => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int, int>)Get(ref Functions.PyObject_RichCompareBool, nameof(PyObject_RichCompareBool));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyObject_IsInstance => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyObject_IsInstance, nameof(PyObject_IsInstance));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyObject_IsSubclass => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyObject_IsSubclass, nameof(PyObject_IsSubclass));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyObject_ClearWeakRefs => (delegate* unmanaged[Cdecl]<BorrowedReference, void>)Get(ref Functions.PyObject_ClearWeakRefs, nameof(PyObject_ClearWeakRefs));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyCallable_Check => (delegate* unmanaged[Cdecl]<BorrowedReference, int>)Get(ref Functions.PyCallable_Check, nameof(PyCallable_Check));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyObject_IsTrue => (delegate* unmanaged[Cdecl]<BorrowedReference, int>)Get(ref Functions.PyObject_IsTrue, nameof(PyObject_IsTrue));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyObject_Not => (delegate* unmanaged[Cdecl]<BorrowedReference, int>)Get(ref Functions.PyObject_Not, nameof(PyObject_Not));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyObject_Size => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PyObject_Size, "PyObject_Size");
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyObject_Hash => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PyObject_Hash, nameof(PyObject_Hash));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_Repr => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyObject_Repr, nameof(PyObject_Repr));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_Str => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyObject_Str, nameof(PyObject_Str));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_Type => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyObject_Type, nameof(PyObject_Type));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyObject_Dir => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyObject_Dir, nameof(PyObject_Dir));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, BorrowedReference, BorrowedReference, NewReference> PyCFunction_NewEx => (delegate* unmanaged[Cdecl]<IntPtr, BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyCFunction_NewEx, nameof(PyCFunction_NewEx));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyInstanceMethod_New => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyInstanceMethod_New, nameof(PyInstanceMethod_New));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, out Py_buffer, int, int> PyObject_GetBuffer => (delegate* unmanaged[Cdecl]<BorrowedReference, out Py_buffer, int, int>)Get(ref Functions.PyObject_GetBuffer, nameof(PyObject_GetBuffer));
+        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, void> PyBuffer_Release => (delegate* unmanaged[Cdecl]<ref Py_buffer, void>)Get(ref Functions.PyBuffer_Release, nameof(PyBuffer_Release));
         internal static delegate* unmanaged[Cdecl]<StrPtr, nint> PyBuffer_SizeFromFormat { get; }
-        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, char, int> PyBuffer_IsContiguous { get; }
-        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, nint[], IntPtr> PyBuffer_GetPointer { get; }
-        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, IntPtr, IntPtr, char, int> PyBuffer_FromContiguous { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, ref Py_buffer, IntPtr, char, int> PyBuffer_ToContiguous { get; }
-        internal static delegate* unmanaged[Cdecl]<int, IntPtr, IntPtr, int, char, void> PyBuffer_FillContiguousStrides { get; }
-        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, BorrowedReference, IntPtr, IntPtr, int, int, int> PyBuffer_FillInfo { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Long { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Float { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, bool> PyNumber_Check { get; }
-        internal static delegate* unmanaged[Cdecl]<long, NewReference> PyLong_FromLongLong { get; }
-        internal static delegate* unmanaged[Cdecl]<ulong, NewReference> PyLong_FromUnsignedLongLong { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, IntPtr, int, NewReference> PyLong_FromString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, long> PyLong_AsLongLong { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, ulong> PyLong_AsUnsignedLongLong { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, NewReference> PyLong_FromVoidPtr { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr> PyLong_AsVoidPtr { get; }
-        internal static delegate* unmanaged[Cdecl]<double, NewReference> PyFloat_FromDouble { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyFloat_FromString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, double> PyFloat_AsDouble { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Add { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Subtract { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Multiply { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_TrueDivide { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_And { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Xor { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Or { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Lshift { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Rshift { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Power { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Remainder { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceAdd { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceSubtract { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceMultiply { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceTrueDivide { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceAnd { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceXor { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceOr { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceLshift { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceRshift { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlacePower { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceRemainder { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Negative { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Positive { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Invert { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, bool> PySequence_Check { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference> PySequence_GetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference, int> PySequence_SetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, int> PySequence_DelItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference> PySequence_GetSlice { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, BorrowedReference, int> PySequence_SetSlice { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, int> PySequence_DelSlice { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PySequence_Size { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PySequence_Contains { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PySequence_Concat { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference> PySequence_Repeat { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, nint> PySequence_Index { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, nint> PySequence_Count { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PySequence_Tuple { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PySequence_List { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr> PyBytes_AsString { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, NewReference> PyBytes_FromString { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, nint, NewReference> PyByteArray_FromStringAndSize { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyBytes_Size { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr> PyUnicode_AsUTF8 { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, nint, IntPtr, IntPtr, NewReference> PyUnicode_DecodeUTF16 { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyUnicode_GetLength { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, int> PyUnicode_ReadChar { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyUnicode_AsUTF16String { get; }
-        internal static delegate* unmanaged[Cdecl]<int, NewReference> PyUnicode_FromOrdinal { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, NewReference> PyUnicode_InternFromString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyUnicode_Compare { get; }
-        internal static delegate* unmanaged[Cdecl]<NewReference> PyDict_New { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference> PyDict_GetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference> PyDict_GetItemString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int> PyDict_SetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference, int> PyDict_SetItemString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyDict_DelItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, int> PyDict_DelItemString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyMapping_HasKey { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyDict_Keys { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyDict_Values { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyDict_Items { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyDict_Copy { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyDict_Update { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyDict_Clear { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyDict_Size { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PySet_New { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PySet_Add { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PySet_Contains { get; }
-        internal static delegate* unmanaged[Cdecl]<nint, NewReference> PyList_New { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference> PyList_GetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int> PyList_SetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference, int> PyList_Insert { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyList_Append { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyList_Reverse { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyList_Sort { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference> PyList_GetSlice { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, BorrowedReference, int> PyList_SetSlice { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyList_Size { get; }
-        internal static delegate* unmanaged[Cdecl]<nint, NewReference> PyTuple_New { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference> PyTuple_GetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int> PyTuple_SetItem { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference> PyTuple_GetSlice { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyTuple_Size { get; }
+        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, char, int> PyBuffer_IsContiguous => (delegate* unmanaged[Cdecl]<ref Py_buffer, char, int>)Get(ref Functions.PyBuffer_IsContiguous, nameof(PyBuffer_IsContiguous));
+        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, nint[], IntPtr> PyBuffer_GetPointer => (delegate* unmanaged[Cdecl]<ref Py_buffer, nint[], IntPtr>)Get(ref Functions.PyBuffer_GetPointer, nameof(PyBuffer_GetPointer));
+        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, IntPtr, IntPtr, char, int> PyBuffer_FromContiguous => (delegate* unmanaged[Cdecl]<ref Py_buffer, IntPtr, IntPtr, char, int>)Get(ref Functions.PyBuffer_FromContiguous, nameof(PyBuffer_FromContiguous));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, ref Py_buffer, IntPtr, char, int> PyBuffer_ToContiguous => (delegate* unmanaged[Cdecl]<IntPtr, ref Py_buffer, IntPtr, char, int>)Get(ref Functions.PyBuffer_ToContiguous, nameof(PyBuffer_ToContiguous));
+        internal static delegate* unmanaged[Cdecl]<int, IntPtr, IntPtr, int, char, void> PyBuffer_FillContiguousStrides => (delegate* unmanaged[Cdecl]<int, IntPtr, IntPtr, int, char, void>)Get(ref Functions.PyBuffer_FillContiguousStrides, nameof(PyBuffer_FillContiguousStrides));
+        internal static delegate* unmanaged[Cdecl]<ref Py_buffer, BorrowedReference, IntPtr, IntPtr, int, int, int> PyBuffer_FillInfo => (delegate* unmanaged[Cdecl]<ref Py_buffer, BorrowedReference, IntPtr, IntPtr, int, int, int>)Get(ref Functions.PyBuffer_FillInfo, nameof(PyBuffer_FillInfo));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Long => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Long, nameof(PyNumber_Long));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Float => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Float, nameof(PyNumber_Float));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, bool> PyNumber_Check => (delegate* unmanaged[Cdecl]<BorrowedReference, bool>)Get(ref Functions.PyNumber_Check, nameof(PyNumber_Check));
+        internal static delegate* unmanaged[Cdecl]<long, NewReference> PyLong_FromLongLong => (delegate* unmanaged[Cdecl]<long, NewReference>)Get(ref Functions.PyLong_FromLongLong, nameof(PyLong_FromLongLong));
+        internal static delegate* unmanaged[Cdecl]<ulong, NewReference> PyLong_FromUnsignedLongLong => (delegate* unmanaged[Cdecl]<ulong, NewReference>)Get(ref Functions.PyLong_FromUnsignedLongLong, nameof(PyLong_FromUnsignedLongLong));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, IntPtr, int, NewReference> PyLong_FromString => (delegate* unmanaged[Cdecl]<StrPtr, IntPtr, int, NewReference>)Get(ref Functions.PyLong_FromString, nameof(PyLong_FromString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, long> PyLong_AsLongLong => (delegate* unmanaged[Cdecl]<BorrowedReference, long>)Get(ref Functions.PyLong_AsLongLong, nameof(PyLong_AsLongLong));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, ulong> PyLong_AsUnsignedLongLong => (delegate* unmanaged[Cdecl]<BorrowedReference, ulong>)Get(ref Functions.PyLong_AsUnsignedLongLong, nameof(PyLong_AsUnsignedLongLong));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, NewReference> PyLong_FromVoidPtr => (delegate* unmanaged[Cdecl]<IntPtr, NewReference>)Get(ref Functions.PyLong_FromVoidPtr, nameof(PyLong_FromVoidPtr));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr> PyLong_AsVoidPtr => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr>)Get(ref Functions.PyLong_AsVoidPtr, nameof(PyLong_AsVoidPtr));
+        internal static delegate* unmanaged[Cdecl]<double, NewReference> PyFloat_FromDouble => (delegate* unmanaged[Cdecl]<double, NewReference>)Get(ref Functions.PyFloat_FromDouble, nameof(PyFloat_FromDouble));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyFloat_FromString => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyFloat_FromString, nameof(PyFloat_FromString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, double> PyFloat_AsDouble => (delegate* unmanaged[Cdecl]<BorrowedReference, double>)Get(ref Functions.PyFloat_AsDouble, nameof(PyFloat_AsDouble));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Add => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Add, nameof(PyNumber_Add));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Subtract => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Subtract, nameof(PyNumber_Subtract));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Multiply => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Multiply, nameof(PyNumber_Multiply));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_TrueDivide => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_TrueDivide, nameof(PyNumber_TrueDivide));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_And => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_And, nameof(PyNumber_And));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Xor => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Xor, nameof(PyNumber_Xor));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Or => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Or, nameof(PyNumber_Or));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Lshift => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Lshift, nameof(PyNumber_Lshift));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Rshift => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Rshift, nameof(PyNumber_Rshift));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Power => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Power, nameof(PyNumber_Power));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_Remainder => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Remainder, nameof(PyNumber_Remainder));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceAdd => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceAdd, nameof(PyNumber_InPlaceAdd));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceSubtract => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceSubtract, nameof(PyNumber_InPlaceSubtract));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceMultiply => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceMultiply, nameof(PyNumber_InPlaceMultiply));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceTrueDivide => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceTrueDivide, nameof(PyNumber_InPlaceTrueDivide));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceAnd => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceAnd, nameof(PyNumber_InPlaceAnd));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceXor => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceXor, nameof(PyNumber_InPlaceXor));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceOr => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceOr, nameof(PyNumber_InPlaceOr));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceLshift => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceLshift, nameof(PyNumber_InPlaceLshift));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceRshift => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceRshift, nameof(PyNumber_InPlaceRshift));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlacePower => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlacePower, nameof(PyNumber_InPlacePower));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyNumber_InPlaceRemainder => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyNumber_InPlaceRemainder, nameof(PyNumber_InPlaceRemainder));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Negative => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Negative, nameof(PyNumber_Negative));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Positive => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Positive, nameof(PyNumber_Positive));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyNumber_Invert => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyNumber_Invert, nameof(PyNumber_Invert));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, bool> PySequence_Check => (delegate* unmanaged[Cdecl]<BorrowedReference, bool>)Get(ref Functions.PySequence_Check, nameof(PySequence_Check));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference> PySequence_GetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference>)Get(ref Functions.PySequence_GetItem, nameof(PySequence_GetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference, int> PySequence_SetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference, int>)Get(ref Functions.PySequence_SetItem, nameof(PySequence_SetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, int> PySequence_DelItem => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, int>)Get(ref Functions.PySequence_DelItem, nameof(PySequence_DelItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference> PySequence_GetSlice => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference>)Get(ref Functions.PySequence_GetSlice, nameof(PySequence_GetSlice));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, BorrowedReference, int> PySequence_SetSlice => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, BorrowedReference, int>)Get(ref Functions.PySequence_SetSlice, nameof(PySequence_SetSlice));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, int> PySequence_DelSlice => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, int>)Get(ref Functions.PySequence_DelSlice, nameof(PySequence_DelSlice));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PySequence_Size => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PySequence_Size, nameof(PySequence_Size));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PySequence_Contains => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PySequence_Contains, nameof(PySequence_Contains));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PySequence_Concat => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PySequence_Concat, nameof(PySequence_Concat));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference> PySequence_Repeat => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference>)Get(ref Functions.PySequence_Repeat, nameof(PySequence_Repeat));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, nint> PySequence_Index => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, nint>)Get(ref Functions.PySequence_Index, nameof(PySequence_Index));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, nint> PySequence_Count => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, nint>)Get(ref Functions.PySequence_Count, nameof(PySequence_Count));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PySequence_Tuple => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PySequence_Tuple, nameof(PySequence_Tuple));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PySequence_List => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PySequence_List, nameof(PySequence_List));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr> PyBytes_AsString => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr>)Get(ref Functions.PyBytes_AsString, nameof(PyBytes_AsString));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, NewReference> PyBytes_FromString => (delegate* unmanaged[Cdecl]<IntPtr, NewReference>)Get(ref Functions.PyBytes_FromString, nameof(PyBytes_FromString));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, nint, NewReference> PyByteArray_FromStringAndSize => (delegate* unmanaged[Cdecl]<IntPtr, nint, NewReference>)Get(ref Functions.PyByteArray_FromStringAndSize, nameof(PyByteArray_FromStringAndSize));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyBytes_Size => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PyBytes_Size, nameof(PyBytes_Size));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr> PyUnicode_AsUTF8 => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr>)Get(ref Functions.PyUnicode_AsUTF8, nameof(PyUnicode_AsUTF8));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, nint, IntPtr, IntPtr, NewReference> PyUnicode_DecodeUTF16 => (delegate* unmanaged[Cdecl]<IntPtr, nint, IntPtr, IntPtr, NewReference>)Get(ref Functions.PyUnicode_DecodeUTF16, nameof(PyUnicode_DecodeUTF16));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyUnicode_GetLength => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PyUnicode_GetLength, nameof(PyUnicode_GetLength));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, int> PyUnicode_ReadChar => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, int>)Get(ref Functions.PyUnicode_ReadChar, nameof(PyUnicode_ReadChar));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyUnicode_AsUTF16String => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyUnicode_AsUTF16String, nameof(PyUnicode_AsUTF16String));
+        internal static delegate* unmanaged[Cdecl]<int, NewReference> PyUnicode_FromOrdinal => (delegate* unmanaged[Cdecl]<int, NewReference>)Get(ref Functions.PyUnicode_FromOrdinal, nameof(PyUnicode_FromOrdinal));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, NewReference> PyUnicode_InternFromString => (delegate* unmanaged[Cdecl]<StrPtr, NewReference>)Get(ref Functions.PyUnicode_InternFromString, nameof(PyUnicode_InternFromString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyUnicode_Compare => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyUnicode_Compare, nameof(PyUnicode_Compare));
+        internal static delegate* unmanaged[Cdecl]<NewReference> PyDict_New => (delegate* unmanaged[Cdecl]<NewReference>)Get(ref Functions.PyDict_New, nameof(PyDict_New));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference> PyDict_GetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference>)Get(ref Functions.PyDict_GetItem, nameof(PyDict_GetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference> PyDict_GetItemString => (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference>)Get(ref Functions.PyDict_GetItemString, nameof(PyDict_GetItemString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int> PyDict_SetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyDict_SetItem, nameof(PyDict_SetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference, int> PyDict_SetItemString => (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, BorrowedReference, int>)Get(ref Functions.PyDict_SetItemString, nameof(PyDict_SetItemString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyDict_DelItem => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyDict_DelItem, nameof(PyDict_DelItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, int> PyDict_DelItemString => (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, int>)Get(ref Functions.PyDict_DelItemString, nameof(PyDict_DelItemString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyMapping_HasKey => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyMapping_HasKey, nameof(PyMapping_HasKey));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyDict_Keys => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyDict_Keys, nameof(PyDict_Keys));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyDict_Values => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyDict_Values, nameof(PyDict_Values));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyDict_Items => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyDict_Items, nameof(PyDict_Items));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyDict_Copy => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyDict_Copy, nameof(PyDict_Copy));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyDict_Update => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyDict_Update, nameof(PyDict_Update));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyDict_Clear => (delegate* unmanaged[Cdecl]<BorrowedReference, void>)Get(ref Functions.PyDict_Clear, nameof(PyDict_Clear));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyDict_Size => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PyDict_Size, nameof(PyDict_Size));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PySet_New => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PySet_New, nameof(PySet_New));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PySet_Add => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PySet_Add, nameof(PySet_Add));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PySet_Contains => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PySet_Contains, nameof(PySet_Contains));
+        internal static delegate* unmanaged[Cdecl]<nint, NewReference> PyList_New => (delegate* unmanaged[Cdecl]<nint, NewReference>)Get(ref Functions.PyList_New, nameof(PyList_New));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference> PyList_GetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference>)Get(ref Functions.PyList_GetItem, nameof(PyList_GetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int> PyList_SetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int>)Get(ref Functions.PyList_SetItem, nameof(PyList_SetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference, int> PyList_Insert => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference, int>)Get(ref Functions.PyList_Insert, nameof(PyList_Insert));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyList_Append => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyList_Append, nameof(PyList_Append));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyList_Reverse => (delegate* unmanaged[Cdecl]<BorrowedReference, int>)Get(ref Functions.PyList_Reverse, nameof(PyList_Reverse));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyList_Sort => (delegate* unmanaged[Cdecl]<BorrowedReference, int>)Get(ref Functions.PyList_Sort, nameof(PyList_Sort));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference> PyList_GetSlice => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference>)Get(ref Functions.PyList_GetSlice, nameof(PyList_GetSlice));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, BorrowedReference, int> PyList_SetSlice => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, BorrowedReference, int>)Get(ref Functions.PyList_SetSlice, nameof(PyList_SetSlice));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyList_Size => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PyList_Size, nameof(PyList_Size));
+        internal static delegate* unmanaged[Cdecl]<nint, NewReference> PyTuple_New => (delegate* unmanaged[Cdecl]<nint, NewReference>)Get(ref Functions.PyTuple_New, nameof(PyTuple_New));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference> PyTuple_GetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, BorrowedReference>)Get(ref Functions.PyTuple_GetItem, nameof(PyTuple_GetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int> PyTuple_SetItem => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int>)Get(ref Functions.PyTuple_SetItem, nameof(PyTuple_SetItem));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference> PyTuple_GetSlice => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference>)Get(ref Functions.PyTuple_GetSlice, nameof(PyTuple_GetSlice));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyTuple_Size => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PyTuple_Size, nameof(PyTuple_Size));
         internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyIter_Check { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyIter_Next { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, NewReference> PyModule_New { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference> PyModule_GetDict { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, IntPtr, int> PyModule_AddObject { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyImport_Import { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, NewReference> PyImport_ImportModule { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyImport_ReloadModule { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference> PyImport_AddModule { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyImport_GetModuleDict { get; }
-        internal static delegate* unmanaged[Cdecl]<int, IntPtr, int, void> PySys_SetArgvEx { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference> PySys_GetObject { get; }
-        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, int> PySys_SetObject { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyType_Modified { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, bool> PyType_IsSubtype { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference> PyType_GenericNew { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference> PyType_GenericAlloc { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyType_Ready { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference> _PyType_Lookup { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyObject_GenericGetAttr { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int> PyObject_GenericSetAttr { get; }
-        internal static delegate* unmanaged[Cdecl]<StolenReference, void> PyObject_GC_Del { get; }
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyIter_Next => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyIter_Next, nameof(PyIter_Next));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, NewReference> PyModule_New => (delegate* unmanaged[Cdecl]<StrPtr, NewReference>)Get(ref Functions.PyModule_New, nameof(PyModule_New));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference> PyModule_GetDict => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference>)Get(ref Functions.PyModule_GetDict, nameof(PyModule_GetDict));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, IntPtr, int> PyModule_AddObject => (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, IntPtr, int>)Get(ref Functions.PyModule_AddObject, nameof(PyModule_AddObject));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyImport_Import => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyImport_Import, nameof(PyImport_Import));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, NewReference> PyImport_ImportModule => (delegate* unmanaged[Cdecl]<StrPtr, NewReference>)Get(ref Functions.PyImport_ImportModule, nameof(PyImport_ImportModule));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyImport_ReloadModule => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyImport_ReloadModule, nameof(PyImport_ReloadModule));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference> PyImport_AddModule => (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference>)Get(ref Functions.PyImport_AddModule, nameof(PyImport_AddModule));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyImport_GetModuleDict => (delegate* unmanaged[Cdecl]<BorrowedReference>)Get(ref Functions.PyImport_GetModuleDict, nameof(PyImport_GetModuleDict));
+        internal static delegate* unmanaged[Cdecl]<int, IntPtr, int, void> PySys_SetArgvEx => (delegate* unmanaged[Cdecl]<int, IntPtr, int, void>)Get(ref Functions.PySys_SetArgvEx, nameof(PySys_SetArgvEx));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference> PySys_GetObject => (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference>)Get(ref Functions.PySys_GetObject, nameof(PySys_GetObject));
+        internal static delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, int> PySys_SetObject => (delegate* unmanaged[Cdecl]<StrPtr, BorrowedReference, int>)Get(ref Functions.PySys_SetObject, nameof(PySys_SetObject));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyType_Modified => (delegate* unmanaged[Cdecl]<BorrowedReference, void>)Get(ref Functions.PyType_Modified, nameof(PyType_Modified));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, bool> PyType_IsSubtype => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, bool>)Get(ref Functions.PyType_IsSubtype, nameof(PyType_IsSubtype));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference> PyType_GenericNew => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyType_GenericNew, nameof(PyType_GenericNew));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference> PyType_GenericAlloc => (delegate* unmanaged[Cdecl]<BorrowedReference, nint, NewReference>)Get(ref Functions.PyType_GenericAlloc, nameof(PyType_GenericAlloc));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyType_Ready => (delegate* unmanaged[Cdecl]<BorrowedReference, int>)Get(ref Functions.PyType_Ready, nameof(PyType_Ready));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference> _PyType_Lookup => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference>)Get(ref Functions._PyType_Lookup, nameof(_PyType_Lookup));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference> PyObject_GenericGetAttr => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, NewReference>)Get(ref Functions.PyObject_GenericGetAttr, nameof(PyObject_GenericGetAttr));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int> PyObject_GenericSetAttr => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyObject_GenericSetAttr, nameof(PyObject_GenericSetAttr));
+        internal static delegate* unmanaged[Cdecl]<StolenReference, void> PyObject_GC_Del => (delegate* unmanaged[Cdecl]<StolenReference, void>)Get(ref Functions.PyObject_GC_Del, nameof(PyObject_GC_Del));
         internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyObject_GC_IsTracked { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyObject_GC_Track { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyObject_GC_UnTrack { get; }
-        internal static delegate* unmanaged[Cdecl]<nint, IntPtr> PyMem_Malloc { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, nint, IntPtr> PyMem_Realloc { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, void> PyMem_Free { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, void> PyErr_SetString { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, void> PyErr_SetObject { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyErr_ExceptionMatches { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyErr_GivenExceptionMatches { get; }
-        internal static delegate* unmanaged[Cdecl]<ref NewReference, ref NewReference, ref NewReference, void> PyErr_NormalizeException { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyErr_Occurred { get; }
-        internal static delegate* unmanaged[Cdecl]<out NewReference, out NewReference, out NewReference, void> PyErr_Fetch { get; }
-        internal static delegate* unmanaged[Cdecl]<StolenReference, StolenReference, StolenReference, void> PyErr_Restore { get; }
-        internal static delegate* unmanaged[Cdecl]<void> PyErr_Clear { get; }
-        internal static delegate* unmanaged[Cdecl]<void> PyErr_Print { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyCell_Get { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyCell_Set { get; }
-        internal static delegate* unmanaged[Cdecl]<nint> PyGC_Collect { get; }
-        internal static delegate* unmanaged[Cdecl]<IntPtr, IntPtr, IntPtr, NewReference> PyCapsule_New { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, IntPtr> PyCapsule_GetPointer { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, int> PyCapsule_SetPointer { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nuint> PyLong_AsUnsignedSize_t { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyLong_AsSignedSize_t { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference> PyDict_GetItemWithError { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyException_GetCause { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyException_GetTraceback { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StolenReference, void> PyException_SetCause { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyException_SetTraceback { get; }
-        internal static delegate* unmanaged[Cdecl]<uint, BorrowedReference, int> PyThreadState_SetAsyncExcLLP64 { get; }
-        internal static delegate* unmanaged[Cdecl]<ulong, BorrowedReference, int> PyThreadState_SetAsyncExcLP64 { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, NewReference> PyObject_GenericGetDict { get; }
-        internal static delegate* unmanaged[Cdecl]<BorrowedReference, TypeSlotID, IntPtr> PyType_GetSlot { get; }
-        internal static delegate* unmanaged[Cdecl]<in NativeTypeSpec, BorrowedReference, NewReference> PyType_FromSpecWithBases { get; }
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyObject_GC_Track => (delegate* unmanaged[Cdecl]<BorrowedReference, void>)Get(ref Functions.PyObject_GC_Track, nameof(PyObject_GC_Track));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> PyObject_GC_UnTrack => (delegate* unmanaged[Cdecl]<BorrowedReference, void>)Get(ref Functions.PyObject_GC_UnTrack, nameof(PyObject_GC_UnTrack));
+        internal static delegate* unmanaged[Cdecl]<nint, IntPtr> PyMem_Malloc => (delegate* unmanaged[Cdecl]<nint, IntPtr>)Get(ref Functions.PyMem_Malloc, nameof(PyMem_Malloc));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, nint, IntPtr> PyMem_Realloc => (delegate* unmanaged[Cdecl]<IntPtr, nint, IntPtr>)Get(ref Functions.PyMem_Realloc, nameof(PyMem_Realloc));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, void> PyMem_Free => (delegate* unmanaged[Cdecl]<IntPtr, void>)Get(ref Functions.PyMem_Free, nameof(PyMem_Free));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, void> PyErr_SetString => (delegate* unmanaged[Cdecl]<BorrowedReference, StrPtr, void>)Get(ref Functions.PyErr_SetString, nameof(PyErr_SetString));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, void> PyErr_SetObject => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, void>)Get(ref Functions.PyErr_SetObject, nameof(PyErr_SetObject));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyErr_ExceptionMatches => (delegate* unmanaged[Cdecl]<BorrowedReference, int>)Get(ref Functions.PyErr_ExceptionMatches, nameof(PyErr_ExceptionMatches));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyErr_GivenExceptionMatches => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyErr_GivenExceptionMatches, nameof(PyErr_GivenExceptionMatches));
+        internal static delegate* unmanaged[Cdecl]<ref NewReference, ref NewReference, ref NewReference, void> PyErr_NormalizeException => (delegate* unmanaged[Cdecl]<ref NewReference, ref NewReference, ref NewReference, void>)Get(ref Functions.PyErr_NormalizeException, nameof(PyErr_NormalizeException));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference> PyErr_Occurred => (delegate* unmanaged[Cdecl]<BorrowedReference>)Get(ref Functions.PyErr_Occurred, nameof(PyErr_Occurred));
+        internal static delegate* unmanaged[Cdecl]<out NewReference, out NewReference, out NewReference, void> PyErr_Fetch => (delegate* unmanaged[Cdecl]<out NewReference, out NewReference, out NewReference, void>)Get(ref Functions.PyErr_Fetch, nameof(PyErr_Fetch));
+        internal static delegate* unmanaged[Cdecl]<StolenReference, StolenReference, StolenReference, void> PyErr_Restore => (delegate* unmanaged[Cdecl]<StolenReference, StolenReference, StolenReference, void>)Get(ref Functions.PyErr_Restore, nameof(PyErr_Restore));
+        internal static delegate* unmanaged[Cdecl]<void> PyErr_Clear => (delegate* unmanaged[Cdecl]<void>)Get(ref Functions.PyErr_Clear, nameof(PyErr_Clear));
+        internal static delegate* unmanaged[Cdecl]<void> PyErr_Print => (delegate* unmanaged[Cdecl]<void>)Get(ref Functions.PyErr_Print, nameof(PyErr_Print));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyCell_Get => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyCell_Get, nameof(PyCell_Get));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyCell_Set => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyCell_Set, nameof(PyCell_Set));
+        internal static delegate* unmanaged[Cdecl]<nint> PyGC_Collect => (delegate* unmanaged[Cdecl]<nint>)Get(ref Functions.PyGC_Collect, nameof(PyGC_Collect));
+        internal static delegate* unmanaged[Cdecl]<IntPtr, IntPtr, IntPtr, NewReference> PyCapsule_New => (delegate* unmanaged[Cdecl]<IntPtr, IntPtr, IntPtr, NewReference>)Get(ref Functions.PyCapsule_New, nameof(PyCapsule_New));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, IntPtr> PyCapsule_GetPointer => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, IntPtr>)Get(ref Functions.PyCapsule_GetPointer, nameof(PyCapsule_GetPointer));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, int> PyCapsule_SetPointer => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, int>)Get(ref Functions.PyCapsule_SetPointer, nameof(PyCapsule_SetPointer));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nuint> PyLong_AsUnsignedSize_t => (delegate* unmanaged[Cdecl]<BorrowedReference, nuint>)Get(ref Functions.PyLong_AsUnsignedSize_t, "PyLong_AsSize_t");
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyLong_AsSignedSize_t => (delegate* unmanaged[Cdecl]<BorrowedReference, nint>)Get(ref Functions.PyLong_AsSignedSize_t, "PyLong_AsSsize_t");
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference> PyDict_GetItemWithError => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference>)Get(ref Functions.PyDict_GetItemWithError, nameof(PyDict_GetItemWithError));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyException_GetCause => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyException_GetCause, nameof(PyException_GetCause));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyException_GetTraceback => (delegate* unmanaged[Cdecl]<BorrowedReference, NewReference>)Get(ref Functions.PyException_GetTraceback, nameof(PyException_GetTraceback));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, StolenReference, void> PyException_SetCause => (delegate* unmanaged[Cdecl]<BorrowedReference, StolenReference, void>)Get(ref Functions.PyException_SetCause, nameof(PyException_SetCause));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int> PyException_SetTraceback => (delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, int>)Get(ref Functions.PyException_SetTraceback, nameof(PyException_SetTraceback));
+        internal static delegate* unmanaged[Cdecl]<uint, BorrowedReference, int> PyThreadState_SetAsyncExcLLP64 => (delegate* unmanaged[Cdecl]<uint, BorrowedReference, int>)Get(ref Functions.PyThreadState_SetAsyncExcLLP64, "PyThreadState_SetAsyncExc");
+        internal static delegate* unmanaged[Cdecl]<ulong, BorrowedReference, int> PyThreadState_SetAsyncExcLP64 => (delegate* unmanaged[Cdecl]<ulong, BorrowedReference, int>)Get(ref Functions.PyThreadState_SetAsyncExcLP64, "PyThreadState_SetAsyncExc");
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, NewReference> PyObject_GenericGetDict => (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr, NewReference>)Get(ref Functions.PyObject_GenericGetDict, nameof(PyObject_GenericGetDict));
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, TypeSlotID, IntPtr> PyType_GetSlot => (delegate* unmanaged[Cdecl]<BorrowedReference, TypeSlotID, IntPtr>)Get(ref Functions.PyType_GetSlot, nameof(PyType_GetSlot));
+        internal static delegate* unmanaged[Cdecl]<in NativeTypeSpec, BorrowedReference, NewReference> PyType_FromSpecWithBases => (delegate* unmanaged[Cdecl]<in NativeTypeSpec, BorrowedReference, NewReference>)Get(ref Functions.PyType_FromSpecWithBases, nameof(PyType_FromSpecWithBases));
         internal static delegate* unmanaged[Cdecl]<BorrowedReference, void> _Py_NewReference { get; }
         internal static delegate* unmanaged[Cdecl]<int> _Py_IsFinalizing { get; }
         internal static IntPtr PyType_Type { get; }
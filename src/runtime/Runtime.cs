@@ -7,6 +7,7 @@ using System.Threading;
 using System.Collections.Generic;
 using System.IO;
 using Python.Runtime.Native;
+using Python.Runtime.StateSerialization;
 using System.Linq;
 using static System.FormattableString;
 
@@ -97,7 +98,7 @@ namespace Python.Runtime
         /// </summary>
         /// <remarks>Always call this method from the Main thread.  After the
         /// first call to this method, the main thread has acquired the GIL.</remarks>
-        internal static void Initialize(bool initSigs = false)
+        internal static void Initialize(bool initSigs = false, StartupTimer? timer = null)
         {
             if (_isInitialized)
             {
@@ -108,6 +109,7 @@ namespace Python.Runtime
             bool interpreterAlreadyInitialized = TryUsingDll(
                 () => Py_IsInitialized() != 0
             );
+            timer?.Complete("Library");
             if (!interpreterAlreadyInitialized)
             {
                 EnsureProgramName();
@@ -139,36 +141,56 @@ namespace Python.Runtime
                     NewRun();
                 }
             }
+            timer?.Complete("Interpreter");
             MainManagedThreadId = Thread.CurrentThread.ManagedThreadId;
 
             Finalizer.Initialize();
+            ThreadStatePool.Initialize();
+
+            if (PythonEngine.InteropConfiguration.EnableProfiling)
+            {
+                InteropProfiler.Instance.Enable = true;
+            }
 
             InitPyMembers();
+            timer?.Complete("PyMembers");
 
             ABI.Initialize(PyVersion);
+            timer?.Complete("ABI");
 
             InternString.Initialize();
+            timer?.Complete("InternString");
 
             GenericUtil.Reset();
             ClassManager.Reset();
+            ClassManager.ReflectMembersLazily = PythonEngine.InteropConfiguration.LazyMemberReflection;
             ClassDerivedObject.Reset();
+            MethodBinder.Reset();
+            ReflectionNames.Reset();
             TypeManager.Initialize();
             CLRObject.creationBlocked = false;
             _typesInitialized = true;
+            timer?.Complete("TypeManager");
 
             // Initialize modules that depend on the runtime class.
             AssemblyManager.Initialize();
+            timer?.Complete("AssemblyManager");
             OperatorMethod.Initialize();
+            timer?.Complete("OperatorMethod");
             if (RuntimeData.HasStashData())
             {
                 RuntimeData.RestoreRuntimeData();
+                timer?.Complete("RuntimeData");
             }
             else
             {
                 PyCLRMetaType = MetaType.Initialize();
+                timer?.Complete("MetaType");
                 ImportHook.Initialize();
+                timer?.Complete("ImportHook");
             }
             Exceptions.Initialize();
+            timer?.Complete("Exceptions");
 
             // Need to add the runtime directory to sys.path so that we
             // can find built-in assemblies like System.Data, et. al.
@@ -180,6 +202,7 @@ namespace Python.Runtime
                 PyList_Append(path, item.Borrow());
             }
             AssemblyManager.UpdatePath();
+            timer?.Complete("Path");
 
             clrInterop = GetModuleLazy("clr.interop");
             inspect = GetModuleLazy("inspect");
@@ -292,13 +315,16 @@ namespace Python.Runtime
             DisposeLazyObject(clrInterop);
             DisposeLazyObject(inspect);
             DisposeLazyObject(hexCallable);
+            Codecs.CtypesLayout.Reset();
             PyObjectConversions.Reset();
+            NumPyScalars.Reset();
 
             PyGC_Collect();
             bool everythingSeemsCollected = TryCollectingGarbage(MaxCollectRetriesOnShutdown);
             Debug.Assert(everythingSeemsCollected);
 
             Finalizer.Shutdown();
+            ThreadStatePool.Shutdown();
             InternString.Shutdown();
 
             ResetPyMembers();
@@ -623,6 +649,17 @@ namespace Python.Runtime
                 return 0;
             }
             var p = (nint*)(op.DangerousGetAddress() + ABI.RefCountOffset);
+            if (ABI.IsFreeThreaded)
+            {
+                // ob_ref_local precedes ob_ref_shared, whose two lowest bits are flags
+                uint local = *((uint*)p - 1);
+                if (local == uint.MaxValue)
+                {
+                    // immortal, see _Py_IMMORTAL_REFCNT
+                    return IntPtr.Size == 8 ? (nint)(long)uint.MaxValue : (nint)(uint.MaxValue >> 2);
+                }
+                return (nint)local + (*p >> 2);
+            }
             return *p;
         }
         [Pure]
@@ -694,12 +731,29 @@ namespace Python.Runtime
         internal static void Py_EndInterpreter(PyThreadState* threadState) => Delegates.Py_EndInterpreter(threadState);
 
 
+        internal static bool SupportsIsolatedInterpreters => Delegates.Py_NewInterpreterFromConfig != null;
+
+        internal static PyStatus Py_NewInterpreterFromConfig(out PyThreadState* threadState, in PyInterpreterConfig config)
+        {
+            PyThreadState* result = null;
+            var status = Delegates.Py_NewInterpreterFromConfig(&result, config);
+            threadState = result;
+            return status;
+        }
+
+
         internal static PyThreadState* PyThreadState_New(PyInterpreterState* istate) => Delegates.PyThreadState_New(istate);
 
 
         internal static PyThreadState* PyThreadState_Get() => Delegates.PyThreadState_Get();
 
 
+        internal static void PyThreadState_Clear(PyThreadState* tstate) => Delegates.PyThreadState_Clear(tstate);
+
+
+        internal static void PyThreadState_DeleteCurrent() => Delegates.PyThreadState_DeleteCurrent();
+
+
         internal static PyThreadState* PyThreadState_GetUnchecked() => Delegates.PyThreadState_GetUnchecked();
 
 
@@ -907,6 +961,56 @@ namespace Python.Runtime
 
         internal static NewReference PyObject_Call(BorrowedReference pointer, BorrowedReference args, BorrowedReference kw) => Delegates.PyObject_Call(pointer, args, kw);
 
+        /// <summary>
+        /// Set in the argument count of vectorcalls, when <c>args[-1]</c> may be
+        /// temporarily overwritten by the callee (<c>PY_VECTORCALL_ARGUMENTS_OFFSET</c>).
+        /// </summary>
+        static readonly nuint PY_VECTORCALL_ARGUMENTS_OFFSET = (nuint)1 << (8 * IntPtr.Size - 1);
+
+        /// <summary>
+        /// Calls <paramref name="callable"/> with the <paramref name="nargs"/> positional
+        /// arguments in <paramref name="args"/>, followed by the values of the keyword
+        /// arguments named in the tuple <paramref name="kwnames"/>, if any.
+        /// <c>args[-1]</c> must be writable.
+        /// </summary>
+        internal static NewReference PyObject_Vectorcall(BorrowedReference callable, IntPtr* args, nint nargs, BorrowedReference kwnames)
+        {
+            var vectorcall = Delegates.PyObject_Vectorcall;
+            if (vectorcall != null)
+            {
+                return vectorcall(callable, args, (nuint)nargs | PY_VECTORCALL_ARGUMENTS_OFFSET, kwnames);
+            }
+
+            // static inline before Python 3.11
+            if (kwnames.IsNull)
+            {
+                return PyObject_VectorcallDict(callable, args, nargs, BorrowedReference.Null);
+            }
+            using var kwargs = PyDict_New();
+            nint count = PyTuple_Size(kwnames);
+            for (nint i = 0; i < count; i++)
+            {
+                if (PyDict_SetItem(kwargs.Borrow(), PyTuple_GetItem(kwnames, i), new BorrowedReference(args[nargs + i])) != 0)
+                {
+                    return default;
+                }
+            }
+            return PyObject_VectorcallDict(callable, args, nargs, kwargs.Borrow());
+        }
+
+        /// <summary>
+        /// Like <see cref="PyObject_Vectorcall"/>, but passes the keyword arguments as a dictionary.
+        /// </summary>
+        internal static NewReference PyObject_VectorcallDict(BorrowedReference callable, IntPtr* args, nint nargs, BorrowedReference kwargs)
+            => Delegates.PyObject_VectorcallDict(callable, args, (nuint)nargs | PY_VECTORCALL_ARGUMENTS_OFFSET, kwargs);
+
+        /// <summary>
+        /// Calls the method <paramref name="name"/> of <c>args[0]</c> with the remaining
+        /// arguments. See <see cref="PyObject_Vectorcall"/>.
+        /// </summary>
+        internal static NewReference PyObject_VectorcallMethod(BorrowedReference name, IntPtr* args, nint nargs, BorrowedReference kwnames)
+            => Delegates.PyObject_VectorcallMethod(name, args, (nuint)nargs | PY_VECTORCALL_ARGUMENTS_OFFSET, kwnames);
+
         internal static NewReference PyObject_CallObject(BorrowedReference callable, BorrowedReference args) => Delegates.PyObject_CallObject(callable, args);
         internal static IntPtr PyObject_CallObject(IntPtr pointer, IntPtr args)
             => Delegates.PyObject_CallObject(new BorrowedReference(pointer), new BorrowedReference(args))
@@ -976,6 +1080,11 @@ namespace Python.Runtime
 
         internal static NewReference PyObject_Dir(BorrowedReference pointer) => Delegates.PyObject_Dir(pointer);
 
+        internal static NewReference PyCFunction_NewEx(IntPtr methodDef, BorrowedReference self, BorrowedReference module)
+            => Delegates.PyCFunction_NewEx(methodDef, self, module);
+
+        internal static NewReference PyInstanceMethod_New(BorrowedReference func) => Delegates.PyInstanceMethod_New(func);
+
         internal static void _Py_NewReference(BorrowedReference ob)
         {
             if (Delegates._Py_NewReference != null)
@@ -1455,7 +1564,7 @@ namespace Python.Runtime
 
         private static NewReference PyList_GetSlice(BorrowedReference pointer, nint start, nint end) => Delegates.PyList_GetSlice(pointer, start, end);
 
-        private static int PyList_SetSlice(BorrowedReference pointer, nint start, nint end, BorrowedReference value) => Delegates.PyList_SetSlice(pointer, start, end, value);
+        internal static int PyList_SetSlice(BorrowedReference pointer, nint start, nint end, BorrowedReference value) => Delegates.PyList_SetSlice(pointer, start, end, value);
 
 
         internal static nint PyList_Size(BorrowedReference pointer) => Delegates.PyList_Size(pointer);
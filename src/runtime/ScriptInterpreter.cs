@@ -0,0 +1,324 @@
+using System;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+
+using Python.Runtime.Native;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Runs pure Python scripts in a PEP 684 sub-interpreter with its own GIL,
+    /// created by <see cref="PythonEngine.CreateScriptInterpreter"/>.
+    /// </summary>
+    /// <remarks>
+    /// Scripts executed in different script interpreters run in parallel.
+    /// Each interpreter is served by a dedicated thread, so its methods can be
+    /// called from any .NET thread, whether or not it holds the GIL of the
+    /// main interpreter.
+    /// <para>
+    /// .NET interop is not available in script interpreters: the <c>clr</c>
+    /// and <c>pythonnet</c> modules can not be imported in them, because the
+    /// reflected .NET types, and the caches of <see cref="ClassManager"/> and
+    /// <see cref="TypeManager"/>, only exist in the main interpreter. For the
+    /// same reason, Python objects never leave a script interpreter: results
+    /// of <see cref="Eval"/> are returned as plain .NET values.
+    /// Only extension modules supporting multi-phase initialization
+    /// can be imported.
+    /// </para>
+    /// </remarks>
+    public sealed unsafe class ScriptInterpreter : IDisposable
+    {
+        static readonly ConcurrentSet<ScriptInterpreter> alive = new();
+
+        readonly BlockingCollection<WorkItem> queue = new();
+        readonly Thread thread;
+        PyThreadState* threadState;
+        Exception? startupError;
+        int disposed;
+
+        ScriptInterpreter()
+        {
+            thread = new Thread(Run)
+            {
+                IsBackground = true,
+                Name = "Python script interpreter",
+            };
+        }
+
+        internal static ScriptInterpreter Create()
+        {
+            var interpreter = new ScriptInterpreter();
+            using (var started = new ManualResetEventSlim())
+            {
+                interpreter.thread.Start(started);
+                WaitWithoutGIL(started.Wait);
+            }
+            if (interpreter.startupError is not null)
+            {
+                interpreter.thread.Join();
+                throw interpreter.startupError;
+            }
+            alive.Add(interpreter);
+            return interpreter;
+        }
+
+        /// <summary>
+        /// Executes Python statements in the <c>__main__</c> module of this interpreter.
+        /// </summary>
+        /// <exception cref="ScriptInterpreterException">The code raised a Python exception.</exception>
+        public void Exec(string code)
+        {
+            if (code is null) throw new ArgumentNullException(nameof(code));
+            Post(() => RunString(code, RunFlagType.File));
+        }
+
+        /// <summary>
+        /// Evaluates a Python expression in the <c>__main__</c> module of this
+        /// interpreter, and returns its result as <c>null</c>, <see cref="bool"/>,
+        /// <see cref="long"/>, <see cref="double"/> or <see cref="string"/>.
+        /// </summary>
+        /// <exception cref="ScriptInterpreterException">The code raised a Python exception,
+        /// or the result is an <c>int</c> out of the range of <see cref="long"/>.</exception>
+        /// <exception cref="NotSupportedException">The result is not <c>None</c>,
+        /// a <c>bool</c>, an <c>int</c>, a <c>float</c> or a <c>str</c>.</exception>
+        public object? Eval(string expression)
+        {
+            if (expression is null) throw new ArgumentNullException(nameof(expression));
+            return Post(() => RunString(expression, RunFlagType.Eval));
+        }
+
+        /// <summary>
+        /// Finalizes the interpreter, after waiting for previously submitted code
+        /// and non-daemon Python threads started by it to complete.
+        /// </summary>
+        public void Dispose()
+        {
+            if (Interlocked.Exchange(ref disposed, 1) != 0) return;
+
+            queue.CompleteAdding();
+            WaitWithoutGIL(thread.Join);
+            alive.Remove(this);
+        }
+
+        internal static void DisposeAll()
+        {
+            foreach (var interpreter in alive)
+            {
+                interpreter.Dispose();
+            }
+        }
+
+        object? Post(Func<object?> action)
+        {
+            var item = new WorkItem(action);
+            try
+            {
+                queue.Add(item);
+            }
+            catch (InvalidOperationException)
+            {
+                throw new ObjectDisposedException(nameof(ScriptInterpreter));
+            }
+            WaitWithoutGIL(() => Task.WaitAny(item.Completion.Task));
+            return item.Completion.Task.GetAwaiter().GetResult();
+        }
+
+        /// <summary>
+        /// Waits for the thread of an interpreter, releasing the GIL of the
+        /// main interpreter, if the current thread holds it: creating
+        /// interpreters, and some imports in them, need that GIL.
+        /// </summary>
+        static void WaitWithoutGIL(Action wait)
+        {
+            // PyGILState_Check is disabled once a subinterpreter exists
+            bool holdsGIL = Runtime.PyThreadState_GetUnchecked() != null;
+            IntPtr mainThreadState = holdsGIL ? PythonEngine.BeginAllowThreads() : IntPtr.Zero;
+            try
+            {
+                wait();
+            }
+            finally
+            {
+                if (holdsGIL) PythonEngine.EndAllowThreads(mainThreadState);
+            }
+        }
+
+        void Run(object state)
+        {
+            var started = (ManualResetEventSlim)state;
+            // new interpreters are created from a thread state of the main
+            // interpreter, that holds its GIL
+            PyGILState gil = Runtime.PyGILState_Ensure();
+            PyThreadState* mainThreadState = Runtime.PyThreadState_Get();
+            PyStatus status = Runtime.Py_NewInterpreterFromConfig(out threadState, PyInterpreterConfig.Isolated);
+            if (!status.IsOk || threadState == null)
+            {
+                // on failure the main interpreter's thread state is current again
+                Runtime.PyGILState_Release(gil);
+                startupError = new InvalidOperationException($"Failed to create a script interpreter: {status}");
+                started.Set();
+                return;
+            }
+            // the new interpreter's GIL is held after creation, and the main
+            // interpreter's GIL is released
+            BlockReflection();
+            Runtime.PyEval_SaveThread();
+            Runtime.PyEval_RestoreThread(mainThreadState);
+            Runtime.PyGILState_Release(gil);
+            started.Set();
+
+            foreach (var item in queue.GetConsumingEnumerable())
+            {
+                Runtime.PyEval_RestoreThread(threadState);
+                try
+                {
+                    item.Completion.SetResult(item.Action());
+                }
+                catch (Exception e)
+                {
+                    item.Completion.SetException(e);
+                }
+                finally
+                {
+                    Runtime.PyEval_SaveThread();
+                }
+            }
+
+            Runtime.PyEval_RestoreThread(threadState);
+            Runtime.Py_EndInterpreter(threadState);
+            threadState = null;
+        }
+
+        /// <summary>
+        /// Makes imports of the modules, that reflect .NET types, fail in the
+        /// current (script) interpreter, so it never reaches the reflection
+        /// caches of the main interpreter.
+        /// </summary>
+        static void BlockReflection()
+        {
+            BorrowedReference modules = Runtime.PyImport_GetModuleDict();
+            foreach (string name in new[] { "clr", "pythonnet" })
+            {
+                // None in sys.modules makes import raise ModuleNotFoundError
+                if (Runtime.PyDict_SetItemString(modules, name, Runtime.PyNone) != 0)
+                {
+                    Runtime.PyErr_Clear();
+                }
+            }
+        }
+
+        static object? RunString(string code, RunFlagType flag)
+        {
+            BorrowedReference globals = Runtime.PyModule_GetDict(Runtime.PyImport_AddModule("__main__"));
+            using var result = Runtime.PyRun_String(code, flag, globals, globals);
+            if (result.IsNull()) throw FetchError();
+            if (flag != RunFlagType.Eval) return null;
+
+            return ToClr(result.Borrow());
+        }
+
+        static object? ToClr(BorrowedReference value)
+        {
+            if (value == Runtime.PyNone) return null;
+            if (Runtime.PyBool_Check(value)) return value == Runtime.PyTrue;
+            if (Runtime.PyInt_Check(value)) return Runtime.PyLong_AsLongLong(value) ?? throw FetchError();
+            if (Runtime.PyFloat_Check(value)) return Runtime.PyFloat_AsDouble(value);
+            if (Runtime.PyString_Check(value)) return Runtime.GetManagedString(value);
+
+            string typeName = GetStringAttr(Runtime.PyObject_TYPE(value), "__name__") ?? "object";
+            throw new NotSupportedException(
+                $"A result of type {typeName} can not leave the script interpreter. " +
+                "Convert it to str, int, float or bool in the expression.");
+        }
+
+        /// <summary>
+        /// Converts the error indicator of the current (script) interpreter
+        /// into a .NET exception, that does not hold any Python objects.
+        /// </summary>
+        static ScriptInterpreterException FetchError()
+        {
+            Runtime.PyErr_Fetch(out var type, out var value, out var traceback);
+            try
+            {
+                Runtime.PyErr_NormalizeException(ref type, ref value, ref traceback);
+                if (!traceback.IsNull())
+                {
+                    Runtime.PyException_SetTraceback(value.Borrow(), traceback.Borrow());
+                }
+
+                string typeName = GetStringAttr(type.Borrow(), "__name__") ?? "Exception";
+                string message = GetStr(value.Borrow()) ?? "";
+                string? formatted = null;
+                using (var locals = Runtime.PyDict_New())
+                {
+                    Runtime.PyDict_SetItemString(locals.Borrow(), "e", value.Borrow());
+                    using var text = Runtime.PyRun_String(
+                        "''.join(__import__('traceback').format_exception(e))",
+                        RunFlagType.Eval, locals.Borrow(), locals.Borrow());
+                    formatted = text.IsNull() ? null : Runtime.GetManagedString(text.Borrow());
+                    Runtime.PyErr_Clear();
+                }
+                return new ScriptInterpreterException(typeName, message, formatted);
+            }
+            finally
+            {
+                type.Dispose();
+                value.Dispose();
+                traceback.Dispose();
+            }
+        }
+
+        static string? GetStringAttr(BorrowedReference ob, string name)
+        {
+            using var attr = Runtime.PyObject_GetAttrString(ob, name);
+            if (attr.IsNull())
+            {
+                Runtime.PyErr_Clear();
+                return null;
+            }
+            return Runtime.GetManagedString(attr.Borrow());
+        }
+
+        static string? GetStr(BorrowedReference ob)
+        {
+            using var str = Runtime.PyObject_Str(ob);
+            if (str.IsNull())
+            {
+                Runtime.PyErr_Clear();
+                return null;
+            }
+            return Runtime.GetManagedString(str.Borrow());
+        }
+
+        sealed class WorkItem
+        {
+            public WorkItem(Func<object?> action) => Action = action;
+
+            public Func<object?> Action { get; }
+            public TaskCompletionSource<object?> Completion { get; }
+                = new(TaskCreationOptions.RunContinuationsAsynchronously);
+        }
+    }
+
+    /// <summary>
+    /// A Python exception raised by code running in a <see cref="ScriptInterpreter"/>.
+    /// </summary>
+    public class ScriptInterpreterException : Exception
+    {
+        internal ScriptInterpreterException(string pythonTypeName, string message, string? pythonTraceback)
+            : base($"{pythonTypeName}: {message}")
+        {
+            PythonTypeName = pythonTypeName;
+            PythonTraceback = pythonTraceback;
+        }
+
+        /// <summary>Name of the Python exception type, e.g. <c>ValueError</c>.</summary>
+        public string PythonTypeName { get; }
+
+        /// <summary>Formatted Python traceback, if available.</summary>
+        public string? PythonTraceback { get; }
+
+        public override string? StackTrace => PythonTraceback ?? base.StackTrace;
+    }
+}
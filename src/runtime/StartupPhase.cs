@@ -0,0 +1,49 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Time spent in a phase of the initialization of the Python runtime,
+    /// see <see cref="PythonEngine.StartupPhases"/>.
+    /// </summary>
+    public sealed class StartupPhase
+    {
+        internal StartupPhase(string name, TimeSpan duration)
+        {
+            Name = name;
+            Duration = duration;
+        }
+
+        /// <summary>Name of the phase, e.g. <c>TypeManager</c>.</summary>
+        public string Name { get; }
+        /// <summary>Wall clock time spent in the phase.</summary>
+        public TimeSpan Duration { get; }
+
+        public override string ToString() => $"{Name}: {Duration.TotalMilliseconds:0.###} ms";
+    }
+
+    /// <summary>
+    /// Records the durations of consecutive phases of the runtime initialization.
+    /// </summary>
+    internal sealed class StartupTimer
+    {
+        readonly List<StartupPhase> phases = new();
+        long phaseStart = Stopwatch.GetTimestamp();
+
+        public IReadOnlyList<StartupPhase> Phases => phases;
+
+        /// <summary>
+        /// Records the time since the previous phase completed as the duration
+        /// of <paramref name="phase"/>.
+        /// </summary>
+        public void Complete(string phase)
+        {
+            long now = Stopwatch.GetTimestamp();
+            var duration = TimeSpan.FromTicks((long)((now - phaseStart) * ((double)TimeSpan.TicksPerSecond / Stopwatch.Frequency)));
+            phases.Add(new StartupPhase(phase, duration));
+            phaseStart = now;
+        }
+    }
+}
@@ -2,6 +2,8 @@ using System;
 using System.Reflection;
 using System.Runtime.Serialization;
 
+using Python.Runtime.StateSerialization;
+
 namespace Python.Runtime
 {
     [Serializable]
@@ -14,14 +16,20 @@ namespace Python.Runtime
         const string SerializationMemberName = "n";
         readonly MemberInfo? info;
 
+        /// <summary>
+        /// Set instead of <see cref="info"/> on deserialization: members are
+        /// only looked up when they are first used after a domain reload.
+        /// </summary>
         [NonSerialized]
-        readonly Exception? deserializationException;
+        readonly DeferredMember? deferred;
+
+        MemberInfo? Info => info ?? deferred?.Member;
 
         public string DeletedMessage
         {
             get
             {
-                return $"The .NET {typeof(T).Name} {Description} no longer exists. Cause: " + deserializationException?.Message ;
+                return $"The .NET {typeof(T).Name} {Description} no longer exists. Cause: " + deferred?.Error?.Message ;
             }
         }
 
@@ -29,20 +37,22 @@ namespace Python.Runtime
         {
             get
             {
-                if (info == null)
+                var member = Info;
+                if (member == null)
                 {
-                    throw new SerializationException(DeletedMessage, innerException: deserializationException);
+                    throw new SerializationException(DeletedMessage, innerException: deferred?.Error);
                 }
-                return (T)info;
+                return (T)member;
             }
         }
 
         public string Description { get; }
-        public bool Valid => info != null;
+        public bool Valid => Info != null;
 
         public override string ToString()
         {
-            return (info != null ? info.ToString() : $"missing: {Description}");
+            var member = Info;
+            return (member != null ? member.ToString() : $"missing: {Description}");
         }
 
         public MaybeMemberInfo(T fi)
@@ -51,31 +61,31 @@ namespace Python.Runtime
             Description = info.ToString();
             if (info.DeclaringType is not null)
                 Description += " of " + info.DeclaringType;
-            deserializationException = null;
+            deferred = null;
         }
 
         internal MaybeMemberInfo(SerializationInfo serializationInfo, StreamingContext context)
         {
             Description = serializationInfo.GetString(SerializationDescription);
             info = null;
-            deserializationException = null;
-            try
+            string? typeName = null, memberName = null;
+            foreach (var entry in serializationInfo)
             {
-                var tp = Type.GetType(serializationInfo.GetString(SerializationType));
-                if (tp != null)
-                {
-                    var memberName = serializationInfo.GetString(SerializationMemberName);
-                    MemberInfo? mi = Get(tp, memberName, ClassManager.BindingFlags);
-                    if (mi != null && ShouldBindMember(mi))
-                    {
-                        info = mi;
-                    }
-                }
-            }
-            catch (Exception e)
-            {
-                deserializationException = e;
+                if (entry.Name == SerializationType) typeName = (string?)entry.Value;
+                if (entry.Name == SerializationMemberName) memberName = (string?)entry.Value;
             }
+            deferred = typeName is null || memberName is null
+                ? null
+                : new DeferredMember(typeName, memberName, Resolve);
+        }
+
+        static MemberInfo? Resolve(string typeName, string memberName)
+        {
+            var tp = ReflectionNames.Resolve(typeName);
+            if (tp == null) return null;
+
+            MemberInfo? mi = Get(tp, memberName, ClassManager.BindingFlags);
+            return mi != null && ShouldBindMember(mi) ? mi : null;
         }
 
         static MemberInfo? Get(Type type, string name, BindingFlags flags)
@@ -113,11 +123,53 @@ namespace Python.Runtime
         public void GetObjectData(SerializationInfo serializationInfo, StreamingContext context)
         {
             serializationInfo.AddValue(SerializationDescription, Description);
-            if (info is not null)
+            if (deferred is { IsResolved: false })
+            {
+                // never used since the last reload: save it as it was restored
+                serializationInfo.AddValue(SerializationMemberName, deferred.MemberName);
+                serializationInfo.AddValue(SerializationType, deferred.TypeName);
+                return;
+            }
+
+            var member = Info;
+            if (member is not null)
             {
-                serializationInfo.AddValue(SerializationMemberName, info.Name);
-                serializationInfo.AddValue(SerializationType, info.ReflectedType.AssemblyQualifiedName);
+                serializationInfo.AddValue(SerializationMemberName, member.Name);
+                serializationInfo.AddValue(SerializationType, ReflectionNames.GetName(member.ReflectedType));
             }
         }
     }
+
+    /// <summary>
+    /// A deserialized field or property, that is looked up on first use.
+    /// </summary>
+    internal sealed class DeferredMember
+    {
+        readonly Lazy<MemberInfo?> member;
+
+        public DeferredMember(string typeName, string memberName, Func<string, string, MemberInfo?> resolve)
+        {
+            TypeName = typeName;
+            MemberName = memberName;
+            member = new Lazy<MemberInfo?>(() =>
+            {
+                try
+                {
+                    return resolve(TypeName, MemberName);
+                }
+                catch (Exception e)
+                {
+                    Error = e;
+                    return null;
+                }
+            });
+        }
+
+        public string TypeName { get; }
+        public string MemberName { get; }
+
+        public MemberInfo? Member => member.Value;
+        public bool IsResolved => member.IsValueCreated;
+        public Exception? Error { get; private set; }
+    }
 }
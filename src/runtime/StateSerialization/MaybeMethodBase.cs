@@ -6,6 +6,7 @@ using System.Runtime.Serialization;
 using System.Linq;
 
 using Python.Runtime.Reflection;
+using Python.Runtime.StateSerialization;
 
 namespace Python.Runtime
 {
@@ -27,14 +28,20 @@ namespace Python.Runtime
         readonly string? name;
         readonly MethodBase? info;
 
+        /// <summary>
+        /// Set instead of <see cref="info"/> on deserialization: methods are
+        /// only looked up when they are first used after a domain reload.
+        /// </summary>
         [NonSerialized]
-        readonly Exception? deserializationException;
+        readonly DeferredMethod? deferred;
+
+        MethodBase? Info => info ?? deferred?.Method;
 
         public string DeletedMessage 
         {
             get
             {
-                return $"The .NET {typeof(T)} {name} no longer exists. Cause: " + deserializationException?.Message ;
+                return $"The .NET {typeof(T)} {name} no longer exists. Cause: " + deferred?.Error?.Message ;
             }
         }
 
@@ -42,22 +49,23 @@ namespace Python.Runtime
         {
             get
             {
-                if (info == null)
+                var method = Info;
+                if (method == null)
                 {
-                    throw new SerializationException(DeletedMessage, innerException: deserializationException);
+                    throw new SerializationException(DeletedMessage, innerException: deferred?.Error);
                 }
-                return (T)info;
+                return (T)method;
             }
         }
 
-        public T UnsafeValue => (T)info!;
+        public T UnsafeValue => (T)Info!;
         public string? Name => name;
-        [MemberNotNullWhen(true, nameof(info))]
-        public bool Valid => info != null;
+        public bool Valid => Info != null;
 
         public override string ToString()
         {
-            return (info != null ? info.ToString() : $"missing method info: {name}");
+            var method = Info;
+            return (method != null ? method.ToString() : $"missing method info: {name}");
         }
 
         public MaybeMethodBase(T? mi)
@@ -65,43 +73,26 @@ namespace Python.Runtime
             info = mi;
             name = mi?.ToString();
             Debug.Assert(name != null || info == null);
-            deserializationException = null;
+            deferred = null;
         }
 
         internal MaybeMethodBase(SerializationInfo serializationInfo, StreamingContext context)
         {
             name = serializationInfo.GetString(SerializationName);
             info = null;
-            deserializationException = null;
+            deferred = null;
 
             if (name is null) return;
 
-            try
-            {
-                // Retrieve the reflected type of the method;
-                var typeName = serializationInfo.GetString(SerializationType);
-                var tp = Type.GetType(typeName);
-                if (tp == null)
-                {
-                    throw new SerializationException($"The underlying type {typeName} can't be found");
-                }
-
-                var flags = (MaybeMethodFlags)serializationInfo.GetInt32(SerializationFlags);
-                int genericCount = serializationInfo.GetInt32(SerializationGenericParamCount);
-
-                // Get the method's parameters types
-                var field_name = serializationInfo.GetString(SerializationMethodName);
-                var param = (ParameterHelper[])serializationInfo.GetValue(SerializationParameters, typeof(ParameterHelper[]));
-
-                info = ScanForMethod(tp, field_name, genericCount, flags, param);
-            }
-            catch (Exception e)
-            {
-                deserializationException = e;
-            }
+            deferred = new DeferredMethod(
+                typeName: serializationInfo.GetString(SerializationType),
+                methodName: serializationInfo.GetString(SerializationMethodName),
+                genericCount: serializationInfo.GetInt32(SerializationGenericParamCount),
+                flags: (MaybeMethodFlags)serializationInfo.GetInt32(SerializationFlags),
+                parameters: (ParameterHelper[])serializationInfo.GetValue(SerializationParameters, typeof(ParameterHelper[])));
         }
 
-        static MethodBase ScanForMethod(Type declaringType, string name, int genericCount, MaybeMethodFlags flags, ParameterHelper[] parameters)
+        internal static MethodBase ScanForMethod(Type declaringType, string name, int genericCount, MaybeMethodFlags flags, ParameterHelper[] parameters)
         {
             var bindingFlags = ClassManager.BindingFlags;
             if (flags.HasFlag(MaybeMethodFlags.Constructor)) bindingFlags &= ~BindingFlags.Static;
@@ -144,16 +135,28 @@ namespace Python.Runtime
         public void GetObjectData(SerializationInfo serializationInfo, StreamingContext context)
         {
             serializationInfo.AddValue(SerializationName, name);
-            if (Valid)
+            if (deferred is { IsResolved: false })
+            {
+                // never used since the last reload: save it as it was restored
+                serializationInfo.AddValue(SerializationMethodName, deferred.MethodName);
+                serializationInfo.AddValue(SerializationGenericParamCount, deferred.GenericCount);
+                serializationInfo.AddValue(SerializationFlags, (int)deferred.Flags);
+                serializationInfo.AddValue(SerializationType, deferred.TypeName);
+                serializationInfo.AddValue(SerializationParameters, deferred.Parameters, typeof(ParameterHelper[]));
+                return;
+            }
+
+            var method = Info;
+            if (method != null)
             {
-                serializationInfo.AddValue(SerializationMethodName, info.Name);
+                serializationInfo.AddValue(SerializationMethodName, method.Name);
                 serializationInfo.AddValue(SerializationGenericParamCount,
-                    info.ContainsGenericParameters ? info.GetGenericArguments().Length : 0);
-                serializationInfo.AddValue(SerializationFlags, (int)Flags(info));
-                string? typeName = info.ReflectedType.AssemblyQualifiedName;
+                    method.ContainsGenericParameters ? method.GetGenericArguments().Length : 0);
+                serializationInfo.AddValue(SerializationFlags, (int)Flags(method));
+                string? typeName = ReflectionNames.GetName(method.ReflectedType);
                 Debug.Assert(typeName != null);
                 serializationInfo.AddValue(SerializationType, typeName);
-                ParameterHelper[] parameters = (from p in info.GetParameters() select new ParameterHelper(p)).ToArray();
+                ParameterHelper[] parameters = (from p in method.GetParameters() select new ParameterHelper(p)).ToArray();
                 serializationInfo.AddValue(SerializationParameters, parameters, typeof(ParameterHelper[]));
             }
         }
@@ -171,6 +174,55 @@ namespace Python.Runtime
             => Flags(method) & MaybeMethodFlags.Visibility;
     }
 
+    /// <summary>
+    /// A deserialized method, that is looked up on first use.
+    /// </summary>
+    internal sealed class DeferredMethod
+    {
+        readonly Lazy<MethodBase?> method;
+
+        public DeferredMethod(string typeName, string methodName, int genericCount,
+                              MaybeMethodFlags flags, ParameterHelper[] parameters)
+        {
+            TypeName = typeName;
+            MethodName = methodName;
+            GenericCount = genericCount;
+            Flags = flags;
+            Parameters = parameters;
+            method = new Lazy<MethodBase?>(Resolve);
+        }
+
+        public string TypeName { get; }
+        public string MethodName { get; }
+        public int GenericCount { get; }
+        public MaybeMethodFlags Flags { get; }
+        public ParameterHelper[] Parameters { get; }
+
+        public MethodBase? Method => method.Value;
+        public bool IsResolved => method.IsValueCreated;
+        public Exception? Error { get; private set; }
+
+        MethodBase? Resolve()
+        {
+            try
+            {
+                // Retrieve the reflected type of the method;
+                var tp = ReflectionNames.Resolve(TypeName);
+                if (tp == null)
+                {
+                    throw new SerializationException($"The underlying type {TypeName} can't be found");
+                }
+
+                return MaybeMethodBase<MethodBase>.ScanForMethod(tp, MethodName, GenericCount, Flags, Parameters);
+            }
+            catch (Exception e)
+            {
+                Error = e;
+                return null;
+            }
+        }
+    }
+
     [Flags]
     internal enum MaybeMethodFlags
     {
@@ -4,6 +4,8 @@ using System.Runtime.Serialization;
 using System.Runtime.Serialization.Formatters.Binary;
 using System.IO;
 
+using Python.Runtime.StateSerialization;
+
 namespace Python.Runtime
 {
     [Serializable]
@@ -47,13 +49,13 @@ namespace Python.Runtime
         public MaybeType(Type tp)
         {
             type = tp;
-            name = tp.AssemblyQualifiedName;
+            name = ReflectionNames.GetName(tp)!;
         }
 
         private MaybeType(SerializationInfo serializationInfo, StreamingContext context)
         {
             name = (string)serializationInfo.GetValue(SerializationName, typeof(string));
-            type = Type.GetType(name, throwOnError:false);
+            type = ReflectionNames.Resolve(name)!;
         }
 
         public void GetObjectData(SerializationInfo serializationInfo, StreamingContext context)
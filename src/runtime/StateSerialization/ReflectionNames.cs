@@ -0,0 +1,57 @@
+using System;
+using System.Collections.Concurrent;
+
+namespace Python.Runtime.StateSerialization;
+
+/// <summary>
+/// Shared table of assembly-qualified type names, used when stashing and
+/// restoring reflected members.
+/// </summary>
+/// <remarks>
+/// Every stashed member refers to its declaring type and parameter types by
+/// name. Resolving each name once avoids repeated
+/// <see cref="Type.GetType(string)"/> lookups on restore.
+/// </remarks>
+internal static class ReflectionNames
+{
+    static readonly ConcurrentDictionary<Type, string?> names = new();
+    static readonly ConcurrentDictionary<string, Type> types = new();
+
+    /// <summary>
+    /// Returns <see cref="Type.AssemblyQualifiedName"/> of <paramref name="type"/>.
+    /// </summary>
+    internal static string? GetName(Type type)
+    {
+        if (!names.TryGetValue(type, out string? name))
+        {
+            name = names.GetOrAdd(type, type.AssemblyQualifiedName);
+        }
+        return name;
+    }
+
+    /// <summary>
+    /// Returns the type with the given assembly-qualified name, or <c>null</c>
+    /// if it does not exist (anymore).
+    /// </summary>
+    /// <remarks>
+    /// Missing types are not cached: their assembly might be loaded later.
+    /// </remarks>
+    internal static Type? Resolve(string? name)
+    {
+        if (name is null) return null;
+        if (types.TryGetValue(name, out Type? type)) return type;
+
+        type = Type.GetType(name, throwOnError: false);
+        if (type is not null)
+        {
+            types.TryAdd(name, type);
+        }
+        return type;
+    }
+
+    internal static void Reset()
+    {
+        names.Clear();
+        types.Clear();
+    }
+}
@@ -5,7 +5,6 @@ using System.IO;
 using System.Linq;
 using System.Runtime.InteropServices;
 using System.Runtime.Serialization;
-using System.Runtime.Serialization.Formatters.Binary;
 
 using Python.Runtime.StateSerialization;
 
@@ -16,19 +15,7 @@ namespace Python.Runtime
     public static class RuntimeData
     {
 
-        public readonly static Func<IFormatter> DefaultFormatterFactory = () =>
-        {
-            try
-            {
-                var res = new BinaryFormatter();
-                res.Serialize(new MemoryStream(), 1); // test if BinaryFormatter is usable
-                return res;
-            }
-            catch
-            {
-                return new NoopFormatter();
-            }
-        };
+        public readonly static Func<IFormatter> DefaultFormatterFactory = () => new StashFormatter();
 
         private static Func<IFormatter> _formatterFactory { get; set; } = DefaultFormatterFactory;
 
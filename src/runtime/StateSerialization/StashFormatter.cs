@@ -0,0 +1,541 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Reflection;
+using System.Runtime.CompilerServices;
+using System.Runtime.Serialization;
+using System.Text;
+
+using Python.Runtime.StateSerialization;
+
+namespace Python.Runtime;
+
+/// <summary>
+/// Compact formatter used by default to stash the Python.NET state across
+/// domain reloads, instead of <c>BinaryFormatter</c>.
+/// </summary>
+/// <remarks>
+/// Objects are serialized by the same rules as with <c>BinaryFormatter</c>:
+/// types must be marked as serializable, <see cref="NonSerializedAttribute"/>
+/// fields are skipped, and <see cref="ISerializable"/>, surrogates from
+/// <see cref="SurrogateSelector"/>, <see cref="IObjectReference"/> and
+/// <see cref="IDeserializationCallback"/> are honored. Serialization
+/// callbacks declared with attributes are not invoked, and only
+/// single-dimensional, zero-based arrays are supported.
+/// <para>
+/// Strings (including type and member names) and types are written once, and
+/// referred to by integer handles afterwards, as are repeated references to
+/// the same object. <see cref="Type"/> objects are written by name.
+/// </para>
+/// </remarks>
+public sealed class StashFormatter : IFormatter
+{
+    // "PNS" followed by the format version
+    const int Magic = 0x01_53_4E_50;
+
+    /// <summary>
+    /// Only used to resolve types on deserialization.
+    /// </summary>
+    public SerializationBinder? Binder { get; set; }
+    public StreamingContext Context { get; set; } = new(StreamingContextStates.All);
+    public ISurrogateSelector? SurrogateSelector { get; set; }
+
+    public void Serialize(Stream serializationStream, object graph)
+    {
+        if (serializationStream is null) throw new ArgumentNullException(nameof(serializationStream));
+
+        using var writer = new BinaryWriter(serializationStream, Encoding.UTF8, leaveOpen: true);
+        writer.Write(Magic);
+        new Writer(this, writer).WriteValue(graph);
+    }
+
+    public object Deserialize(Stream serializationStream)
+    {
+        if (serializationStream is null) throw new ArgumentNullException(nameof(serializationStream));
+
+        using var reader = new BinaryReader(serializationStream, Encoding.UTF8, leaveOpen: true);
+        if (reader.ReadInt32() != Magic)
+        {
+            throw new SerializationException("The stream was not written by " + nameof(StashFormatter));
+        }
+        return new Reader(this, reader).ReadGraph()!;
+    }
+
+    enum Tag : byte
+    {
+        Null,
+        Reference,
+        Object,
+        Value,
+        Array,
+        String,
+        Type,
+        Enum,
+        Boolean,
+        Char,
+        SByte,
+        Byte,
+        Int16,
+        UInt16,
+        Int32,
+        UInt32,
+        Int64,
+        UInt64,
+        Single,
+        Double,
+        Decimal,
+        DateTime,
+        IntPtr,
+        UIntPtr,
+    }
+
+    static readonly Dictionary<Type, Tag> primitiveTags = new()
+    {
+        [typeof(bool)] = Tag.Boolean,
+        [typeof(char)] = Tag.Char,
+        [typeof(sbyte)] = Tag.SByte,
+        [typeof(byte)] = Tag.Byte,
+        [typeof(short)] = Tag.Int16,
+        [typeof(ushort)] = Tag.UInt16,
+        [typeof(int)] = Tag.Int32,
+        [typeof(uint)] = Tag.UInt32,
+        [typeof(long)] = Tag.Int64,
+        [typeof(ulong)] = Tag.UInt64,
+        [typeof(float)] = Tag.Single,
+        [typeof(double)] = Tag.Double,
+        [typeof(decimal)] = Tag.Decimal,
+        [typeof(DateTime)] = Tag.DateTime,
+        [typeof(IntPtr)] = Tag.IntPtr,
+        [typeof(UIntPtr)] = Tag.UIntPtr,
+    };
+
+    sealed class Writer
+    {
+        readonly StashFormatter formatter;
+        readonly BinaryWriter writer;
+        readonly FormatterConverter converter = new();
+        readonly Dictionary<string, int> strings = new();
+        readonly Dictionary<(string assembly, string name), int> types = new();
+        readonly Dictionary<object, int> objects = new(ReferenceComparer.Instance);
+        readonly Dictionary<Type, MemberInfo[]> fields = new();
+
+        public Writer(StashFormatter formatter, BinaryWriter writer)
+        {
+            this.formatter = formatter;
+            this.writer = writer;
+        }
+
+        public void WriteValue(object? value)
+        {
+            if (value is null)
+            {
+                Write(Tag.Null);
+                return;
+            }
+
+            Type type = value.GetType();
+            if (primitiveTags.TryGetValue(type, out Tag tag))
+            {
+                Write(tag);
+                WritePrimitive(tag, value);
+            }
+            else if (value is string str)
+            {
+                Write(Tag.String);
+                WriteString(str);
+            }
+            else if (value is Type valueType)
+            {
+                Write(Tag.Type);
+                WriteType(valueType);
+            }
+            else if (type.IsEnum)
+            {
+                Write(Tag.Enum);
+                WriteType(type);
+                WriteValue(Convert.ChangeType(value, Enum.GetUnderlyingType(type)));
+            }
+            else if (type.IsValueType)
+            {
+                Write(Tag.Value);
+                WriteObject(value, type);
+            }
+            else if (objects.TryGetValue(value, out int handle))
+            {
+                Write(Tag.Reference);
+                WriteInt(handle);
+            }
+            else
+            {
+                objects.Add(value, objects.Count);
+                if (value is Array array)
+                {
+                    WriteArray(array, type);
+                }
+                else
+                {
+                    Write(Tag.Object);
+                    WriteObject(value, type);
+                }
+            }
+        }
+
+        void WriteArray(Array array, Type type)
+        {
+            if (array.Rank != 1 || array.GetLowerBound(0) != 0)
+            {
+                throw new SerializationException($"Only single-dimensional, zero-based arrays are supported, got {type}");
+            }
+
+            Write(Tag.Array);
+            WriteType(type.GetElementType());
+            WriteInt(array.Length);
+            for (int i = 0; i < array.Length; i++)
+            {
+                WriteValue(array.GetValue(i));
+            }
+        }
+
+        void WriteObject(object value, Type type)
+        {
+            var info = new SerializationInfo(type, converter);
+            var context = formatter.Context;
+            var surrogate = formatter.SurrogateSelector?.GetSurrogate(type, context, out _);
+            if (surrogate is not null)
+            {
+                surrogate.GetObjectData(value, info, context);
+            }
+            else if (!type.IsSerializable)
+            {
+                throw new SerializationException($"Type '{type}' is not marked as serializable.");
+            }
+            else if (value is ISerializable serializable)
+            {
+                serializable.GetObjectData(info, context);
+            }
+            else
+            {
+                WriteType(info.AssemblyName, info.FullTypeName);
+                var members = GetFields(type);
+                WriteInt(members.Length);
+                foreach (FieldInfo field in members)
+                {
+                    WriteString(field.Name);
+                    WriteValue(field.GetValue(value));
+                }
+                return;
+            }
+
+            WriteType(info.AssemblyName, info.FullTypeName);
+            WriteInt(info.MemberCount);
+            foreach (SerializationEntry entry in info)
+            {
+                WriteString(entry.Name);
+                WriteValue(entry.Value);
+            }
+        }
+
+        MemberInfo[] GetFields(Type type)
+        {
+            if (!fields.TryGetValue(type, out var members))
+            {
+                members = FormatterServices.GetSerializableMembers(type, formatter.Context);
+                fields.Add(type, members);
+            }
+            return members;
+        }
+
+        void WriteType(Type type)
+        {
+            if (type.FullName is null)
+            {
+                throw new SerializationException($"Type '{type}' can not be serialized by name.");
+            }
+            WriteType(type.Assembly.FullName, type.FullName);
+        }
+
+        void WriteType(string assembly, string name)
+        {
+            if (types.TryGetValue((assembly, name), out int handle))
+            {
+                WriteInt(handle);
+                return;
+            }
+
+            handle = types.Count;
+            types.Add((assembly, name), handle);
+            WriteInt(handle);
+            WriteString(assembly);
+            WriteString(name);
+        }
+
+        void WriteString(string? str)
+        {
+            // 0 is null, other values are the handle plus one
+            if (str is null)
+            {
+                WriteInt(0);
+            }
+            else if (strings.TryGetValue(str, out int handle))
+            {
+                WriteInt(handle + 1);
+            }
+            else
+            {
+                handle = strings.Count;
+                strings.Add(str, handle);
+                WriteInt(handle + 1);
+                writer.Write(str);
+            }
+        }
+
+        void WritePrimitive(Tag tag, object value)
+        {
+            switch (tag)
+            {
+                case Tag.Boolean: writer.Write((bool)value); break;
+                case Tag.Char: writer.Write((char)value); break;
+                case Tag.SByte: writer.Write((sbyte)value); break;
+                case Tag.Byte: writer.Write((byte)value); break;
+                case Tag.Int16: writer.Write((short)value); break;
+                case Tag.UInt16: writer.Write((ushort)value); break;
+                case Tag.Int32: writer.Write((int)value); break;
+                case Tag.UInt32: writer.Write((uint)value); break;
+                case Tag.Int64: writer.Write((long)value); break;
+                case Tag.UInt64: writer.Write((ulong)value); break;
+                case Tag.Single: writer.Write((float)value); break;
+                case Tag.Double: writer.Write((double)value); break;
+                case Tag.Decimal: writer.Write((decimal)value); break;
+                case Tag.DateTime: writer.Write(((DateTime)value).ToBinary()); break;
+                case Tag.IntPtr: writer.Write(((IntPtr)value).ToInt64()); break;
+                case Tag.UIntPtr: writer.Write(((UIntPtr)value).ToUInt64()); break;
+                default: throw new ArgumentOutOfRangeException(nameof(tag));
+            }
+        }
+
+        void Write(Tag tag) => writer.Write((byte)tag);
+
+        void WriteInt(int value)
+        {
+            uint rest = (uint)value;
+            while (rest >= 0x80)
+            {
+                writer.Write((byte)(rest | 0x80));
+                rest >>= 7;
+            }
+            writer.Write((byte)rest);
+        }
+    }
+
+    sealed class Reader
+    {
+        readonly StashFormatter formatter;
+        readonly BinaryReader reader;
+        readonly FormatterConverter converter = new();
+        readonly List<string> strings = new();
+        readonly List<Type> types = new();
+        readonly List<object?> objects = new();
+        readonly List<IDeserializationCallback> callbacks = new();
+        readonly Dictionary<Type, Dictionary<string, int>> fields = new();
+
+        public Reader(StashFormatter formatter, BinaryReader reader)
+        {
+            this.formatter = formatter;
+            this.reader = reader;
+        }
+
+        public object? ReadGraph()
+        {
+            object? graph = ReadValue();
+            foreach (var callback in callbacks)
+            {
+                callback.OnDeserialization(null);
+            }
+            return graph;
+        }
+
+        object? ReadValue()
+        {
+            var tag = (Tag)reader.ReadByte();
+            switch (tag)
+            {
+                case Tag.Null:
+                    return null;
+                case Tag.Reference:
+                    return objects[ReadInt()];
+                case Tag.String:
+                    return ReadString();
+                case Tag.Type:
+                    return ReadType();
+                case Tag.Enum:
+                    Type enumType = ReadType();
+                    return Enum.ToObject(enumType, ReadValue()!);
+                case Tag.Array:
+                    return ReadArray();
+                case Tag.Object:
+                    return ReadObject(isReference: true);
+                case Tag.Value:
+                    return ReadObject(isReference: false);
+                default:
+                    return ReadPrimitive(tag);
+            }
+        }
+
+        Array ReadArray()
+        {
+            Type elementType = ReadType();
+            int length = ReadInt();
+            var array = Array.CreateInstance(elementType, length);
+            objects.Add(array);
+            for (int i = 0; i < length; i++)
+            {
+                array.SetValue(ReadValue(), i);
+            }
+            return array;
+        }
+
+        object ReadObject(bool isReference)
+        {
+            Type type = ReadType();
+            object obj = FormatterServices.GetUninitializedObject(type);
+            int handle = objects.Count;
+            // register before reading the members, that might refer back to the object
+            if (isReference) objects.Add(obj);
+
+            var context = formatter.Context;
+            ISurrogateSelector? selector = null;
+            var surrogate = formatter.SurrogateSelector?.GetSurrogate(type, context, out selector);
+            int count = ReadInt();
+            if (surrogate is null && obj is not ISerializable)
+            {
+                var members = FormatterServices.GetSerializableMembers(type, context);
+                var indices = GetFieldIndices(type, members);
+                var data = new object?[members.Length];
+                for (int i = 0; i < count; i++)
+                {
+                    string name = ReadString()!;
+                    object? value = ReadValue();
+                    // fields that no longer exist are skipped
+                    if (indices.TryGetValue(name, out int index)) data[index] = value;
+                }
+                FormatterServices.PopulateObjectMembers(obj, members, data);
+            }
+            else
+            {
+                var info = new SerializationInfo(type, converter);
+                for (int i = 0; i < count; i++)
+                {
+                    string name = ReadString()!;
+                    info.AddValue(name, ReadValue());
+                }
+
+                if (surrogate is not null)
+                {
+                    obj = surrogate.SetObjectData(obj, info, context, selector) ?? obj;
+                }
+                else
+                {
+                    var ctor = type.GetConstructor(
+                        BindingFlags.Instance | BindingFlags.Public | BindingFlags.NonPublic,
+                        binder: null,
+                        new[] { typeof(SerializationInfo), typeof(StreamingContext) },
+                        modifiers: null);
+                    if (ctor is null)
+                    {
+                        throw new SerializationException($"The constructor to deserialize an object of type '{type}' was not found.");
+                    }
+                    ctor.Invoke(obj, new object[] { info, context });
+                }
+            }
+
+            if (obj is IObjectReference reference)
+            {
+                obj = reference.GetRealObject(context);
+            }
+            if (isReference) objects[handle] = obj;
+            if (obj is IDeserializationCallback callback) callbacks.Add(callback);
+            return obj;
+        }
+
+        Dictionary<string, int> GetFieldIndices(Type type, MemberInfo[] members)
+        {
+            if (!fields.TryGetValue(type, out var indices))
+            {
+                indices = new Dictionary<string, int>(members.Length);
+                for (int i = 0; i < members.Length; i++)
+                {
+                    indices.Add(members[i].Name, i);
+                }
+                fields.Add(type, indices);
+            }
+            return indices;
+        }
+
+        Type ReadType()
+        {
+            int handle = ReadInt();
+            if (handle < types.Count) return types[handle];
+
+            string assembly = ReadString()!;
+            string name = ReadString()!;
+            Type? type = formatter.Binder?.BindToType(assembly, name)
+                ?? ReflectionNames.Resolve(name + ", " + assembly);
+            if (type is null)
+            {
+                throw new SerializationException($"Unable to find type '{name}' in assembly '{assembly}'.");
+            }
+            types.Add(type);
+            return type;
+        }
+
+        string? ReadString()
+        {
+            int handle = ReadInt();
+            if (handle == 0) return null;
+            if (handle <= strings.Count) return strings[handle - 1];
+
+            string str = reader.ReadString();
+            strings.Add(str);
+            return str;
+        }
+
+        object ReadPrimitive(Tag tag) => tag switch
+        {
+            Tag.Boolean => reader.ReadBoolean(),
+            Tag.Char => reader.ReadChar(),
+            Tag.SByte => reader.ReadSByte(),
+            Tag.Byte => reader.ReadByte(),
+            Tag.Int16 => reader.ReadInt16(),
+            Tag.UInt16 => reader.ReadUInt16(),
+            Tag.Int32 => reader.ReadInt32(),
+            Tag.UInt32 => reader.ReadUInt32(),
+            Tag.Int64 => reader.ReadInt64(),
+            Tag.UInt64 => reader.ReadUInt64(),
+            Tag.Single => reader.ReadSingle(),
+            Tag.Double => reader.ReadDouble(),
+            Tag.Decimal => reader.ReadDecimal(),
+            Tag.DateTime => DateTime.FromBinary(reader.ReadInt64()),
+            Tag.IntPtr => new IntPtr(reader.ReadInt64()),
+            Tag.UIntPtr => new UIntPtr(reader.ReadUInt64()),
+            _ => throw new SerializationException($"Invalid tag {tag} in the serialized data"),
+        };
+
+        int ReadInt()
+        {
+            uint result = 0;
+            for (int shift = 0; ; shift += 7)
+            {
+                byte b = reader.ReadByte();
+                result |= (uint)(b & 0x7F) << shift;
+                if (b < 0x80) return (int)result;
+            }
+        }
+    }
+
+    sealed class ReferenceComparer : IEqualityComparer<object>
+    {
+        public static ReferenceComparer Instance { get; } = new();
+        public new bool Equals(object? x, object? y) => ReferenceEquals(x, y);
+        public int GetHashCode(object obj) => RuntimeHelpers.GetHashCode(obj);
+    }
+}
@@ -0,0 +1,274 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel;
+using System.Threading;
+
+using Python.Runtime.Native;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Keeps the Python thread states of .NET thread pool threads alive
+    /// between GIL acquisitions.
+    /// </summary>
+    /// <remarks>
+    /// Without it, every <see cref="Py.GIL"/> on a thread, that has no Python
+    /// thread state, creates one, and releasing the GIL destroys it again.
+    /// With <see cref="Enable"/> set, the thread state created by the first
+    /// acquisition on a thread pool thread is kept until the thread exits,
+    /// or the engine is shut down.
+    /// <para>
+    /// Thread states of exited threads are destroyed on a dedicated thread,
+    /// that makes each of them its current thread state first, because
+    /// Python 3.12 and later can only delete the current thread state
+    /// without unbinding the deleting thread from its own.
+    /// </para>
+    /// </remarks>
+    public sealed class ThreadStatePool
+    {
+        internal static ThreadStatePool Instance { get; } = new();
+
+        static volatile bool enabled;
+
+        [ThreadStatic]
+        static Lease? lease;
+
+        readonly object sync = new();
+        // guarded by sync
+        readonly Queue<IntPtr> exitedThreadStates = new();
+        Thread? reaper;
+        bool reaping;
+        bool stopping;
+
+        int count;
+        long created;
+        long reused;
+        long rejected;
+        long released;
+
+        ThreadStatePool() { }
+
+        /// <summary>
+        /// Set to <c>true</c> to keep the thread states of thread pool threads.
+        /// </summary>
+        [DefaultValue(false)]
+        public bool Enable
+        {
+            get => enabled;
+            set => enabled = value;
+        }
+
+        const int DefaultMaxSize = 256;
+        /// <summary>
+        /// Maximum number of thread states to keep. Threads beyond that
+        /// create and destroy their thread state as usual.
+        /// </summary>
+        [DefaultValue(DefaultMaxSize)]
+        public int MaxSize { get; set; } = DefaultMaxSize;
+
+        internal static bool IsEnabled => enabled;
+
+        public ThreadStatePoolStatistics GetStatistics() => new(
+            count: Volatile.Read(ref count),
+            created: Interlocked.Read(ref created),
+            reused: Interlocked.Read(ref reused),
+            rejected: Interlocked.Read(ref rejected),
+            released: Interlocked.Read(ref released));
+
+        /// <summary>
+        /// Acquires the GIL like <see cref="PythonEngine.AcquireLock"/>,
+        /// keeping the thread state of the current thread, if it is a
+        /// thread pool thread.
+        /// </summary>
+        internal unsafe PyGILState Ensure()
+        {
+            var current = lease;
+            if (current is not null && current.Run == Runtime.GetRun())
+            {
+                // nested acquisitions would not have created a thread state
+                if (Runtime.PyThreadState_GetUnchecked() == null)
+                {
+                    Interlocked.Increment(ref reused);
+                }
+                return Runtime.PyGILState_Ensure();
+            }
+
+            if (!Thread.CurrentThread.IsThreadPoolThread
+                || Runtime.PyGILState_GetThisThreadState() != null)
+            {
+                return Runtime.PyGILState_Ensure();
+            }
+
+            // creates a thread state for the current thread
+            var state = Runtime.PyGILState_Ensure();
+            if (Interlocked.Increment(ref count) > MaxSize)
+            {
+                Interlocked.Decrement(ref count);
+                Interlocked.Increment(ref rejected);
+                return state;
+            }
+
+            // the extra reference to the thread state is never released
+            // on this thread, so releasing the GIL does not destroy it
+            Runtime.PyGILState_Ensure();
+            lease = new Lease((IntPtr)Runtime.PyThreadState_Get(), Runtime.GetRun());
+            Interlocked.Increment(ref created);
+            return state;
+        }
+
+        /// <summary>
+        /// Called on the finalizer thread. Only hands the thread state
+        /// over to the reaper thread, without calling into Python.
+        /// </summary>
+        void OnThreadExit(Lease exited)
+        {
+            if (exited.Run != Runtime.GetRun()) return;
+
+            Interlocked.Decrement(ref count);
+            ReleaseExited(exited.ThreadState);
+        }
+
+        /// <summary>
+        /// Queues the thread state of an exited thread for destruction on the reaper thread.
+        /// </summary>
+        internal void ReleaseExited(IntPtr threadState)
+        {
+            lock (sync)
+            {
+                if (stopping) return;
+
+                exitedThreadStates.Enqueue(threadState);
+                if (reaper is null)
+                {
+                    reaper = new Thread(ReleaseExitedThreadStates)
+                    {
+                        IsBackground = true,
+                        Name = "Python thread state reaper",
+                    };
+                    reaper.Start();
+                }
+                Monitor.PulseAll(sync);
+            }
+        }
+
+        /// <summary>
+        /// Body of the reaper thread. It never uses <c>PyGILState</c>, so it can
+        /// take over thread states of exited threads, and delete them as current.
+        /// </summary>
+        unsafe void ReleaseExitedThreadStates()
+        {
+            while (true)
+            {
+                IntPtr threadState;
+                lock (sync)
+                {
+                    reaping = false;
+                    Monitor.PulseAll(sync);
+                    while (reaper == Thread.CurrentThread && exitedThreadStates.Count == 0)
+                    {
+                        Monitor.Wait(sync);
+                    }
+                    if (reaper != Thread.CurrentThread) return;
+
+                    threadState = exitedThreadStates.Dequeue();
+                    reaping = true;
+                }
+
+                // Shutdown waits while reaping, so the thread state is still alive
+                Runtime.PyEval_RestoreThread((PyThreadState*)threadState);
+                Runtime.PyThreadState_Clear((PyThreadState*)threadState);
+                // also releases the GIL
+                Runtime.PyThreadState_DeleteCurrent();
+                Interlocked.Increment(ref released);
+            }
+        }
+
+        internal static void Initialize()
+        {
+            lock (Instance.sync)
+            {
+                Instance.stopping = false;
+            }
+        }
+
+        /// <summary>
+        /// Stops the reaper thread, and forgets the kept thread states.
+        /// <c>Py_Finalize</c> destroys them. Requires the GIL.
+        /// </summary>
+        internal static void Shutdown() => Instance.Stop();
+
+        void Stop()
+        {
+            lock (sync)
+            {
+                stopping = true;
+                reaper = null;
+                exitedThreadStates.Clear();
+                Monitor.PulseAll(sync);
+                if (reaping)
+                {
+                    // the reaper needs the GIL to finish the thread state it took
+                    IntPtr threadState = PythonEngine.BeginAllowThreads();
+                    while (reaping)
+                    {
+                        Monitor.Wait(sync);
+                    }
+                    PythonEngine.EndAllowThreads(threadState);
+                }
+                Volatile.Write(ref count, 0);
+            }
+        }
+
+        /// <summary>
+        /// Owned by the [ThreadStatic] <see cref="lease"/>, so that it is
+        /// finalized after its thread exits.
+        /// </summary>
+        sealed class Lease
+        {
+            public readonly IntPtr ThreadState;
+            public readonly int Run;
+
+            public Lease(IntPtr threadState, int run)
+            {
+                ThreadState = threadState;
+                Run = run;
+            }
+
+            ~Lease()
+            {
+                Instance.OnThreadExit(this);
+            }
+        }
+    }
+
+    public sealed class ThreadStatePoolStatistics
+    {
+        internal ThreadStatePoolStatistics(int count, long created, long reused, long rejected,
+                                           long released)
+        {
+            Count = count;
+            Created = created;
+            Reused = reused;
+            Rejected = rejected;
+            Released = released;
+        }
+
+        /// <summary>Number of thread states currently kept.</summary>
+        public int Count { get; }
+        /// <summary>Number of thread states, that were kept after their creation.</summary>
+        public long Created { get; }
+        /// <summary>
+        /// Number of GIL acquisitions, that reused a kept thread state instead
+        /// of creating one. Nested acquisitions are not counted.
+        /// </summary>
+        public long Reused { get; }
+        /// <summary>Number of thread states, that were not kept, because the pool was full.</summary>
+        public long Rejected { get; }
+        /// <summary>Number of kept thread states, destroyed after their thread exited.</summary>
+        public long Released { get; }
+
+        public override string ToString()
+            => $"{Count} thread states: {Created} created, {Reused} reused, {Rejected} rejected, "
+             + $"{Released} released";
+    }
+}
@@ -29,7 +29,7 @@ namespace Python.Runtime
 
 
         private const BindingFlags tbFlags = BindingFlags.Public | BindingFlags.Static;
-        private static readonly Dictionary<MaybeType, PyType> cache = new();
+        private static readonly ConcurrentDictionary<MaybeType, PyType> cache = new();
 
         static readonly Dictionary<PyType, SlotsHolder> _slotsHolders = new(PythonReferenceComparer.Instance);
 
@@ -234,33 +234,36 @@ namespace Python.Runtime
 
         internal static void RemoveTypes()
         {
-            if (Runtime.HostedInPython)
+            lock (_slotsHolders)
             {
-                foreach (var holder in _slotsHolders)
+                if (Runtime.HostedInPython)
                 {
-                    // If refcount > 1, it needs to reset the managed slot,
-                    // otherwise it can dealloc without any trick.
-                    if (holder.Key.Refcount > 1)
+                    foreach (var holder in _slotsHolders)
                     {
-                        holder.Value.ResetSlots();
+                        // If refcount > 1, it needs to reset the managed slot,
+                        // otherwise it can dealloc without any trick.
+                        if (holder.Key.Refcount > 1)
+                        {
+                            holder.Value.ResetSlots();
+                        }
                     }
                 }
-            }
 
-            dynamicMemberAccessor.Clear();
+                dynamicMemberAccessor.Clear();
 
-            foreach (var type in cache.Values)
-            {
-                type.Dispose();
+                foreach (var type in cache.Values)
+                {
+                    type.Dispose();
+                }
+                cache.Clear();
+                _slotsHolders.Clear();
             }
-            cache.Clear();
-            _slotsHolders.Clear();
         }
 
         internal static TypeManagerState SaveRuntimeData()
             => new()
             {
-                Cache = cache,
+                Cache = new Dictionary<MaybeType, PyType>(cache),
             };
 
         internal static void RestoreRuntimeData(TypeManagerState storage)
@@ -284,7 +287,13 @@ namespace Python.Runtime
             if (!cache.TryGetValue(type, out var pyType))
             {
                 pyType = CreateType(type);
-                cache[type] = pyType;
+                if (!cache.TryAdd(type, pyType))
+                {
+                    // another thread created the same type concurrently
+                    RemoveSlotsHolder(pyType);
+                    pyType.Dispose();
+                    pyType = cache[type];
+                }
             }
             return pyType;
         }
@@ -331,6 +340,10 @@ namespace Python.Runtime
 
             type.Flags = TypeFlags.Default | TypeFlags.HasClrInstance |
                            TypeFlags.HeapType | TypeFlags.HaveGC;
+            if (impl == typeof(OperatorMethodObject))
+            {
+                type.Flags |= TypeFlags.MethodDescriptor;
+            }
 
             if (Runtime.PyType_Ready(type) != 0)
             {
@@ -859,7 +872,8 @@ namespace Python.Runtime
                     string name = method.Name;
                     if (!name.StartsWith("tp_") && !TypeOffset.IsSupportedSlotName(name))
                     {
-                        Debug.Assert(!name.Contains("_") || name.StartsWith("_") || method.IsSpecialName);
+                        Debug.Assert(!name.Contains("_") || name.StartsWith("_") || method.IsSpecialName
+                                     || method.IsDefined(typeof(ModuleFunctionAttribute), inherit: false));
                         continue;
                     }
 
@@ -945,9 +959,24 @@ namespace Python.Runtime
         {
             type = new PyType(type);
             var holder = new SlotsHolder(type);
-            _slotsHolders.Add(type, holder);
+            lock (_slotsHolders)
+            {
+                _slotsHolders.Add(type, holder);
+            }
             return holder;
         }
+
+        static void RemoveSlotsHolder(PyType type)
+        {
+            lock (_slotsHolders)
+            {
+                if (!_slotsHolders.TryGetValue(type, out var holder)) return;
+
+                _slotsHolders.Remove(type);
+                // the key is the reference held by the holder, not the one passed in
+                holder.Type.Dispose();
+            }
+        }
     }
 
 
@@ -961,7 +990,7 @@ namespace Python.Runtime
         private readonly List<Action> _deallocators = new();
         private bool _alreadyReset = false;
 
-        private readonly PyType Type;
+        internal PyType Type { get; }
 
         public string?[] Holds => _slots.Keys.Select(TypeOffset.GetSlotName).ToArray();
 
@@ -0,0 +1,80 @@
+using System;
+using System.Collections.Concurrent;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Equality and ordering of .NET objects through <see cref="IEquatable{T}"/>
+    /// and <see cref="IComparable{T}"/> of their own type, specialized once per type,
+    /// so struct operands are neither boxed nor compared field by field by
+    /// <see cref="ValueType.Equals(object)"/>.
+    /// </summary>
+    internal abstract class TypedComparer
+    {
+        static readonly ConcurrentDictionary<Type, TypedComparer?> comparers = new();
+
+        /// <summary>
+        /// Returns the comparer for objects of the exact type <paramref name="type"/>,
+        /// or <c>null</c>, if it implements neither interface for itself.
+        /// </summary>
+        public static TypedComparer? For(Type type) => comparers.GetOrAdd(type, Create);
+
+        static TypedComparer? Create(Type type)
+        {
+            if (type.ContainsGenericParameters) return null;
+
+            bool equatable = typeof(IEquatable<>).MakeGenericType(type).IsAssignableFrom(type);
+            bool comparable = typeof(IComparable<>).MakeGenericType(type).IsAssignableFrom(type);
+            if (!equatable && !comparable) return null;
+
+            var comparerType = typeof(TypedComparer<>).MakeGenericType(type);
+            return (TypedComparer)Activator.CreateInstance(comparerType, equatable, comparable);
+        }
+
+        /// <summary>
+        /// Compares <paramref name="left"/> to <paramref name="right"/> for equality.
+        /// Returns <c>false</c>, if the typed comparison does not apply to them.
+        /// </summary>
+        public abstract bool TryEquals(object left, object? right, out bool equal);
+
+        /// <summary>
+        /// Compares the order of <paramref name="left"/> and <paramref name="right"/>.
+        /// Returns <c>false</c>, if the typed comparison does not apply to them.
+        /// </summary>
+        public abstract bool TryCompare(object left, object? right, out int comparison);
+    }
+
+    internal sealed class TypedComparer<T> : TypedComparer
+    {
+        readonly bool equatable;
+        readonly bool comparable;
+
+        public TypedComparer(bool equatable, bool comparable)
+        {
+            this.equatable = equatable;
+            this.comparable = comparable;
+        }
+
+        public override bool TryEquals(object left, object? right, out bool equal)
+        {
+            if (equatable && right is T other)
+            {
+                equal = ((IEquatable<T>)left).Equals(other);
+                return true;
+            }
+            equal = false;
+            return false;
+        }
+
+        public override bool TryCompare(object left, object? right, out int comparison)
+        {
+            if (comparable && right is T other)
+            {
+                comparison = ((IComparable<T>)left).CompareTo(other);
+                return true;
+            }
+            comparison = 0;
+            return false;
+        }
+    }
+}
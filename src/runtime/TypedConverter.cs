@@ -0,0 +1,151 @@
+using System;
+
+namespace Python.Runtime
+{
+    internal delegate NewReference ToPythonDelegate<in T>(T value);
+    internal delegate bool ToManagedDelegate<T>(BorrowedReference value, out T? result, bool setError);
+
+    /// <summary>
+    /// Conversion of .NET values of a statically known type to and from Python,
+    /// specialized once per type.
+    /// </summary>
+    /// <remarks>
+    /// Primitive types and strings are converted without boxing. Other types
+    /// go through <see cref="Converter.ToPython(object, Type)"/> and
+    /// <see cref="Converter.ToManaged(BorrowedReference, Type, out object?, bool)"/>,
+    /// so the result is always the same as converting the boxed value.
+    /// </remarks>
+    internal static class TypedConverter<T>
+    {
+        public static readonly ToPythonDelegate<T> ToPython = CreateToPython();
+        public static readonly ToManagedDelegate<T> ToManaged = CreateToManaged();
+
+        static ToPythonDelegate<T> CreateToPython()
+        {
+            Type type = typeof(T);
+            Delegate? convert =
+                type == typeof(double) ? new ToPythonDelegate<double>(Runtime.PyFloat_FromDouble)
+                : type == typeof(float) ? new ToPythonDelegate<float>(v => Runtime.PyFloat_FromDouble(v))
+                : type == typeof(int) ? new ToPythonDelegate<int>(Runtime.PyInt_FromInt32)
+                : type == typeof(long) ? new ToPythonDelegate<long>(Runtime.PyLong_FromLongLong)
+                : type == typeof(short) ? new ToPythonDelegate<short>(v => Runtime.PyInt_FromInt32(v))
+                : type == typeof(sbyte) ? new ToPythonDelegate<sbyte>(v => Runtime.PyInt_FromInt32(v))
+                : type == typeof(byte) ? new ToPythonDelegate<byte>(v => Runtime.PyInt_FromInt32(v))
+                : type == typeof(ushort) ? new ToPythonDelegate<ushort>(v => Runtime.PyInt_FromInt32(v))
+                : type == typeof(uint) ? new ToPythonDelegate<uint>(v => Runtime.PyLong_FromUnsignedLongLong(v))
+                : type == typeof(ulong) ? new ToPythonDelegate<ulong>(Runtime.PyLong_FromUnsignedLongLong)
+                : type == typeof(char) ? new ToPythonDelegate<char>(v => Runtime.PyUnicode_FromOrdinal(v))
+                : type == typeof(bool) ? new ToPythonDelegate<bool>(v => new NewReference(v ? Runtime.PyTrue : Runtime.PyFalse))
+                : type == typeof(string) ? new ToPythonDelegate<string?>(v => v is null
+                    ? new NewReference(Runtime.PyNone)
+                    : Runtime.PyString_FromString(v))
+                : null;
+            return (ToPythonDelegate<T>?)convert
+                ?? (value => Converter.ToPython(value, typeof(T)));
+        }
+
+        static ToManagedDelegate<T> CreateToManaged()
+        {
+            Type type = typeof(T);
+            Delegate? convert =
+                type == typeof(double) ? new ToManagedDelegate<double>(ToDouble)
+                : type == typeof(float) ? new ToManagedDelegate<float>(ToSingle)
+                : type == typeof(long) ? new ToManagedDelegate<long>(ToInt64)
+                : type == typeof(int) ? new ToManagedDelegate<int>(ToInt32)
+                : type == typeof(bool) ? new ToManagedDelegate<bool>(ToBoolean)
+                : type == typeof(string) ? new ToManagedDelegate<string>(ToManagedString)
+                : null;
+            return (ToManagedDelegate<T>?)convert ?? ToManagedObject;
+        }
+
+        // The specialized conversions only handle exact Python ints, floats
+        // and strs, that convert successfully. Anything else, including errors,
+        // is left to the general conversion, which reports them.
+
+        static bool ToManagedObject(BorrowedReference value, out T? result, bool setError)
+        {
+            if (Converter.ToManaged(value, typeof(T), out object? converted, setError))
+            {
+                result = (T)converted!;
+                return true;
+            }
+            result = default;
+            return false;
+        }
+
+        static bool ToDouble(BorrowedReference value, out double result, bool setError)
+        {
+            if (Runtime.PyFloat_CheckExact(value) || Runtime.PyInt_CheckExact(value))
+            {
+                result = Runtime.PyFloat_AsDouble(value);
+                if (result != -1.0 || !Exceptions.ErrorOccurred()) return true;
+                Exceptions.Clear();
+            }
+            return TypedConverter<double>.ToManagedObject(value, out result, setError);
+        }
+
+        static bool ToSingle(BorrowedReference value, out float result, bool setError)
+        {
+            if (Runtime.PyFloat_CheckExact(value))
+            {
+                double num = Runtime.PyFloat_AsDouble(value);
+                if (num is >= float.MinValue and <= float.MaxValue || double.IsInfinity(num) || double.IsNaN(num))
+                {
+                    result = (float)num;
+                    return true;
+                }
+            }
+            return TypedConverter<float>.ToManagedObject(value, out result, setError);
+        }
+
+        static bool ToInt64(BorrowedReference value, out long result, bool setError)
+        {
+            if (Runtime.PyInt_CheckExact(value))
+            {
+                long? num = Runtime.PyLong_AsLongLong(value);
+                if (num is not null)
+                {
+                    result = num.Value;
+                    return true;
+                }
+                Exceptions.Clear();
+            }
+            return TypedConverter<long>.ToManagedObject(value, out result, setError);
+        }
+
+        static bool ToInt32(BorrowedReference value, out int result, bool setError)
+        {
+            if (Runtime.PyInt_CheckExact(value))
+            {
+                long? num = Runtime.PyLong_AsLongLong(value);
+                if (num is >= int.MinValue and <= int.MaxValue)
+                {
+                    result = (int)num.Value;
+                    return true;
+                }
+                Exceptions.Clear();
+            }
+            return TypedConverter<int>.ToManagedObject(value, out result, setError);
+        }
+
+        static bool ToBoolean(BorrowedReference value, out bool result, bool setError)
+        {
+            if (value == Runtime.PyTrue || value == Runtime.PyFalse)
+            {
+                result = value == Runtime.PyTrue;
+                return true;
+            }
+            return TypedConverter<bool>.ToManagedObject(value, out result, setError);
+        }
+
+        static bool ToManagedString(BorrowedReference value, out string? result, bool setError)
+        {
+            if (Runtime.PyString_CheckExact(value))
+            {
+                result = Runtime.GetManagedString(value);
+                return true;
+            }
+            return TypedConverter<string>.ToManagedObject(value, out result, setError);
+        }
+    }
+}
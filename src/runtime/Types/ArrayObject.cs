@@ -1,6 +1,7 @@
 using System;
 using System.Collections;
 using System.Collections.Generic;
+using System.Linq;
 using System.Runtime.InteropServices;
 
 namespace Python.Runtime
@@ -189,7 +190,11 @@ namespace Python.Runtime
                     return default;
                 }
 
-                value = items.GetValue(index);
+                // arrays of reference types are covariant with object[],
+                // which is indexed directly instead of through GetValue
+                value = items is object?[] references
+                    ? references[index]
+                    : items.GetValue(index);
 
                 return Converter.ToPython(value, itemType);
             }
@@ -296,7 +301,14 @@ namespace Python.Runtime
                     return -1;
                 }
 
-                items.SetValue(value, index);
+                if (items is object?[] references)
+                {
+                    references[index] = value;
+                }
+                else
+                {
+                    items.SetValue(value, index);
+                }
                 return 0;
             }
 
@@ -393,8 +405,8 @@ namespace Python.Runtime
             Type itemType = self.GetType().GetElementType();
 
             bool formatRequested = (flags & PyBUF.FORMATS) != 0;
-            string? format = GetFormat(itemType);
-            if (formatRequested && format is null)
+            IntPtr format = GetFormat(itemType);
+            if (formatRequested && format == IntPtr.Zero)
             {
                 Exceptions.SetError(Exceptions.BufferError, "unsupported element type: " + itemType.Name);
                 return -1;
@@ -506,8 +518,15 @@ namespace Python.Runtime
             [typeof(double)] = "d",
         };
 
-        static string? GetFormat(Type elementType)
-            => ItemFormats.TryGetValue(elementType, out string result) ? result : null;
+        /// <summary>
+        /// Native copies of <see cref="ItemFormats"/>, that live as long as the process,
+        /// because consumers may keep using the format of a buffer until it is released.
+        /// </summary>
+        static readonly Dictionary<Type, IntPtr> NativeItemFormats
+            = ItemFormats.ToDictionary(item => item.Key, item => Marshal.StringToHGlobalAnsi(item.Value));
+
+        static IntPtr GetFormat(Type elementType)
+            => NativeItemFormats.TryGetValue(elementType, out IntPtr result) ? result : IntPtr.Zero;
 
         static readonly GetBufferProc getBufferProc = GetBuffer;
         static readonly ReleaseBufferProc releaseBufferProc = ReleaseBuffer;
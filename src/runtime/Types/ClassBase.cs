@@ -1,5 +1,6 @@
 using System;
 using System.Collections;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.Linq;
@@ -7,6 +8,7 @@ using System.Reflection;
 using System.Runtime.InteropServices;
 using System.Runtime.Serialization;
 
+using Python.Runtime.Native;
 using Python.Runtime.Slots;
 
 namespace Python.Runtime
@@ -28,6 +30,14 @@ namespace Python.Runtime
         internal MethodBinder? del;
         internal readonly Dictionary<int, MethodObject> richcompare = new();
         internal MaybeType type;
+        /// <summary>
+        /// Members, that are added to the class __dict__ on first access.
+        /// See <see cref="InteropConfiguration.LazyMemberReflection"/>.
+        /// </summary>
+        [NonSerialized]
+        internal ConcurrentDictionary<string, Func<PyObject>>? lazyMembers;
+        [NonSerialized]
+        internal CollectionSlots? collectionSlots;
 
         internal ClassBase(Type tp)
         {
@@ -103,6 +113,10 @@ namespace Python.Runtime
             // otherwise fallback to checking if an IComparable interface is handled.
             if (cls.richcompare.TryGetValue(op, out var methodObject))
             {
+                if (methodObject.binder.TryInvokeOperator(ob, other, out var result))
+                {
+                    return result;
+                }
                 // Wrap the `other` argument of a binary comparison operator in a PyTuple.
                 using var args = Runtime.PyTuple_New(1);
                 Runtime.PyTuple_SetItem(args.Borrow(), 0, other);
@@ -138,6 +152,12 @@ namespace Python.Runtime
                     object o1 = co1.inst;
                     object o2 = co2.inst;
 
+                    if (TypedComparer.For(o1.GetType()) is { } equalityComparer
+                        && equalityComparer.TryEquals(o1, o2, out bool equal))
+                    {
+                        return new NewReference(equal ? pytrue : pyfalse);
+                    }
+
                     if (Equals(o1, o2))
                     {
                         return new NewReference(pytrue);
@@ -154,14 +174,19 @@ namespace Python.Runtime
                     {
                         return Exceptions.RaiseTypeError("Cannot get managed object");
                     }
-                    if (co1.inst is not IComparable co1Comp)
-                    {
-                        Type co1Type = co1.GetType();
-                        return Exceptions.RaiseTypeError($"Cannot convert object of type {co1Type} to IComparable");
-                    }
                     try
                     {
-                        int cmp = co1Comp.CompareTo(co2.inst);
+                        int cmp;
+                        if (TypedComparer.For(co1.inst.GetType()) is not { } typedComparer
+                            || !typedComparer.TryCompare(co1.inst, co2.inst, out cmp))
+                        {
+                            if (co1.inst is not IComparable co1Comp)
+                            {
+                                Type co1Type = co1.GetType();
+                                return Exceptions.RaiseTypeError($"Cannot convert object of type {co1Type} to IComparable");
+                            }
+                            cmp = co1Comp.CompareTo(co2.inst);
+                        }
 
                         BorrowedReference pyCmp;
                         if (cmp < 0)
@@ -235,21 +260,7 @@ namespace Python.Runtime
                 }
             }
 
-            var elemType = typeof(object);
-            var iterType = co.inst.GetType();
-            foreach (var ifc in iterType.GetInterfaces())
-            {
-                if (ifc.IsGenericType)
-                {
-                    var genTypeDef = ifc.GetGenericTypeDefinition();
-                    if (genTypeDef == typeof(IEnumerable<>) || genTypeDef == typeof(IEnumerator<>))
-                    {
-                        elemType = ifc.GetGenericArguments()[0];
-                        break;
-                    }
-                }
-            }
-
+            var elemType = Iterator.GetElementType(co.inst.GetType());
             return new Iterator(o, elemType).Alloc();
         }
 
@@ -432,6 +443,11 @@ namespace Python.Runtime
                 return default;
             }
 
+            if (cls.collectionSlots is { } slots && slots.TryGetItem(ob, idx, out var item))
+            {
+                return item;
+            }
+
             // Arg may be a tuple in the case of an indexer with multiple
             // parameters. If so, use it directly, else make a new tuple
             // with the index arg (method binders expect arg tuples).
@@ -472,6 +488,11 @@ namespace Python.Runtime
                 return DelImpl(ob, idx, cls);
             }
 
+            if (cls.collectionSlots is { } slots && slots.TrySetItem(ob, idx, v, out int status))
+            {
+                return status;
+            }
+
             if (!Runtime.PyTuple_Check(idx))
             {
                 argsTuple = Runtime.PyTuple_New(1);
@@ -603,10 +624,218 @@ namespace Python.Runtime
             => type.GetMethods(BindingFlags.Public | BindingFlags.Instance)
                 .Where(m => m.Name == "__call__");
 
+        /// <summary>
+        /// tp_getattro of classes with lazily reflected members:
+        /// reflects the member, if it is not found.
+        /// </summary>
+        internal static NewReference tp_getattro_lazy(BorrowedReference ob, BorrowedReference key)
+        {
+            var attr = Runtime.PyObject_GenericGetAttr(ob, key);
+            if (attr.IsNull() && ReflectLazyMember(Runtime.PyObject_TYPE(ob), key))
+            {
+                return Runtime.PyObject_GenericGetAttr(ob, key);
+            }
+            return attr;
+        }
+
+        /// <summary>
+        /// tp_setattro of classes with lazily reflected members: reflects the
+        /// member first, so that the value is not stored in the instance __dict__.
+        /// </summary>
+        static int tp_setattro_lazy(BorrowedReference ob, BorrowedReference key, BorrowedReference val)
+        {
+            if (Runtime.PyString_Check(key))
+            {
+                BorrowedReference type = Runtime.PyObject_TYPE(ob);
+                string name = Runtime.GetManagedString(key)!;
+                try
+                {
+                    if (HasLazyMember(type, name)) ReflectLazyMember(type, name);
+                }
+                catch (Exception e)
+                {
+                    Exceptions.SetError(e);
+                    return -1;
+                }
+            }
+            return Runtime.PyObject_GenericSetAttr(ob, key, val);
+        }
+
+        /// <summary>
+        /// Called after looking up <paramref name="key"/> failed. Reflects the member
+        /// with that name of the first class in the MRO of <paramref name="type"/>,
+        /// that did not reflect it yet, and clears the AttributeError, if there was one.
+        /// </summary>
+        internal static bool ReflectLazyMember(BorrowedReference type, BorrowedReference key)
+        {
+            if (!Runtime.PyString_Check(key)
+                || Runtime.PyErr_ExceptionMatches(Exceptions.AttributeError) == 0)
+            {
+                return false;
+            }
+
+            string name = Runtime.GetManagedString(key)!;
+            if (!HasLazyMember(type, name)) return false;
+
+            Runtime.PyErr_Clear();
+            try
+            {
+                return ReflectLazyMember(type, name);
+            }
+            catch (Exception e)
+            {
+                Exceptions.SetError(e);
+                return false;
+            }
+        }
+
+        static bool HasLazyMember(BorrowedReference type, string name)
+        {
+            BorrowedReference mro = Util.ReadRef(type, TypeOffset.tp_mro);
+            nint count = Runtime.PyTuple_Size(mro);
+            for (nint i = 0; i < count; i++)
+            {
+                if (GetManagedObject(Runtime.PyTuple_GetItem(mro, i)) is ClassBase { lazyMembers: { } lazy }
+                    && lazy.ContainsKey(name))
+                {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        internal static bool ReflectLazyMember(BorrowedReference type, string name)
+        {
+            BorrowedReference mro = Util.ReadRef(type, TypeOffset.tp_mro);
+            nint count = Runtime.PyTuple_Size(mro);
+            for (nint i = 0; i < count; i++)
+            {
+                BorrowedReference item = Runtime.PyTuple_GetItem(mro, i);
+                if (GetManagedObject(item) is ClassBase cb && cb.TryReflectLazyMember(item, name))
+                {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Reflects all members of the classes in the MRO of <paramref name="type"/>,
+        /// e.g. before it is subclassed in Python, where <c>super()</c> only looks
+        /// at the __dict__ of each class.
+        /// </summary>
+        internal static void ReflectAllLazyMembers(BorrowedReference type)
+        {
+            BorrowedReference mro = Util.ReadRef(type, TypeOffset.tp_mro);
+            nint count = Runtime.PyTuple_Size(mro);
+            for (nint i = 0; i < count; i++)
+            {
+                BorrowedReference item = Runtime.PyTuple_GetItem(mro, i);
+                if (GetManagedObject(item) is ClassBase { lazyMembers: { } lazy } cb)
+                {
+                    foreach (string name in lazy.Keys)
+                    {
+                        cb.TryReflectLazyMember(item, name);
+                    }
+                }
+            }
+        }
+
+        bool TryReflectLazyMember(BorrowedReference pyType, string name)
+        {
+            if (lazyMembers is null || !lazyMembers.TryGetValue(name, out var member))
+            {
+                return false;
+            }
+
+            ClassManager.AddLazyMember(this, pyType, name, member);
+            lazyMembers.TryRemove(name, out _);
+            // otherwise this member would hide members of derived classes with the same name
+            ReflectInSubclasses(pyType, name);
+            return true;
+        }
+
+        static void ReflectInSubclasses(BorrowedReference pyType, string name)
+        {
+            using var method = Runtime.PyObject_GetAttrString(pyType, "__subclasses__");
+            using var subclasses = Runtime.PyObject_CallObject(method.BorrowOrThrow(), null);
+            BorrowedReference list = subclasses.BorrowOrThrow();
+            nint count = Runtime.PyList_Size(list);
+            for (nint i = 0; i < count; i++)
+            {
+                BorrowedReference subclass = Runtime.PyList_GetItem(list, i);
+                if (GetManagedObject(subclass) is ClassBase { lazyMembers: { } lazy } cb
+                    && lazy.TryGetValue(name, out var member))
+                {
+                    ClassManager.AddLazyMember(cb, subclass, name, member);
+                    lazy.TryRemove(name, out _);
+                }
+                ReflectInSubclasses(subclass, name);
+            }
+        }
+
+        /// <summary>
+        /// Returns the result of <paramref name="dir"/> for <paramref name="ob"/>,
+        /// including members of the classes in the MRO of <paramref name="type"/>,
+        /// that are not reflected yet.
+        /// </summary>
+        internal static NewReference DirWithLazyMembers(BorrowedReference dir, BorrowedReference ob, BorrowedReference type)
+        {
+            using var args = Runtime.PyTuple_New(1);
+            Runtime.PyTuple_SetItem(args.Borrow(), 0, new NewReference(ob).Steal());
+            using var names = Runtime.PyObject_Call(dir, args.Borrow(), null);
+            if (names.IsNull()) return default;
+            using var result = Runtime.PySequence_List(names.Borrow());
+            if (result.IsNull()) return default;
+
+            var seen = new HashSet<string>();
+            BorrowedReference mro = Util.ReadRef(type, TypeOffset.tp_mro);
+            nint count = Runtime.PyTuple_Size(mro);
+            for (nint i = 0; i < count; i++)
+            {
+                if (GetManagedObject(Runtime.PyTuple_GetItem(mro, i)) is not ClassBase { lazyMembers: { } lazy })
+                {
+                    continue;
+                }
+                foreach (string name in lazy.Keys)
+                {
+                    if (!seen.Add(name)) continue;
+                    using var pyName = Runtime.PyString_FromString(name);
+                    if (Runtime.PyList_Append(result.Borrow(), pyName.Borrow()) != 0) return default;
+                }
+            }
+            return result.Move();
+        }
+
+        static NativeMethod? lazyDir;
+
+        /// <summary>
+        /// Adds <c>__dir__</c> to the __dict__ of a class with lazily reflected members,
+        /// that lists the members, that are not reflected yet.
+        /// </summary>
+        internal static void AddLazyDir(BorrowedReference dict)
+        {
+            lazyDir ??= new NativeMethod("__dir__", new Interop.BB_N(LazyDir), PyMethodFlags.O);
+            lazyDir.AddTo(dict);
+        }
+
+        static NewReference LazyDir(BorrowedReference _, BorrowedReference ob)
+        {
+            using var dir = Runtime.PyObject_GetAttrString(Runtime.PyBaseObjectType, "__dir__");
+            if (dir.IsNull()) return default;
+            return DirWithLazyMembers(dir.Borrow(), ob, Runtime.PyObject_TYPE(ob));
+        }
+
         public virtual void InitializeSlots(BorrowedReference pyType, SlotsHolder slotsHolder)
         {
             if (!this.type.Valid) return;
 
+            if (lazyMembers is not null)
+            {
+                TypeManager.InitializeSlotIfEmpty(pyType, TypeOffset.tp_getattro, new Interop.BB_N(tp_getattro_lazy), slotsHolder);
+                TypeManager.InitializeSlotIfEmpty(pyType, TypeOffset.tp_setattro, new Interop.BBB_I32(tp_setattro_lazy), slotsHolder);
+            }
+
             if (GetCallImplementations(this.type.Value).Any())
             {
                 TypeManager.InitializeSlotIfEmpty(pyType, TypeOffset.tp_call, new Interop.BBB_N(tp_call_impl), slotsHolder);
@@ -630,6 +859,8 @@ namespace Python.Runtime
                 TypeManager.InitializeSlotIfEmpty(pyType, TypeOffset.tp_iter, new Interop.B_N(tp_iter_impl), slotsHolder);
             }
 
+            collectionSlots?.InitializeSlots(pyType, slotsHolder);
+
             if (MpLengthSlot.CanAssign(type.Value))
             {
                 TypeManager.InitializeSlotIfEmpty(pyType, TypeOffset.mp_length, new Interop.B_P(MpLengthSlot.impl), slotsHolder);
@@ -950,7 +950,7 @@ namespace Python.Runtime
             if (selfRef.Ref == null)
             {
                 // this might happen when the object is created from .NET
-                using var _ = Py.GIL();
+                using var _ = Py.EnterGIL();
                 // In the end we decrement the python object's reference count.
                 // This doesn't actually destroy the object, it just sets the reference to this object
                 // to be a weak reference and it will be destroyed when the C# object is destroyed.
@@ -173,6 +173,207 @@ namespace Python.Runtime
             return names;
         }
 
+        /// <summary>
+        /// Start recording call counts and timings of CLR members invoked from Python.
+        /// See <see cref="InteropProfiler"/>.
+        /// </summary>
+        [ModuleFunction]
+        public static void enable_profiling()
+        {
+            InteropProfiler.Instance.Enable = true;
+        }
+
+        [ModuleFunction]
+        public static void disable_profiling()
+        {
+            InteropProfiler.Instance.Enable = false;
+        }
+
+        [ModuleFunction]
+        public static void reset_profiling()
+        {
+            InteropProfiler.Instance.Reset();
+        }
+
+        /// <summary>
+        /// Get the statistics recorded by the profiler as a dict, that maps
+        /// CLR member names to dicts of counters and times (in seconds).
+        /// </summary>
+        [ModuleFunction]
+        [ForbidPythonThreads]
+        public static PyDict get_profiling_stats()
+        {
+            var result = new PyDict();
+            foreach (var stats in InteropProfiler.Instance.GetSnapshot())
+            {
+                using var entry = new PyDict();
+                SetItem(entry, "calls", stats.Calls);
+                SetItem(entry, "bind_failures", stats.BindFailures);
+                SetItem(entry, "exceptions_translated", stats.ExceptionsTranslated);
+                SetItem(entry, "bind_time", stats.BindTime.TotalSeconds);
+                SetItem(entry, "argument_conversion_time", stats.ArgumentConversionTime.TotalSeconds);
+                SetItem(entry, "invocation_time", stats.InvocationTime.TotalSeconds);
+                SetItem(entry, "result_conversion_time", stats.ResultConversionTime.TotalSeconds);
+                SetItem(entry, "total_time", stats.TotalTime.TotalSeconds);
+                result[stats.Member] = entry;
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Start recording the allocation sites of every
+        /// <paramref name="sample_rate"/>-th PyObject wrapper created in .NET.
+        /// See <see cref="Finalizer.LeakTrackingSampleRate"/>.
+        /// </summary>
+        [ModuleFunction]
+        public static void enable_leak_tracking(int sample_rate = 64)
+        {
+            if (sample_rate < 1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(sample_rate), "must be a positive number");
+            }
+            Finalizer.Instance.LeakTrackingSampleRate = sample_rate;
+        }
+
+        [ModuleFunction]
+        public static void disable_leak_tracking()
+        {
+            Finalizer.Instance.LeakTrackingSampleRate = 0;
+        }
+
+        [ModuleFunction]
+        public static void reset_leak_tracking()
+        {
+            Finalizer.Instance.ResetLeakTracking();
+        }
+
+        /// <summary>
+        /// Get the wrappers recorded by leak tracking as a list of dicts with
+        /// the allocation site, Python type, and counts of live, disposed and
+        /// finalized wrappers, with the most live wrappers first.
+        /// </summary>
+        [ModuleFunction]
+        [ForbidPythonThreads]
+        public static PyList leak_report()
+        {
+            var result = new PyList();
+            foreach (var stats in Finalizer.Instance.GetLiveObjectReport())
+            {
+                using var entry = new PyDict();
+                SetItem(entry, "site", stats.Site);
+                SetItem(entry, "type", stats.PythonType);
+                SetItem(entry, "live", stats.Live);
+                SetItem(entry, "disposed", stats.Disposed);
+                SetItem(entry, "finalized", stats.Finalized);
+                result.Append(entry);
+            }
+            return result;
+        }
+
+        static void SetItem(PyDict dict, string key, object value)
+        {
+            using var pyValue = value.ToPython();
+            dict[key] = pyValue;
+        }
+
+        /// <summary>
+        /// Write the statistics recorded by the profiler to a speedscope file.
+        /// </summary>
+        [ModuleFunction]
+        public static void export_profile(string path)
+        {
+            InteropProfiler.Instance.ExportSpeedscope(path);
+        }
+
+        /// <summary>
+        /// Call a .NET method once for every item of <paramref name="iterable"/>
+        /// on the thread pool, with the GIL released, and return a list of the
+        /// results in the order of the items. Tuple items are unpacked into
+        /// positional arguments. Exceptions thrown by the calls are raised
+        /// together as a System.AggregateException.
+        /// </summary>
+        /// <param name="method">A static method, or a method bound to an instance.</param>
+        /// <param name="iterable">The arguments for each call.</param>
+        /// <param name="max_degree">Maximum number of concurrent calls, or -1 for no limit.</param>
+        [ModuleFunction]
+        [ForbidPythonThreads]
+        public static PyObject parallel_map(PyObject method, PyObject iterable, int max_degree = -1)
+        {
+            if (max_degree == 0 || max_degree < -1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(max_degree), "must be -1 or a positive number");
+            }
+
+            MethodObject m;
+            PyObject? target;
+            MethodBase? info = null;
+            switch (ManagedType.GetManagedObject(method))
+            {
+                case MethodBinding binding when binding.target is not null || binding.m.IsStatic():
+                    m = binding.m;
+                    target = binding.target;
+                    info = binding.info.UnsafeValue;
+                    break;
+                case MethodObject methodObject when methodObject.IsStatic():
+                    m = methodObject;
+                    target = null;
+                    break;
+                default:
+                    throw new ArgumentException("expected a static or bound .NET method", nameof(method));
+            }
+
+            using var argTuples = new PyList();
+            using (var iterator = iterable.GetIterator())
+            {
+                foreach (PyObject item in iterator)
+                {
+                    using (item)
+                    {
+                        if (PyTuple.IsTupleType(item))
+                        {
+                            argTuples.Append(item);
+                        }
+                        else
+                        {
+                            using var args = new PyTuple(new[] { item });
+                            argTuples.Append(args);
+                        }
+                    }
+                }
+            }
+
+            var results = m.binder.InvokeParallel(target is null ? BorrowedReference.Null : target,
+                                                  argTuples, info, m.info, max_degree);
+            if (results.IsNull()) throw PythonException.ThrowLastAsClrException();
+            return results.MoveToPyObject();
+        }
+
+        /// <summary>
+        /// Convert a .NET collection (any IEnumerable) to a new Python list,
+        /// converting the items in bulk.
+        /// </summary>
+        [ModuleFunction]
+        [ForbidPythonThreads]
+        public static PyObject to_pylist(object collection)
+        {
+            var result = CollectionConverter.ToPyList(collection);
+            if (result.IsNull()) throw PythonException.ThrowLastAsClrException();
+            return result.MoveToPyObject();
+        }
+
+        /// <summary>
+        /// Convert a .NET dictionary to a new Python dict, converting the
+        /// keys and values in bulk.
+        /// </summary>
+        [ModuleFunction]
+        [ForbidPythonThreads]
+        public static PyObject to_pydict(object dictionary)
+        {
+            var result = CollectionConverter.ToPyDict(dictionary);
+            if (result.IsNull()) throw PythonException.ThrowLastAsClrException();
+            return result.MoveToPyObject();
+        }
+
         /// <summary>
         /// Note: This should *not* be called directly.
         /// The function that get/import a CLR assembly as a python module.
@@ -14,7 +14,7 @@ namespace Python.Runtime
         internal static bool creationBlocked = false;
 
         // "borrowed" references
-        internal static readonly HashSet<IntPtr> reflectedObjects = new();
+        internal static readonly ConcurrentSet<IntPtr> reflectedObjects = new();
         static NewReference Create(object ob, BorrowedReference tp)
         {
             if (creationBlocked)
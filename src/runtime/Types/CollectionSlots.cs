@@ -0,0 +1,591 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+
+using Python.Runtime.Native;
+
+namespace Python.Runtime.Slots
+{
+    /// <summary>
+    /// Native __len__, __contains__, items() and get() for .NET collections
+    /// and dictionaries, instead of the Python implementations in the
+    /// collection mixins, that call reflected members.
+    /// </summary>
+    /// <remarks>
+    /// One instance is created per reflected type, specialized for the
+    /// element (or key and value) types of its collection interface,
+    /// so items are converted without reflection or binding.
+    /// </remarks>
+    internal abstract class CollectionSlots
+    {
+        /// <summary>
+        /// Returns the collection slots for <paramref name="type"/>,
+        /// or <c>null</c>, if it is not a supported collection.
+        /// </summary>
+        /// <param name="type">The reflected type.</param>
+        /// <param name="indexer">The indexer of the reflected type, if any.
+        /// Item access bypasses it, when it only implements the indexer of
+        /// the collection interface.</param>
+        public static CollectionSlots? For(Type type, Indexer? indexer)
+        {
+            if (type.ContainsGenericParameters) return null;
+
+            var slots = Create(type, out Type? iface);
+            if (slots is not null && iface is not null)
+            {
+                slots.BindIndexer(type, iface, indexer);
+            }
+            return slots;
+        }
+
+        static CollectionSlots? Create(Type type, out Type? iface)
+        {
+            iface = FindGenericInterface(type, typeof(IDictionary<,>));
+            if (iface is not null)
+            {
+                return Create(typeof(DictionarySlots<,>), iface);
+            }
+            iface = FindGenericInterface(type, typeof(IReadOnlyDictionary<,>));
+            if (iface is not null)
+            {
+                return Create(typeof(ReadOnlyDictionarySlots<,>), iface);
+            }
+            iface = FindGenericInterface(type, typeof(IList<>));
+            if (iface is not null)
+            {
+                return Create(typeof(GenericListSlots<>), iface);
+            }
+            iface = FindGenericInterface(type, typeof(ICollection<>));
+            if (iface is not null)
+            {
+                return Create(typeof(GenericCollectionSlots<>), iface);
+            }
+            if (typeof(IList).IsAssignableFrom(type))
+            {
+                iface = typeof(IList);
+                return new ListSlots();
+            }
+            iface = FindGenericInterface(type, typeof(IReadOnlyList<>));
+            if (iface is not null)
+            {
+                return Create(typeof(ReadOnlyListSlots<>), iface);
+            }
+            iface = FindGenericInterface(type, typeof(IReadOnlyCollection<>));
+            if (iface is not null)
+            {
+                return Create(typeof(ReadOnlyCollectionSlots<>), iface);
+            }
+            return null;
+        }
+
+        static CollectionSlots Create(Type definition, Type iface)
+            => (CollectionSlots)Activator.CreateInstance(definition.MakeGenericType(iface.GetGenericArguments()));
+
+        static Type? FindGenericInterface(Type type, Type definition)
+        {
+            if (type.IsInterface && type.IsGenericType && type.GetGenericTypeDefinition() == definition)
+            {
+                return type;
+            }
+            return type.GetInterfaces()
+                .FirstOrDefault(i => i.IsGenericType && i.GetGenericTypeDefinition() == definition);
+        }
+
+        /// <summary>
+        /// Whether <see cref="TryGetItem"/> and <see cref="TrySetItem"/>
+        /// call the interface indexer directly.
+        /// </summary>
+        bool getsItems, setsItems;
+
+        /// <summary>
+        /// Only use the interface indexer, if every overload of the reflected
+        /// indexer implements it (or its read-only counterpart, that is often
+        /// the public one). Other indexers go through the binder.
+        /// </summary>
+        void BindIndexer(Type type, Type iface, Indexer? indexer)
+        {
+            if (indexer is null || IndexType is not { } indexType || type.IsArray) return;
+
+            var interfaces = new List<Type> { iface };
+            if (iface.IsGenericType
+                && readOnlyInterfaces.TryGetValue(iface.GetGenericTypeDefinition(), out var readOnlyDefinition))
+            {
+                var readOnly = readOnlyDefinition.MakeGenericType(iface.GetGenericArguments());
+                if (readOnly.IsAssignableFrom(type)) interfaces.Add(readOnly);
+            }
+            MethodInfo[]? implementations = type.IsInterface
+                ? null
+                : interfaces.SelectMany(i => type.GetInterfaceMap(i).TargetMethods).ToArray();
+            bool ImplementsInterface(MethodBinder binder, int parameterCount)
+                => binder.GetMethods().All(method =>
+                    method.GetParameters() is { } parameters
+                    && parameters.Length == parameterCount
+                    && parameters[0].ParameterType == indexType
+                    && (implementations is null
+                        ? interfaces.Contains(method.DeclaringType)
+                        : implementations.Any(impl => impl.MethodHandle.Equals(method.MethodHandle))));
+
+            getsItems = indexer.CanGet && ImplementsInterface(indexer.GetterBinder, 1);
+            setsItems = CanSetItems && indexer.CanSet && ImplementsInterface(indexer.SetterBinder, 2);
+        }
+
+        static readonly Dictionary<Type, Type> readOnlyInterfaces = new()
+        {
+            [typeof(IList<>)] = typeof(IReadOnlyList<>),
+            [typeof(IDictionary<,>)] = typeof(IReadOnlyDictionary<,>),
+        };
+
+        protected abstract int Count(object collection);
+
+        /// <summary>
+        /// Whether <see cref="Contains"/> is implemented.
+        /// </summary>
+        protected virtual bool HasContains => false;
+
+        protected virtual bool Contains(object collection, BorrowedReference item) => throw new NotSupportedException();
+
+        /// <summary>
+        /// Whether <see cref="Items"/> and <see cref="Get"/> are implemented.
+        /// </summary>
+        protected virtual bool IsMapping => false;
+
+        protected virtual NewReference Items(object dictionary) => throw new NotSupportedException();
+
+        protected virtual NewReference Get(object dictionary, BorrowedReference key, BorrowedReference @default)
+            => throw new NotSupportedException();
+
+        /// <summary>
+        /// The type of the index (or key) of the interface indexer,
+        /// if <see cref="GetItem"/> is implemented.
+        /// </summary>
+        protected virtual Type? IndexType => null;
+
+        /// <summary>
+        /// Whether <see cref="SetItem"/> is implemented.
+        /// </summary>
+        protected virtual bool CanSetItems => false;
+
+        /// <summary>
+        /// Gets an item using the interface indexer.
+        /// Returns <c>false</c>, if the key can not be converted.
+        /// </summary>
+        protected virtual bool GetItem(object collection, BorrowedReference key, out NewReference item)
+            => throw new NotSupportedException();
+
+        /// <summary>
+        /// Sets an item using the interface indexer.
+        /// Returns <c>false</c>, if the key or the value can not be converted.
+        /// </summary>
+        protected virtual bool SetItem(object collection, BorrowedReference key, BorrowedReference value)
+            => throw new NotSupportedException();
+
+        /// <summary>
+        /// Implements <c>ob[key]</c> using the interface indexer.
+        /// Returns <c>false</c>, if the reflected indexer has to be bound instead.
+        /// </summary>
+        public bool TryGetItem(BorrowedReference ob, BorrowedReference key, out NewReference item)
+        {
+            item = default;
+            // tuples are the arguments of indexers with multiple parameters
+            if (!getsItems || Runtime.PyTuple_Check(key)
+                || (ManagedType.GetManagedObject(ob) as CLRObject)?.inst is not { } collection)
+            {
+                return false;
+            }
+            try
+            {
+                return GetItem(collection, key, out item);
+            }
+            catch (Exception e)
+            {
+                Exceptions.SetError(e);
+                return true;
+            }
+        }
+
+        /// <summary>
+        /// Implements <c>ob[key] = value</c> using the interface indexer.
+        /// Returns <c>false</c>, if the reflected indexer has to be bound instead.
+        /// </summary>
+        public bool TrySetItem(BorrowedReference ob, BorrowedReference key, BorrowedReference value, out int result)
+        {
+            result = 0;
+            if (!setsItems || Runtime.PyTuple_Check(key)
+                || (ManagedType.GetManagedObject(ob) as CLRObject)?.inst is not { } collection)
+            {
+                return false;
+            }
+            try
+            {
+                return SetItem(collection, key, value);
+            }
+            catch (Exception e)
+            {
+                Exceptions.SetError(e);
+                result = -1;
+                return true;
+            }
+        }
+
+        public void InitializeSlots(BorrowedReference pyType, SlotsHolder slotsHolder)
+        {
+            TypeManager.InitializeSlotIfEmpty(pyType, TypeOffset.mp_length, new Interop.B_P(mp_length), slotsHolder);
+            if (HasContains)
+            {
+                TypeManager.InitializeSlotIfEmpty(pyType, TypeOffset.sq_contains, new Interop.BB_I32(sq_contains), slotsHolder);
+            }
+        }
+
+        /// <summary>
+        /// Adds items() and get() to the __dict__ of a reflected dictionary type,
+        /// unless it already has members with these names.
+        /// </summary>
+        public void AddMethods(BorrowedReference dict)
+        {
+            if (!IsMapping) return;
+
+            AddMethod(dict, itemsMethod);
+            AddMethod(dict, getMethod);
+        }
+
+        static void AddMethod(BorrowedReference dict, NativeMethod method)
+        {
+            if (Runtime.PyDict_GetItemString(dict, method.Name).IsNull)
+            {
+                method.AddTo(dict);
+            }
+        }
+
+        static readonly NativeMethod itemsMethod = new("items", new Interop.BB_N(items), PyMethodFlags.O);
+        static readonly NativeMethod getMethod = new("get", new Interop.BB_N(get), PyMethodFlags.VarArgs);
+
+        static CollectionSlots? GetSlots(BorrowedReference ob, out object? collection)
+        {
+            collection = (ManagedType.GetManagedObject(ob) as CLRObject)?.inst;
+            // Python subclasses inherit the slots of their reflected base
+            for (var type = Runtime.PyObject_TYPE(ob); type != null; type = Util.ReadRef(type, TypeOffset.tp_base))
+            {
+                if (ManagedType.GetManagedObject(type) is ClassBase { collectionSlots: { } slots })
+                {
+                    return slots;
+                }
+            }
+            return null;
+        }
+
+        static nint mp_length(BorrowedReference ob)
+        {
+            if (GetSlots(ob, out var collection) is not { } slots || collection is null)
+            {
+                Exceptions.RaiseTypeError("invalid object");
+                return -1;
+            }
+            try
+            {
+                return slots.Count(collection);
+            }
+            catch (Exception e)
+            {
+                Exceptions.SetError(e);
+                return -1;
+            }
+        }
+
+        static int sq_contains(BorrowedReference ob, BorrowedReference item)
+        {
+            if (GetSlots(ob, out var collection) is not { } slots || collection is null)
+            {
+                Exceptions.RaiseTypeError("invalid object");
+                return -1;
+            }
+            try
+            {
+                return slots.Contains(collection, item) ? 1 : 0;
+            }
+            catch (Exception e)
+            {
+                Exceptions.SetError(e);
+                return -1;
+            }
+        }
+
+        static NewReference items(BorrowedReference _, BorrowedReference ob)
+        {
+            if (GetSlots(ob, out var collection) is not { IsMapping: true } slots || collection is null)
+            {
+                return Exceptions.RaiseTypeError("invalid object");
+            }
+            try
+            {
+                return slots.Items(collection);
+            }
+            catch (Exception e)
+            {
+                Exceptions.SetError(e);
+                return default;
+            }
+        }
+
+        static NewReference get(BorrowedReference _, BorrowedReference args)
+        {
+            nint argCount = Runtime.PyTuple_Size(args);
+            if (argCount is < 2 or > 3)
+            {
+                return Exceptions.RaiseTypeError($"get expected 1 or 2 arguments, got {argCount - 1}");
+            }
+            BorrowedReference ob = Runtime.PyTuple_GetItem(args, 0);
+            if (GetSlots(ob, out var collection) is not { IsMapping: true } slots || collection is null)
+            {
+                return Exceptions.RaiseTypeError("invalid object");
+            }
+            BorrowedReference @default = argCount == 3 ? Runtime.PyTuple_GetItem(args, 2) : Runtime.PyNone;
+            try
+            {
+                return slots.Get(collection, Runtime.PyTuple_GetItem(args, 1), @default);
+            }
+            catch (Exception e)
+            {
+                Exceptions.SetError(e);
+                return default;
+            }
+        }
+
+        /// <summary>
+        /// Converts <paramref name="value"/> to <typeparamref name="T"/>.
+        /// Values, that can not be converted, are not in the collection.
+        /// </summary>
+        protected static bool TryConvert<T>(BorrowedReference value, out T converted)
+        {
+            if (typeof(T) == typeof(string) && Runtime.PyString_CheckExact(value))
+            {
+                converted = (T)(object)Runtime.GetManagedString(value)!;
+                return true;
+            }
+            if (Converter.ToManaged(value, typeof(T), out object? result, setError: false))
+            {
+                converted = (T)result!;
+                return true;
+            }
+            if (Exceptions.ErrorOccurred()) Runtime.PyErr_Clear();
+            converted = default!;
+            return false;
+        }
+
+        /// <summary>
+        /// Converts key-value pairs to a new Python list of tuples.
+        /// </summary>
+        protected static NewReference ItemList<TKey, TValue>(IEnumerable<KeyValuePair<TKey, TValue>> pairs, int count)
+        {
+            using var list = Runtime.PyList_New(count);
+            if (list.IsNull()) return default;
+            int i = 0;
+            foreach (var pair in pairs)
+            {
+                using var item = Runtime.PyTuple_New(2);
+                if (item.IsNull()) return default;
+                using var key = TypedConverter<TKey>.ToPython(pair.Key);
+                if (key.IsNull()) return default;
+                Runtime.PyTuple_SetItem(item.Borrow(), 0, key.Steal());
+                using var value = TypedConverter<TValue>.ToPython(pair.Value);
+                if (value.IsNull()) return default;
+                Runtime.PyTuple_SetItem(item.Borrow(), 1, value.Steal());
+
+                if (i < count)
+                {
+                    Runtime.PyList_SetItem(list.Borrow(), i, item.Steal());
+                }
+                else if (Runtime.PyList_Append(list.Borrow(), item.Borrow()) != 0)
+                {
+                    return default;
+                }
+                i++;
+            }
+            if (i < count)
+            {
+                // the dictionary shrank while being enumerated
+                if (Runtime.PyList_SetSlice(list.Borrow(), i, count, BorrowedReference.Null) != 0)
+                {
+                    return default;
+                }
+            }
+            return list.Move();
+        }
+
+        protected static NewReference GetValue<TKey, TValue>(BorrowedReference key, BorrowedReference @default,
+                                                             TryGetValue<TKey, TValue> tryGetValue)
+        {
+            if (TryConvert(key, out TKey clrKey) && clrKey is not null
+                && tryGetValue(clrKey, out TValue value))
+            {
+                return TypedConverter<TValue>.ToPython(value);
+            }
+            return new NewReference(@default);
+        }
+
+        protected delegate bool TryGetValue<TKey, TValue>(TKey key, out TValue value);
+
+        class GenericCollectionSlots<T> : CollectionSlots
+        {
+            protected override int Count(object collection) => ((ICollection<T>)collection).Count;
+
+            protected override bool HasContains => true;
+
+            protected override bool Contains(object collection, BorrowedReference item)
+                => TryConvert(item, out T value) && ((ICollection<T>)collection).Contains(value);
+        }
+
+        sealed class GenericListSlots<T> : GenericCollectionSlots<T>
+        {
+            protected override Type IndexType => typeof(int);
+            protected override bool CanSetItems => true;
+
+            protected override bool GetItem(object list, BorrowedReference index, out NewReference item)
+            {
+                if (!TryConvert(index, out int i))
+                {
+                    item = default;
+                    return false;
+                }
+                item = TypedConverter<T>.ToPython(((IList<T>)list)[i]);
+                return true;
+            }
+
+            protected override bool SetItem(object list, BorrowedReference index, BorrowedReference value)
+            {
+                if (!TryConvert(index, out int i) || !TryConvert(value, out T item)) return false;
+                ((IList<T>)list)[i] = item;
+                return true;
+            }
+        }
+
+        class ReadOnlyCollectionSlots<T> : CollectionSlots
+        {
+            protected override int Count(object collection) => ((IReadOnlyCollection<T>)collection).Count;
+        }
+
+        sealed class ReadOnlyListSlots<T> : ReadOnlyCollectionSlots<T>
+        {
+            protected override Type IndexType => typeof(int);
+
+            protected override bool GetItem(object list, BorrowedReference index, out NewReference item)
+            {
+                if (!TryConvert(index, out int i))
+                {
+                    item = default;
+                    return false;
+                }
+                item = TypedConverter<T>.ToPython(((IReadOnlyList<T>)list)[i]);
+                return true;
+            }
+        }
+
+        sealed class ListSlots : CollectionSlots
+        {
+            protected override int Count(object collection) => ((ICollection)collection).Count;
+
+            protected override bool HasContains => true;
+
+            protected override bool Contains(object collection, BorrowedReference item)
+                => TryConvert(item, out object? value) && ((IList)collection).Contains(value);
+
+            protected override Type IndexType => typeof(int);
+            protected override bool CanSetItems => true;
+
+            protected override bool GetItem(object list, BorrowedReference index, out NewReference item)
+            {
+                if (!TryConvert(index, out int i))
+                {
+                    item = default;
+                    return false;
+                }
+                item = Converter.ToPython(((IList)list)[i], typeof(object));
+                return true;
+            }
+
+            protected override bool SetItem(object list, BorrowedReference index, BorrowedReference value)
+            {
+                if (!TryConvert(index, out int i) || !TryConvert(value, out object? item)) return false;
+                ((IList)list)[i] = item;
+                return true;
+            }
+        }
+
+        sealed class DictionarySlots<TKey, TValue> : CollectionSlots
+        {
+            protected override bool IsMapping => true;
+            protected override bool HasContains => true;
+
+            protected override int Count(object dictionary) => ((IDictionary<TKey, TValue>)dictionary).Count;
+
+            protected override bool Contains(object dictionary, BorrowedReference key)
+                => TryConvert(key, out TKey clrKey) && clrKey is not null
+                   && ((IDictionary<TKey, TValue>)dictionary).ContainsKey(clrKey);
+
+            protected override NewReference Items(object dictionary)
+            {
+                var pairs = (IDictionary<TKey, TValue>)dictionary;
+                return ItemList(pairs, pairs.Count);
+            }
+
+            protected override NewReference Get(object dictionary, BorrowedReference key, BorrowedReference @default)
+                => GetValue<TKey, TValue>(key, @default, ((IDictionary<TKey, TValue>)dictionary).TryGetValue);
+
+            protected override Type IndexType => typeof(TKey);
+            protected override bool CanSetItems => true;
+
+            protected override bool GetItem(object dictionary, BorrowedReference key, out NewReference item)
+            {
+                if (!TryConvert(key, out TKey clrKey))
+                {
+                    item = default;
+                    return false;
+                }
+                item = TypedConverter<TValue>.ToPython(((IDictionary<TKey, TValue>)dictionary)[clrKey]);
+                return true;
+            }
+
+            protected override bool SetItem(object dictionary, BorrowedReference key, BorrowedReference value)
+            {
+                if (!TryConvert(key, out TKey clrKey) || !TryConvert(value, out TValue clrValue)) return false;
+                ((IDictionary<TKey, TValue>)dictionary)[clrKey] = clrValue;
+                return true;
+            }
+        }
+
+        sealed class ReadOnlyDictionarySlots<TKey, TValue> : CollectionSlots
+        {
+            protected override bool IsMapping => true;
+            protected override bool HasContains => true;
+
+            protected override int Count(object dictionary) => ((IReadOnlyDictionary<TKey, TValue>)dictionary).Count;
+
+            protected override bool Contains(object dictionary, BorrowedReference key)
+                => TryConvert(key, out TKey clrKey) && clrKey is not null
+                   && ((IReadOnlyDictionary<TKey, TValue>)dictionary).ContainsKey(clrKey);
+
+            protected override NewReference Items(object dictionary)
+            {
+                var pairs = (IReadOnlyDictionary<TKey, TValue>)dictionary;
+                return ItemList(pairs, pairs.Count);
+            }
+
+            protected override NewReference Get(object dictionary, BorrowedReference key, BorrowedReference @default)
+                => GetValue<TKey, TValue>(key, @default, ((IReadOnlyDictionary<TKey, TValue>)dictionary).TryGetValue);
+
+            protected override Type IndexType => typeof(TKey);
+
+            protected override bool GetItem(object dictionary, BorrowedReference key, out NewReference item)
+            {
+                if (!TryConvert(key, out TKey clrKey))
+                {
+                    item = default;
+                    return false;
+                }
+                item = TypedConverter<TValue>.ToPython(((IReadOnlyDictionary<TKey, TValue>)dictionary)[clrKey]);
+                return true;
+            }
+        }
+    }
+}
@@ -43,7 +43,7 @@ namespace Python.Runtime
         public PyObject AllocObject() => new(Alloc().Steal());
 
         // "borrowed" references
-        internal static readonly HashSet<IntPtr> loadedExtensions = new();
+        internal static readonly ConcurrentSet<IntPtr> loadedExtensions = new();
         void SetupGc (BorrowedReference ob, BorrowedReference tp)
         {
             GCHandle gc = GCHandle.Alloc(this);
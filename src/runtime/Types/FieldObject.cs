@@ -11,6 +11,10 @@ namespace Python.Runtime
     internal class FieldObject : ExtensionType
     {
         private MaybeFieldInfo info;
+        [NonSerialized]
+        private MemberAccessor? accessor;
+        [NonSerialized]
+        private int accesses;
 
         public FieldObject(FieldInfo info)
         {
@@ -50,6 +54,10 @@ namespace Python.Runtime
                 }
                 try
                 {
+                    if (self.GetAccessor() is { } staticAccessor)
+                    {
+                        return staticAccessor.GetValue(null);
+                    }
                     result = info.GetValue(null);
                     return Converter.ToPython(result, info.FieldType);
                 }
@@ -68,6 +76,10 @@ namespace Python.Runtime
                     Exceptions.SetError(Exceptions.TypeError, "instance is not a clr object");
                     return default;
                 }
+                if (self.GetAccessor() is { } accessor)
+                {
+                    return accessor.GetValue(co.inst);
+                }
                 result = info.GetValue(co.inst);
                 return Converter.ToPython(result, info.FieldType);
             }
@@ -129,6 +141,7 @@ namespace Python.Runtime
 
             try
             {
+                var accessor = self.GetAccessor();
                 if (!is_static)
                 {
                     var co = (CLRObject?)GetManagedObject(ob);
@@ -137,7 +150,18 @@ namespace Python.Runtime
                         Exceptions.SetError(Exceptions.TypeError, "instance is not a clr object");
                         return -1;
                     }
-                    info.SetValue(co.inst, newval);
+                    if (accessor is { CanSet: true })
+                    {
+                        accessor.SetValue(co.inst, newval);
+                    }
+                    else
+                    {
+                        info.SetValue(co.inst, newval);
+                    }
+                }
+                else if (accessor is { CanSet: true })
+                {
+                    accessor.SetValue(null, newval);
                 }
                 else
                 {
@@ -152,6 +176,13 @@ namespace Python.Runtime
             }
         }
 
+        /// <summary>
+        /// Returns the compiled accessor of the field, once it has been
+        /// accessed often enough to be worth compiling.
+        /// </summary>
+        MemberAccessor? GetAccessor()
+            => MemberAccessor.GetOrCompile(ref accessor, ref accesses, info.Value, null, null);
+
         /// <summary>
         /// Descriptor __repr__ implementation.
         /// </summary>
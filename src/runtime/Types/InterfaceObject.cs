@@ -115,7 +115,7 @@ namespace Python.Runtime
                 return CLRObject.GetReference(clrObj.inst);
             }
 
-            return Runtime.PyObject_GenericGetAttr(ob, key);
+            return tp_getattro_lazy(ob, key);
         }
 
         protected override void OnDeserialization(object sender)
@@ -1,5 +1,8 @@
 using System;
 using System.Collections;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Reflection;
 
 namespace Python.Runtime
 {
@@ -9,15 +12,61 @@ namespace Python.Runtime
     /// </summary>
     internal class Iterator : ExtensionType
     {
+        delegate NewReference CurrentToPython(IEnumerator iter);
+
+        static readonly ConcurrentDictionary<Type, Type> elementTypes = new();
+        static readonly ConcurrentDictionary<Type, (Type Enumerator, CurrentToPython Convert)> typedConverters = new();
+        static readonly MethodInfo typedCurrent = typeof(Iterator)
+            .GetMethod(nameof(TypedCurrent), BindingFlags.Static | BindingFlags.NonPublic)!;
+
         private readonly IEnumerator iter;
         private readonly Type elemType;
+        private readonly CurrentToPython? convertCurrent;
 
         public Iterator(IEnumerator e, Type elemType)
         {
             iter = e;
             this.elemType = elemType;
+            if (elemType != typeof(object))
+            {
+                var typed = typedConverters.GetOrAdd(elemType, CreateTypedConverter);
+                // IEnumerable<T> implementations might return a non-generic enumerator
+                if (typed.Enumerator.IsInstanceOfType(e))
+                {
+                    convertCurrent = typed.Convert;
+                }
+            }
         }
 
+        /// <summary>
+        /// Returns the item type of an IEnumerable or IEnumerator type.
+        /// </summary>
+        internal static Type GetElementType(Type type)
+            => elementTypes.GetOrAdd(type, FindElementType);
+
+        static Type FindElementType(Type type)
+        {
+            foreach (var ifc in type.GetInterfaces())
+            {
+                if (ifc.IsGenericType)
+                {
+                    var genTypeDef = ifc.GetGenericTypeDefinition();
+                    if (genTypeDef == typeof(IEnumerable<>) || genTypeDef == typeof(IEnumerator<>))
+                    {
+                        return ifc.GetGenericArguments()[0];
+                    }
+                }
+            }
+            return typeof(object);
+        }
+
+        static (Type, CurrentToPython) CreateTypedConverter(Type elemType)
+            => (typeof(IEnumerator<>).MakeGenericType(elemType),
+                (CurrentToPython)Delegate.CreateDelegate(typeof(CurrentToPython),
+                                                         typedCurrent.MakeGenericMethod(elemType)));
+
+        static NewReference TypedCurrent<T>(IEnumerator iter)
+            => TypedConverter<T>.ToPython(((IEnumerator<T>)iter).Current);
 
         /// <summary>
         /// Implements support for the Python iteration protocol.
@@ -32,6 +81,10 @@ namespace Python.Runtime
                     Exceptions.SetError(Exceptions.StopIteration, Runtime.PyNone);
                     return default;
                 }
+                if (self.convertCurrent is not null)
+                {
+                    return self.convertCurrent(self.iter);
+                }
             }
             catch (Exception e)
             {
@@ -28,6 +28,7 @@ namespace Python.Runtime
         {
             "__instancecheck__",
             "__subclasscheck__",
+            "__dir__",
         };
 
         /// <summary>
@@ -36,6 +37,7 @@ namespace Python.Runtime
         public static PyType Initialize()
         {
             PyCLRMetaType = TypeManager.CreateMetaType(typeof(MetaType), out _metaSlotsHodler);
+            InitializeLazyMemberSlot();
 
             // Retrieve the offset of the type's dictionary from PyType_Type for
             // use in the tp_setattro implementation.
@@ -75,6 +77,7 @@ namespace Python.Runtime
             PyCLRMetaType = storage.CLRMetaType;
             _metaSlotsHodler = new SlotsHolder(PyCLRMetaType);
             TypeManager.InitializeSlots(PyCLRMetaType, typeof(MetaType), _metaSlotsHodler);
+            InitializeLazyMemberSlot();
 
             IntPtr mdef = Util.ReadIntPtr(PyCLRMetaType, TypeOffset.tp_methods);
             foreach (var methodName in CustomMethods)
@@ -87,6 +90,31 @@ namespace Python.Runtime
             return PyCLRMetaType;
         }
 
+        static void InitializeLazyMemberSlot()
+        {
+            if (!ClassManager.ReflectMembersLazily) return;
+
+            typeGetAttr = Util.ReadIntPtr(Runtime.PyTypeType, TypeOffset.tp_getattro);
+            TypeManager.InitializeSlot(PyCLRMetaType, TypeOffset.tp_getattro, new Interop.BB_N(tp_getattro_lazy), _metaSlotsHodler);
+            Runtime.PyType_Modified(PyCLRMetaType);
+        }
+
+        static IntPtr typeGetAttr;
+
+        /// <summary>
+        /// Type __getattribute__ implementation for reflected types with lazily
+        /// reflected members: reflects static members on first access.
+        /// </summary>
+        static NewReference tp_getattro_lazy(BorrowedReference tp, BorrowedReference name)
+        {
+            var attr = NativeCall.Call_2(typeGetAttr, tp, name);
+            if (attr.IsNull() && ClassBase.ReflectLazyMember(tp, name))
+            {
+                return NativeCall.Call_2(typeGetAttr, tp, name);
+            }
+            return attr;
+        }
+
         /// <summary>
         /// Metatype __new__ implementation. This is called to create a new
         /// class / type when a reflected class is subclassed.
@@ -178,6 +206,14 @@ namespace Python.Runtime
                 return Exceptions.RaiseTypeError($"Underlying C# Base class {cb.type} has been deleted");
             }
 
+            if (ClassManager.ReflectMembersLazily)
+            {
+                for (nint i = 0; i < baseClassCount; i++)
+                {
+                    ClassBase.ReflectAllLazyMembers(Runtime.PyTuple_GetItem(bases, i));
+                }
+            }
+
             BorrowedReference slots = Runtime.PyDict_GetItem(dict, PyIdentifier.__slots__);
             if (slots != null)
             {
@@ -287,6 +323,20 @@ namespace Python.Runtime
         /// </summary>
         public static int tp_setattro(BorrowedReference tp, BorrowedReference name, BorrowedReference value)
         {
+            if (ClassManager.ReflectMembersLazily && Runtime.PyString_Check(name))
+            {
+                // static fields and properties are set through their descriptors
+                try
+                {
+                    ClassBase.ReflectLazyMember(tp, Runtime.GetManagedString(name)!);
+                }
+                catch (Exception e)
+                {
+                    Exceptions.SetError(e);
+                    return -1;
+                }
+            }
+
             BorrowedReference descr = Runtime._PyType_Lookup(tp, name);
 
             if (descr != null)
@@ -427,5 +477,16 @@ namespace Python.Runtime
         {
             return DoInstanceCheck(tp, args, true);
         }
+
+        /// <summary>
+        /// Lists the attributes of a reflected type, including members,
+        /// that are not reflected yet.
+        /// </summary>
+        public static NewReference __dir__(BorrowedReference tp, BorrowedReference args)
+        {
+            using var dir = Runtime.PyObject_GetAttrString(Runtime.PyTypeType, "__dir__");
+            if (dir.IsNull()) return default;
+            return ClassBase.DirWithLazyMembers(dir.Borrow(), tp, tp);
+        }
     }
 }
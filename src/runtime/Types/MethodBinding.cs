@@ -41,17 +41,12 @@ namespace Python.Runtime
                 return Exceptions.RaiseTypeError("type(s) expected");
             }
 
-            MethodBase[] overloads = self.m.IsInstanceConstructor
-                ? self.m.type.Value.GetConstructor(types) is { } ctor
-                    ? new[] { ctor }
-                    : Array.Empty<MethodBase>()
-                : MethodBinder.MatchParameters(self.m.info, types);
-            if (overloads.Length == 0)
+            MethodObject? overloaded = self.m.WithTypeArguments(types);
+            if (overloaded is null)
             {
                 return Exceptions.RaiseTypeError("No match found for given type params");
             }
 
-            MethodObject overloaded = self.m.WithOverloads(overloads);
             var mb = new MethodBinding(overloaded, self.target?.NewReference(), self.targetType.NewReference());
             return mb.Alloc();
         }
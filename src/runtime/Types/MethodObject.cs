@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Linq;
 using System.Reflection;
@@ -26,6 +27,12 @@ namespace Python.Runtime
         internal bool is_static = false;
         internal PyString? doc;
         internal MaybeType type;
+        /// <summary>
+        /// Overloads selected by subscripting the method with type arguments,
+        /// e.g. <c>obj.Method[int]</c>.
+        /// </summary>
+        [NonSerialized]
+        private ConcurrentDictionary<Type[], MethodObject?>? genericOverloads;
 
         public MethodObject(MaybeType type, string name, MethodBase[] info, bool allow_threads, bool argsReversed = false)
         {
@@ -55,6 +62,28 @@ namespace Python.Runtime
         public MethodObject WithOverloads(MethodBase[] overloads)
             => new(type, name, overloads, allow_threads: binder.allow_threads);
 
+        /// <summary>
+        /// Returns the method object for the overloads matching <paramref name="typeArguments"/>,
+        /// or <c>null</c> if there are none. The results are cached, so that repeated
+        /// subscript expressions reuse the same binder.
+        /// </summary>
+        internal MethodObject? WithTypeArguments(Type[] typeArguments)
+        {
+            genericOverloads ??= new ConcurrentDictionary<Type[], MethodObject?>(TypeArrayComparer.Instance);
+            if (genericOverloads.TryGetValue(typeArguments, out var overloaded))
+            {
+                return overloaded;
+            }
+
+            MethodBase[] overloads = IsInstanceConstructor
+                ? type.Value.GetConstructor(typeArguments) is { } ctor
+                    ? new[] { ctor }
+                    : Array.Empty<MethodBase>()
+                : MethodBinder.MatchParameters(info, typeArguments);
+            overloaded = overloads.Length == 0 ? null : WithOverloads(overloads);
+            return genericOverloads.GetOrAdd(typeArguments, overloaded);
+        }
+
         internal MethodBase[] info
         {
             get
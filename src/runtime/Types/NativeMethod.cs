@@ -0,0 +1,41 @@
+using System;
+using System.Runtime.InteropServices;
+
+using Python.Runtime.Native;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// A method implemented by a .NET delegate, that can be added to the
+    /// __dict__ of reflected types. Like methods defined in Python, it
+    /// receives the instance as its first argument.
+    /// </summary>
+    /// <remarks>
+    /// The method definition and the thunk live until the process exits.
+    /// </remarks>
+    internal sealed class NativeMethod
+    {
+        readonly ThunkInfo thunk;
+        readonly IntPtr methodDef;
+
+        public NativeMethod(string name, Delegate impl, PyMethodFlags flags)
+        {
+            Name = name;
+            thunk = Interop.GetThunk(impl);
+            methodDef = Marshal.AllocHGlobal(Marshal.SizeOf<PyMethodDef>());
+            TypeManager.WriteMethodDef(methodDef, name, thunk.Address, flags);
+        }
+
+        public string Name { get; }
+
+        public void AddTo(BorrowedReference dict)
+        {
+            using var func = Runtime.PyCFunction_NewEx(methodDef, null, null);
+            using var method = Runtime.PyInstanceMethod_New(func.BorrowOrThrow());
+            if (Runtime.PyDict_SetItemString(dict, Name, method.BorrowOrThrow()) != 0)
+            {
+                throw PythonException.ThrowLastAsClrException();
+            }
+        }
+    }
+}
@@ -0,0 +1,48 @@
+using System;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// The special method (e.g. <c>__add__</c>), that implements a Python operator
+    /// for the operator overloads of a reflected type.
+    /// </summary>
+    /// <remarks>
+    /// Its type is a method descriptor, so the operator slots of the interpreter,
+    /// and method calls on instances, call it with the instance as the first
+    /// argument, instead of binding it to the instance first.
+    /// </remarks>
+    [Serializable]
+    internal class OperatorMethodObject : MethodObject
+    {
+        public OperatorMethodObject(MaybeType type, string name, MethodBase[] info, bool argsReversed = false)
+            : base(type, name, info, argsReversed)
+        {
+        }
+
+        /// <summary>
+        /// __call__ implementation, that takes the instance as the first argument.
+        /// </summary>
+        public static NewReference tp_call(BorrowedReference ob, BorrowedReference args, BorrowedReference kw)
+        {
+            var self = (OperatorMethodObject)GetManagedObject(ob)!;
+
+            nint argCount = Runtime.PyTuple_Size(args);
+            if (argCount < 1)
+            {
+                return Exceptions.RaiseTypeError($"{self.name} takes the instance as the first argument");
+            }
+            BorrowedReference inst = Runtime.PyTuple_GetItem(args, 0);
+
+            if (kw.IsNull && argCount <= 2
+                && self.binder.TryInvokeOperator(inst, argCount == 2 ? Runtime.PyTuple_GetItem(args, 1) : BorrowedReference.Null,
+                                                 out var result))
+            {
+                return result;
+            }
+
+            using var boundArgs = Runtime.PyTuple_GetSlice(args, 1, argCount);
+            return self.Invoke(inst, boundArgs.Borrow(), kw);
+        }
+    }
+}
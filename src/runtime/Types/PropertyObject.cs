@@ -1,6 +1,5 @@
 using System;
 using System.Reflection;
-using System.Runtime.Serialization;
 
 namespace Python.Runtime
 {
@@ -9,13 +8,19 @@ namespace Python.Runtime
     /// Implements a Python descriptor type that manages CLR properties.
     /// </summary>
     [Serializable]
-    internal class PropertyObject : ExtensionType, IDeserializationCallback
+    internal class PropertyObject : ExtensionType
     {
         internal MaybeMemberInfo<PropertyInfo> info;
         [NonSerialized]
         private MethodInfo? getter;
         [NonSerialized]
         private MethodInfo? setter;
+        [NonSerialized]
+        private bool accessorsCached;
+        [NonSerialized]
+        private MemberAccessor? accessor;
+        [NonSerialized]
+        private int accesses;
 
         public PropertyObject(PropertyInfo md)
         {
@@ -28,6 +33,18 @@ namespace Python.Runtime
             PropertyInfo md = info.Value;
             getter = md.GetGetMethod(true) ?? md.GetBaseGetMethod(true);
             setter = md.GetSetMethod(true) ?? md.GetBaseSetMethod(true);
+            accessorsCached = true;
+        }
+
+        /// <summary>
+        /// Valid property with its accessors cached. After a domain reload,
+        /// the property is only looked up when it is first used.
+        /// </summary>
+        bool EnsureValid()
+        {
+            if (!info.Valid) return false;
+            if (!accessorsCached) CacheAccessors();
+            return true;
         }
 
 
@@ -39,7 +56,7 @@ namespace Python.Runtime
         public static NewReference tp_descr_get(BorrowedReference ds, BorrowedReference ob, BorrowedReference tp)
         {
             var self = (PropertyObject)GetManagedObject(ds)!;
-            if (!self.info.Valid)
+            if (!self.EnsureValid())
             {
                 return Exceptions.RaiseTypeError(self.info.DeletedMessage);
             }
@@ -62,6 +79,10 @@ namespace Python.Runtime
 
                 try
                 {
+                    if (self.GetAccessor() is { } staticAccessor)
+                    {
+                        return staticAccessor.GetValue(null);
+                    }
                     result = info.GetValue(null, null);
                     return Converter.ToPython(result, info.PropertyType);
                 }
@@ -77,11 +98,22 @@ namespace Python.Runtime
                 return Exceptions.RaiseTypeError("invalid target");
             }
 
+            var accessor = self.GetAccessor();
             try
             {
+                if (accessor is not null)
+                {
+                    return accessor.GetValue(co.inst);
+                }
                 result = getter.Invoke(co.inst, Array.Empty<object>());
                 return Converter.ToPython(result, info.PropertyType);
             }
+            catch (Exception e) when (accessor is not null)
+            {
+                // compiled accessors do not wrap exceptions
+                Exceptions.SetError(e);
+                return default;
+            }
             catch (Exception e)
             {
                 if (e.InnerException != null)
@@ -102,7 +134,7 @@ namespace Python.Runtime
         public static int tp_descr_set(BorrowedReference ds, BorrowedReference ob, BorrowedReference val)
         {
             var self = (PropertyObject)GetManagedObject(ds)!;
-            if (!self.info.Valid)
+            if (!self.EnsureValid())
             {
                 Exceptions.RaiseTypeError(self.info.DeletedMessage);
                 return -1;
@@ -140,6 +172,11 @@ namespace Python.Runtime
                 }
             }
 
+            var accessor = self.GetAccessor();
+            if (accessor is { CanSet: false })
+            {
+                accessor = null;
+            }
             try
             {
                 if (!is_static)
@@ -150,7 +187,18 @@ namespace Python.Runtime
                         Exceptions.RaiseTypeError("invalid target");
                         return -1;
                     }
-                    setter.Invoke(co.inst, new object?[] { newval });
+                    if (accessor is not null)
+                    {
+                        accessor.SetValue(co.inst, newval);
+                    }
+                    else
+                    {
+                        setter.Invoke(co.inst, new object?[] { newval });
+                    }
+                }
+                else if (accessor is not null)
+                {
+                    accessor.SetValue(null, newval);
                 }
                 else
                 {
@@ -158,6 +206,11 @@ namespace Python.Runtime
                 }
                 return 0;
             }
+            catch (Exception e) when (accessor is not null)
+            {
+                Exceptions.SetError(e);
+                return -1;
+            }
             catch (Exception e)
             {
                 if (e.InnerException != null)
@@ -170,6 +223,14 @@ namespace Python.Runtime
         }
 
 
+        /// <summary>
+        /// Returns the compiled accessor of the property, once it has been
+        /// accessed often enough to be worth compiling.
+        /// </summary>
+        MemberAccessor? GetAccessor()
+            => MemberAccessor.GetOrCompile(ref accessor, ref accesses, info.Value, getter, setter);
+
+
         /// <summary>
         /// Descriptor __repr__ implementation.
         /// </summary>
@@ -178,13 +239,5 @@ namespace Python.Runtime
             var self = (PropertyObject)GetManagedObject(ob)!;
             return Runtime.PyString_FromString($"<property '{self.info}'>");
         }
-
-        void IDeserializationCallback.OnDeserialization(object sender)
-        {
-            if (info.Valid)
-            {
-                CacheAccessors();
-            }
-        }
     }
 }
@@ -1,7 +1,9 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.Runtime.Serialization;
+using System.Threading;
 
 using static Python.Runtime.PythonException;
 
@@ -21,22 +23,80 @@ internal sealed class ReflectedClrType : PyType
     /// Get the Python type that reflects the given CLR type.
     /// </summary>
     /// <remarks>
-    /// Returned <see cref="ReflectedClrType"/> might be partially initialized.
+    /// Returned <see cref="ReflectedClrType"/> might be partially initialized,
+    /// when it is requested again by the thread, that is initializing it.
+    /// Other threads wait until the initialization completes.
     /// </remarks>
     public static ReflectedClrType GetOrCreate(Type type)
     {
         if (ClassManager.cache.TryGetValue(type, out var pyType))
         {
+            if (initializing.TryGetValue(type, out int thread)
+                && thread != Environment.CurrentManagedThreadId)
+            {
+                // the initializing thread holds the lock until it is done
+                EnterInitialization();
+                Monitor.Exit(initializationLock);
+            }
             return pyType;
         }
 
+        EnterInitialization();
+        try
+        {
+            if (ClassManager.cache.TryGetValue(type, out pyType))
+            {
+                // created by another thread while this one was waiting
+                return pyType;
+            }
+            initializing[type] = Environment.CurrentManagedThreadId;
+            return Create(type);
+        }
+        finally
+        {
+            initializing.TryRemove(type, out _);
+            Monitor.Exit(initializationLock);
+        }
+    }
+
+    // The lock is global on purpose. Reflecting a type reflects the types of
+    // its members and bases, and they can refer back to it. With a lock per
+    // type, two threads starting from different types of such a cycle would
+    // each hold one lock and wait for the other. A single lock can not
+    // deadlock this way, and it is only taken the first time each type is
+    // reflected: afterwards GetOrCreate returns the cached type without
+    // locking, unless the type is still being initialized.
+    static readonly object initializationLock = new();
+    // types published in ClassManager.cache before their initialization
+    // completed, and the threads initializing them
+    static readonly ConcurrentDictionary<Type, int> initializing = new();
+
+    static void EnterInitialization()
+    {
+        if (Monitor.TryEnter(initializationLock)) return;
+
+        // the thread holding the lock needs the GIL to complete
+        IntPtr threadState = PythonEngine.BeginAllowThreads();
+        try
+        {
+            Monitor.Enter(initializationLock);
+        }
+        finally
+        {
+            PythonEngine.EndAllowThreads(threadState);
+        }
+    }
+
+    static ReflectedClrType Create(Type type)
+    {
+        ReflectedClrType pyType;
         try
         {
             // Ensure, that matching Python type exists first.
             // It is required for self-referential classes
             // (e.g. with members, that refer to the same class)
             pyType = AllocateClass(type);
-            ClassManager.cache.Add(type, pyType);
+            ClassManager.cache[type] = pyType;
 
             var impl = ClassManager.CreateClass(type);
 
@@ -0,0 +1,28 @@
+using System.Collections;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+
+namespace Python.Runtime;
+
+/// <summary>
+/// A minimal thread-safe replacement for <see cref="HashSet{T}"/>.
+/// Enumeration is a moment-in-time snapshot, and does not block writers.
+/// </summary>
+internal sealed class ConcurrentSet<T> : IEnumerable<T> where T : notnull
+{
+    readonly ConcurrentDictionary<T, byte> items = new();
+
+    public int Count => items.Count;
+
+    public bool Add(T item) => items.TryAdd(item, 0);
+
+    public bool Remove(T item) => items.TryRemove(item, out _);
+
+    public bool Contains(T item) => items.ContainsKey(item);
+
+    public void Clear() => items.Clear();
+
+    public IEnumerator<T> GetEnumerator() => items.Keys.GetEnumerator();
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+}
@@ -1,5 +1,7 @@
 using System;
 using System.Collections.Generic;
+using System.Linq;
+using System.Linq.Expressions;
 using System.Reflection;
 using System.Runtime.Serialization;
 using System.Security.Permissions;
@@ -10,14 +12,31 @@ namespace Python.Runtime;
 internal class EventHandlerCollection: Dictionary<object, List<Handler>>
 {
     readonly EventInfo info;
+    [NonSerialized]
+    bool? canMulticast;
+    [NonSerialized]
+    EventAccessor? add;
+    [NonSerialized]
+    EventAccessor? remove;
     public EventHandlerCollection(EventInfo @event)
     {
         info = @event;
     }
 
+    /// <summary>
+    /// Whether handlers of an instance share one delegate. Not serialized,
+    /// so it is computed again after a domain reload.
+    /// </summary>
+    bool CanMulticast => canMulticast ??= Dispatcher.CanMulticast(info.EventHandlerType);
+
     /// <summary>
     /// Register a new Python object event handler with the event.
     /// </summary>
+    /// <remarks>
+    /// Events, whose handlers return nothing and have no by-ref parameters,
+    /// get a single delegate per instance, that calls all Python handlers
+    /// of that instance, see <see cref="DelegateManager.GetMulticastDelegate"/>.
+    /// </remarks>
     internal bool AddEventHandler(BorrowedReference target, PyObject handler)
     {
         object? obj = null;
@@ -27,28 +46,54 @@ internal class EventHandlerCollection: Dictionary<object, List<Handler>>
             obj = co.inst;
         }
 
-        // Create a true delegate instance of the appropriate type to
-        // wrap the Python handler. Note that wrapper delegate creation
-        // always succeeds, though calling the wrapper may fail.
-        Type type = info.EventHandlerType;
-        Delegate d = PythonEngine.DelegateManager.GetDelegate(type, handler);
+        nint hash = Runtime.PyObject_Hash(handler);
+        if (hash == -1 && Exceptions.ErrorOccurred())
+        {
+            return false;
+        }
 
         // Now register the handler in a mapping from instance to pairs
         // of (handler hash, delegate) so we can lookup to remove later.
         object key = obj ?? info.ReflectedType;
-        if (!TryGetValue(key, out var list))
+        TryGetValue(key, out var list);
+
+        Type type = info.EventHandlerType;
+        if (CanMulticast && list is { Count: > 0 })
         {
-            list = new List<Handler>();
-            this[key] = list;
+            Delegate shared = list[0].del;
+            var dispatcher = (Dispatcher)shared.Target;
+            dispatcher.multicastTargets = dispatcher.multicastTargets!.Append(handler).ToArray();
+            list.Add(new Handler(hash, shared));
+            return true;
         }
-        list.Add(new Handler(Runtime.PyObject_Hash(handler), d));
+
+        // Create a true delegate instance of the appropriate type to
+        // wrap the Python handler. Note that wrapper delegate creation
+        // always succeeds, though calling the wrapper may fail.
+        Delegate d = CanMulticast
+            ? PythonEngine.DelegateManager.GetMulticastDelegate(type, handler)
+            : PythonEngine.DelegateManager.GetDelegate(type, handler);
 
         // Note that AddEventHandler helper only works for public events,
         // so we have to get the underlying add method explicitly.
-        object[] args = { d };
-        MethodInfo mi = info.GetAddMethod(true);
-        mi.Invoke(obj, BindingFlags.Default, null, args, null);
+        // The handler is only recorded once the accessor succeeded.
+        try
+        {
+            InvokeAccessor(ref add, info.GetAddMethod(true), obj, d);
+        }
+        catch (Exception e)
+        {
+            // reflection wraps exceptions, compiled accessors do not
+            Exceptions.SetError(e is TargetInvocationException { InnerException: { } inner } ? inner : e);
+            return false;
+        }
 
+        if (list is null)
+        {
+            list = new List<Handler>();
+            this[key] = list;
+        }
+        list.Add(new Handler(hash, d));
         return true;
     }
 
@@ -79,9 +124,6 @@ internal class EventHandlerCollection: Dictionary<object, List<Handler>>
             return false;
         }
 
-        object?[] args = { null };
-        MethodInfo mi = info.GetRemoveMethod(true);
-
         for (var i = 0; i < list.Count; i++)
         {
             var item = (Handler)list[i];
@@ -89,10 +131,22 @@ internal class EventHandlerCollection: Dictionary<object, List<Handler>>
             {
                 continue;
             }
-            args[0] = item.del;
+
+            if (CanMulticast && list.Count > 1)
+            {
+                // the delegate stays registered for the remaining handlers,
+                // that are in the same order in the multicast targets
+                var dispatcher = (Dispatcher)item.del.Target;
+                var targets = dispatcher.multicastTargets!.ToList();
+                targets.RemoveAt(i);
+                dispatcher.multicastTargets = targets.ToArray();
+                list.RemoveAt(i);
+                return true;
+            }
+
             try
             {
-                mi.Invoke(obj, BindingFlags.Default, null, args, null);
+                InvokeAccessor(ref remove, info.GetRemoveMethod(true), obj, item.del);
             }
             catch
             {
@@ -110,6 +164,59 @@ internal class EventHandlerCollection: Dictionary<object, List<Handler>>
         return false;
     }
 
+    /// <summary>
+    /// Calls the add or remove accessor of the event, through reflection
+    /// at first, and through a compiled delegate, once the accessor was
+    /// called <see cref="MemberAccessor.CompileThreshold"/> times.
+    /// </summary>
+    static void InvokeAccessor(ref EventAccessor? accessor, MethodInfo method, object? obj, Delegate handler)
+    {
+        accessor ??= new EventAccessor(method);
+        accessor.Invoke(obj, handler);
+    }
+
+    sealed class EventAccessor
+    {
+        readonly MethodInfo method;
+        Action<object?, Delegate>? compiled;
+        int calls;
+
+        public EventAccessor(MethodInfo method)
+        {
+            this.method = method;
+        }
+
+        public void Invoke(object? obj, Delegate handler)
+        {
+            if (compiled is null && ++calls >= MemberAccessor.CompileThreshold)
+            {
+                compiled = Compile(method);
+            }
+
+            if (compiled is not null)
+            {
+                compiled(obj, handler);
+            }
+            else
+            {
+                method.Invoke(obj, BindingFlags.Default, null, new object[] { handler }, null);
+            }
+        }
+
+        static Action<object?, Delegate> Compile(MethodInfo method)
+        {
+            var target = Expression.Parameter(typeof(object), "target");
+            var handler = Expression.Parameter(typeof(Delegate), "handler");
+            Type declaringType = method.DeclaringType!;
+            Expression? instance = method.IsStatic ? null
+                : declaringType.IsValueType ? Expression.Unbox(target, declaringType)
+                : Expression.Convert(target, declaringType);
+            Type handlerType = method.GetParameters()[0].ParameterType;
+            var call = Expression.Call(instance, method, Expression.Convert(handler, handlerType));
+            return Expression.Lambda<Action<object?, Delegate>>(call, target, handler).Compile();
+        }
+    }
+
     #region Serializable
     [SecurityPermission(SecurityAction.Demand, SerializationFormatter = true)]
     protected EventHandlerCollection(SerializationInfo info, StreamingContext context)
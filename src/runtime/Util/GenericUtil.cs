@@ -15,10 +15,18 @@ namespace Python.Runtime
         /// Maps namespace -> generic base name -> list of generic type names
         /// </summary>
         private static Dictionary<string, Dictionary<string, List<string>>> mapping = new();
+        /// <summary>
+        /// Guards <see cref="mapping"/>. Assemblies can be loaded (and their
+        /// generic types registered) from any thread, whether it holds the GIL or not.
+        /// </summary>
+        private static readonly object mappingLock = new();
 
         public static void Reset()
         {
-            mapping = new Dictionary<string, Dictionary<string, List<string>>>();
+            lock (mappingLock)
+            {
+                mapping = new Dictionary<string, Dictionary<string, List<string>>>();
+            }
         }
 
         /// <summary>
@@ -32,18 +40,21 @@ namespace Python.Runtime
                 return;
             }
 
-            if (!mapping.TryGetValue(t.Namespace, out var nsmap))
-            {
-                nsmap = new Dictionary<string, List<string>>();
-                mapping[t.Namespace] = nsmap;
-            }
             string basename = GetBasename(t.Name);
-            if (!nsmap.TryGetValue(basename, out var gnames))
+            lock (mappingLock)
             {
-                gnames = new List<string>();
-                nsmap[basename] = gnames;
+                if (!mapping.TryGetValue(t.Namespace, out var nsmap))
+                {
+                    nsmap = new Dictionary<string, List<string>>();
+                    mapping[t.Namespace] = nsmap;
+                }
+                if (!nsmap.TryGetValue(basename, out var gnames))
+                {
+                    gnames = new List<string>();
+                    nsmap[basename] = gnames;
+                }
+                gnames.Add(t.Name);
             }
-            gnames.Add(t.Name);
         }
 
         /// <summary>
@@ -51,9 +62,12 @@ namespace Python.Runtime
         /// </summary>
         public static List<string>? GetGenericBaseNames(string ns)
         {
-            if (mapping.TryGetValue(ns, out var nsmap))
+            lock (mappingLock)
             {
-                return nsmap.Keys.ToList();
+                if (mapping.TryGetValue(ns, out var nsmap))
+                {
+                    return nsmap.Keys.ToList();
+                }
             }
             return null;
         }
@@ -71,19 +85,24 @@ namespace Python.Runtime
         /// </summary>
         public static Type? GenericByName(string ns, string basename, int paramCount)
         {
-            if (mapping.TryGetValue(ns, out var nsmap))
+            string[] names;
+            lock (mappingLock)
             {
-                if (nsmap.TryGetValue(GetBasename(basename), out var names))
+                if (!mapping.TryGetValue(ns, out var nsmap)
+                    || !nsmap.TryGetValue(GetBasename(basename), out var gnames))
                 {
-                    foreach (string name in names)
-                    {
-                        string qname = $"{ns}.{name}";
-                        Type o = AssemblyManager.LookupTypes(qname).FirstOrDefault();
-                        if (o != null && o.GetGenericArguments().Length == paramCount)
-                        {
-                            return o;
-                        }
-                    }
+                    return null;
+                }
+                names = gnames.ToArray();
+            }
+
+            foreach (string name in names)
+            {
+                string qname = $"{ns}.{name}";
+                Type o = AssemblyManager.LookupTypes(qname).FirstOrDefault();
+                if (o != null && o.GetGenericArguments().Length == paramCount)
+                {
+                    return o;
                 }
             }
             return null;
@@ -94,12 +113,15 @@ namespace Python.Runtime
         /// </summary>
         public static string? GenericNameForBaseName(string ns, string name)
         {
-            if (mapping.TryGetValue(ns, out var nsmap))
+            lock (mappingLock)
             {
-                nsmap.TryGetValue(name, out var gnames);
-                if (gnames?.Count > 0)
+                if (mapping.TryGetValue(ns, out var nsmap))
                 {
-                    return gnames[0];
+                    nsmap.TryGetValue(name, out var gnames);
+                    if (gnames?.Count > 0)
+                    {
+                        return gnames[0];
+                    }
                 }
             }
             return null;
@@ -4,6 +4,8 @@ using System.Diagnostics;
 using System.Linq;
 using System.Reflection;
 
+using Python.Runtime.StateSerialization;
+
 namespace Python.Runtime.Reflection;
 
 [Serializable]
@@ -33,7 +35,7 @@ class ParameterHelper : IEquatable<ParameterInfo>
 
     public ParameterHelper(Type type)
     {
-        TypeName = type.AssemblyQualifiedName;
+        TypeName = ReflectionNames.GetName(type)!;
         if (TypeName is null)
         {
             if (type.IsByRef || type.IsArray)
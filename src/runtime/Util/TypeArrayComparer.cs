@@ -0,0 +1,40 @@
+using System;
+using System.Collections.Generic;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Compares arrays of types element by element, e.g. to use
+    /// generic type arguments as dictionary keys.
+    /// </summary>
+    internal sealed class TypeArrayComparer : IEqualityComparer<Type[]>
+    {
+        public static TypeArrayComparer Instance { get; } = new TypeArrayComparer();
+
+        public bool Equals(Type[]? x, Type[]? y)
+        {
+            if (ReferenceEquals(x, y)) return true;
+            if (x is null || y is null || x.Length != y.Length) return false;
+            for (int i = 0; i < x.Length; i++)
+            {
+                if (x[i] != y[i]) return false;
+            }
+            return true;
+        }
+
+        public int GetHashCode(Type[] obj)
+        {
+            unchecked
+            {
+                int hash = obj.Length;
+                foreach (Type type in obj)
+                {
+                    hash = hash * 31 + (type?.GetHashCode() ?? 0);
+                }
+                return hash;
+            }
+        }
+
+        private TypeArrayComparer() { }
+    }
+}
@@ -46,6 +46,37 @@ namespace Python.Test
         }
     }
 
+    public struct BlittablePoint
+    {
+        public double X;
+        public double Y;
+        public int Tag;
+        public BlittableColor Color;
+
+        public BlittablePoint(double x, double y, int tag)
+        {
+            X = x;
+            Y = y;
+            Tag = tag;
+            Color = default;
+        }
+    }
+
+    public struct BlittableColor
+    {
+        public byte R, G, B;
+    }
+
+    public static class BlittableStructTester
+    {
+        public static BlittablePoint Echo(BlittablePoint point) => point;
+
+        public static BlittablePoint[] Range(int count)
+            => Enumerable.Range(0, count).Select(i => new BlittablePoint(i, -i, i * 10)).ToArray();
+
+        public static double SumX(BlittablePoint[] points) => points.Sum(p => p.X);
+    }
+
     public static class CodecResetter
     {
         public static void Reset()
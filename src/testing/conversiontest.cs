@@ -94,4 +94,23 @@ namespace Python.Test
             return 0;
         }
     }
+
+    public class MultiEnumerable : IEnumerable<int>, IEnumerable<string>
+    {
+        public IEnumerator<int> GetEnumerator()
+        {
+            yield return 1;
+        }
+
+        IEnumerator<string> IEnumerable<string>.GetEnumerator()
+        {
+            yield return "a";
+        }
+
+        System.Collections.IEnumerator System.Collections.IEnumerable.GetEnumerator()
+        {
+            yield return 1;
+            yield return "a";
+        }
+    }
 }
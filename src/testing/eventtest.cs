@@ -31,6 +31,12 @@ namespace Python.Test
         public event RefStringDelegate RefStringEvent;
         public event RefIntDelegate RefIntEvent;
 
+        public event EventHandlerTest RejectingEvent
+        {
+            add { throw new InvalidOperationException("handler rejected"); }
+            remove { }
+        }
+
         public static int s_value;
         public int value;
 
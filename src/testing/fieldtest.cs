@@ -50,4 +50,16 @@ namespace Python.Test
         public object ObjectField;
         public ISpam SpamField;
     }
+
+    public struct FieldTestStruct
+    {
+        public int Int32Field;
+        public string StringField;
+
+        public int Int32Property
+        {
+            get { return Int32Field; }
+            set { Int32Field = value; }
+        }
+    }
 }
@@ -446,4 +446,12 @@ namespace Python.Test
             set { t[index] = value; }
         }
     }
+
+    public class NamedListIndexerTest : System.Collections.Generic.List<string>
+    {
+        public string this[string name]
+        {
+            get { return "named " + name; }
+        }
+    }
 }
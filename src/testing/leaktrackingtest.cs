@@ -0,0 +1,48 @@
+using System.Collections.Generic;
+
+using Python.Runtime;
+
+namespace Python.Test
+{
+    /// <summary>
+    /// Creates Python objects from .NET for the leak tracking tests.
+    /// </summary>
+    public class LeakTrackingTest
+    {
+        static readonly List<PyObject> held = new();
+
+        public static void Hold(int count)
+        {
+            using (Py.GIL())
+            {
+                for (int i = 0; i < count; i++)
+                {
+                    held.Add(new PyString("held"));
+                }
+            }
+        }
+
+        public static void ReleaseHeld()
+        {
+            using (Py.GIL())
+            {
+                foreach (var obj in held)
+                {
+                    obj.Dispose();
+                }
+                held.Clear();
+            }
+        }
+
+        public static void Abandon(int count)
+        {
+            using (Py.GIL())
+            {
+                for (int i = 0; i < count; i++)
+                {
+                    _ = new PyString("abandoned");
+                }
+            }
+        }
+    }
+}
@@ -3,6 +3,8 @@ using System.IO;
 using System.Linq;
 using System.Runtime.InteropServices;
 
+using Python.Runtime;
+
 namespace Python.Test
 {
     /// <summary>
@@ -754,6 +756,25 @@ namespace Python.Test
         public string Foo(int a) { return "Arity 1"; }
         public string Foo(int a, int b) { return "Arity 2"; }
     }
+
+    public delegate string BorrowedArgumentDelegate([Borrowed] PyObject value);
+
+    public class BorrowedArgumentTest
+    {
+        public static PyObject Stored;
+
+        public static string Str([Borrowed] PyObject value) => value.ToString();
+
+        public static PyObject Echo([Borrowed] PyObject value) => value;
+
+        public static void Store([Borrowed] PyObject value) => Stored = value;
+
+        public static void Keep([Borrowed] PyObject value) => Stored = value.NewReference();
+
+        public static bool StoredIsReleased() => Stored.Handle == IntPtr.Zero;
+
+        public static BorrowedArgumentDelegate GetDelegate() => Str;
+    }
 }
 
 namespace PlainOldNamespace
@@ -291,6 +291,50 @@ def test_comparisons():
         c1 < c2
 
 
+def test_struct_operators():
+    """Test operators of .NET structs with operand overloads."""
+    from System import DateTime, TimeSpan
+
+    clr.AddReference("System.Numerics")
+    from System.Numerics import Vector3, BigInteger
+
+    a = Vector3(1, 2, 3)
+    b = Vector3(4, 5, 6)
+    assert a + b == Vector3(5, 7, 9)
+    assert a * 2.0 == Vector3(2, 4, 6)
+    assert 2.0 * a == Vector3(2, 4, 6)
+    assert -a == Vector3(-1, -2, -3)
+    assert (a == b) == False
+    assert (a != b) == True
+
+    with pytest.raises(TypeError):
+        a + "spam"
+
+    assert DateTime(2020, 1, 2) - DateTime(2020, 1, 1) == TimeSpan(1, 0, 0, 0)
+    assert DateTime(2020, 1, 2) - TimeSpan(1, 0, 0, 0) == DateTime(2020, 1, 1)
+    assert (DateTime(2020, 1, 2) < DateTime(2020, 1, 3)) == True
+    assert (TimeSpan(1, 0, 0) >= TimeSpan(2, 0, 0)) == False
+
+    assert BigInteger(10) + 5 == BigInteger(15)
+    assert 5 + BigInteger(10) == BigInteger(15)
+    assert (BigInteger(3) < 5) == True
+    assert BigInteger(10) + 2 ** 70 == BigInteger.Parse(str(10 + 2 ** 70))
+
+
+def test_operator_method_access():
+    """Test operator special methods called through the class and instance."""
+    clr.AddReference("System.Numerics")
+    from System.Numerics import Vector3
+
+    a = Vector3(1, 2, 3)
+    assert a.__add__(a) == Vector3(2, 4, 6)
+    assert Vector3.__add__(a, a) == Vector3(2, 4, 6)
+    assert Vector3.__rmul__(a, 2.0) == Vector3(2, 4, 6)
+
+    with pytest.raises(TypeError):
+        Vector3.__add__()
+
+
 def test_self_callback():
     """Test calling back and forth between this and a c# baseclass."""
 
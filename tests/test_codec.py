@@ -113,3 +113,78 @@ def test_enum():
     assert Test.LongEnum.Max == 9223372036854775807
     assert Test.LongEnum.Min == -9223372036854775808
     assert int(Test.ULongEnum.Max) == 18446744073709551615
+
+
+def test_collection_encoder():
+    from System import Int32
+    from System.Collections.Generic import List, Dictionary
+
+    Python.Runtime.PyObjectConversions.RegisterEncoder(
+        Python.Runtime.Codecs.CollectionEncoder.Instance
+    )
+
+    ob = Test.ConversionTest()
+    items = List[Int32]()
+    for i in range(1, 4):
+        items.Add(i)
+    ob.ObjectField = items
+    assert ob.ObjectField == [1, 2, 3]
+
+    d = Dictionary[str, Int32]()
+    d["one"] = 1
+    ob.ObjectField = d
+    assert ob.ObjectField == {"one": 1}
+
+    from System import Version
+    ob.ObjectField = Version(1, 2)
+    assert ob.ObjectField.Major == 1
+
+
+def test_blittable_struct_codec():
+    import ctypes
+    from Python.Runtime.Codecs import BlittableStructCodec
+    from Python.Test import BlittablePoint, BlittableStructTester
+
+    BlittableStructCodec[BlittablePoint].Register()
+
+    point = BlittableStructTester.Echo(BlittablePoint(1.5, 2.5, 3))
+    assert isinstance(point, ctypes.Structure)
+    assert (point.X, point.Y, point.Tag) == (1.5, 2.5, 3)
+    assert point.Color.R == 0
+    assert ctypes.sizeof(point) == 24
+
+    point.X = 4.0
+    point.Color.G = 7
+    echoed = BlittableStructTester.Echo(point)
+    assert (echoed.X, echoed.Color.G) == (4.0, 7)
+
+    points = BlittableStructTester.Range(5)
+    assert isinstance(points, ctypes.Array)
+    assert len(points) == 5
+    assert [p.Tag for p in points] == [0, 10, 20, 30, 40]
+
+    view = memoryview(points)
+    assert view.itemsize == 24 and view.shape == (5,)
+    assert BlittableStructTester.SumX(points) == 10
+    assert BlittableStructTester.SumX(type(points)()) == 0
+
+    with pytest.raises(TypeError):
+        # items of a different size
+        BlittableStructTester.SumX(bytes(48))
+
+    class Other(ctypes.Structure):
+        _fields_ = [("values", ctypes.c_double * 3)]
+
+    with pytest.raises(TypeError):
+        # items of the same size, but a different format
+        BlittableStructTester.SumX((Other * 2)())
+
+
+def test_blittable_struct_codec_rejects_unsupported_types():
+    from System import NotSupportedException
+    from Python.Runtime.Codecs import BlittableStructCodec
+    from System import DateTime
+
+    with pytest.raises(NotSupportedException):
+        # auto layout
+        BlittableStructCodec[DateTime].Register()
@@ -21,3 +21,51 @@ def test_dict_in_keys():
     d["a"] = 42
     assert "a" in d.Keys
     assert "b" not in d.Keys
+
+def test_dict_get_value_type():
+    d = C.Dictionary[str, float]()
+    d["a"] = 1.5
+    assert d.get("a") == 1.5
+    assert d.get("b") is None
+    assert d.get("b", 2) == 2
+    assert d.get(42, "x") == "x"
+
+def test_dict_pop_and_setdefault_value_type():
+    d = C.Dictionary[str, int]()
+    d["a"] = 1
+    assert d.setdefault("a", 5) == 1
+    assert d.setdefault("b", 2) == 2
+    assert d.pop("a") == 1
+    assert d.pop("a", None) is None
+    assert dict(d.items()) == {"b": 2}
+
+def test_dict_contains_unconvertible_key():
+    d = C.Dictionary[int, str]()
+    d[1] = "a"
+    assert 1 in d
+    assert "1" not in d
+
+def test_read_only_dict():
+    from System.Collections.ObjectModel import ReadOnlyDictionary
+    d = C.Dictionary[str, int]()
+    d["a"] = 1
+    ro = ReadOnlyDictionary[str, int](d)
+    assert len(ro) == 1
+    assert "a" in ro
+    assert ro.items() == [("a", 1)]
+    assert ro.get("a") == 1
+
+def test_collection_contains():
+    s = C.HashSet[str]()
+    s.Add("a")
+    assert "a" in s
+    assert "b" not in s
+    assert 1 not in s
+    assert len(s) == 1
+
+def test_non_generic_list_contains():
+    from System.Collections import ArrayList
+    l = ArrayList()
+    l.Add("a")
+    assert "a" in l
+    assert "b" not in l
@@ -755,3 +755,126 @@ def test_explicit_conversion():
         assert int(t(123.4)) == 123
         with pytest.raises(TypeError):
             index(t(123.4))
+
+
+def test_numpy_scalar_conversion():
+    """Test conversion of NumPy scalars and 0-d arrays to primitives."""
+    np = pytest.importorskip("numpy")
+    ob = ConversionTest()
+
+    ob.BooleanField = np.bool_(True)
+    assert ob.BooleanField is True
+
+    ob.Int32Field = np.int32(-7)
+    assert ob.Int32Field == -7
+
+    ob.ByteField = np.uint8(200)
+    assert ob.ByteField == 200
+
+    ob.UInt64Field = np.uint64(2 ** 63)
+    assert ob.UInt64Field == 2 ** 63
+
+    ob.SingleField = np.float32(2.5)
+    assert ob.SingleField == 2.5
+
+    ob.DoubleField = np.array(1.5)
+    assert ob.DoubleField == 1.5
+
+    ob.Int64Field = np.array([1, 2, 3])[1]
+    assert ob.Int64Field == 2
+
+    with pytest.raises(OverflowError):
+        ob.ByteField = np.int32(256)
+
+    with pytest.raises(TypeError):
+        ob.BooleanField = np.int32(1)
+
+    with pytest.raises(TypeError):
+        ob.Int32Field = np.float32(1)
+
+    with pytest.raises(TypeError):
+        ob.Int32Field = np.array([1, 2])
+
+
+def test_numpy_type_check_does_not_keep_types_alive():
+    """Test that the NumPy type check does not leak Python classes."""
+    import gc
+    import weakref
+
+    class NotNumPy:
+        pass
+
+    ob = ConversionTest()
+    with pytest.raises(TypeError):
+        ob.Int32Field = NotNumPy()
+
+    ref = weakref.ref(NotNumPy)
+    del NotNumPy
+    gc.collect()
+    assert ref() is None
+
+
+def test_to_pylist():
+    """Test bulk conversion of .NET collections to Python lists."""
+    import clr
+    from System import Array
+    from System.Collections.Generic import List, HashSet, Queue
+    from System.Linq import Enumerable
+
+    doubles = List[System.Double]()
+    for i in range(5):
+        doubles.Add(i / 2)
+    result = clr.to_pylist(doubles)
+    assert type(result) is list
+    assert result == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert all(type(v) is float for v in result)
+
+    def fill(collection, *items):
+        for item in items:
+            collection.Add(item)
+        return collection
+
+    assert clr.to_pylist(Array[System.Int64]([1, 2, 3])) == [1, 2, 3]
+    assert clr.to_pylist(fill(List[System.Boolean](), True, False)) == [True, False]
+    assert clr.to_pylist(fill(List[System.String](), "a", None)) == ["a", None]
+    assert sorted(clr.to_pylist(fill(HashSet[System.Int32](), 3, 1, 2))) == [1, 2, 3]
+    queue = Queue[System.Byte]()
+    queue.Enqueue(1)
+    queue.Enqueue(2)
+    assert clr.to_pylist(queue) == [1, 2]
+    assert clr.to_pylist(Enumerable.Range(0, 4)) == [0, 1, 2, 3]
+    assert clr.to_pylist(fill(System.Collections.ArrayList(), 1, "b")) == [1, "b"]
+
+    items = clr.to_pylist(fill(List[System.Object](), System.Version(1, 2)))
+    assert items[0].Major == 1
+
+    with pytest.raises(TypeError):
+        clr.to_pylist(System.Version(1, 2))
+
+    # several IEnumerable<T> instantiations: the non-generic enumerator is used
+    from Python.Test import MultiEnumerable
+    assert clr.to_pylist(MultiEnumerable()) == [1, "a"]
+
+
+def test_to_pydict():
+    """Test bulk conversion of .NET dictionaries to Python dicts."""
+    import clr
+    from System.Collections.Generic import Dictionary, SortedDictionary
+
+    d = Dictionary[System.String, System.Double]()
+    d["a"] = 1.5
+    d["b"] = 2.0
+    result = clr.to_pydict(d)
+    assert type(result) is dict
+    assert result == {"a": 1.5, "b": 2.0}
+
+    sd = SortedDictionary[System.Int32, System.String]()
+    sd[2] = "two"
+    assert clr.to_pydict(sd) == {2: "two"}
+
+    table = System.Collections.Hashtable()
+    table["x"] = 1
+    assert clr.to_pydict(table) == {"x": 1}
+
+    with pytest.raises(TypeError):
+        clr.to_pydict(d.Keys)
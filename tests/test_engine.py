@@ -27,6 +27,16 @@ def test_supported_version():
     assert ver <= PythonEngine.MaxSupportedVersion
 
 
+def test_startup_phases():
+    """Test the timing breakdown of the runtime initialization."""
+    names = [phase.Name for phase in PythonEngine.StartupPhases]
+    assert names[0] == "DelegateManager"
+    assert names[-1] == "ClrModule"
+    for name in ("Library", "TypeManager", "AssemblyManager", "Exceptions"):
+        assert name in names
+    assert all(phase.Duration >= System.TimeSpan.Zero for phase in PythonEngine.StartupPhases)
+
+
 @pytest.mark.skip(reason="FIXME: test crashes")
 def test_import_module():
     """Test module import."""
@@ -119,6 +119,44 @@ def test_multicast_event():
     ob.PublicEvent -= handler3.handler
 
 
+def test_multicast_event_handlers_changed_while_firing():
+    """Test that handlers removed while an event fires are still called,
+    and that the remaining handlers keep their order."""
+    ob = EventTest()
+    calls = []
+    removed = []
+
+    def first(sender, args):
+        calls.append("first")
+        if not removed:
+            removed.append(second)
+            ob.PublicEvent -= second
+
+    def second(sender, args):
+        calls.append("second")
+
+    def third(sender, args):
+        calls.append("third")
+
+    ob.PublicEvent += first
+    ob.PublicEvent += second
+    ob.PublicEvent += third
+
+    ob.OnPublicEvent(EventArgsTest(10))
+    assert calls == ["first", "second", "third"]
+
+    del calls[:]
+    ob.OnPublicEvent(EventArgsTest(20))
+    assert calls == ["first", "third"]
+
+    ob.PublicEvent -= first
+    ob.PublicEvent -= third
+
+    del calls[:]
+    ob.OnPublicEvent(EventArgsTest(30))
+    assert calls == []
+
+
 def test_instance_method_handler():
     """Test instance method handlers."""
     ob = EventTest()
@@ -517,6 +555,20 @@ def test_remove_unknown_handler():
         ob.PublicEvent -= handler.handler
 
 
+def test_failed_add_does_not_register_handler():
+    """Test that a handler rejected by the add accessor is not recorded."""
+    from System import InvalidOperationException
+
+    ob = EventTest()
+    handler = GenericHandler()
+
+    with pytest.raises(InvalidOperationException):
+        ob.RejectingEvent += handler.handler
+
+    with pytest.raises(ValueError):
+        ob.RejectingEvent -= handler.handler
+
+
 def test_handler_callback_failure():
     """Test failure mode for inappropriate handlers."""
 
@@ -389,3 +389,45 @@ def test_nullable_field():
 
     with pytest.raises(TypeError):
         FieldTest().EnumField = None
+
+
+def test_repeated_field_access():
+    """Test fields accessed often enough to use compiled accessors."""
+    ob = FieldTest()
+
+    for i in range(20):
+        ob.Int32Field = i
+        assert ob.Int32Field == i
+        ob.DoubleField = i / 2
+        assert ob.DoubleField == i / 2
+        ob.StringField = str(i)
+        assert ob.StringField == str(i)
+        FieldTest.PublicStaticField = i
+        assert FieldTest.PublicStaticField == i
+        assert ob.ReadOnlyField == 0
+        assert ob.ConstField == 0
+
+    ob.StringField = None
+    assert ob.StringField is None
+    FieldTest.PublicStaticField = 0
+
+    with pytest.raises(TypeError):
+        ob.ReadOnlyField = 1
+
+    with pytest.raises(TypeError):
+        ob.Int32Field = "spam"
+
+
+def test_repeated_struct_field_access():
+    """Test that struct fields accessed repeatedly update the boxed struct."""
+    from Python.Test import FieldTestStruct
+
+    ob = FieldTestStruct()
+    for i in range(20):
+        ob.Int32Field = i
+        assert ob.Int32Field == i
+        assert ob.Int32Property == i
+        ob.Int32Property = i + 1
+        assert ob.Int32Field == i + 1
+        ob.StringField = str(i)
+        assert ob.StringField == str(i)
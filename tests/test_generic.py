@@ -802,3 +802,21 @@ def test_generic_list_array_conversion():
         result = GenericArrayConversionTest.EchoRange(items)
         assert result[0].__class__ == Spam
         assert len(result) == 10
+
+
+def test_repeated_generic_method_instantiation():
+    """Test that cached generic method instantiations behave like fresh ones."""
+    from Python.Test import ConversionTest, GenericArrayConversionTest, Spam
+
+    ob = ConversionTest()
+    for i in range(5):
+        assert ob.Echo[System.Int32](i) == i
+        assert ob.Echo[System.Int64](i) == i
+        assert GenericArrayConversionTest.EchoRange[Spam]([Spam(str(i))])[0].GetValue() == str(i)
+
+        with pytest.raises(TypeError):
+            ConversionTest.Echo[System.Object]
+
+    method = ob.Echo[System.Int32]
+    assert method(1) == 1
+    assert ConversionTest().Echo[System.Int32](2) == 2
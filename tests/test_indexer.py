@@ -704,3 +704,66 @@ def test_del_indexer_absent():
     l = Uri("http://www.example.com")
     with pytest.raises(TypeError):
         del l[0]
+
+def test_generic_list_indexer():
+    """Test indexing IList<T> through the interface indexer."""
+    from System import ArgumentOutOfRangeException
+    from System.Collections.Generic import List
+    l = List[int]()
+    l.Add(1)
+    l.Add(2)
+    assert l[1] == 2
+    l[0] = 7
+    assert l[0] == 7
+    with pytest.raises(ArgumentOutOfRangeException):
+        _ = l[-1]
+    with pytest.raises(ArgumentOutOfRangeException):
+        l[2] = 3
+    with pytest.raises(TypeError):
+        _ = l["0"]
+    with pytest.raises(TypeError):
+        l[0] = "x"
+
+def test_generic_dictionary_indexer():
+    """Test indexing IDictionary<TKey, TValue> through the interface indexer."""
+    from System.Collections.Generic import Dictionary, KeyNotFoundException
+    d = Dictionary[str, int]()
+    d["a"] = 1
+    assert d["a"] == 1
+    d["a"] = 2
+    assert d["a"] == 2
+    with pytest.raises(KeyNotFoundException):
+        _ = d["b"]
+    with pytest.raises(TypeError):
+        _ = d[1]
+    with pytest.raises(TypeError):
+        d["b"] = "x"
+
+def test_read_only_list_indexer():
+    """Test indexing a list, that only has a public read-only indexer."""
+    from System.Collections.Generic import List
+    from System.Collections.ObjectModel import ReadOnlyCollection
+    items = List[str]()
+    items.Add("spam")
+    l = ReadOnlyCollection[str](items)
+    assert l[0] == "spam"
+    assert l[l.Count - 1] == "spam"
+
+def test_list_with_additional_indexer():
+    """Test a list, that declares another indexer, uses the binder."""
+    ob = Test.NamedListIndexerTest()
+    ob.Add("spam")
+    assert ob[0] == "spam"
+    assert ob["eggs"] == "named eggs"
+
+def test_object_array_indexer():
+    """Test indexing arrays of reference types."""
+    from System import Array, Object
+    a = Array[Object]([1, "spam", None])
+    assert a[0] == 1
+    assert a[-2] == "spam"
+    assert a[2] is None
+    a[2] = 3.5
+    assert a[-1] == 3.5
+    with pytest.raises(IndexError):
+        _ = a[3]
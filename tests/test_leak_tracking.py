@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Test sampled leak tracking of PyObject wrappers."""
+
+import clr
+import pytest
+
+clr.AddReference("Python.Test")
+
+from Python.Test import LeakTrackingTest
+from System import ArgumentOutOfRangeException, GC
+
+
+@pytest.fixture
+def leak_tracking():
+    clr.reset_leak_tracking()
+    yield
+    clr.disable_leak_tracking()
+    LeakTrackingTest.ReleaseHeld()
+    clr.reset_leak_tracking()
+
+
+def _entries(site):
+    return [e for e in clr.leak_report() if site in e["site"]]
+
+
+def test_leak_tracking_records_live_objects(leak_tracking):
+    clr.enable_leak_tracking(1)
+    LeakTrackingTest.Hold(10)
+
+    entries = _entries("Python.Test.LeakTrackingTest.Hold")
+    assert len(entries) == 1
+    assert entries[0]["type"] == "str"
+    assert entries[0]["live"] == 10
+    assert entries[0]["disposed"] == 0
+
+    LeakTrackingTest.ReleaseHeld()
+    entries = _entries("Python.Test.LeakTrackingTest.Hold")
+    assert entries[0]["live"] == 0
+    assert entries[0]["disposed"] == 10
+
+
+def test_leak_tracking_samples(leak_tracking):
+    clr.enable_leak_tracking(10)
+    LeakTrackingTest.Hold(100)
+
+    entries = _entries("Python.Test.LeakTrackingTest.Hold")
+    assert entries[0]["live"] == 10
+
+
+def test_leak_tracking_records_finalized_objects(leak_tracking):
+    clr.enable_leak_tracking(1)
+    LeakTrackingTest.Abandon(10)
+    GC.Collect()
+    GC.WaitForPendingFinalizers()
+
+    entries = _entries("Python.Test.LeakTrackingTest.Abandon")
+    assert entries[0]["live"] == 0
+    assert entries[0]["finalized"] == 10
+
+
+def test_leak_tracking_disabled_records_nothing(leak_tracking):
+    LeakTrackingTest.Hold(10)
+    assert _entries("Python.Test.LeakTrackingTest.Hold") == []
+
+
+def test_leak_tracking_rejects_invalid_sample_rate():
+    with pytest.raises(ArgumentOutOfRangeException):
+        clr.enable_leak_tracking(0)
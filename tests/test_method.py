@@ -1323,3 +1323,33 @@ def test_method_call_implicit_conversion():
             min_value = t(t.MinValue)
             compare_to = min_value.CompareTo.__overloads__[t]
             assert compare_to(SomeNonFloat()) == -1
+
+
+def test_borrowed_argument():
+    """Test PyObject parameters, that borrow the argument for the call."""
+    from Python.Test import BorrowedArgumentTest
+
+    value = ["spam"]
+    refcount = sys.getrefcount(value)
+    for _ in range(100):
+        assert BorrowedArgumentTest.Str(value) == "['spam']"
+        assert BorrowedArgumentTest.Str(value=value) == "['spam']"
+        assert BorrowedArgumentTest.Echo(value) is value
+    assert sys.getrefcount(value) == refcount
+
+    assert BorrowedArgumentTest.Str(None) == "None"
+    assert BorrowedArgumentTest.GetDelegate()(value) == "['spam']"
+
+
+def test_borrowed_argument_released_after_call():
+    """Test that borrowed arguments can not be used after the call."""
+    from Python.Test import BorrowedArgumentTest
+
+    value = ["spam"]
+    BorrowedArgumentTest.Store(value)
+    assert BorrowedArgumentTest.StoredIsReleased()
+
+    BorrowedArgumentTest.Keep(value)
+    assert not BorrowedArgumentTest.StoredIsReleased()
+    assert BorrowedArgumentTest.Stored is value
+    BorrowedArgumentTest.Stored = None
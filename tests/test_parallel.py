@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""Test clr.parallel_map."""
+
+import clr
+import pytest
+
+import System
+from System import Math, Int32, TimeSpan
+
+
+def test_parallel_map_static_method():
+    """Test results are returned in the order of the inputs."""
+    values = list(range(-500, 500))
+    assert clr.parallel_map(Math.Abs, values) == [abs(v) for v in values]
+
+
+def test_parallel_map_unpacks_tuples():
+    assert clr.parallel_map(Math.Max, [(1, 2), (4, 3), (5, 5)]) == [2, 4, 5]
+
+
+def test_parallel_map_bound_method():
+    span = TimeSpan.FromSeconds(1)
+    results = clr.parallel_map(span.Add, [TimeSpan.FromSeconds(i) for i in range(3)])
+    assert [r.TotalSeconds for r in results] == [1, 2, 3]
+
+
+def test_parallel_map_overload_per_item():
+    """Test items not matching the first selected overload are bound again."""
+    results = clr.parallel_map(Math.Abs, [-1, -2.5, -3])
+    assert results == [1, 2.5, 3]
+    assert type(results[1]) is float
+
+
+def test_parallel_map_overload_per_argument_types():
+    """Test overloads do not depend on the order of the items."""
+    values = [-2.5, -1, -3.5, -4]
+    results = clr.parallel_map(Math.Abs, values)
+    assert results == [Math.Abs(v) for v in values]
+    assert [type(r) for r in results] == [type(Math.Abs(v)) for v in values]
+
+
+def test_parallel_map_max_degree():
+    assert clr.parallel_map(Math.Abs, [-1, -2], max_degree=1) == [1, 2]
+
+    with pytest.raises(System.ArgumentOutOfRangeException):
+        clr.parallel_map(Math.Abs, [-1], max_degree=0)
+
+
+def test_parallel_map_empty():
+    assert clr.parallel_map(Math.Abs, []) == []
+
+
+def test_parallel_map_aggregates_exceptions():
+    with pytest.raises(System.AggregateException) as cm:
+        clr.parallel_map(Int32.Parse, ["1", "x", "2", "y"])
+
+    inner = list(cm.value.InnerExceptions)
+    assert len(inner) == 2
+    assert all(isinstance(e, System.FormatException) for e in inner)
+
+
+def test_parallel_map_no_matching_overload():
+    with pytest.raises(TypeError):
+        clr.parallel_map(Math.Abs, ["not a number"])
+
+
+def test_parallel_map_requires_method():
+    with pytest.raises(System.ArgumentException):
+        clr.parallel_map(abs, [1])
+
+    with pytest.raises(System.ArgumentException):
+        clr.parallel_map(System.String.Trim, [" a "])
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""Test the interop call profiler."""
+
+import json
+
+import clr
+import pytest
+
+
+@pytest.fixture
+def profiling():
+    clr.reset_profiling()
+    clr.enable_profiling()
+    yield
+    clr.disable_profiling()
+    clr.reset_profiling()
+
+
+def _total(stats, name, counter):
+    return sum(v[counter] for k, v in stats.items() if name in k)
+
+
+def test_profiling_counts_calls(profiling):
+    from System import Math
+
+    for i in range(10):
+        Math.Abs(-i)
+
+    stats = clr.get_profiling_stats()
+    assert _total(stats, "System.Math.Abs(", "calls") == 10
+    assert _total(stats, "System.Math.Abs(", "bind_failures") == 0
+    for name, entry in stats.items():
+        assert entry["total_time"] >= entry["invocation_time"] >= 0
+
+
+def test_profiling_disabled_records_nothing():
+    from System import Math
+
+    clr.reset_profiling()
+    Math.Abs(-1)
+    assert clr.get_profiling_stats() == {}
+
+
+def test_profiling_counts_failures(profiling):
+    from System import Math, Int32
+
+    with pytest.raises(TypeError):
+        Math.Abs("not a number")
+
+    with pytest.raises(Exception):
+        Int32.Parse("not a number")
+
+    stats = clr.get_profiling_stats()
+    # no overload matched, so the failure is charged to the method group
+    assert stats["System.Math.Abs"]["bind_failures"] == 1
+    assert _total(stats, "System.Math.Abs(", "bind_failures") == 0
+    assert _total(stats, "System.Int32.Parse(", "exceptions_translated") == 1
+
+
+def test_profiling_export(profiling, tmp_path):
+    from System import Math
+
+    Math.Abs(-1)
+
+    path = tmp_path / "profile.speedscope.json"
+    clr.export_profile(str(path))
+    with open(path) as f:
+        profile = json.load(f)
+    names = [frame["name"] for frame in profile["shared"]["frames"]]
+    assert any("System.Math.Abs" in name for name in names)
+
+    stats = clr.profiling_pstats()
+    assert any("System.Math.Abs" in func for _, _, func in stats.stats)
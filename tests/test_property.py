@@ -146,3 +146,25 @@ def test_interface_property():
     mapping = Hashtable()
     coll = ICollection(mapping)
     assert coll.Count == 0
+
+
+def test_repeated_property_access():
+    """Test properties accessed often enough to use compiled accessors."""
+    from Python.Test import ExceptionTest
+    from System import OverflowException
+
+    ob = PropertyTest()
+    for i in range(20):
+        ob.PublicProperty = i
+        assert ob.PublicProperty == i
+        PropertyTest.PublicStaticProperty = i
+        assert PropertyTest.PublicStaticProperty == i
+    PropertyTest.PublicStaticProperty = 0
+
+    # exceptions are still translated after compilation
+    for _ in range(20):
+        with pytest.raises(OverflowException):
+            _ = ExceptionTest().ThrowProperty
+
+        with pytest.raises(OverflowException):
+            ExceptionTest().ThrowProperty = 1
@@ -56,3 +56,35 @@ def test_python_thread_calls_to_clr():
     while len(done) < 50:
         dprint(len(done))
         time.sleep(0.1)
+
+
+def test_concurrent_type_reflection():
+    """Test threads reflecting the same CLR types at the same time."""
+    import sys
+    import System.Collections.Specialized as specialized
+
+    names = [name for name in dir(specialized) if not name.startswith("_")]
+    errors = []
+
+    def reflect():
+        try:
+            for name in names:
+                cls = getattr(specialized, name)
+                # members are only usable, once reflection is complete
+                assert cls.__name__
+                assert hasattr(cls, "GetType")
+        except Exception as e:
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=reflect) for _ in range(8)]
+        for thread_ in threads:
+            thread_.start()
+        for thread_ in threads:
+            thread_.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors